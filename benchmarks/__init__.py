@@ -0,0 +1,5 @@
+"""
+Micro and macro benchmarks for the cortex loop.
+
+Run ``uv run python -m benchmarks --help`` for usage.
+"""
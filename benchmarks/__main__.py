@@ -0,0 +1,91 @@
+import importlib
+import logging
+import os
+import sys
+from typing import Optional
+
+import typer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from benchmarks.harness import (  # noqa: E402
+    BASELINE_DIR,
+    compare,
+    format_results,
+    load_baseline,
+    registered,
+    run_benchmark,
+    save_baseline,
+)
+
+BENCHMARK_MODULES = [
+    "benchmarks.bench_fuser",
+    "benchmarks.bench_llm",
+    "benchmarks.bench_actions",
+    "benchmarks.bench_tick",
+    "benchmarks.bench_config",
+]
+
+app = typer.Typer()
+
+
+def _baseline_path(name: str) -> str:
+    if name.endswith(".json"):
+        return name
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+@app.command()
+def main(
+    filter: Optional[str] = typer.Option(
+        None, "--filter", "-k", help="Only run benchmarks whose name contains this."
+    ),
+    save: Optional[str] = typer.Option(
+        None, help="Save the results as a baseline with this name or path."
+    ),
+    compare_to: Optional[str] = typer.Option(
+        None, "--compare", help="Compare with the baseline with this name or path."
+    ),
+    threshold: float = typer.Option(
+        0.15, help="Relative slowdown or memory growth reported as a regression."
+    ),
+    min_time: float = typer.Option(0.2, help="Minimum seconds per timed round."),
+    rounds: int = typer.Option(5, help="Number of timed rounds."),
+) -> None:
+    """
+    Run the benchmarks, report ops/s and allocations, and optionally save
+    or compare against a baseline. Exits with status 1 on regressions.
+    """
+    # Keep per-call logging out of the measurements
+    logging.disable(logging.CRITICAL)
+
+    for module in BENCHMARK_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            print(f"Skipping {module}: {e}", file=sys.stderr)
+
+    results = []
+    for bench in registered(filter):
+        print(f"Running {bench.name}...", file=sys.stderr)
+        results.append(run_benchmark(bench, min_time=min_time, rounds=rounds))
+
+    comparisons = None
+    if compare_to:
+        comparisons = compare(
+            results, load_baseline(_baseline_path(compare_to)), threshold
+        )
+
+    print(format_results(results, comparisons))
+
+    if save:
+        path = _baseline_path(save)
+        save_baseline(results, path)
+        print(f"Baseline saved to {path}")
+
+    if comparisons and any(c.regressed for c in comparisons):
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,37 @@
+import asyncio
+
+from actions.orchestrator import ActionOrchestrator
+from benchmarks.fakes import make_config
+from benchmarks.harness import benchmark
+from llm.output_model import Action
+
+
+@benchmark("actions.promise_and_flush", actions=[10, 100, 500])
+def promise_and_flush(actions: int):
+    orchestrator = ActionOrchestrator(make_config(1, 3))
+    labels = ("speak", "move", "emotion")
+    values = ("hello", "sit", "happy")
+
+    async def op():
+        await orchestrator.promise(
+            [Action(type=labels[i % 3], value=values[i % 3]) for i in range(actions)]
+        )
+        # Let the connectors finish before flushing
+        await asyncio.sleep(0)
+        await orchestrator.flush_promises()
+
+    return op
+
+
+@benchmark("actions.flush_promises", pending=[100, 500])
+async def flush_promises(pending: int):
+    # Connectors block until released, so every promise stays pending
+    release = asyncio.Event()
+    orchestrator = ActionOrchestrator(make_config(1, 3, release=release))
+    await orchestrator.promise([Action(type="speak", value="hi")] * pending)
+    await asyncio.sleep(0)
+
+    async def op():
+        await orchestrator.flush_promises()
+
+    return op
@@ -0,0 +1,109 @@
+"""
+Configuration loading: parsing every file in ``config/`` with ``json5``
+against loading it from the compiled config cache.
+
+Run ``uv run python -m benchmarks.bench_config`` for a per-file comparison.
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+import json5
+import typer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from benchmarks.harness import benchmark  # noqa: E402
+from runtime import config_cache  # noqa: E402
+
+
+def config_paths() -> List[str]:
+    """
+    Paths of the configuration files in ``config/``.
+    """
+    return sorted(
+        os.path.join(config_cache.CONFIG_DIR, name)
+        for name in os.listdir(config_cache.CONFIG_DIR)
+        if name.endswith(".json5")
+    )
+
+
+def _json5(path: str) -> None:
+    with open(path, "r") as f:
+        json5.load(f)
+
+
+def _disk(path: str) -> None:
+    config_cache._memory.clear()
+    config_cache.load_raw_config(path)
+
+
+def _memory(path: str) -> None:
+    config_cache.load_raw_config(path)
+
+
+LOADERS: Dict[str, Callable[[str], None]] = {
+    "json5": _json5,
+    "disk": _disk,
+    "memory": _memory,
+}
+
+
+def _use_temporary_cache() -> None:
+    """
+    Point the config cache at a new directory and fill it.
+    """
+    logging.disable(logging.CRITICAL)
+    config_cache.CACHE_DIR = tempfile.mkdtemp(prefix="om1-config-cache-")
+    config_cache._memory.clear()
+    for path in config_paths():
+        config_cache.load_raw_config(path)
+
+
+@benchmark("config.load_all", source=list(LOADERS))
+def load_all(source: str):
+    _use_temporary_cache()
+    paths = config_paths()
+    load = LOADERS[source]
+
+    def op():
+        for path in paths:
+            load(path)
+
+    return op
+
+
+app = typer.Typer()
+
+
+@app.command()
+def main(
+    repeat: int = typer.Option(20, help="Loads per file and source."),
+) -> None:
+    """
+    Compare the time to load each configuration file with json5, from the
+    compiled cache on disk and from the in-process cache.
+    """
+    _use_temporary_cache()
+
+    print(f"{'config':40} " + " ".join(f"{name + ' ms':>10}" for name in LOADERS))
+    totals = dict.fromkeys(LOADERS, 0.0)
+    for path in config_paths():
+        row = []
+        for name, load in LOADERS.items():
+            start = time.perf_counter()
+            for _ in range(repeat):
+                load(path)
+            ms = 1000 * (time.perf_counter() - start) / repeat
+            totals[name] += ms
+            row.append(f"{ms:10.3f}")
+        print(f"{os.path.basename(path):40} " + " ".join(row))
+    print(f"{'total':40} " + " ".join(f"{ms:10.3f}" for ms in totals.values()))
+
+
+if __name__ == "__main__":
+    app()
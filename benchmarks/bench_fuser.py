@@ -0,0 +1,15 @@
+from benchmarks.fakes import make_config
+from benchmarks.harness import benchmark
+from fuser import Fuser
+
+
+@benchmark("fuser.fuse", inputs=[1, 10, 50], actions=[1, 10, 50])
+def fuse(inputs: int, actions: int):
+    config = make_config(inputs, actions)
+    fuser = Fuser(config)
+    agent_inputs = config.agent_inputs
+
+    def op():
+        fuser.fuse(agent_inputs, [])
+
+    return op
@@ -0,0 +1,72 @@
+import json
+
+from benchmarks.fakes import FakeInput, make_actions
+from benchmarks.harness import benchmark
+from llm import LLM, LLMConfig
+from llm.function_schemas import (
+    convert_function_calls_to_actions,
+    generate_function_schemas_from_actions,
+)
+from llm.output_model import Action, CortexOutputModel
+from providers.llm_history_manager import LLMHistoryManager
+
+
+@benchmark("llm.generate_function_schemas", actions=[1, 10, 50])
+def function_schemas(actions: int):
+    agent_actions = make_actions(actions)
+
+    def op():
+        generate_function_schemas_from_actions(agent_actions)
+
+    return op
+
+
+@benchmark("llm.convert_function_calls", calls=[1, 10, 50])
+def convert_function_calls(calls: int):
+    function_calls = [
+        {
+            "function": {
+                "name": ("speak", "move", "emotion")[i % 3],
+                "arguments": json.dumps({"action": f"value {i}"}),
+            }
+        }
+        for i in range(calls)
+    ]
+
+    def op():
+        convert_function_calls_to_actions(function_calls)
+
+    return op
+
+
+class _HistoryLLM(LLM[CortexOutputModel]):
+    def __init__(self):
+        super().__init__(LLMConfig(history_length=10**9, agent_name="Spot"))
+        self.history_manager = LLMHistoryManager(self._config, client=None)  # type: ignore
+        self.output = CortexOutputModel(
+            actions=[
+                Action(type="speak", value="Hello there!"),
+                Action(type="emotion", value="happy"),
+            ]
+        )
+
+    @LLMHistoryManager.update_history()
+    async def ask(self, prompt: str, messages=[]) -> CortexOutputModel:
+        return self.output
+
+
+@benchmark("llm.update_history", history=[0, 100, 1000])
+async def update_history(history: int):
+    llm = _HistoryLLM()
+    for i in range(10):
+        FakeInput(i).formatted_latest_buffer()
+
+    # Every call appends the inputs and the actions taken
+    for _ in range(history // 2):
+        await llm.ask("prompt")
+
+    async def op():
+        await llm.ask("prompt")
+        del llm.history_manager.history[history:]
+
+    return op
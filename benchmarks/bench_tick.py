@@ -0,0 +1,29 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from benchmarks.fakes import make_config
+from benchmarks.harness import benchmark
+from llm.output_model import Action
+from runtime.single_mode.cortex import CortexRuntime
+
+
+@benchmark("cortex.tick", inputs=[1, 10, 50], actions=[10])
+def tick(inputs: int, actions: int):
+    config = make_config(
+        inputs,
+        actions,
+        llm_actions=[
+            Action(type="speak", value="Hello there!"),
+            Action(type="move", value="wag tail"),
+        ],
+    )
+    # The benchmark never talks to Zenoh
+    with patch("runtime.single_mode.cortex.ConfigProvider", MagicMock()):
+        cortex = CortexRuntime(config, config.name, hot_reload=False)
+
+    async def op():
+        await cortex._tick()
+        # The cortex loop yields between ticks, which lets the actions run
+        await asyncio.sleep(0)
+
+    return op
@@ -0,0 +1,161 @@
+import asyncio
+import time
+import typing as T
+
+from actions.base import ActionConfig, ActionConnector, AgentAction
+from actions.emotion.interface import Emotion
+from actions.move.interface import Move
+from actions.speak.interface import Speak
+from inputs.base import Sensor, SensorConfig
+from inputs.base.loop import FuserInput
+from llm import LLM
+from llm.output_model import Action, CortexOutputModel
+from providers.io_provider import IOProvider
+from runtime.single_mode.config import RuntimeConfig
+
+# Real action interfaces, so prompts and schemas are built as in production
+_INTERFACES = [("speak", Speak), ("move", Move), ("emotion", Emotion)]
+
+
+class FakeInput(Sensor[str]):
+    """
+    Input with a fixed buffer, formatted like the real plugins.
+    """
+
+    def __init__(self, index: int, text: str = "A person is waving at you."):
+        super().__init__(SensorConfig())
+        self.descriptor_for_LLM = f"Sensor {index}"
+        self.text = text
+        self.io_provider = IOProvider()
+
+    def formatted_latest_buffer(self) -> T.Optional[str]:
+        self.io_provider.add_input(self.descriptor_for_LLM, self.text, None)
+        return f"""
+INPUT: {self.descriptor_for_LLM}
+// START
+{self.text}
+// END
+"""
+
+
+class BusyInput(FuserInput[int]):
+    """
+    Input that, like a local vision model, computes on the event loop for
+    ``work_ms`` milliseconds every ``period`` seconds.
+    """
+
+    def __init__(self, config: SensorConfig = SensorConfig()):
+        super().__init__(config)
+        self.period = float(getattr(config, "period", 0.25))
+        self.work_ms = float(getattr(config, "work_ms", 50.0))
+        self.frames = 0
+        self.text: T.Optional[str] = None
+        self.io_provider = IOProvider()
+
+    async def _poll(self) -> int:
+        await asyncio.sleep(self.period)
+        end = time.perf_counter() + self.work_ms / 1000
+        while time.perf_counter() < end:
+            pass
+        self.frames += 1
+        return self.frames
+
+    async def raw_to_text(self, raw_input: T.Optional[int]) -> None:
+        if raw_input is not None:
+            self.text = f"Frame {raw_input}: a person is waving at you."
+
+    def buffer_changed(self) -> bool:
+        return self.text is not None
+
+    def formatted_latest_buffer(self) -> T.Optional[str]:
+        if self.text is None:
+            return None
+        text, self.text = self.text, None
+        self.io_provider.add_input("BusyInput", text, None)
+        return f"""
+INPUT: Camera
+// START
+{text}
+// END
+"""
+
+
+class NoopConnector(ActionConnector[T.Any]):
+    """
+    Connector that completes immediately, or waits for ``release`` if given.
+    """
+
+    def __init__(self, release: T.Optional[asyncio.Event] = None):
+        super().__init__(ActionConfig())
+        self.release = release
+
+    async def connect(self, input_protocol: T.Any) -> None:
+        if self.release is not None:
+            await self.release.wait()
+
+    def tick(self) -> None:
+        # Short, so the connector threads stop soon after the runtime
+        time.sleep(0.1)
+
+
+class ZeroLatencyLLM(LLM[CortexOutputModel]):
+    """
+    LLM that answers every prompt instantly with a fixed set of actions.
+    """
+
+    def __init__(self, actions: T.List[Action], available_actions: list):
+        super().__init__(available_actions=available_actions)
+        self.output = CortexOutputModel(actions=actions)
+
+    async def ask(
+        self, prompt: str, messages: T.List[T.Dict[str, str]] = []
+    ) -> CortexOutputModel:
+        return self.output
+
+
+def make_actions(
+    count: int, release: T.Optional[asyncio.Event] = None
+) -> T.List[AgentAction]:
+    """
+    Build agent actions cycling through the real speak, move and emotion
+    interfaces, with unique labels.
+    """
+    actions = []
+    for i in range(count):
+        name, interface = _INTERFACES[i % len(_INTERFACES)]
+        actions.append(
+            AgentAction(
+                name=name,
+                llm_label=name if i < len(_INTERFACES) else f"{name}_{i}",
+                interface=interface,
+                connector=NoopConnector(release),
+                exclude_from_prompt=False,
+            )
+        )
+    return actions
+
+
+def make_config(
+    inputs: int,
+    actions: int,
+    llm_actions: T.Optional[T.List[Action]] = None,
+    release: T.Optional[asyncio.Event] = None,
+) -> RuntimeConfig:
+    """
+    Build a runtime config with fake inputs, real action interfaces and a
+    zero-latency LLM.
+    """
+    agent_actions = make_actions(actions, release)
+    return RuntimeConfig(
+        version="v1.0.0",
+        hertz=10,
+        name="benchmark",
+        system_prompt_base="You are a friendly robot dog named Spot. " * 8,
+        system_governance="Here are the laws that govern your actions. " * 8,
+        system_prompt_examples="If a person waves, wave back and say hello. " * 4,
+        agent_inputs=[FakeInput(i) for i in range(inputs)],
+        cortex_llm=ZeroLatencyLLM(llm_actions or [], agent_actions),
+        simulators=[],
+        agent_actions=agent_actions,
+        backgrounds=[],
+    )
@@ -0,0 +1,364 @@
+"""
+Fleet load test: many cortex runtimes in one process.
+
+Each runtime gets its own provider scope, replay mock inputs from
+``tests/integration``, real action interfaces and an ``OpenAILLM`` pointed
+at a local ``StubLLMServer`` with a fixed latency. All of them run their
+input listen loops and cortex loops on one event loop, as the gateway
+would see them. Run ``uv run python -m benchmarks.fleet --help`` for usage.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import typer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from tests.integration.mock_inputs.data_providers.mock_recording_provider import (  # noqa: E402
+    SessionRecording,
+    get_recording_provider,
+    load_recording,
+)
+from tests.integration.mock_inputs.mock_replay_input import (  # noqa: E402
+    MockReplayInput,
+)
+
+from benchmarks.fakes import make_actions  # noqa: E402
+from benchmarks.stub_llm_server import LatencyModel, StubLLMServer  # noqa: E402
+from inputs.base import SensorConfig  # noqa: E402
+from llm import LLMConfig  # noqa: E402
+from llm.plugins.openai_llm import OpenAILLM  # noqa: E402
+from providers.singleton import provider_scope  # noqa: E402
+from runtime.single_mode.config import RuntimeConfig  # noqa: E402
+from runtime.single_mode.cortex import CortexRuntime  # noqa: E402
+
+
+@dataclass
+class FleetResult:
+    """
+    Measurement of one fleet run.
+
+    Parameters
+    ----------
+    runtimes : int
+        Number of runtimes.
+    duration : float
+        Seconds the fleet ran.
+    ticks : int
+        Ticks completed by all runtimes.
+    ticks_per_sec : float
+        Aggregate ticks per second.
+    min_runtime_ticks : int
+        Ticks of the slowest runtime; far below the mean means starvation.
+    p50_ms : float
+        Median tick latency in milliseconds.
+    p95_ms : float
+        95th percentile tick latency in milliseconds.
+    p99_ms : float
+        99th percentile tick latency in milliseconds.
+    max_ms : float
+        Maximum tick latency in milliseconds.
+    llm_requests_per_sec : float
+        Requests the stub LLM server received per second.
+    memory_per_runtime : float
+        Mean memory allocated to build one runtime, in bytes.
+    """
+
+    runtimes: int
+    duration: float
+    ticks: int
+    ticks_per_sec: float
+    min_runtime_ticks: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    llm_requests_per_sec: float
+    memory_per_runtime: float
+
+
+@dataclass
+class _Instance:
+    runtime: CortexRuntime
+    providers: Dict[type, Any]
+    latencies: List[float]
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(q * len(values)) - 1))
+    return values[index]
+
+
+def make_recording(inputs: int, duration: float, period: float) -> SessionRecording:
+    """
+    Build a recording in which every input hands the fuser a new buffer every
+    ``period`` seconds.
+
+    Parameters
+    ----------
+    inputs : int
+        Number of recorded inputs, named ``Sensor 0`` and up.
+    duration : float
+        Seconds of recording.
+    period : float
+        Seconds between the buffers of an input.
+
+    Returns
+    -------
+    SessionRecording
+        The recording, for timed replay by ``MockReplayInput``.
+    """
+    events = []
+    for tick in range(int(duration / period) + 1):
+        for i in range(inputs):
+            name = f"Sensor {i}"
+            text = f"Frame {tick}: a person is waving at you."
+            events.append(
+                {
+                    "kind": "buffer",
+                    "t": tick * period,
+                    "input": name,
+                    "tick": tick,
+                    "text": f"\nINPUT: {name}\n// START\n{text}\n// END\n",
+                    "io_inputs": {name: text},
+                }
+            )
+    return SessionRecording(meta={"name": "fleet"}, events=events)
+
+
+def build_fleet(
+    runtimes: int, inputs: int, actions: int, hertz: float, base_url: str
+) -> List[_Instance]:
+    """
+    Build the runtimes, each in its own provider scope.
+
+    Parameters
+    ----------
+    runtimes : int
+        Number of runtimes.
+    inputs : int
+        Replay inputs per runtime.
+    actions : int
+        Actions per runtime.
+    hertz : float
+        Tick rate of each runtime.
+    base_url : str
+        Base URL of the stub LLM server.
+
+    Returns
+    -------
+    List[_Instance]
+        The runtimes with their providers.
+    """
+    fleet = []
+    # The benchmark never talks to Zenoh
+    with patch("runtime.single_mode.cortex.ConfigProvider", MagicMock()):
+        for i in range(runtimes):
+            with provider_scope() as providers:
+                agent_actions = make_actions(actions)
+                config = RuntimeConfig(
+                    version="v1.0.0",
+                    hertz=hertz,
+                    name=f"fleet-{i}",
+                    system_prompt_base="You are a friendly robot dog named Spot. " * 8,
+                    system_governance="Here are the laws that govern your actions. "
+                    * 8,
+                    system_prompt_examples="If a person waves, wave back and say "
+                    "hello. " * 4,
+                    agent_inputs=[
+                        MockReplayInput(SensorConfig(input_name=f"Sensor {j}"))
+                        for j in range(inputs)
+                    ],
+                    cortex_llm=OpenAILLM(
+                        config=LLMConfig(
+                            base_url=base_url, api_key="fleet", model="stub"
+                        ),
+                        available_actions=agent_actions,
+                    ),
+                    simulators=[],
+                    agent_actions=agent_actions,
+                    backgrounds=[],
+                )
+                runtime = CortexRuntime(config, config.name, hot_reload=False)
+            fleet.append(_Instance(runtime, providers, []))
+    return fleet
+
+
+async def _start(instance: _Instance) -> None:
+    """Start the input listeners and the cortex loop of one runtime."""
+    runtime = instance.runtime
+    tick = runtime._tick
+
+    async def timed_tick() -> None:
+        start = time.perf_counter()
+        await tick()
+        instance.latencies.append(time.perf_counter() - start)
+
+    runtime._tick = timed_tick  # type: ignore[method-assign]
+    with provider_scope(instance.providers):
+        await runtime._start_orchestrators()
+        runtime.cortex_loop_task = asyncio.create_task(runtime._run_cortex_loop())
+
+
+async def _stop(instance: _Instance) -> None:
+    """Stop the tasks, action threads and LLM client of one runtime."""
+    runtime = instance.runtime
+    with provider_scope(instance.providers):
+        await runtime._cleanup_tasks()
+        runtime.action_orchestrator.stop()
+        await runtime.config.cortex_llm._client.close()
+
+
+async def run_fleet(
+    runtimes: int = 10,
+    duration: float = 5.0,
+    hertz: float = 10.0,
+    inputs: int = 5,
+    actions: int = 5,
+    llm_latency: float = 0.1,
+    input_period: float = 0.1,
+) -> FleetResult:
+    """
+    Run a fleet of runtimes concurrently and measure it.
+
+    Parameters
+    ----------
+    runtimes : int
+        Number of runtimes.
+    duration : float
+        Seconds to run.
+    hertz : float
+        Tick rate of each runtime.
+    inputs : int
+        Replay inputs per runtime.
+    actions : int
+        Actions per runtime.
+    llm_latency : float
+        Seconds the stub LLM server takes to answer.
+    input_period : float
+        Seconds between the buffers of each input.
+
+    Returns
+    -------
+    FleetResult
+        Throughput, tick latency and memory of the fleet.
+    """
+    server = StubLLMServer(latency=LatencyModel(mean=llm_latency))
+    base_url = await server.start()
+    # The benchmark never talks to Zenoh, which the avatar state of the LLM uses
+    avatar = patch("providers.avatar_llm_state_provider.AvatarProvider", MagicMock())
+    avatar.start()
+    try:
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        fleet = build_fleet(runtimes, inputs, actions, hertz, base_url)
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        load_recording(make_recording(inputs, duration, input_period))
+        get_recording_provider().start_clock()
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for instance in fleet:
+            await _start(instance)
+        await asyncio.sleep(duration)
+        elapsed = loop.time() - start
+        requests = server.stats["requests"]
+        for instance in fleet:
+            await _stop(instance)
+    finally:
+        avatar.stop()
+        get_recording_provider().reset()
+        await server.stop()
+
+    latencies = sorted(t for instance in fleet for t in instance.latencies)
+    return FleetResult(
+        runtimes=runtimes,
+        duration=elapsed,
+        ticks=len(latencies),
+        ticks_per_sec=len(latencies) / elapsed if elapsed > 0 else 0.0,
+        min_runtime_ticks=min((len(i.latencies) for i in fleet), default=0),
+        p50_ms=1000 * _percentile(latencies, 0.50),
+        p95_ms=1000 * _percentile(latencies, 0.95),
+        p99_ms=1000 * _percentile(latencies, 0.99),
+        max_ms=1000 * (latencies[-1] if latencies else 0.0),
+        llm_requests_per_sec=requests / elapsed if elapsed > 0 else 0.0,
+        memory_per_runtime=(after - before) / runtimes if runtimes else 0.0,
+    )
+
+
+def format_fleet(result: FleetResult) -> str:
+    """
+    Format a fleet result as text.
+
+    Parameters
+    ----------
+    result : FleetResult
+        The result.
+
+    Returns
+    -------
+    str
+        The report.
+    """
+    return "\n".join(
+        [
+            f"runtimes            {result.runtimes}",
+            f"duration s          {result.duration:.2f}",
+            f"ticks               {result.ticks}",
+            f"ticks/s             {result.ticks_per_sec:.1f}",
+            f"min runtime ticks   {result.min_runtime_ticks}",
+            f"tick p50 ms         {result.p50_ms:.2f}",
+            f"tick p95 ms         {result.p95_ms:.2f}",
+            f"tick p99 ms         {result.p99_ms:.2f}",
+            f"tick max ms         {result.max_ms:.2f}",
+            f"LLM requests/s      {result.llm_requests_per_sec:.1f}",
+            f"memory/runtime KiB  {result.memory_per_runtime / 1024:.1f}",
+        ]
+    )
+
+
+app = typer.Typer()
+
+
+@app.command()
+def main(
+    runtimes: int = typer.Option(10, help="Number of runtimes."),
+    duration: float = typer.Option(5.0, help="Seconds to run."),
+    hertz: float = typer.Option(10.0, help="Tick rate of each runtime."),
+    inputs: int = typer.Option(5, help="Replay inputs per runtime."),
+    actions: int = typer.Option(5, help="Actions per runtime."),
+    llm_latency: float = typer.Option(
+        0.1, help="Seconds the stub LLM server takes to answer."
+    ),
+    input_period: float = typer.Option(
+        0.1, help="Seconds between the buffers of each input."
+    ),
+) -> None:
+    """
+    Run many cortex runtimes in one process and report aggregate ticks/s,
+    tick latency percentiles and memory per runtime.
+    """
+    # Keep per-tick logging out of the measurements
+    logging.disable(logging.CRITICAL)
+
+    result = asyncio.run(
+        run_fleet(runtimes, duration, hertz, inputs, actions, llm_latency, input_period)
+    )
+    print(format_fleet(result))
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,380 @@
+import asyncio
+import gc
+import inspect
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+
+
+@dataclass
+class Benchmark:
+    """
+    A registered benchmark.
+
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark, including its parameters, e.g.
+        ``fuser.fuse[inputs=10,actions=10]``.
+    setup : Callable
+        Factory returning the operation to measure. Either may be async.
+    params : Dict[str, Any]
+        Parameters passed to the factory.
+    """
+
+    name: str
+    setup: Callable[..., Any]
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Measurement of one benchmark.
+
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark.
+    ops_per_sec : float
+        Operations per second in the fastest round.
+    mean_us : float
+        Mean time per operation in microseconds, over all rounds.
+    allocated_blocks : float
+        Memory blocks still allocated per operation after it returned; a
+        growing value means the operation retains state.
+    peak_bytes : float
+        Peak traced memory of a single operation, in bytes.
+    ops : int
+        Total number of operations timed.
+    """
+
+    name: str
+    ops_per_sec: float
+    mean_us: float
+    allocated_blocks: float
+    peak_bytes: float
+    ops: int
+
+
+_REGISTRY: List[Benchmark] = []
+
+
+def benchmark(name: str, **param_grid: List[Any]):
+    """
+    Register a benchmark factory.
+
+    The factory is called once per combination of parameters and returns the
+    operation to time. Factories and operations may be coroutine functions;
+    they run on one event loop per benchmark.
+
+    Parameters
+    ----------
+    name : str
+        Base name of the benchmark.
+    **param_grid : List[Any]
+        Values per factory parameter; every combination is registered.
+    """
+
+    def decorator(factory: Callable[..., Any]) -> Callable[..., Any]:
+        keys = list(param_grid)
+        for values in itertools.product(*(param_grid[k] for k in keys)):
+            params = dict(zip(keys, values))
+            label = ",".join(f"{k}={v}" for k, v in params.items())
+            full_name = f"{name}[{label}]" if label else name
+            _REGISTRY.append(Benchmark(full_name, factory, params))
+        return factory
+
+    return decorator
+
+
+def registered(pattern: Optional[str] = None) -> List[Benchmark]:
+    """
+    Get the registered benchmarks.
+
+    Parameters
+    ----------
+    pattern : str, optional
+        Only return benchmarks whose name contains this string.
+
+    Returns
+    -------
+    List[Benchmark]
+        The benchmarks, in registration order.
+    """
+    return [b for b in _REGISTRY if pattern is None or pattern in b.name]
+
+
+def _runner(loop: asyncio.AbstractEventLoop, op: Callable[[], Any]):
+    if inspect.iscoroutinefunction(op):
+
+        async def repeat(n: int):
+            for _ in range(n):
+                await op()
+
+        return lambda n: loop.run_until_complete(repeat(n))
+
+    def repeat_sync(n: int):
+        for _ in range(n):
+            op()
+
+    return repeat_sync
+
+
+def run_benchmark(
+    bench: Benchmark, min_time: float = 0.2, rounds: int = 5
+) -> BenchmarkResult:
+    """
+    Time a benchmark and count its allocations.
+
+    The number of operations per round is calibrated so that a round takes
+    at least ``min_time`` seconds. Allocations are measured in a separate
+    pass with tracemalloc, so they do not distort the timings.
+
+    Parameters
+    ----------
+    bench : Benchmark
+        The benchmark to run.
+    min_time : float
+        Minimum duration of a timed round in seconds.
+    rounds : int
+        Number of timed rounds.
+
+    Returns
+    -------
+    BenchmarkResult
+        The measurement.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        op = bench.setup(**bench.params)
+        if inspect.isawaitable(op):
+            op = loop.run_until_complete(op)
+        repeat = _runner(loop, op)
+
+        # Warm up and calibrate
+        n = 1
+        while True:
+            start = time.perf_counter()
+            repeat(n)
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time or n >= 1 << 20:
+                break
+            scale = min(10.0, min_time / elapsed) if elapsed > 0 else 10.0
+            n = min(1 << 20, max(n * 2, int(n * scale)))
+
+        best = float("inf")
+        total_time = 0.0
+        for _ in range(rounds):
+            gc.collect()
+            start = time.perf_counter()
+            repeat(n)
+            elapsed = time.perf_counter() - start
+            best = min(best, elapsed)
+            total_time += elapsed
+
+        alloc_ops = min(n, 100)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            base, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            repeat(1)
+            _, peak = tracemalloc.get_traced_memory()
+
+            gc.collect()
+            blocks = sys.getallocatedblocks()
+            repeat(alloc_ops)
+            gc.collect()
+            retained = sys.getallocatedblocks() - blocks
+        finally:
+            tracemalloc.stop()
+    finally:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+        asyncio.set_event_loop(None)
+
+    return BenchmarkResult(
+        name=bench.name,
+        ops_per_sec=n / best,
+        mean_us=total_time / (n * rounds) * 1e6,
+        allocated_blocks=retained / alloc_ops,
+        peak_bytes=float(peak - base),
+        ops=n * rounds,
+    )
+
+
+def save_baseline(results: List[BenchmarkResult], path: str) -> None:
+    """
+    Save results as a baseline.
+
+    Parameters
+    ----------
+    results : List[BenchmarkResult]
+        The results to save.
+    path : str
+        Destination JSON file.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    data = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "created": time.time(),
+        "results": [asdict(r) for r in results],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, BenchmarkResult]:
+    """
+    Load a baseline saved by ``save_baseline``.
+
+    Parameters
+    ----------
+    path : str
+        The baseline file.
+
+    Returns
+    -------
+    Dict[str, BenchmarkResult]
+        Results by benchmark name.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {r["name"]: BenchmarkResult(**r) for r in data["results"]}
+
+
+@dataclass
+class Comparison:
+    """
+    A result compared with its baseline.
+
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark.
+    speed_change : float
+        Relative change in ops/s; negative is slower.
+    peak_change : float
+        Relative change in peak bytes per operation; positive is more.
+    regressed : bool
+        Whether either change exceeds the threshold.
+    """
+
+    name: str
+    speed_change: float
+    peak_change: float
+    regressed: bool
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    threshold: float = 0.15,
+) -> List[Comparison]:
+    """
+    Compare results with a baseline.
+
+    A benchmark regresses when its ops/s drop, or its peak memory grows, by
+    more than ``threshold``. Benchmarks missing from the baseline are skipped.
+
+    Parameters
+    ----------
+    results : List[BenchmarkResult]
+        The new results.
+    baseline : Dict[str, BenchmarkResult]
+        The baseline results by name.
+    threshold : float
+        Allowed relative change.
+
+    Returns
+    -------
+    List[Comparison]
+        One comparison per benchmark present in both.
+    """
+    comparisons = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+
+        speed_change = result.ops_per_sec / base.ops_per_sec - 1.0
+        # Ignore peak changes below 1 KiB, which are allocator noise
+        if abs(result.peak_bytes - base.peak_bytes) < 1024:
+            peak_change = 0.0
+        else:
+            peak_change = result.peak_bytes / max(base.peak_bytes, 1.0) - 1.0
+
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                speed_change=speed_change,
+                peak_change=peak_change,
+                regressed=speed_change < -threshold or peak_change > threshold,
+            )
+        )
+    return comparisons
+
+
+def format_results(
+    results: List[BenchmarkResult], comparisons: Optional[List[Comparison]] = None
+) -> str:
+    """
+    Format results, and optionally their comparison, as a text table.
+
+    Parameters
+    ----------
+    results : List[BenchmarkResult]
+        The results.
+    comparisons : List[Comparison], optional
+        Comparisons with a baseline.
+
+    Returns
+    -------
+    str
+        The table.
+    """
+    by_name = {c.name: c for c in comparisons or []}
+    width = max([len("benchmark")] + [len(r.name) for r in results])
+
+    header = (
+        f"{'benchmark':<{width}} {'ops/s':>12} {'mean us':>10} "
+        f"{'blocks/op':>10} {'peak B':>10}"
+    )
+    if comparisons is not None:
+        header += f" {'speed':>8} {'peak':>8}"
+    lines = [header]
+
+    for r in results:
+        line = (
+            f"{r.name:<{width}} {r.ops_per_sec:>12.1f} {r.mean_us:>10.2f} "
+            f"{r.allocated_blocks:>10.2f} {r.peak_bytes:>10.0f}"
+        )
+        c = by_name.get(r.name)
+        if c is not None:
+            line += f" {c.speed_change:>+8.1%} {c.peak_change:>+8.1%}"
+            if c.regressed:
+                line += "  REGRESSED"
+        lines.append(line)
+
+    return "\n".join(lines)
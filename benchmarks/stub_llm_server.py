@@ -0,0 +1,499 @@
+"""
+Local OpenAI-compatible chat completions server for offline benchmarks.
+
+The server answers ``POST .../chat/completions`` with deterministic tool
+calls, optionally streamed, after a configurable latency, and can inject
+errors. Point an LLM plugin at it by setting ``base_url`` in its config, e.g.
+``http://127.0.0.1:8000/v1``. Run ``uv run python -m benchmarks.stub_llm_server
+--help`` for usage.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import random
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence
+
+import json5
+import typer
+from aiohttp import web
+
+
+@dataclass
+class LatencyModel:
+    """
+    Distribution of the time to the first token.
+
+    Parameters
+    ----------
+    distribution : str
+        One of "fixed", "uniform", "normal" or "lognormal".
+    mean : float
+        Mean latency in seconds; the median for "lognormal".
+    spread : float
+        Half-width for "uniform", standard deviation for "normal", and
+        sigma of the underlying normal for "lognormal".
+    """
+
+    distribution: str = "fixed"
+    mean: float = 0.0
+    spread: float = 0.0
+
+    def __post_init__(self):
+        if self.distribution not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency distribution {self.distribution}")
+
+    def sample(self, rng: random.Random) -> float:
+        """
+        Draw a latency.
+
+        Parameters
+        ----------
+        rng : random.Random
+            Source of randomness.
+
+        Returns
+        -------
+        float
+            Latency in seconds, never negative.
+        """
+        if self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.spread, self.mean + self.spread)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean, self.spread)
+        elif self.distribution == "lognormal":
+            value = self.mean * rng.lognormvariate(0.0, self.spread)
+        else:
+            value = self.mean
+        return max(0.0, value)
+
+
+@dataclass
+class StubResponse:
+    """
+    A scripted assistant message.
+
+    Parameters
+    ----------
+    content : str, optional
+        Text of the message.
+    tool_calls : List[Dict[str, Any]]
+        Calls as ``{"name": ..., "arguments": {...}}``.
+    """
+
+    content: Optional[str] = None
+    tool_calls: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def script_from_test_case(test_case: Dict[str, Any]) -> List[StubResponse]:
+    """
+    Script responses matching the expected output of an integration test
+    case, cycling through its expected movements and emotions.
+
+    Parameters
+    ----------
+    test_case : Dict[str, Any]
+        A test case from ``tests/integration/data/test_cases``.
+
+    Returns
+    -------
+    List[StubResponse]
+        One response per expected movement or emotion.
+    """
+    expected = test_case.get("expected", {})
+
+    def options(key: str) -> List[str]:
+        value = expected.get(key)
+        if value is None:
+            return []
+        return value if isinstance(value, list) else [value]
+
+    movements = options("movement")
+    emotions = options("emotion")
+    keywords = expected.get("keywords") or []
+
+    responses = []
+    for i in range(max(len(movements), len(emotions), 1)):
+        calls: List[Dict[str, Any]] = []
+        if movements:
+            calls.append(
+                {"name": "move", "arguments": {"action": movements[i % len(movements)]}}
+            )
+        if keywords:
+            calls.append(
+                {
+                    "name": "speak",
+                    "arguments": {"action": f"I see a {keywords[i % len(keywords)]}!"},
+                }
+            )
+        if emotions:
+            calls.append(
+                {
+                    "name": "emotion",
+                    "arguments": {"action": emotions[i % len(emotions)]},
+                }
+            )
+        responses.append(StubResponse(tool_calls=calls))
+    return responses
+
+
+def load_script(path: str) -> List[StubResponse]:
+    """
+    Load scripted responses from a JSON5 file.
+
+    The file is either a list of responses, each with ``content`` and/or
+    ``tool_calls``, or an integration test case with an ``expected`` section.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    List[StubResponse]
+        The responses, served in order and then repeated.
+    """
+    with open(path, "r") as f:
+        data = json5.load(f)
+    if isinstance(data, dict):
+        return script_from_test_case(data)
+    return [
+        StubResponse(content=item.get("content"), tool_calls=item.get("tool_calls", []))
+        for item in data
+    ]
+
+
+def _default_arguments(tool: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments for a tool: the first enum value of each property, or a stub."""
+    properties = tool.get("function", {}).get("parameters", {}).get("properties", {})
+    arguments: Dict[str, Any] = {}
+    for name, schema in properties.items():
+        if schema.get("enum"):
+            arguments[name] = schema["enum"][0]
+        elif schema.get("type") in ("integer", "number"):
+            arguments[name] = 0
+        elif schema.get("type") == "boolean":
+            arguments[name] = False
+        else:
+            arguments[name] = "Hello from the stub LLM."
+    return arguments
+
+
+def _count_tokens(text: str) -> int:
+    """Rough token count, about four characters per token."""
+    return max(1, len(text) // 4) if text else 0
+
+
+def _chunks(text: str, size: int = 4) -> List[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class StubLLMServer:
+    """
+    OpenAI-compatible chat completions server with deterministic answers.
+
+    Requests are answered from ``script`` in order, repeating it; calls to
+    tools the request does not offer are left out. Without a script, every
+    offered tool is called with the first enum value of each parameter. The
+    first token is sent after a latency drawn from ``latency``, and the rest
+    at ``tokens_per_sec``; a fraction ``error_rate`` of the requests fail
+    with one of ``error_statuses`` instead. Randomness is seeded, so runs
+    are reproducible.
+
+    Parameters
+    ----------
+    script : Sequence[StubResponse], optional
+        Responses served in order.
+    latency : LatencyModel, optional
+        Time to the first token.
+    tokens_per_sec : float
+        Output token rate; 0 sends all tokens at once.
+    error_rate : float
+        Fraction of requests that fail.
+    error_statuses : Sequence[int]
+        HTTP statuses of the injected errors, chosen at random.
+    seed : int
+        Seed of the latency and error draws.
+    """
+
+    def __init__(
+        self,
+        script: Optional[Sequence[StubResponse]] = None,
+        latency: Optional[LatencyModel] = None,
+        tokens_per_sec: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500,),
+        seed: int = 0,
+    ):
+        self.script = list(script or [])
+        self.latency = latency or LatencyModel()
+        self.tokens_per_sec = tokens_per_sec
+        self.error_rate = error_rate
+        self.error_statuses = list(error_statuses)
+
+        self._rng = random.Random(seed)
+        self._script_iter: Iterator[StubResponse] = itertools.cycle(self.script)
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url: Optional[str] = None
+
+        self.requests: Deque[Dict[str, Any]] = deque(maxlen=100)
+        self._counts = {"requests": 0, "streamed": 0, "errors": 0, "tokens": 0}
+
+        self.app = web.Application()
+        self.app.router.add_post("/chat/completions", self._handle)
+        self.app.router.add_post("/{prefix:.+}/chat/completions", self._handle)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the server counters.
+
+        Returns
+        -------
+        Dict[str, int]
+            Requests, streamed requests, injected errors and tokens sent.
+        """
+        return dict(self._counts)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Start serving on the running event loop.
+
+        Parameters
+        ----------
+        host : str
+            Address to bind.
+        port : int
+            Port to bind; 0 picks a free one.
+
+        Returns
+        -------
+        str
+            Base URL to configure in the LLM plugins.
+        """
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        server = getattr(site, "_server", None)
+        if server is not None and server.sockets:
+            port = server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{port}/v1"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """
+        Stop serving.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _next_message(self, tools: List[Dict[str, Any]]) -> StubResponse:
+        offered = {t.get("function", {}).get("name") for t in tools}
+        if self.script:
+            scripted = next(self._script_iter)
+            return StubResponse(
+                content=scripted.content,
+                tool_calls=[
+                    c for c in scripted.tool_calls if not tools or c["name"] in offered
+                ],
+            )
+        return StubResponse(
+            tool_calls=[
+                {"name": t["function"]["name"], "arguments": _default_arguments(t)}
+                for t in tools
+                if t.get("function", {}).get("name")
+            ]
+        )
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        try:
+            body = await request.json()
+        except ValueError:
+            return self._error(400, "Request body is not JSON")
+        self.requests.append(body)
+        self._counts["requests"] += 1
+
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self._counts["errors"] += 1
+            status = self._rng.choice(self.error_statuses)
+            return self._error(status, f"Injected error {status}")
+
+        message = self._next_message(body.get("tools") or [])
+        tool_calls = [
+            {
+                "id": f"call_{uuid.uuid4().hex[:24]}",
+                "type": "function",
+                "function": {
+                    "name": call["name"],
+                    "arguments": json.dumps(call["arguments"]),
+                },
+            }
+            for call in message.tool_calls
+        ]
+        prompt_tokens = sum(
+            _count_tokens(str(m.get("content") or "")) for m in body.get("messages", [])
+        )
+        completion_tokens = _count_tokens(message.content or "") + sum(
+            _count_tokens(tc["function"]["arguments"]) for tc in tool_calls
+        )
+        self._counts["tokens"] += completion_tokens
+
+        await asyncio.sleep(self.latency.sample(self._rng))
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        model = body.get("model", "stub")
+        if body.get("stream"):
+            self._counts["streamed"] += 1
+            return await self._stream(
+                request, completion_id, model, message.content, tool_calls
+            )
+
+        if self.tokens_per_sec > 0:
+            await asyncio.sleep(completion_tokens / self.tokens_per_sec)
+        return web.json_response(
+            {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {
+                            "role": "assistant",
+                            "content": message.content,
+                            "tool_calls": tool_calls or None,
+                        },
+                        "finish_reason": "tool_calls" if tool_calls else "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            }
+        )
+
+    async def _stream(
+        self,
+        request: web.Request,
+        completion_id: str,
+        model: str,
+        content: Optional[str],
+        tool_calls: List[Dict[str, Any]],
+    ) -> web.StreamResponse:
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        await response.prepare(request)
+        created = int(time.time())
+        delay = 1.0 / self.tokens_per_sec if self.tokens_per_sec > 0 else 0.0
+
+        async def send(delta: Dict[str, Any], finish_reason: Optional[str] = None):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+
+        async def pace():
+            if delay:
+                await asyncio.sleep(delay)
+
+        await send({"role": "assistant", "content": ""})
+        for piece in _chunks(content or ""):
+            await pace()
+            await send({"content": piece})
+        for index, call in enumerate(tool_calls):
+            await send(
+                {
+                    "tool_calls": [
+                        {
+                            "index": index,
+                            "id": call["id"],
+                            "type": "function",
+                            "function": {
+                                "name": call["function"]["name"],
+                                "arguments": "",
+                            },
+                        }
+                    ]
+                }
+            )
+            for piece in _chunks(call["function"]["arguments"]):
+                await pace()
+                await send(
+                    {"tool_calls": [{"index": index, "function": {"arguments": piece}}]}
+                )
+        await send({}, "tool_calls" if tool_calls else "stop")
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    @staticmethod
+    def _error(status: int, message: str) -> web.Response:
+        return web.json_response(
+            {
+                "error": {
+                    "message": message,
+                    "type": "server_error" if status >= 500 else "invalid_request",
+                    "code": status,
+                }
+            },
+            status=status,
+        )
+
+
+app = typer.Typer()
+
+
+@app.command()
+def main(
+    host: str = typer.Option("127.0.0.1", help="Address to bind."),
+    port: int = typer.Option(8000, help="Port to bind."),
+    script: Optional[str] = typer.Option(
+        None, help="JSON5 file of scripted responses or an integration test case."
+    ),
+    distribution: str = typer.Option(
+        "fixed", help="Latency distribution: fixed, uniform, normal or lognormal."
+    ),
+    latency: float = typer.Option(0.0, help="Mean time to first token in seconds."),
+    spread: float = typer.Option(0.0, help="Spread of the latency distribution."),
+    tokens_per_sec: float = typer.Option(
+        0.0, help="Output token rate; 0 sends all tokens at once."
+    ),
+    error_rate: float = typer.Option(0.0, help="Fraction of requests that fail."),
+    seed: int = typer.Option(0, help="Seed of the latency and error draws."),
+) -> None:
+    """
+    Serve OpenAI-compatible chat completions with scripted tool calls.
+    """
+    logging.basicConfig(level=logging.INFO)
+    server = StubLLMServer(
+        script=load_script(script) if script else None,
+        latency=LatencyModel(distribution, latency, spread),
+        tokens_per_sec=tokens_per_sec,
+        error_rate=error_rate,
+        error_statuses=(429, 500, 503),
+        seed=seed,
+    )
+    logging.info(f"Stub LLM server on http://{host}:{port}/v1")
+    web.run_app(server.app, host=host, port=port, print=None, access_log=None)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,175 @@
+"""
+Tick jitter with a CPU-heavy input in the cortex process and in a worker.
+
+Runs a cortex runtime with a ``BusyInput``, which computes on the event loop
+for ``--work-ms`` every ``--period`` seconds as a local vision model does,
+once in the cortex process and once placed into a worker process by a
+``Topology``. Run ``uv run python -m benchmarks.topology --help`` for usage.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import typer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from benchmarks.fakes import BusyInput, make_config  # noqa: E402
+from benchmarks.fleet import _percentile  # noqa: E402
+from inputs.base import SensorConfig  # noqa: E402
+from llm.output_model import Action  # noqa: E402
+from providers.singleton import provider_scope  # noqa: E402
+from runtime.single_mode.cortex import CortexRuntime  # noqa: E402
+from runtime.topology import Topology  # noqa: E402
+
+_LLM_ACTIONS = [Action(type="speak", value="Hello there!")]
+
+
+@dataclass
+class JitterResult:
+    """
+    Measurement of one run.
+
+    Parameters
+    ----------
+    placement : str
+        Where the busy input ran.
+    ticks : int
+        Ticks completed.
+    frames : int
+        Input texts that reached a prompt.
+    p50_ms : float
+        Median lateness of a tick start in milliseconds.
+    p95_ms : float
+        95th percentile lateness in milliseconds.
+    p99_ms : float
+        99th percentile lateness in milliseconds.
+    max_ms : float
+        Maximum lateness in milliseconds.
+    """
+
+    placement: str
+    ticks: int
+    frames: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+async def run_jitter(
+    placement: str, duration: float, hertz: float, period: float, work_ms: float
+) -> JitterResult:
+    """
+    Run a cortex runtime with a busy input and measure when its ticks start.
+
+    A tick is late by the time between the end of the previous tick plus the
+    tick period and its start.
+
+    Parameters
+    ----------
+    placement : str
+        ``"cortex"`` to run the busy input in the cortex process, ``"worker"``
+        to run it in a worker process.
+    duration : float
+        Seconds to run.
+    hertz : float
+        Tick rate of the runtime.
+    period : float
+        Seconds between the frames of the busy input.
+    work_ms : float
+        Milliseconds of computation per frame.
+
+    Returns
+    -------
+    JitterResult
+        Tick lateness percentiles.
+    """
+    input_config = {"period": period, "work_ms": work_ms}
+    with provider_scope():
+        config = make_config(inputs=0, actions=3, llm_actions=_LLM_ACTIONS)
+        config.hertz = hertz
+        if placement == "worker":
+            config.topology = Topology.from_config(
+                {"processes": {"perception": {"inputs": ["BusyInput"]}}}
+            )
+            remote_input = config.topology.place_input("BusyInput", input_config)
+            config.topology.workers[0].inputs[0]["module"] = "benchmarks.fakes"
+            config.agent_inputs = [remote_input]
+        else:
+            config.agent_inputs = [BusyInput(SensorConfig(**input_config))]
+
+        with patch("runtime.single_mode.cortex.ConfigProvider", MagicMock()):
+            runtime = CortexRuntime(config, config.name, hot_reload=False)
+
+        lateness: List[float] = []
+        frames = 0
+        tick = runtime._tick
+        last_end = None
+
+        async def timed_tick() -> None:
+            nonlocal last_end, frames
+            start = time.perf_counter()
+            if last_end is not None:
+                lateness.append(max(0.0, start - last_end - 1 / hertz))
+            frames += int(config.agent_inputs[0].buffer_changed())
+            await tick()
+            last_end = time.perf_counter()
+
+        runtime._tick = timed_tick  # type: ignore[method-assign]
+        await runtime._start_orchestrators()
+        runtime.cortex_loop_task = asyncio.create_task(runtime._run_cortex_loop())
+        await asyncio.sleep(duration)
+        await runtime._cleanup_tasks()
+        runtime.action_orchestrator.stop()
+
+    lateness.sort()
+    return JitterResult(
+        placement=placement,
+        ticks=len(lateness) + 1,
+        frames=frames,
+        p50_ms=1000 * _percentile(lateness, 0.50),
+        p95_ms=1000 * _percentile(lateness, 0.95),
+        p99_ms=1000 * _percentile(lateness, 0.99),
+        max_ms=1000 * (lateness[-1] if lateness else 0.0),
+    )
+
+
+app = typer.Typer()
+
+
+@app.command()
+def main(
+    duration: float = typer.Option(10.0, help="Seconds per placement."),
+    hertz: float = typer.Option(20.0, help="Tick rate of the runtime."),
+    period: float = typer.Option(0.25, help="Seconds between busy input frames."),
+    work_ms: float = typer.Option(80.0, help="Milliseconds of work per frame."),
+) -> None:
+    """
+    Compare tick lateness with the busy input in the cortex process and in a
+    worker process.
+    """
+    # Keep per-tick logging out of the measurements
+    logging.disable(logging.CRITICAL)
+
+    print(
+        f"{'placement':10} {'ticks':>6} {'frames':>6} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for placement in ("cortex", "worker"):
+        result = asyncio.run(run_jitter(placement, duration, hertz, period, work_ms))
+        print(
+            f"{result.placement:10} {result.ticks:6d} {result.frames:6d} "
+            f"{result.p50_ms:8.2f} {result.p95_ms:8.2f} "
+            f"{result.p99_ms:8.2f} {result.max_ms:8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    app()
@@ -1,11 +1,11 @@
 import logging
 import time
 
-import requests
 from dimo import DIMO
 
 from actions.base import ActionConfig, ActionConnector
 from actions.dimo.interface import TeslaInput
+from providers.http_client_provider import HTTPClientProvider, HTTPResponse
 from providers.io_provider import IOProvider
 
 
@@ -15,6 +15,7 @@ class DIMOTeslaConnector(ActionConnector[TeslaInput]):
         super().__init__(config)
 
         self.io_provider = IOProvider()
+        self.http = HTTPClientProvider()
 
         self.base_url = "https://devices-api.dimo.zone/v1/vehicle"
 
@@ -56,6 +57,11 @@ class DIMOTeslaConnector(ActionConnector[TeslaInput]):
                 )
                 self.vehicle_jwt = None
 
+    async def _post(self, url: str) -> HTTPResponse:
+        return await self.http.post(
+            url, headers={"Authorization": f"Bearer {self.vehicle_jwt}"}
+        )
+
     async def connect(self, output_interface: TeslaInput) -> None:
         logging.info(f"DIMOTeslaConnector: {output_interface.action}")
         if output_interface.action != self.previouse_output:
@@ -84,9 +90,7 @@ class DIMOTeslaConnector(ActionConnector[TeslaInput]):
             if self.vehicle_jwt is not None:
                 if output_interface.action == "lock doors":
                     url = f"{self.base_url}/{self.token_id}/commands/doors/lock"
-                    response = requests.post(
-                        url, headers={"Authorization": f"Bearer {self.vehicle_jwt}"}
-                    )
+                    response = await self._post(url)
                     if response.status_code == 200:
                         logging.info("DIMO Tesla: Door locked")
                     else:
@@ -95,9 +99,7 @@ class DIMOTeslaConnector(ActionConnector[TeslaInput]):
                         )
                 elif output_interface.action == "unlock doors":
                     url = f"{self.base_url}/{self.token_id}/commands/doors/unlock"
-                    response = requests.post(
-                        url, headers={"Authorization": f"Bearer {self.vehicle_jwt}"}
-                    )
+                    response = await self._post(url)
                     if response.status_code == 200:
                         logging.info("DIMO Tesla: Door unlocked")
                     else:
@@ -106,9 +108,7 @@ class DIMOTeslaConnector(ActionConnector[TeslaInput]):
                         )
                 elif output_interface.action == "open frunk":
                     url = f"{self.base_url}/{self.token_id}/commands/frunk/open"
-                    response = requests.post(
-                        url, headers={"Authorization": f"Bearer {self.vehicle_jwt}"}
-                    )
+                    response = await self._post(url)
                     if response.status_code == 200:
                         logging.info("DIMO Tesla: Frunk opened")
                     else:
@@ -117,9 +117,7 @@ class DIMOTeslaConnector(ActionConnector[TeslaInput]):
                         )
                 elif output_interface.action == "open trunk":
                     url = f"{self.base_url}/{self.token_id}/commands/trunk/open"
-                    response = requests.post(
-                        url, headers={"Authorization": f"Bearer {self.vehicle_jwt}"}
-                    )
+                    response = await self._post(url)
                     if response.status_code == 200:
                         logging.info("DIMO Tesla: Trunk opened")
                     else:
@@ -40,6 +40,7 @@ class EmergencyAlertElevenLabsTTSConnector(ActionConnector[EmergencyAlertInput])
         voice_id = getattr(self.config, "voice_id", "JBFqnCBsd6RMkjVDRZzb")
         model_id = getattr(self.config, "model_id", "eleven_flash_v2_5")
         output_format = getattr(self.config, "output_format", "mp3_44100_128")
+        cache_dir = getattr(self.config, "cache_dir", None)
 
         # IO Provider
         self.io_provider = IOProvider()
@@ -96,6 +97,7 @@ class EmergencyAlertElevenLabsTTSConnector(ActionConnector[EmergencyAlertInput])
             voice_id=voice_id,
             model_id=model_id,
             output_format=output_format,
+            cache_dir=cache_dir,
         )
         self.tts.start()
 
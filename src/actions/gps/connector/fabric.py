@@ -1,9 +1,8 @@
 import logging
 
-import requests
-
 from actions.base import ActionConfig, ActionConnector
 from actions.gps.interface import GPSAction, GPSInput
+from providers.http_client_provider import HTTPClientError, HTTPClientProvider
 from providers.io_provider import IOProvider
 
 
@@ -14,6 +13,7 @@ class GPSFabricConnector(ActionConnector[GPSInput]):
 
         # Set IO Provider
         self.io_provider = IOProvider()
+        self.http = HTTPClientProvider()
 
         # Set fabric endpoint configuration
         self.fabric_endpoint = getattr(
@@ -28,9 +28,9 @@ class GPSFabricConnector(ActionConnector[GPSInput]):
 
         if output_interface.action == GPSAction.SHARE_LOCATION:
             # Send GPS coordinates to the Fabric network
-            self.send_coordinates()
+            await self.send_coordinates()
 
-    def send_coordinates(self) -> None:
+    async def send_coordinates(self) -> None:
         """
         Send GPS coordinates to the Fabric network.
         """
@@ -48,7 +48,7 @@ class GPSFabricConnector(ActionConnector[GPSInput]):
             return None
 
         try:
-            share_status_response = requests.post(
+            share_status_response = await self.http.post(
                 f"{self.fabric_endpoint}",
                 json={
                     "method": "omp2p_shareStatus",
@@ -66,5 +66,5 @@ class GPSFabricConnector(ActionConnector[GPSInput]):
             else:
                 logging.error("GPSFabricConnector: Failed to share coordinates.")
                 return None
-        except requests.RequestException as e:
+        except (HTTPClientError, ValueError) as e:
             logging.error(f"GPSFabricConnector: Error sending coordinates: {e}")
@@ -0,0 +1,235 @@
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from queue import Empty, Queue
+from typing import Callable, Deque, Dict, Optional
+
+from actions.base import MoveCommand
+from providers.odom_provider import OdomProvider
+
+
+class StepResult(Enum):
+    """
+    Outcome of one control step of a MoveCommand.
+    """
+
+    CONTINUE = "continue"
+    DONE = "done"
+    ABORTED = "aborted"
+
+
+class MotionController:
+    """
+    Closed-loop executor for MoveCommands.
+
+    Commands are queued with ``submit`` and executed one at a time. Each call
+    to ``tick`` waits for a fresh odometry pose, at most ``rate_hz`` times per
+    second, and then runs one step of the connector's control law on the
+    current command. Stepping on every new pose instead of on a fixed sleep
+    lets turns and advances stop as soon as they reach their tolerance.
+
+    ``tick`` is meant to be called from the connector's ``tick``, so the
+    controller runs on the connector thread of the ActionOrchestrator.
+
+    Parameters
+    ----------
+    odom : OdomProvider
+        Source of the robot pose.
+    step : Callable[[MoveCommand], StepResult]
+        Control law; issues one velocity command towards the target.
+    stop : Callable[[], None], optional
+        Stops the robot; called when a command times out.
+    rate_hz : float
+        Maximum number of control steps per second.
+    command_timeout : float, optional
+        Seconds after which a command that has not converged is aborted.
+    odom_timeout : float
+        Seconds to wait for a fresh pose before stepping on the last one.
+    """
+
+    def __init__(
+        self,
+        odom: OdomProvider,
+        step: Callable[[MoveCommand], StepResult],
+        stop: Optional[Callable[[], None]] = None,
+        rate_hz: float = 50.0,
+        command_timeout: Optional[float] = None,
+        odom_timeout: float = 0.5,
+    ):
+        self.odom = odom
+        self._step = step
+        self._stop = stop
+        self.period = 1.0 / rate_hz
+        self.command_timeout = command_timeout
+        self.odom_timeout = odom_timeout
+
+        self._queue: Queue[MoveCommand] = Queue()
+        self._lock = threading.Lock()
+        self._current: Optional[MoveCommand] = None
+        self._started_at = 0.0
+        self._steps = 0
+
+        self._odom_seq = 0
+        self._last_step = 0.0
+
+        self._metrics_lock = threading.Lock()
+        self._step_periods: Deque[float] = deque(maxlen=500)
+        self._odom_ages: Deque[float] = deque(maxlen=500)
+        self._durations: Deque[float] = deque(maxlen=100)
+        self._counts: Dict[str, int] = {
+            "steps": 0,
+            "stale_steps": 0,
+            "completed": 0,
+            "aborted": 0,
+            "timed_out": 0,
+        }
+
+    @property
+    def busy(self) -> bool:
+        """
+        Whether a command is queued or being executed.
+        """
+        with self._lock:
+            return self._current is not None or not self._queue.empty()
+
+    def submit(self, command: MoveCommand) -> None:
+        """
+        Queue a command for execution.
+
+        Parameters
+        ----------
+        command : MoveCommand
+            The command.
+        """
+        self._queue.put(command)
+
+    def clear(self) -> None:
+        """
+        Drop the current command and all queued ones.
+        """
+        with self._lock:
+            self._current = None
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except Empty:
+                    break
+
+    def wait_for_odom(self) -> bool:
+        """
+        Wait for a pose newer than the last one stepped on, but no longer
+        than ``odom_timeout``, and no sooner than one period after the last
+        step.
+
+        Returns
+        -------
+        bool
+            True if a fresh pose arrived.
+        """
+        seq = self.odom.wait_for_update(self._odom_seq, timeout=self.odom_timeout)
+        fresh = seq != self._odom_seq
+        self._odom_seq = seq
+
+        delay = self._last_step + self.period - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+        now = time.monotonic()
+        with self._metrics_lock:
+            if self._last_step:
+                self._step_periods.append(now - self._last_step)
+            self._odom_ages.append(max(0.0, time.time() - self.odom.odom_subscriber_ts))
+            self._counts["steps"] += 1
+            if not fresh:
+                self._counts["stale_steps"] += 1
+        self._last_step = now
+        return fresh
+
+    def tick(self, idle_timeout: float = 0.1) -> None:
+        """
+        Run one control step of the current command.
+
+        Blocks for up to ``idle_timeout`` seconds when there is nothing to
+        do, so it can be called in a tight loop.
+
+        Parameters
+        ----------
+        idle_timeout : float
+            Seconds to wait for a command when idle.
+        """
+        with self._lock:
+            current = self._current
+        if current is None:
+            try:
+                current = self._queue.get(timeout=idle_timeout)
+            except Empty:
+                return
+            with self._lock:
+                self._current = current
+            self._started_at = time.monotonic()
+            self._steps = 0
+            self._odom_seq = self.odom.update_seq
+
+        self.wait_for_odom()
+        result = self._step(current)
+        self._steps += 1
+
+        elapsed = time.monotonic() - self._started_at
+        if result is StepResult.CONTINUE:
+            if self.command_timeout is None or elapsed <= self.command_timeout:
+                return
+            logging.info(
+                f"MotionController: not converging after {elapsed:.2f} s - aborting"
+            )
+            if self._stop:
+                self._stop()
+            self._finish(current, "timed_out", elapsed)
+        elif result is StepResult.DONE:
+            logging.info(
+                f"MotionController: command completed in {elapsed:.2f} s "
+                f"({self._steps} steps)"
+            )
+            self._finish(current, "completed", elapsed)
+        else:
+            self._finish(current, "aborted", elapsed)
+
+    def _finish(self, command: MoveCommand, outcome: str, elapsed: float) -> None:
+        with self._lock:
+            if self._current is command:
+                self._current = None
+        with self._metrics_lock:
+            self._counts[outcome] += 1
+            if outcome == "completed":
+                self._durations.append(elapsed)
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """
+        Get the controller timing metrics.
+
+        Returns
+        -------
+        Dict[str, float]
+            Step and command counts, the mean and maximum control period and
+            odometry age in milliseconds, and the mean and last duration of
+            completed commands in seconds.
+        """
+        with self._metrics_lock:
+            periods = list(self._step_periods)
+            ages = list(self._odom_ages)
+            durations = list(self._durations)
+            metrics: Dict[str, float] = dict(self._counts)
+
+        metrics["period_ms_mean"] = (
+            1000 * sum(periods) / len(periods) if periods else 0.0
+        )
+        metrics["period_ms_max"] = 1000 * max(periods, default=0.0)
+        metrics["odom_age_ms_mean"] = 1000 * sum(ages) / len(ages) if ages else 0.0
+        metrics["odom_age_ms_max"] = 1000 * max(ages, default=0.0)
+        metrics["command_s_mean"] = (
+            sum(durations) / len(durations) if durations else 0.0
+        )
+        metrics["command_s_last"] = durations[-1] if durations else 0.0
+        return metrics
@@ -1,6 +1,7 @@
 import logging
 import threading
 import time
+from typing import List, Optional, Tuple
 
 from actions.base import ActionConfig, ActionConnector
 from actions.move_game_controller.interface import IDLEInput
@@ -17,6 +18,8 @@ except ImportError:
     )
     hid = None
 
+STOP = (0.0, 0.0, 0.0)
+
 
 class Go2GameControllerConnector(ActionConnector[IDLEInput]):
     """
@@ -42,6 +45,18 @@ class Go2GameControllerConnector(ActionConnector[IDLEInput]):
         self.yaw_correction = getattr(config, "yaw_correction", 0.0)
         self.lateral_correction = getattr(config, "lateral_correction", 0.0)
 
+        # Velocity changes are sent as soon as a HID report arrives; the
+        # publisher runs at command_hz to repeat them every keepalive_interval
+        # seconds while moving
+        self.command_hz = getattr(config, "command_hz", 50.0)
+        self.keepalive_interval = getattr(config, "keepalive_interval", 0.2)
+        self.read_timeout_ms = int(getattr(config, "read_timeout_ms", 100))
+        self.reconnect_interval = getattr(config, "reconnect_interval", 1.0)
+        # The publisher stops the robot when tick has not run for this long
+        self.reader_timeout = 2.0 * max(
+            self.reconnect_interval, self.read_timeout_ms / 1000.0
+        )
+
         self.topic = "robot/status/audio"
         self.session = None
         try:
@@ -75,9 +90,6 @@ class Go2GameControllerConnector(ActionConnector[IDLEInput]):
             )
 
         # Pad buttons
-        self.rt_previous = 0
-        self.lt_previous = 0
-        self.d_pad_previous = 0
         self.button_previous = 0
 
         self.lt_value = 0
@@ -85,14 +97,19 @@ class Go2GameControllerConnector(ActionConnector[IDLEInput]):
         self.d_pad_value = 0
         self.button_value = 0
 
-        self.RTLT_moving = False
-
         unitree_ethernet = getattr(config, "unitree_ethernet", "")
         self.odom = OdomProvider(channel=unitree_ethernet)
         self.unitree_state_provider = UnitreeGo2StateProvider()
 
         self.thread_lock = threading.Lock()
 
+        # Velocity target, written by the reader and sent by the publisher
+        self._command_lock = threading.Lock()
+        self._command_event = threading.Event()
+        self._target: Tuple[float, float, float] = STOP
+        self._last_tick = time.monotonic()
+        self._publisher_thread: Optional[threading.Thread] = None
+
     def zenoh_audio_message(self, data):
         self.audio_status = AudioStatus.deserialize(data.payload.to_bytes())
 
@@ -238,13 +255,13 @@ class Go2GameControllerConnector(ActionConnector[IDLEInput]):
         -------
         None
         """
-        logging.info(f"GAME _move_robot: vx={vx}, vy={vy}, vturn={vturn}")
+        logging.debug(f"GAME _move_robot: vx={vx}, vy={vy}, vturn={vturn}")
 
         if not self.sport_client:
             return
 
         if self.odom.position["body_attitude"] is not RobotState.STANDING:
-            logging.info("self.sport_client.Move blocked - dog is sitting")
+            logging.debug("self.sport_client.Move blocked - dog is sitting")
             return
 
         if self.unitree_state_provider.state == "jointLock":
@@ -252,235 +269,206 @@ class Go2GameControllerConnector(ActionConnector[IDLEInput]):
             self.sport_client.Move(0.05, 0, 0)
 
         try:
-            logging.info(f"self.sport_client.Move: vx={vx}, vy={vy}, vturn={vturn}")
+            logging.debug(f"self.sport_client.Move: vx={vx}, vy={vy}, vturn={vturn}")
             self.sport_client.Move(vx, vy, vturn)
         except Exception as e:
             logging.error(f"Error moving robot: {e}")
 
-    def tick(self) -> None:
+    def _parse_report(self, data: List[int]) -> None:
+        """
+        Update the trigger, D-pad and button state from a HID report.
+
+        Parameters
+        ----------
+        data : List[int]
+            The raw HID report.
+        """
+        if self.xbox:
+            self.lt_value = data[9]  # Left Trigger
+            self.rt_value = data[11]  # Right Trigger
+            self.d_pad_value = data[13]
+            self.button_value = data[14]
+        elif self.sony_dualsense or self.sony_edge:
+            multi = 0
+
+            if len(data) > 10:
+                self.lt_value = data[5]  # Left Trigger
+                self.rt_value = data[6]  # Right Trigger
+                multi = data[8]
+            elif len(data) == 10:
+                self.lt_value = data[8]  # Left Trigger
+                self.rt_value = data[9]  # Right Trigger
+                multi = data[5]
+
+            if multi == 8:
+                self.d_pad_value = 0
+                self.button_value = 0
+            elif multi == 0:
+                self.d_pad_value = 1  # up
+                self.button_value = 0
+            elif multi == 6:
+                self.d_pad_value = 7  # left
+                self.button_value = 0
+            elif multi == 2:
+                self.d_pad_value = 3  # right
+                self.button_value = 0
+            elif multi == 4:
+                self.d_pad_value = 5  # back
+                self.button_value = 0
+            elif multi == 40:
+                # "A" aka X button
+                self.d_pad_value = 0
+                self.button_value = 1
+            elif multi == 72:
+                # "B" aka 0 button
+                self.d_pad_value = 0
+                self.button_value = 2
+
+    def _target_velocity(self) -> Tuple[float, float, float]:
         """
-        Tick function is called periodically to check for input from the Xbox controller.
-        It reads the input from the controller and sends the corresponding commands to the robot.
+        Get the velocity commanded by the current pad state.
+
+        Triggers take precedence over the D-pad.
 
         Returns
         -------
-        None
+        Tuple[float, float, float]
+            The target vx, vy and vturn.
+        """
+        # Normalize trigger values from 0-255 to 0-1.0
+        rt = self.rt_value / 255.0
+        lt = self.lt_value / 255.0
+
+        # Right Trigger - clockwise rotation
+        if rt > 0.8 and rt > lt:
+            return (0.0, 0.0, -self.turn_speed)
+        # Left Trigger - counter-clockwise rotation
+        if lt > 0.8 and lt > rt:
+            return (0.0, 0.0, self.turn_speed)
+
+        if self.d_pad_value == 1:  # Up
+            return (self.move_speed, self.lateral_correction, self.yaw_correction)
+        if self.d_pad_value == 5:  # Down
+            return (-self.move_speed, -self.lateral_correction, -self.yaw_correction)
+        if self.d_pad_value == 7:  # Left
+            return (0.0, self.move_speed, 0.0)
+        if self.d_pad_value == 3:  # Right
+            return (0.0, -self.move_speed, 0.0)
+
+        return STOP
+
+    def _handle_report(self, data: List[int]) -> None:
         """
-        time.sleep(0.05)
-        logging.debug("Gamepad tick")
+        Turn a HID report into a velocity target or a sport command.
 
-        data = None
+        Parameters
+        ----------
+        data : List[int]
+            The raw HID report.
+        """
+        logging.debug(f"Gamepad data: {data}")
+        self._parse_report(data)
+
+        target = self._target_velocity()
+        with self._command_lock:
+            changed = target != self._target
+            self._target = target
+        if changed:
+            # Wake the publisher so the change goes out right away
+            self._command_event.set()
+
+        # When the user presses a button the gamepad sends a 'press'
+        # indication numerous times for several hundred ms. Only act when the
+        # button state changes from 0 to > 0, and never while moving.
+        if target == STOP and self.button_previous == 0 and self.button_value > 0:
+            # button A
+            if self.button_value == 1:
+                logging.info("Controller unitree: stand_up")
+                self._execute_sport_command_sync("StandUp")
+            # button B
+            elif self.button_value == 2:
+                logging.info("Controller unitree: lay_down")
+                self._execute_sport_command_sync("StandDown")
+
+        self.button_previous = self.button_value
+
+    def _ensure_publisher(self) -> None:
+        if self._publisher_thread is None or not self._publisher_thread.is_alive():
+            self._publisher_thread = threading.Thread(
+                target=self._publish_loop, name="go2-gamepad-publisher", daemon=True
+            )
+            self._publisher_thread.start()
 
-        # Attempt reconnection if no gamepad is currently attached
-        if self.gamepad is None and hid is not None:
-            logging.warning("Controller disconnected - will try to reconnect")
-            self._init_controller()
-
-        if self.gamepad:
-            try:
-                # try to read USB data, and if there is nothing, timeout
-                data = list(self.gamepad.read(64, timeout=50))
-            except Exception as e:
-                logging.warning(f"Controller disconnected: {e}")
-                self.gamepad = None
-
-        # special case for no data if the D-pad or LT and RT is kept pressed
-        if data is None or len(data) == 0:
-            if self.rt_previous > 0 or self.lt_previous > 0:
-                # we always excute the left turn first
-                if self.lt_previous > 0:
-                    logging.info(
-                        "Left Trigger is kept pressed - Counter-clockwise rotation"
-                    )
-                    self._move_robot(0.0, 0.0, self.turn_speed)
-                    return
-                if self.rt_previous > 0:
-                    logging.info("Right Trigger is kept pressed - Clockwise rotation")
-                    self._move_robot(0.0, 0.0, -self.turn_speed)
+    def _publish_loop(self) -> None:
+        """
+        Send velocity commands at a fixed rate.
+
+        A command is sent as soon as the target changes, and repeated every
+        ``keepalive_interval`` seconds while the robot should keep moving.
+        The loop stops the robot and exits once the reader has stopped
+        calling ``tick``, e.g. after the runtime was stopped.
+        """
+        period = 1.0 / self.command_hz
+        last_sent = STOP
+        last_sent_at = 0.0
+
+        while True:
+            self._command_event.wait(period)
+            self._command_event.clear()
+            now = time.monotonic()
+
+            reader_alive = now - self._last_tick < self.reader_timeout
+            with self._command_lock:
+                target = self._target if reader_alive else STOP
+
+            if target != last_sent:
+                logging.info(
+                    f"Gamepad velocity: vx={target[0]}, vy={target[1]}, vturn={target[2]}"
+                )
+            elif target == STOP or now - last_sent_at < self.keepalive_interval:
+                if not reader_alive:
                     return
+                continue
 
-            if self.d_pad_previous and self.d_pad_previous > 0:
-                if self.d_pad_previous == 1:  # Up
-                    logging.info("D-pad UP - Moving forward")
-                    self._move_robot(
-                        self.move_speed, self.lateral_correction, self.yaw_correction
-                    )
-                elif self.d_pad_previous == 5:  # Down
-                    logging.info("D-pad DOWN - Moving backward")
-                    self._move_robot(
-                        -self.move_speed, -self.lateral_correction, -self.yaw_correction
-                    )
-                elif self.d_pad_previous == 7:  # Left
-                    logging.info("D-pad LEFT - Moving left")
-                    self._move_robot(0.0, self.move_speed)
-                elif self.d_pad_previous == 3:  # Right
-                    logging.info("D-pad RIGHT - Moving right")
-                    self._move_robot(0.0, -self.move_speed)
+            self._move_robot(*target)
+            last_sent = target
+            last_sent_at = now
 
-            return
+    def tick(self) -> None:
+        """
+        Block on the next HID report and act on it immediately.
 
-        if data and len(data) > 0:
-
-            logging.debug(f"Gamepad data: {data}")
-
-            # deal with the different mappings
-            if self.xbox:
-                logging.debug(f"Gamepad data Xbox: {data}")
-                self.lt_value = data[9]  # Left Trigger
-                self.rt_value = data[11]  # Right Trigger
-                self.d_pad_value = data[13]
-                self.button_value = data[14]
-            elif self.sony_dualsense or self.sony_edge:
-                logging.debug(f"Gamepad data Sony: {data}")
-
-                multi = 0
-
-                if len(data) > 10:
-                    logging.debug("Gamepad data Sony length > 10")
-                    self.lt_value = data[5]  # Left Trigger
-                    self.rt_value = data[6]  # Right Trigger
-                    multi = data[8]
-                elif len(data) == 10:
-                    logging.debug("Gamepad data Sony length == 10")
-                    self.lt_value = data[8]  # Left Trigger
-                    self.rt_value = data[9]  # Right Trigger
-                    multi = data[5]
-
-                if multi == 8:
-                    self.d_pad_value = 0
-                    self.button_value = 0
-                elif multi == 0:
-                    self.d_pad_value = 1  # up
-                    self.button_value = 0
-                elif multi == 6:
-                    self.d_pad_value = 7  # left
-                    self.button_value = 0
-                elif multi == 2:
-                    self.d_pad_value = 3  # right
-                    self.button_value = 0
-                elif multi == 4:
-                    self.d_pad_value = 5  # back
-                    self.button_value = 0
-                elif multi == 40:
-                    # "A" aka X button
-                    self.d_pad_value = 0
-                    self.button_value = 1
-                elif multi == 72:
-                    # "B" aka 0 button
-                    self.d_pad_value = 0
-                    self.button_value = 2
-
-                logging.debug(f"Gamepad data lt: {self.lt_value}")
-                logging.debug(f"Gamepad data rt: {self.rt_value}")
-                logging.debug(f"Gamepad data multi: {multi}")
-
-            move_triggered_RTLT = False
-            move_triggered_dpad = False
-
-            # Trigger values range from 0 to 255
-            # Check if the triggers have changed significantly
-            # rt_changed = abs(self.rt_value - self.rt_previous) > 5
-            # lt_changed = abs(self.lt_value - self.lt_previous) > 5
-
-            # Normalize trigger values from 0-255 to 0-1.0
-            rt = self.rt_value / 255.0
-            lt = self.lt_value / 255.0
-
-            previous_RTLT = self.lt_previous + self.rt_previous
-
-            # Right Trigger - clockwise rotation
-            if rt > 0.8 and rt > lt:
-                move_triggered_RTLT = True
-                self._move_robot(0.0, 0.0, -self.turn_speed)
-            # Left Trigger - counter-clockwise rotation
-            elif lt > 0.8 and lt > rt:
-                move_triggered_RTLT = True
-                self._move_robot(0.0, 0.0, self.turn_speed)
-            # Both triggers released or below threshold
-            elif (rt <= 0.8 and lt <= 0.8) and previous_RTLT > 0.8:
-                # we WERE moving, but we just let go of one or both triggers
-                move_triggered_RTLT = True
-                logging.debug("Triggers released - Stopping rotation")
-
-            # Update previous Trigger values
-            self.rt_previous = rt
-            self.lt_previous = lt
-
-            if move_triggered_RTLT:
-                # update the previous value of the button
-                self.button_previous = self.button_value
-                # and return, since we just issued a action command in this tick
-                return
+        Runs on the connector thread of the ActionOrchestrator, which makes it
+        the dedicated reader for the controller. Velocity commands are sent by
+        a separate fixed-rate publisher thread.
 
-            # Control robot movement based on D-pad
-            logging.debug(f"Gamepad DPAD: {self.d_pad_value}")
+        Returns
+        -------
+        None
+        """
+        self._last_tick = time.monotonic()
+        self._ensure_publisher()
 
-            if self.d_pad_value == 1:  # Up
-                logging.info("D-pad UP - Moving forward")
-                move_triggered_dpad = True
-                self._move_robot(
-                    self.move_speed, self.lateral_correction, self.yaw_correction
-                )
-            elif self.d_pad_value == 5:  # Down
-                logging.info("D-pad DOWN - Moving backward")
-                move_triggered_dpad = True
-                self._move_robot(
-                    -self.move_speed, -self.lateral_correction, -self.yaw_correction
-                )
-            elif self.d_pad_value == 7:  # Left
-                logging.info("D-pad LEFT - Moving left")
-                move_triggered_dpad = True
-                self._move_robot(0.0, self.move_speed)
-            elif self.d_pad_value == 3:  # Right
-                logging.info("D-pad RIGHT - Moving right")
-                move_triggered_dpad = True
-                self._move_robot(0.0, -self.move_speed)
-            elif self.d_pad_previous > 0 and self.d_pad_value == 0:
-                # User just released DPAD
-                logging.info("D-pad released - Stopping movement")
-                move_triggered_dpad = True
-                self._move_robot(0.0, 0.0)
-
-            # update the value of d_pad_previous
-            self.d_pad_previous = self.d_pad_value
-
-            if move_triggered_dpad:
-                self.button_previous = self.button_value
-                # return, since we just issued a DPAD move command in this tick
+        # Attempt reconnection if no gamepad is currently attached
+        if self.gamepad is None:
+            if hid is not None:
+                self._init_controller()
+            if self.gamepad is None:
+                with self._command_lock:
+                    self._target = STOP
+                time.sleep(self.reconnect_interval)
                 return
 
-            # logging.debug(f"Gamepad button value {button_value}")
-
-            if self.button_previous == 0 and self.button_value > 0:
-
-                # logging.debug(f"Gamepad button pressed")
-
-                # We need this logic because when the user presses a button
-                # the gamepad sends a 'press' indication numerous times
-                # for several hundred ms, creating numerous
-                # duplicated movement commands with a single button press.
-                # To prevent this, which would freeze/crash the robot,
-                # we only act when the button state changes from 0 to > 0
-                # This is basically a software button debounce
-
-                # button A
-                if self.button_value == 1:
-                    logging.info("Controller unitree: stand_up")
-                    self._execute_sport_command_sync("StandUp")
-                # button B
-                elif self.button_value == 2:
-                    logging.info("Controller unitree: lay_down")
-                    self._execute_sport_command_sync("StandDown")
-                # # X button
-                # elif button_value == 8:
-                #     self._execute_sport_command_sync("Hello")
-                #     logging.info("Controller unitree: say_hello")
-                # # Y button
-                # elif button_value == 16:
-                #     self._execute_sport_command_sync("Stretch")
-                #     logging.info("Controller unitree: stretch")
-
-                logging.info(f"Gamepad button depressed edge {self.button_value}")
-
-            # update the value of button_previous
-            self.button_previous = self.button_value
+        try:
+            # Wake up at least every read_timeout ms to keep the publisher alive
+            data = self.gamepad.read(64, timeout=self.read_timeout_ms)
+        except Exception as e:
+            logging.warning(f"Controller disconnected - will try to reconnect: {e}")
+            self.gamepad = None
+            with self._command_lock:
+                self._target = STOP
+            self._command_event.set()
+            return
+
+        if data:
+            self._handle_report(list(data))
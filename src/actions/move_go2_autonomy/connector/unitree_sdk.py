@@ -2,10 +2,9 @@ import logging
 import math
 import random
 import time
-from queue import Queue
-from typing import List, Optional
 
 from actions.base import ActionConfig, ActionConnector, MoveCommand
+from actions.motion_controller import MotionController, StepResult
 from actions.move_go2_autonomy.interface import MoveInput
 from providers.odom_provider import OdomProvider, RobotState
 from providers.rplidar_provider import RPLidarProvider
@@ -24,10 +23,6 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         self.turn_speed = 0.8
         self.angle_tolerance = 5.0  # degrees
         self.distance_tolerance = 0.05  # meters
-        self.pending_movements: Queue[Optional[MoveCommand]] = Queue()
-        self.movement_attempts = 0
-        self.movement_attempt_limit = 15
-        self.gap_previous = 0
 
         self.lidar = RPLidarProvider()
         self.unitree_go2_state = UnitreeGo2StateProvider()
@@ -48,6 +43,15 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         self.odom = OdomProvider(channel=unitree_ethernet)
         logging.info(f"Autonomy Odom Provider: {self.odom}")
 
+        # Closed-loop execution of the AI movement commands
+        self.motion = MotionController(
+            self.odom,
+            self._step,
+            stop=self._stop_robot,
+            rate_hz=getattr(config, "control_hz", 50.0),
+            command_timeout=getattr(config, "command_timeout", 5.0),
+        )
+
     async def connect(self, output_interface: MoveInput) -> None:
 
         # this is used only by the LLM
@@ -73,7 +77,7 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
                 )
                 return
 
-        if self.pending_movements.qsize() > 0:
+        if self.motion.busy:
             logging.info("Movement in progress: disregarding new AI command")
             return
 
@@ -132,7 +136,7 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         vturn : float, optional
             Angular velocity (turning speed) in radians per second (default is 0.0).
         """
-        logging.info(f"_move_robot: vx={vx}, vy={vy}, vturn={vturn}")
+        logging.debug(f"_move_robot: vx={vx}, vy={vy}, vturn={vturn}")
 
         if not self.sport_client:
             return
@@ -144,18 +148,20 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
             self.sport_client.BalanceStand()
 
         try:
-            logging.info(f"self.sport_client.Move: vx={vx}, vy={vy}, vturn={vturn}")
+            logging.debug(f"self.sport_client.Move: vx={vx}, vy={vy}, vturn={vturn}")
             self.sport_client.Move(vx, vy, vturn)
         except Exception as e:
             logging.error(f"Error moving robot: {e}")
 
-    def clean_abort(self) -> None:
+    def _stop_robot(self) -> None:
         """
-        Cleanly abort current movement and reset state.
+        Stop the robot after an aborted movement.
         """
-        self.movement_attempts = 0
-        if not self.pending_movements.empty():
-            self.pending_movements.get()
+        if self.sport_client:
+            try:
+                self.sport_client.StopMove()
+            except Exception as e:
+                logging.error(f"Error stopping robot: {e}")
 
     def tick(self) -> None:
         """
@@ -181,113 +187,95 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
             return
 
         # if we got to this point, we have good data and we are able to
-        # safely proceed
-        target: List[MoveCommand] = list(self.pending_movements.queue)
+        # safely proceed; the controller steps on every fresh odom pose
+        self.motion.tick()
+
+    def _step(self, current_target: MoveCommand) -> StepResult:
+        """
+        Run one control step towards the current movement target.
 
-        if len(target) > 0:
+        Parameters
+        ----------
+        current_target : MoveCommand
+            The movement being executed.
 
-            current_target = target[0]
+        Returns
+        -------
+        StepResult
+            Whether the movement continues, completed, or was aborted.
+        """
+        position = self.odom.position
 
-            logging.info(
-                f"Target: {current_target} current yaw: {self.odom.position['odom_yaw_m180_p180']}"
+        logging.debug(
+            f"Target: {current_target} current yaw: {position['odom_yaw_m180_p180']}"
+        )
+
+        goal_dx = current_target.dx
+        goal_yaw = current_target.yaw
+
+        # Phase 1: Turn to face the target direction
+        if not current_target.turn_complete:
+            gap = self._calculate_angle_gap(
+                -1 * position["odom_yaw_m180_p180"], goal_yaw
             )
+            logging.debug(f"Phase 1 - Turning remaining GAP: {gap}DEG")
+
+            if abs(gap) > 10.0:
+                logging.debug("Phase 1 - Gap is big, using large displacements")
+                if not self._execute_turn(gap):
+                    return StepResult.ABORTED
+            elif abs(gap) > self.angle_tolerance:
+                logging.debug("Phase 1 - Gap is decreasing, using smaller steps")
+                # rotate only because we are so close
+                # no need to check barriers because we are just performing small rotations
+                if gap > 0:
+                    self._move_robot(0, 0, 0.2)
+                elif gap < 0:
+                    self._move_robot(0, 0, -0.2)
+            else:
+                logging.info("Phase 1 - Turn completed, starting movement")
+                current_target.turn_complete = True
+            return StepResult.CONTINUE
 
-            if self.movement_attempts > self.movement_attempt_limit:
-                # abort - we are not converging
-                self.clean_abort()
-                logging.info(
-                    f"TIMEOUT - not converging after {self.movement_attempt_limit} attempts - StopMove()"
-                )
-                return
+        # Phase 2: Move towards the target position, if needed
+        if goal_dx == 0:
+            logging.info("No movement required, processing next AI command")
+            return StepResult.DONE
 
-            goal_dx = current_target.dx
-            goal_yaw = current_target.yaw
+        s_x = current_target.start_x
+        s_y = current_target.start_y
+        speed = current_target.speed
 
-            # Phase 1: Turn to face the target direction
-            if not current_target.turn_complete:
-                gap = self._calculate_angle_gap(
-                    -1 * self.odom.position["odom_yaw_m180_p180"], goal_yaw
-                )
-                logging.info(f"Phase 1 - Turning remaining GAP: {gap}DEG")
-
-                progress = round(abs(self.gap_previous - gap), 2)
-                self.gap_previous = gap
-                if self.movement_attempts > 0:
-                    logging.info(f"Phase 1 - Turn GAP delta: {progress}DEG")
-
-                if abs(gap) > 10.0:
-                    logging.debug("Phase 1 - Gap is big, using large displacements")
-                    self.movement_attempts += 1
-                    if not self._execute_turn(gap):
-                        self.clean_abort()
-                        return
-                elif abs(gap) > self.angle_tolerance and abs(gap) <= 10.0:
-                    logging.debug("Phase 1 - Gap is decreasing, using smaller steps")
-                    self.movement_attempts += 1
-                    # rotate only because we are so close
-                    # no need to check barriers because we are just performing small rotations
-                    if gap > 0:
-                        self._move_robot(0, 0, 0.2)
-                    elif gap < 0:
-                        self._move_robot(0, 0, -0.2)
-                elif abs(gap) <= self.angle_tolerance:
-                    logging.info("Phase 1 - Turn completed, starting movement")
-                    current_target.turn_complete = True
-                    self.gap_previous = 0
+        distance_traveled = math.sqrt(
+            (position["odom_x"] - s_x) ** 2 + (position["odom_y"] - s_y) ** 2
+        )
+        gap = round(abs(goal_dx - distance_traveled), 2)
 
-            else:
-                # Phase 2: Move towards the target position, if needed
-                if goal_dx == 0:
-                    logging.info("No movement required, processing next AI command")
-                    self.clean_abort()
-                    return
-
-                s_x = current_target.start_x
-                s_y = current_target.start_y
-                speed = current_target.speed
-
-                distance_traveled = math.sqrt(
-                    (self.odom.position["odom_x"] - s_x) ** 2
-                    + (self.odom.position["odom_y"] - s_y) ** 2
-                )
-                gap = round(abs(goal_dx - distance_traveled), 2)
-                progress = round(abs(self.gap_previous - gap), 2)
-                self.gap_previous = gap
-
-                if self.movement_attempts > 0:
-                    logging.info(f"Phase 2 - Forward/retreat GAP delta: {progress}m")
-
-                if goal_dx > 0:
-                    if 4 not in self.lidar.advance:
-                        logging.warning("Cannot advance due to barrier")
-                        self.clean_abort()
-                        return
-                    fb = 1
-
-                if goal_dx < 0:
-                    if not self.lidar.retreat:
-                        logging.warning("Cannot retreat due to barrier")
-                        self.clean_abort()
-                        return
-                    fb = -1
-
-                if gap > self.distance_tolerance:
-                    self.movement_attempts += 1
-                    if distance_traveled < abs(goal_dx):
-                        logging.info(f"Phase 2 - Keep moving. Remaining: {gap}m ")
-                        self._move_robot(fb * speed, 0.0, 0.0)
-                    elif distance_traveled > abs(goal_dx):
-                        logging.debug(
-                            f"Phase 2 - OVERSHOOT: move other way. Remaining: {gap}m"
-                        )
-                        self._move_robot(-1 * fb * 0.2, 0.0, 0.0)
-                else:
-                    logging.info(
-                        "Phase 2 - Movement completed normally, processing next AI command"
-                    )
-                    self.clean_abort()
-
-        time.sleep(0.1)
+        if goal_dx > 0:
+            if 4 not in self.lidar.advance:
+                logging.warning("Cannot advance due to barrier")
+                return StepResult.ABORTED
+            fb = 1
+
+        if goal_dx < 0:
+            if not self.lidar.retreat:
+                logging.warning("Cannot retreat due to barrier")
+                return StepResult.ABORTED
+            fb = -1
+
+        if gap <= self.distance_tolerance:
+            logging.info(
+                "Phase 2 - Movement completed normally, processing next AI command"
+            )
+            return StepResult.DONE
+
+        if distance_traveled < abs(goal_dx):
+            logging.debug(f"Phase 2 - Keep moving. Remaining: {gap}m ")
+            self._move_robot(fb * speed, 0.0, 0.0)
+        elif distance_traveled > abs(goal_dx):
+            logging.debug(f"Phase 2 - OVERSHOOT: move other way. Remaining: {gap}m")
+            self._move_robot(-1 * fb * 0.2, 0.0, 0.0)
+        return StepResult.CONTINUE
 
     def _process_turn_left(self):
         """
@@ -303,7 +291,7 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         target_yaw = self._normalize_angle(
             -1 * self.odom.position["odom_yaw_m180_p180"] + path_angle
         )
-        self.pending_movements.put(
+        self.motion.submit(
             MoveCommand(
                 dx=0.5,
                 yaw=round(target_yaw, 2),
@@ -327,7 +315,7 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         target_yaw = self._normalize_angle(
             -1 * self.odom.position["odom_yaw_m180_p180"] + path_angle
         )
-        self.pending_movements.put(
+        self.motion.submit(
             MoveCommand(
                 dx=0.5,
                 yaw=round(target_yaw, 2),
@@ -351,7 +339,7 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         target_yaw = self._normalize_angle(
             -1 * self.odom.position["odom_yaw_m180_p180"] + path_angle
         )
-        self.pending_movements.put(
+        self.motion.submit(
             MoveCommand(
                 dx=0.5,
                 yaw=target_yaw,
@@ -369,7 +357,7 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
             logging.warning("Cannot retreat due to barrier")
             return
 
-        self.pending_movements.put(
+        self.motion.submit(
             MoveCommand(
                 dx=-0.5,
                 yaw=0.0,
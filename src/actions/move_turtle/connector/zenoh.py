@@ -2,12 +2,11 @@ import logging
 import math
 import random
 import time
-from queue import Queue
-from typing import List, Optional
 
 import zenoh
 
 from actions.base import ActionConfig, ActionConnector, MoveCommand
+from actions.motion_controller import MotionController, StepResult
 from actions.move_turtle.interface import MoveInput
 from providers.odom_provider import OdomProvider
 from providers.rplidar_provider import RPLidarProvider
@@ -24,8 +23,6 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
         self.angle_tolerance = 5.0
         self.distance_tolerance = 0.05  # m
 
-        self.pending_movements: Queue[Optional[MoveCommand]] = Queue()
-
         self.hazard = None
         self.emergency = None
 
@@ -54,6 +51,15 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
         self.lidar = RPLidarProvider()
         self.odom = OdomProvider(URID=URID, use_zenoh=True)
 
+        # Closed-loop execution of the AI movement commands
+        self.motion = MotionController(
+            self.odom,
+            self._step,
+            stop=self._stop_robot,
+            rate_hz=getattr(self.config, "control_hz", 20.0),
+            command_timeout=getattr(self.config, "command_timeout", None),
+        )
+
     def listen_hazard(self, data: zenoh.Sample) -> None:
         """
         Callback for Zenoh hazard detection messages.
@@ -109,7 +115,7 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
 
         logging.info(f"AI motion command: {output_interface.action}")
 
-        if self.pending_movements.qsize() > 0:
+        if self.motion.busy:
             logging.info("Movement in progress: disregarding new AI command")
             return
 
@@ -142,17 +148,17 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
             target_yaw = self.odom.odom_yaw_m180_p180 - 30.0
             if target_yaw <= -180:
                 target_yaw += 360.0
-            self.pending_movements.put(MoveCommand(dx=0.0, yaw=target_yaw))
+            self.motion.submit(MoveCommand(dx=0.0, yaw=target_yaw))
         elif output_interface.action == "turn right":
             # turn 90 Deg to the right (CW)
             target_yaw = self.odom.odom_yaw_m180_p180 + 30.0
             if target_yaw >= 180.0:
                 target_yaw -= 360.0
-            self.pending_movements.put(MoveCommand(dx=0.0, yaw=target_yaw))
+            self.motion.submit(MoveCommand(dx=0.0, yaw=target_yaw))
         elif output_interface.action == "move forwards":
             if advance_danger:
                 return
-            self.pending_movements.put(
+            self.motion.submit(
                 MoveCommand(
                     dx=0.5,
                     yaw=0.0,
@@ -163,7 +169,7 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
         elif output_interface.action == "move back":
             if retreat_danger:
                 return
-            self.pending_movements.put(
+            self.motion.submit(
                 MoveCommand(
                     dx=-0.5,
                     yaw=0.0,
@@ -200,18 +206,14 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
             gap += 360.0
         return round(gap, 2)
 
-    def clean_abort(self) -> None:
+    def _stop_robot(self) -> None:
         """
-        Cleanly abort current movement and reset state.
+        Stop the robot after an aborted movement.
         """
-        self.movement_attempts = 0
-        if not self.pending_movements.empty():
-            self.pending_movements.get()
+        self.move(0.0, 0.0)
 
     def tick(self) -> None:
 
-        time.sleep(0.1)
-
         logging.debug("Move tick")
 
         if self.odom.x == 0.0:
@@ -241,137 +243,143 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
             logging.info(f"Should have non-zero avoidance yaw: {self.emergency}")
 
         if self.emergency:
+            # when there is a hazard, focus on clearing it, at the control rate
+            self.motion.wait_for_odom()
+            self._avoid_hazard(self.emergency)
+            return
 
-            # target = self.emergency
-            target = [MoveCommand(dx=0.0, yaw=self.emergency)]
-            logging.info(f"Emergency target: {target}")
+        # if we got to this point, we have good data and there is hard wall
+        # touch emergency; the controller steps on every fresh odom pose
+        self.motion.tick()
 
-            gap = self.odom.odom_yaw_m180_p180 - target[0].yaw
-            if gap > 180.0:
-                gap -= 360.0
-            elif gap < -180.0:
-                gap += 360.0
+    def _avoid_hazard(self, emergency_yaw: float) -> None:
+        """
+        Run one control step of the hazard avoidance turn.
 
-            """
-            gap is a SIGNED value indicating:
-                * the direction to turn to get to goal, and
-                * the magnitude remaining to turn
+        Parameters
+        ----------
+        emergency_yaw : float
+            The yaw to turn to, in degrees.
+        """
+        logging.debug(f"Emergency target yaw: {emergency_yaw}")
 
-            a mathematically equivalent way to do this is
+        gap = self.odom.odom_yaw_m180_p180 - emergency_yaw
+        if gap > 180.0:
+            gap -= 360.0
+        elif gap < -180.0:
+            gap += 360.0
 
-            a = targetA - sourceA
-            a = (a + 180) % 360 - 180
-            where mod = (a, n) -> a - floor(a/n) * n
-            """
-            logging.info(f"GAP: {gap}")
-            if abs(gap) > 10.0:
-                logging.debug("gap is big, using large displacements")
-                if gap > 0:
-                    self.move(0.0, 0.3)
-                elif gap < 0:
-                    self.move(0.0, -0.3)
-            elif abs(gap) > self.angle_tolerance and abs(gap) <= 10.0:
-                logging.debug("gap is getting smaller, using smaller steps")
-                if gap > 0:
-                    self.move(0.0, 0.1)
-                elif gap < 0:
-                    self.move(0.0, -0.1)
-            elif abs(gap) <= self.angle_tolerance:
-                logging.info("avoidance motion completed, clear emergency")
-                self.emergency = None
+        """
+        gap is a SIGNED value indicating:
+            * the direction to turn to get to goal, and
+            * the magnitude remaining to turn
 
-            # when there is a hazard, focus on clearing it
-            return
+        a mathematically equivalent way to do this is
 
-        # if we got to this point, we have good data and there is hard wall
-        # touch emergency
+        a = targetA - sourceA
+        a = (a + 180) % 360 - 180
+        where mod = (a, n) -> a - floor(a/n) * n
+        """
+        logging.debug(f"GAP: {gap}")
+        if abs(gap) > 10.0:
+            logging.debug("gap is big, using large displacements")
+            if gap > 0:
+                self.move(0.0, 0.3)
+            elif gap < 0:
+                self.move(0.0, -0.3)
+        elif abs(gap) > self.angle_tolerance:
+            logging.debug("gap is getting smaller, using smaller steps")
+            if gap > 0:
+                self.move(0.0, 0.1)
+            elif gap < 0:
+                self.move(0.0, -0.1)
+        else:
+            logging.info("avoidance motion completed, clear emergency")
+            self.emergency = None
 
-        target: List[MoveCommand] = list(self.pending_movements.queue)
+    def _step(self, current_target: MoveCommand) -> StepResult:
+        """
+        Run one control step towards the current movement target.
 
-        if len(target) > 0:
+        Parameters
+        ----------
+        current_target : MoveCommand
+            The movement being executed.
 
-            current_target = target[0]
+        Returns
+        -------
+        StepResult
+            Whether the movement continues, completed, or was aborted.
+        """
+        logging.debug(
+            f"Target: {current_target} current yaw: {self.odom.odom_yaw_m180_p180}"
+        )
 
-            logging.debug(
-                f"Target: {current_target} current yaw: {self.odom.odom_yaw_m180_p180}"
-            )
+        goal_dx = current_target.dx
+        goal_yaw = current_target.yaw
 
-            goal_dx = current_target.dx
-            goal_yaw = current_target.yaw
+        if not current_target.turn_complete:
+            gap = self._calculate_angle_gap(
+                -1 * self.odom.position["odom_yaw_m180_p180"], goal_yaw
+            )
+            logging.debug(f"Phase 1 - Turning remaining GAP: {gap}DEG")
 
-            if not current_target.turn_complete:
-                gap = self._calculate_angle_gap(
-                    -1 * self.odom.position["odom_yaw_m180_p180"], goal_yaw
-                )
-                logging.info(f"Phase 1 - Turning remaining GAP: {gap}DEG")
-
-                progress = round(abs(self.gap_previous - gap), 2)
-                self.gap_previous = gap
-                if self.movement_attempts > 0:
-                    logging.info(f"Phase 1 - Turn GAP delta: {progress}DEG")
-
-                if abs(gap) > 10.0:
-                    logging.debug("Phase 1 - Gap is big, using large displacements")
-                    self.movement_attempts += 1
-                    if not self._execute_turn(gap):
-                        self.clean_abort()
-                        return
-                elif abs(gap) > self.angle_tolerance and abs(gap) <= 10.0:
-                    logging.debug("Phase 1 - Gap is decreasing, using smaller steps")
-                    self.movement_attempts += 1
-                    # rotate only because we are so close
-                    # no need to check barriers because we are just performing small rotations
-                    if gap > 0:
-                        self.move(0, 0.2)
-                    elif gap < 0:
-                        self.move(0, -0.2)
-                elif abs(gap) <= self.angle_tolerance:
-                    logging.info("Phase 1 - Turn completed, starting movement")
-                    current_target.turn_complete = True
-                    self.gap_previous = 0
+            if abs(gap) > 10.0:
+                logging.debug("Phase 1 - Gap is big, using large displacements")
+                if not self._execute_turn(gap):
+                    return StepResult.ABORTED
+            elif abs(gap) > self.angle_tolerance:
+                logging.debug("Phase 1 - Gap is decreasing, using smaller steps")
+                # rotate only because we are so close
+                # no need to check barriers because we are just performing small rotations
+                if gap > 0:
+                    self.move(0, 0.2)
+                elif gap < 0:
+                    self.move(0, -0.2)
             else:
-                if goal_dx == 0:
-                    logging.info("No movement required, processing next AI command")
-                    self.clean_abort()
-                    return
+                logging.info("Phase 1 - Turn completed, starting movement")
+                current_target.turn_complete = True
+            return StepResult.CONTINUE
 
-                # reconfirm possible paths
-                pp = self.lidar.valid_paths
+        if goal_dx == 0:
+            logging.info("No movement required, processing next AI command")
+            return StepResult.DONE
 
-                logging.debug(f"Action - Valid paths: {pp}")
+        # reconfirm possible paths
+        pp = self.lidar.valid_paths
 
-                s_x = current_target.start_x
-                s_y = current_target.start_y
-                distance_traveled = math.sqrt(
-                    (self.odom.x - s_x) ** 2 + (self.odom.y - s_y) ** 2
-                )
-                remaining = abs(goal_dx - distance_traveled)
-                logging.info(f"remaining advance GAP: {round(remaining,2)}")
-
-                fb = 0
-                if pp is not None and 4 in pp:
-                    fb = 1
-                elif pp is not None and 9 in pp:
-                    fb = -1
-                else:
-                    logging.info("danger, pop 1 off queue")
-                    self.pending_movements.get()
-                    return
-
-                if remaining > self.distance_tolerance:
-                    if distance_traveled < goal_dx:  # keep advancing
-                        logging.debug(f"keep moving. remaining:{remaining} ")
-                        self.move(fb * 0.4, 0.0)
-                    elif distance_traveled > goal_dx:  # you moved too far
-                        logging.debug(
-                            f"OVERSHOOT: move other way. remaining:{remaining} "
-                        )
-                        self.move(-1 * fb * 0.1, 0.0)
-                else:
-                    logging.info(
-                        "advance is completed, gap is small enough, done, pop 1 off queue"
-                    )
-                    self.pending_movements.get()
+        logging.debug(f"Action - Valid paths: {pp}")
+
+        s_x = current_target.start_x
+        s_y = current_target.start_y
+        distance_traveled = math.sqrt(
+            (self.odom.x - s_x) ** 2 + (self.odom.y - s_y) ** 2
+        )
+        remaining = abs(goal_dx - distance_traveled)
+        logging.debug(f"remaining advance GAP: {round(remaining,2)}")
+
+        fb = 0
+        if pp is not None and 4 in pp:
+            fb = 1
+        elif pp is not None and 9 in pp:
+            fb = -1
+        else:
+            logging.info("danger, pop 1 off queue")
+            return StepResult.ABORTED
+
+        if remaining <= self.distance_tolerance:
+            logging.info(
+                "advance is completed, gap is small enough, done, pop 1 off queue"
+            )
+            return StepResult.DONE
+
+        if distance_traveled < goal_dx:  # keep advancing
+            logging.debug(f"keep moving. remaining:{remaining} ")
+            self.move(fb * 0.4, 0.0)
+        elif distance_traveled > goal_dx:  # you moved too far
+            logging.debug(f"OVERSHOOT: move other way. remaining:{remaining} ")
+            self.move(-1 * fb * 0.1, 0.0)
+        return StepResult.CONTINUE
 
     def _execute_turn(self, gap: float) -> bool:
         """
@@ -1,4 +1,5 @@
 import asyncio
+import contextvars
 import logging
 import threading
 import time
@@ -7,6 +8,7 @@ from concurrent.futures import ThreadPoolExecutor
 
 from actions.base import AgentAction
 from llm.output_model import Action
+from providers.reflex_provider import ReflexProvider
 from runtime.single_mode.config import RuntimeConfig
 
 
@@ -35,6 +37,7 @@ class ActionOrchestrator:
         )
         self._submitted_connectors = set()
         self._stop_event = threading.Event()
+        self._reflex_provider = ReflexProvider()
 
     def start(self):
         """
@@ -46,7 +49,9 @@ class ActionOrchestrator:
                     f"Connector {agent_action.llm_label} already submitted, skipping."
                 )
                 continue
-            self._connector_executor.submit(self._run_connector_loop, agent_action)
+            self._connector_executor.submit(
+                contextvars.copy_context().run, self._run_connector_loop, agent_action
+            )
             self._submitted_connectors.add(agent_action.llm_label)
 
         return asyncio.Future()  # Return future for compatibility
@@ -74,14 +79,18 @@ class ActionOrchestrator:
         self.promise_queue = [p for p in self.promise_queue if p not in done_promises]
         return done_promises, self.promise_queue
 
-    async def promise(self, actions: list[Action]) -> None:
+    async def promise(self, actions: list[Action], ignore_vetoes: bool = False) -> None:
         """
         Promises the actions to the appropriate connectors.
 
+        Actions vetoed by an active reflex are dropped.
+
         Parameters
         ----------
         actions : list[Action]
             List of actions to promise to connectors.
+        ignore_vetoes : bool
+            Dispatch vetoed actions too; used for the actions of the reflexes.
         """
         for action in actions:
             logging.debug(f"Sending command: {action}")
@@ -106,6 +115,12 @@ class ActionOrchestrator:
                 action.type = "move"
                 action.value = "move back"
 
+            if not ignore_vetoes:
+                reflex = self._reflex_provider.vetoed_by(action)
+                if reflex is not None:
+                    logging.info(f"Reflex {reflex} vetoed action: {action}")
+                    continue
+
             agent_action = next(
                 (
                     m
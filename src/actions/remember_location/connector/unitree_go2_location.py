@@ -1,12 +1,10 @@
-import asyncio
 import logging
 from typing import Any
 
-import aiohttp
-
 from actions.base import ActionConfig, ActionConnector
 from actions.remember_location.interface import RememberLocationInput
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
+from providers.http_client_provider import HTTPClientProvider, HTTPTimeoutError
 
 
 class UnitreeGo2RememberLocationConnector(ActionConnector[RememberLocationInput]):
@@ -32,6 +30,7 @@ class UnitreeGo2RememberLocationConnector(ActionConnector[RememberLocationInput]
         self.map_name = getattr(config, "map_name", "map")
 
         self.elevenlabs_provider = ElevenLabsTTSProvider()
+        self.http = HTTPClientProvider()
 
     async def connect(self, input_protocol: RememberLocationInput) -> None:
         """
@@ -55,23 +54,22 @@ class UnitreeGo2RememberLocationConnector(ActionConnector[RememberLocationInput]
         headers = {"Content-Type": "application/json"}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.base_url, json=payload, headers=headers, timeout=self.timeout
-                ) as resp:
-                    text = await resp.text()
-                    if resp.status >= 200 and resp.status < 300:
-                        logging.info(
-                            f"RememberLocationGo2: stored '{input_protocol.action}' -> {resp.status} {text}"
-                        )
-                        self.elevenlabs_provider.add_pending_message(
-                            f"Location {input_protocol.action} remembered for Go2. Woof! Woof!"
-                        )
-                    else:
-                        logging.error(
-                            f"RememberLocationGo2 API returned {resp.status}: {text}"
-                        )
-        except asyncio.TimeoutError:
+            resp = await self.http.post(
+                self.base_url, json=payload, headers=headers, timeout=self.timeout
+            )
+            text = resp.text
+            if resp.ok:
+                logging.info(
+                    f"RememberLocationGo2: stored '{input_protocol.action}' -> {resp.status_code} {text}"
+                )
+                self.elevenlabs_provider.add_pending_message(
+                    f"Location {input_protocol.action} remembered for Go2. Woof! Woof!"
+                )
+            else:
+                logging.error(
+                    f"RememberLocationGo2 API returned {resp.status_code}: {text}"
+                )
+        except HTTPTimeoutError:
             logging.error("RememberLocationGo2 API request timed out")
         except Exception as e:
             logging.error(f"RememberLocationGo2 API request failed: {e}")
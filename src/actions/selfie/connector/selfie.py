@@ -3,11 +3,11 @@ import logging
 import time
 import typing
 
-import requests
-
 from actions.base import ActionConfig, ActionConnector
 from actions.selfie.interface import SelfieInput
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
+from providers.face_presence_provider import FacePresenceProvider, PresenceSnapshot
+from providers.http_client_provider import HTTPClientProvider
 from providers.io_provider import IOProvider
 
 _JSON = typing.Dict[str, typing.Any]
@@ -34,9 +34,19 @@ class SelfieConnector(ActionConnector[SelfieInput]):
         )
 
         self.recent_sec: float = float(getattr(self.config, "face_recent_sec", 1.0))
-        self.poll_ms: int = int(getattr(self.config, "poll_ms", 200))
         self.default_timeout: int = int(getattr(self.config, "timeout_sec", 15))
         self.http_timeout: float = float(getattr(self.config, "http_timeout_sec", 5.0))
+        self.http = HTTPClientProvider()
+
+        # Presence updates wake the selfie gate instead of it polling /who. The
+        # provider is shared, so it is configured by the face presence input
+        self.face_presence = FacePresenceProvider()
+        if self.face_presence.base_url != self.base_url.rstrip("/"):
+            logging.warning(
+                "Selfie: face presence comes from %s, not %s",
+                self.face_presence.base_url,
+                self.base_url,
+            )
 
         self.evelenlabs_tts_provider = ElevenLabsTTSProvider()
         self.io_provider = IOProvider()
@@ -73,7 +83,7 @@ class SelfieConnector(ActionConnector[SelfieInput]):
         """
         url = f"{self.base_url}{path}"
         try:
-            r = requests.post(url, json=body, timeout=self.http_timeout)
+            r = self.http.post_sync(url, json=body, timeout=self.http_timeout)
             return r.json()
         except Exception as e:
             logging.warning("HTTP POST %s failed (%s) body=%s", url, e, body)
@@ -113,9 +123,30 @@ class SelfieConnector(ActionConnector[SelfieInput]):
         """
         return self._post_json("/who", {"recent_sec": self.recent_sec})
 
+    @staticmethod
+    def _face_count(snap: PresenceSnapshot) -> int:
+        """
+        Count the faces currently in view.
+
+        Parameters
+        ----------
+        snap : PresenceSnapshot
+            A presence snapshot.
+
+        Returns
+        -------
+        int
+            Known plus unknown faces in the latest frame.
+        """
+        now = snap.raw.get("now") or []
+        return len(now) + int(snap.raw.get("unknown_now") or 0)
+
     def _wait_single_face(self, timeout_sec: int) -> bool:
         """
-        Poll /who until exactly one face is visible or timeout.
+        Wait until exactly one face is visible or timeout.
+
+        Wakes on each presence snapshot from the FacePresenceProvider, which
+        only runs for the wait unless another owner keeps it running.
 
         Parameters
         ----------
@@ -129,22 +160,25 @@ class SelfieConnector(ActionConnector[SelfieInput]):
         """
         if timeout_sec <= 0:
             timeout_sec = self.default_timeout
-        tries = max(1, int((timeout_sec * 1000) / self.poll_ms))
-        for _ in range(tries):
-            resp = self._who_snapshot() or {}
-            now = resp.get("now") or []
-            unknown_now = int(resp.get("unknown_now") or 0)
-            faces = len(now) + unknown_now
-            if faces == 1:
-                logging.info(
-                    "Selfie gate: exactly 1 face detected (now=%s, unknown=%d)",
-                    now,
-                    unknown_now,
-                )
-                return True
-            time.sleep(self.poll_ms / 1000.0)
-        logging.error("Selfie gate: timeout waiting for exactly 1 face.")
-        return False
+        owned = not self.face_presence.running
+        if owned:
+            self.face_presence.start()
+        try:
+            snap = self.face_presence.wait_for(
+                lambda s: self._face_count(s) == 1, timeout=timeout_sec
+            )
+        finally:
+            if owned:
+                self.face_presence.stop()
+        if snap is None:
+            logging.error("Selfie gate: timeout waiting for exactly 1 face.")
+            return False
+        logging.info(
+            "Selfie gate: exactly 1 face detected (now=%s, unknown=%d)",
+            snap.raw.get("now") or [],
+            int(snap.raw.get("unknown_now") or 0),
+        )
+        return True
 
     async def connect(self, output_interface: SelfieInput) -> None:
         """
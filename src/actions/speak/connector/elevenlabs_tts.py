@@ -41,6 +41,7 @@ class SpeakElevenLabsTTSConnector(ActionConnector[SpeakInput]):
         voice_id = getattr(self.config, "voice_id", "JBFqnCBsd6RMkjVDRZzb")
         model_id = getattr(self.config, "model_id", "eleven_flash_v2_5")
         output_format = getattr(self.config, "output_format", "mp3_44100_128")
+        cache_dir = getattr(self.config, "cache_dir", None)
 
         # silence rate
         self.silence_rate = getattr(self.config, "silence_rate", 0)
@@ -107,6 +108,7 @@ class SpeakElevenLabsTTSConnector(ActionConnector[SpeakInput]):
             voice_id=voice_id,
             model_id=model_id,
             output_format=output_format,
+            cache_dir=cache_dir,
         )
         self.tts.start()
 
@@ -1,4 +1,5 @@
 import asyncio
+import contextvars
 import logging
 import threading
 import time
@@ -48,7 +49,9 @@ class BackgroundOrchestrator:
                     f"Background {background.name} already submitted, skipping."
                 )
                 continue
-            self._background_executor.submit(self._run_background_loop, background)
+            self._background_executor.submit(
+                contextvars.copy_context().run, self._run_background_loop, background
+            )
             self._submitted_backgrounds.add(background.name)
 
         return asyncio.Future()
@@ -20,6 +20,7 @@ class ElevenLabsTTS(Background):
         voice_id = getattr(self.config, "voice_id", "JBFqnCBsd6RMkjVDRZzb")
         model_id = getattr(self.config, "model_id", "eleven_flash_v2_5")
         output_format = getattr(self.config, "output_format", "mp3_44100_128")
+        cache_dir = getattr(self.config, "cache_dir", None)
 
         # Initialize Eleven Labs TTS Provider
         self.tts = ElevenLabsTTSProvider(
@@ -29,6 +30,7 @@ class ElevenLabsTTS(Background):
             voice_id=voice_id,
             model_id=model_id,
             output_format=output_format,
+            cache_dir=cache_dir,
         )
         self.tts.start()
 
@@ -1,8 +1,11 @@
 import asyncio
+import heapq
 import logging
 import threading
 import time
-from typing import Dict, List
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Dict, List, Optional
 
 from bleak import BleakScanner
 from bleak.backends.scanner import AdvertisementData
@@ -19,6 +22,150 @@ from providers.odom_provider import OdomProvider
 from providers.rtk_provider import RtkProvider
 
 
+class BLEDeviceTable:
+    """
+    Bounded table of the BLE devices seen in recent scans.
+
+    Devices are kept in the order they were last seen, so devices that have
+    not been seen for ``ttl_scans`` scans are evicted from the front of the
+    table when a scan ends, and when the table is full the device seen least
+    recently makes room for a new one. Memory therefore stays flat however
+    many devices pass by.
+
+    Parameters
+    ----------
+    max_devices : int
+        Maximum number of devices in the table.
+    ttl_scans : int
+        Number of scans a device is kept after it was last seen.
+    top_k : int
+        Number of strongest devices reported per scan.
+    """
+
+    def __init__(self, max_devices: int = 2000, ttl_scans: int = 12, top_k: int = 20):
+        self.max_devices = max_devices
+        self.ttl_scans = ttl_scans
+        self.top_k = top_k
+
+        self.scan_idx = 0
+        self._devices: "OrderedDict[str, RFData]" = OrderedDict()
+        self._last_seen: Dict[str, int] = {}
+        self._seen_this_scan: Dict[str, RFData] = {}
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._devices
+
+    def get(self, address: str) -> Optional[RFData]:
+        """
+        Get a device by address.
+
+        Parameters
+        ----------
+        address : str
+            Bluetooth address.
+
+        Returns
+        -------
+        Optional[RFData]
+            The device, or None if it is not in the table.
+        """
+        return self._devices.get(address)
+
+    def update(
+        self,
+        address: str,
+        name: Optional[str],
+        rssi: int,
+        tx_power: Optional[int],
+        service_uuid: str,
+        mfgkey: str,
+        mfgval: str,
+    ) -> RFData:
+        """
+        Record one advertisement.
+
+        Everything is updated EXCEPT that a resolved name is not overwritten
+        and a long mfgval is not replaced with a short one; the TX power is
+        filled in when it first arrives.
+
+        Returns
+        -------
+        RFData
+            The device entry.
+        """
+        device = self._devices.get(address)
+        if device is not None:
+            device.rssi = rssi
+            device.unix_ts = time.time()
+            if tx_power and device.tx_power is None:
+                device.tx_power = tx_power
+                logging.info(f"Updated BLE tx_power: {device.tx_power}")
+            if name and device.name is None:
+                device.name = name
+                logging.info(f"Updated BLE name: {device.name}")
+            if len(mfgval) > len(device.mfgval):
+                device.mfgval = mfgval
+                logging.info(f"Updated BLE mfgval: {device.mfgval}")
+            self._devices.move_to_end(address)
+        else:
+            # this is a new device
+            if len(self._devices) >= self.max_devices:
+                self._evict_oldest()
+            device = RFData(
+                unix_ts=time.time(),
+                address=address,
+                name=name if name else None,
+                rssi=rssi,
+                tx_power=tx_power if tx_power else None,
+                service_uuid=service_uuid,
+                mfgkey=mfgkey,
+                mfgval=mfgval,
+            )
+            self._devices[address] = device
+
+        self._last_seen[address] = self.scan_idx
+        self._seen_this_scan[address] = device
+        return device
+
+    def _evict_oldest(self) -> None:
+        address, _ = self._devices.popitem(last=False)
+        del self._last_seen[address]
+        self._seen_this_scan.pop(address, None)
+        self.evicted += 1
+
+    def end_scan(self) -> List[RFData]:
+        """
+        Finish the current scan and evict expired devices.
+
+        Returns
+        -------
+        List[RFData]
+            Snapshots of the devices seen during the scan: the ``top_k``
+            strongest ones, plus any others with a local name.
+        """
+        seen = list(self._seen_this_scan.values())
+        strongest = heapq.nlargest(self.top_k, seen, key=lambda d: d.rssi)
+        selected = {d.address for d in strongest}
+        delta = strongest + [d for d in seen if d.name and d.address not in selected]
+
+        self._seen_this_scan = {}
+        self.scan_idx += 1
+
+        # Devices are ordered by last sighting, so the expired ones are in front
+        horizon = self.scan_idx - self.ttl_scans
+        while self._devices:
+            address = next(iter(self._devices))
+            if self._last_seen[address] >= horizon:
+                break
+            self._evict_oldest()
+
+        return [replace(d) for d in delta]
+
+
 class RFmapper(Background):
     """
     Assemble location and BLE data.
@@ -84,9 +231,18 @@ class RFmapper(Background):
         self.odom = OdomProvider()
         logging.info(f"Mapper Odom Provider: {self.odom}")
 
-        self.fds = FabricDataSubmitter(api_key=self.api_key, write_to_local_file=True)
+        self.fds = FabricDataSubmitter(
+            api_key=self.api_key,
+            write_to_local_file=True,
+            batch_size=getattr(config, "fabric_batch_size", 10),
+            batch_interval=getattr(config, "fabric_batch_interval", 5.0),
+        )
 
-        self.seen_devices: Dict[str, RFData] = {}
+        self.seen_devices = BLEDeviceTable(
+            max_devices=getattr(config, "max_devices", 2000),
+            ttl_scans=getattr(config, "device_ttl_scans", 12),
+            top_k=getattr(config, "top_k", 20),
+        )
 
         self.seen_names: List[str] = []
 
@@ -117,41 +273,15 @@ class RFmapper(Background):
             if advdata.service_uuids:
                 service_uuid = advdata.service_uuids[0]
 
-            # we want to update everything EXCEPT we do not want to overwrite a resolved name
-            # and we do not want to replace a long mfgval with a short one
-            # we also want to update the TX power if we receive those data
-            rssi = advdata.rssi
-            tx_power = advdata.tx_power
-
-            if addr in self.seen_devices:
-                self.seen_devices[addr].rssi = rssi
-                self.seen_devices[addr].unix_ts = time.time()
-                if tx_power and self.seen_devices[addr].tx_power is None:
-                    self.seen_devices[addr].tx_power = tx_power
-                    logging.info(
-                        f"Updated BLE tx_power: {self.seen_devices[addr].tx_power}"
-                    )
-                if local_name and self.seen_devices[addr].name is None:
-                    self.seen_devices[addr].name = local_name
-                    logging.info(f"Updated BLE name: {self.seen_devices[addr].name}")
-                if len(mfgval) > len(self.seen_devices[addr].mfgval):
-                    self.seen_devices[addr].mfgval = mfgval
-                    logging.info(
-                        f"Updated BLE mfgval: {self.seen_devices[addr].mfgval}"
-                    )
-            else:
-
-                # this is a new device
-                self.seen_devices[addr] = RFData(
-                    unix_ts=time.time(),
-                    address=addr,
-                    name=local_name if local_name else None,
-                    rssi=rssi,
-                    tx_power=tx_power if tx_power else None,
-                    service_uuid=service_uuid,
-                    mfgkey=mfgkey,
-                    mfgval=mfgval,
-                )
+            self.seen_devices.update(
+                addr,
+                local_name,
+                advdata.rssi,
+                advdata.tx_power,
+                service_uuid,
+                mfgkey,
+                mfgval,
+            )
 
         scanner = BleakScanner(detection_callback)
 
@@ -160,21 +290,13 @@ class RFmapper(Background):
         await asyncio.sleep(5.0)
         await scanner.stop()
 
-        logging.debug(f"ready to sort: {self.seen_devices.values()}")
-
-        # Get the top 20 devices with the strongest RSSI
-        sorted_devices = sorted(
-            self.seen_devices.values(), key=lambda d: d.rssi, reverse=True
+        # return the strongest devices of this scan, and the ones with a local name
+        final_list = self.seen_devices.end_scan()
+        logging.debug(
+            f"Scan...{final_list} ({len(self.seen_devices)} devices tracked, "
+            f"{self.seen_devices.evicted} evicted)"
         )
 
-        final_list: List[RFData] = []
-        for i, device in enumerate(sorted_devices):
-            # return all the strong ones, or, the ones with a local name
-            # some will be both, but that's good
-            if i < 20 or device.name:
-                final_list.append(device)
-        logging.debug(f"Scan...{final_list}")
-
         self.scan_idx += 1
 
         return final_list
@@ -196,6 +318,7 @@ class RFmapper(Background):
         self.running = False
         time.sleep(1)
         self.thread.join()
+        self.fds.stop()
 
     def run(self) -> None:
         """
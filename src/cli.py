@@ -1,11 +1,13 @@
 import logging
 import multiprocessing as mp
 import os
+from typing import Optional
 
 import dotenv
-import json5
 import typer
 
+from providers.sensor_log_provider import sensor_log_to_jsonl
+from runtime.config_cache import is_mode_config, load_raw_config
 from runtime.multi_mode.config import load_mode_config
 
 app = typer.Typer()
@@ -99,10 +101,9 @@ def list_configs() -> None:
             config_path = os.path.join(config_dir, filename)
 
             try:
-                with open(config_path, "r") as f:
-                    raw_config = json5.load(f)
+                raw_config = load_raw_config(config_path)
 
-                if "modes" in raw_config and "default_mode" in raw_config:
+                if is_mode_config(raw_config):
                     mode_configs.append(
                         (config_name, raw_config.get("name", config_name))
                     )
@@ -127,6 +128,26 @@ def list_configs() -> None:
             print(f"• {config_name} - {display_name}")
 
 
+@app.command()
+def convert_log(log_path: str, output_path: Optional[str] = None) -> None:
+    """
+    Convert a binary sensor log (.slog) to JSON lines.
+
+    Parameters
+    ----------
+    log_path : str
+        Path to the sensor log, e.g. dump/lidar_1700000000_0Z.slog
+    output_path : str, optional
+        Destination file. Defaults to the log path with a .jsonl extension.
+    """
+    try:
+        written = sensor_log_to_jsonl(log_path, output_path)
+        print(f"Wrote {written}")
+    except (FileNotFoundError, ValueError) as e:
+        logging.error(f"Could not convert sensor log: {e}")
+        raise typer.Exit(1)
+
+
 if __name__ == "__main__":
 
     # Fix for Linux multiprocessing
@@ -4,9 +4,15 @@ import typing as T
 
 from actions import describe_action
 from inputs.base import Sensor
+from llm import LLM
+from llm.tokens import token_report
 from providers.io_provider import IOProvider
+from providers.reflex_provider import ReflexProvider
 from runtime.single_mode.config import RuntimeConfig
 
+# Formatted buffer of every input, and the reflex messages, read by a fuse
+_ReadInputs = T.Tuple[T.List[T.Optional[str]], T.List[str]]
+
 
 class Fuser:
     """
@@ -26,6 +32,16 @@ class Fuser:
         Runtime configuration settings.
     io_provider : IOProvider
         Provider for handling I/O data and timing.
+    reflex_provider : ReflexProvider
+        Provider of the messages of the reflexes that fired.
+    inputs_changed : bool
+        Whether the last fuse had anything new: an input that received data
+        since the previous fuse, a reflex message, a finished action or
+        kept inputs.
+    token_report : dict[str, int]
+        Tokens per section of the last prompt, the tools sent with it, and
+        the total; counted while debug logging or the ``token_report``
+        option of the LLM is enabled.
     """
 
     def __init__(self, config: RuntimeConfig):
@@ -39,6 +55,24 @@ class Fuser:
         """
         self.config = config
         self.io_provider = IOProvider()
+        self.reflex_provider = ReflexProvider()
+        self.inputs_changed = True
+        self.token_report: T.Dict[str, int] = {}
+
+        # Inputs read by the last fuse, and those kept for the next one
+        self._last_inputs: _ReadInputs = ([], [])
+        self._kept_inputs: T.Optional[_ReadInputs] = None
+
+    def keep_inputs(self) -> None:
+        """
+        Reuse the inputs read by the last fuse in the next one.
+
+        Reading an input consumes its buffer, so a prompt that is never
+        answered, e.g. because a higher-priority input superseded it, would
+        lose the inputs it read. The next fuse uses the kept input of every
+        input that has nothing newer, and the kept reflex messages.
+        """
+        self._kept_inputs = self._last_inputs
 
     def fuse(self, inputs: list[Sensor], finished_promises: list[T.Any]) -> str:
         """
@@ -62,32 +96,72 @@ class Fuser:
         # Record the timestamp of the input
         self.io_provider.fuser_start_time = time.time()
 
+        # Ask before reading, since reading marks the buffers as read
+        inputs_changed = any(input.buffer_changed() for input in inputs)
         input_strings = [input.formatted_latest_buffer() for input in inputs]
+
+        # what the reflexes did since the previous prompt
+        reflex_messages = self.reflex_provider.take_messages()
+
+        kept, self._kept_inputs = self._kept_inputs, None
+        if kept is not None:
+            kept_strings, kept_reflex_messages = kept
+            if len(kept_strings) == len(input_strings):
+                input_strings = [
+                    new if new is not None else old
+                    for new, old in zip(input_strings, kept_strings)
+                ]
+            reflex_messages = kept_reflex_messages + reflex_messages
+        self.inputs_changed = (
+            inputs_changed
+            or kept is not None
+            or bool(reflex_messages)
+            or bool(finished_promises)
+        )
+        self._last_inputs = (list(input_strings), reflex_messages)
         logging.debug(f"InputMessageArray: {input_strings}")
 
         # Combine all inputs, memories, and configurations into a single prompt
-        system_prompt = "\nBASIC CONTEXT:\n" + self.config.system_prompt_base + "\n"
+        basic_context = "\nBASIC CONTEXT:\n" + self.config.system_prompt_base + "\n"
+
+        if reflex_messages:
+            input_strings.append(
+                "\nINPUT: Reflexes\n// START\n"
+                + "\n".join(reflex_messages)
+                + "\n// END\n"
+            )
 
         inputs_fused = " ".join([s for s in input_strings if s is not None])
 
         # if we provide laws from blockchain, these override the locally stored rules
         # the rules are not provided in the system prompt, but as a separate INPUT,
         # since they are flowing from the outside world
+        laws = ""
         if "Universal Laws" not in inputs_fused:
-            system_prompt += "\nLAWS:\n" + self.config.system_governance
+            laws = "\nLAWS:\n" + self.config.system_governance
 
+        examples = ""
         if self.config.system_prompt_examples:
-            system_prompt += "\n\nEXAMPLES:\n" + self.config.system_prompt_examples
+            examples = "\n\nEXAMPLES:\n" + self.config.system_prompt_examples
+
+        system_prompt = basic_context + laws + examples
+
+        # the tools already describe the actions to an LLM that receives them
+        cortex_llm = getattr(self.config, "cortex_llm", None)
+        tools_describe_actions = (
+            isinstance(cortex_llm, LLM) and cortex_llm.tools_describe_actions
+        )
 
         # descriptions of possible actions
         actions_fused = ""
 
-        for action in self.config.agent_actions:
-            desc = describe_action(
-                action.name, action.llm_label, action.exclude_from_prompt
-            )
-            if desc:
-                actions_fused += desc + "\n\n"
+        if not tools_describe_actions:
+            for action in self.config.agent_actions:
+                desc = describe_action(
+                    action.name, action.llm_label, action.exclude_from_prompt
+                )
+                if desc:
+                    actions_fused += desc + "\n\n"
 
         question_prompt = "What will you do? Actions:"
 
@@ -96,10 +170,35 @@ class Fuser:
         # (2) all the inputs (vision, sound, etc.)
         # (3) a (typically) fixed list of available actions
         # (4) a (typically) fixed system prompt requesting commands to be generated
-        fused_prompt = f"{system_prompt}\n\nAVAILABLE INPUTS:\n{inputs_fused}\nAVAILABLE ACTIONS:\n\n{actions_fused}\n\n{question_prompt}"
+        if tools_describe_actions:
+            question_prompt = "What will you do? Call the tools for your actions."
+            fused_prompt = f"{system_prompt}\n\nAVAILABLE INPUTS:\n{inputs_fused}\n{question_prompt}"
+        else:
+            fused_prompt = f"{system_prompt}\n\nAVAILABLE INPUTS:\n{inputs_fused}\nAVAILABLE ACTIONS:\n\n{actions_fused}\n\n{question_prompt}"
 
         logging.debug(f"FINAL PROMPT: {fused_prompt}")
 
+        # Counting tokens is costly, so only count when someone looks
+        if logging.getLogger().isEnabledFor(logging.DEBUG) or (
+            isinstance(cortex_llm, LLM) and cortex_llm.reports_tokens
+        ):
+            self.token_report = token_report(
+                {
+                    "system": basic_context,
+                    "laws": laws,
+                    "examples": examples,
+                    "inputs": inputs_fused,
+                    "actions": actions_fused,
+                    "question": question_prompt,
+                },
+                (
+                    cortex_llm.function_schemas
+                    if isinstance(cortex_llm, LLM) and cortex_llm.supports_tools
+                    else None
+                ),
+            )
+            logging.debug(f"Prompt tokens per section: {self.token_report}")
+
         # Record the global prompt, actions and inputs
         self.io_provider.set_fuser_system_prompt(f"{system_prompt}")
         self.io_provider.set_fuser_inputs(inputs_fused)
@@ -1,9 +1,8 @@
 import logging
 from typing import Any, Dict
 
-import aiohttp
-
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
+from providers.http_client_provider import HTTPClientError, HTTPClientProvider
 
 
 async def start_nav2_hook(context: Dict[str, Any]):
@@ -20,42 +19,41 @@ async def start_nav2_hook(context: Dict[str, Any]):
     nav2_url = f"{base_url}/start/nav2"
 
     elevenlabs_provider: ElevenLabsTTSProvider = ElevenLabsTTSProvider()
+    http = HTTPClientProvider()
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                nav2_url,
-                json={"map_name": map_name},
-                headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=5),
-            ) as response:
-
-                if response.status == 200:
-                    result = await response.json()
-                    logging.info(
-                        f"Nav2 started successfully: {result.get('message', 'Success')}"
-                    )
-                    elevenlabs_provider.add_pending_message(
-                        "Navigation system has started successfully."
-                    )
-                    return {
-                        "status": "success",
-                        "message": "Nav2 process initiated",
-                        "response": result,
-                    }
-                else:
-                    try:
-                        error_info = await response.json()
-                    except Exception as _:
-                        error_info = {"message": "Unknown error"}
-                    logging.error(
-                        f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
-                    )
-                    raise Exception(
-                        f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
-                    )
+        response = await http.post(
+            nav2_url,
+            json={"map_name": map_name},
+            headers={"Content-Type": "application/json"},
+            timeout=5,
+        )
+        if response.status_code == 200:
+            result = response.json()
+            logging.info(
+                f"Nav2 started successfully: {result.get('message', 'Success')}"
+            )
+            elevenlabs_provider.add_pending_message(
+                "Navigation system has started successfully."
+            )
+            return {
+                "status": "success",
+                "message": "Nav2 process initiated",
+                "response": result,
+            }
+        else:
+            try:
+                error_info = response.json()
+            except Exception as _:
+                error_info = {"message": "Unknown error"}
+            logging.error(
+                f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
+            )
+            raise Exception(
+                f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
+            )
 
-    except aiohttp.ClientError as e:
+    except HTTPClientError as e:
         logging.error(f"Error calling Nav2 API: {str(e)}")
         raise Exception(f"Error calling Nav2 API: {str(e)}")
 
@@ -72,36 +70,36 @@ async def stop_nav2_hook(context: Dict[str, Any]):
     base_url = context.get("base_url", "http://localhost:5000")
     nav2_url = f"{base_url}/stop/nav2"
 
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                nav2_url,
-                headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=5),
-            ) as response:
+    http = HTTPClientProvider()
 
-                if response.status == 200:
-                    result = await response.json()
-                    logging.info(
-                        f"Nav2 started successfully: {result.get('message', 'Success')}"
-                    )
-                    return {
-                        "status": "success",
-                        "message": "Nav2 process initiated",
-                        "response": result,
-                    }
-                else:
-                    try:
-                        error_info = await response.json()
-                    except Exception as _:
-                        error_info = {"message": "Unknown error"}
-                    logging.error(
-                        f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
-                    )
-                    raise Exception(
-                        f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
-                    )
+    try:
+        response = await http.post(
+            nav2_url,
+            headers={"Content-Type": "application/json"},
+            timeout=5,
+        )
+        if response.status_code == 200:
+            result = response.json()
+            logging.info(
+                f"Nav2 started successfully: {result.get('message', 'Success')}"
+            )
+            return {
+                "status": "success",
+                "message": "Nav2 process initiated",
+                "response": result,
+            }
+        else:
+            try:
+                error_info = response.json()
+            except Exception as _:
+                error_info = {"message": "Unknown error"}
+            logging.error(
+                f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
+            )
+            raise Exception(
+                f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
+            )
 
-    except aiohttp.ClientError as e:
+    except HTTPClientError as e:
         logging.error(f"Error calling Nav2 API: {str(e)}")
         raise Exception(f"Error calling Nav2 API: {str(e)}")
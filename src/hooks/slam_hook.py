@@ -1,9 +1,8 @@
 import logging
 from typing import Any, Dict
 
-import aiohttp
-
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
+from providers.http_client_provider import HTTPClientError, HTTPClientProvider
 
 
 async def start_slam_hook(context: Dict[str, Any]):
@@ -18,37 +17,37 @@ async def start_slam_hook(context: Dict[str, Any]):
     base_url = context.get("base_url", "http://localhost:5000")
     slam_url = f"{base_url}/start/slam"
 
+    http = HTTPClientProvider()
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                slam_url,
-                headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=5),
-            ) as response:
-
-                if response.status == 200:
-                    result = await response.json()
-                    logging.info(
-                        f"SLAM started successfully: {result.get('message', 'Success')}"
-                    )
-                    return {
-                        "status": "success",
-                        "message": "SLAM process initiated",
-                        "response": result,
-                    }
-                else:
-                    try:
-                        error_info = await response.json()
-                    except Exception as _:
-                        error_info = {"message": "Unknown error"}
-                    logging.error(
-                        f"Failed to start SLAM: {error_info.get('message', 'Unknown error')}"
-                    )
-                    raise Exception(
-                        f"Failed to start SLAM: {error_info.get('message', 'Unknown error')}"
-                    )
-
-    except aiohttp.ClientError as e:
+        response = await http.post(
+            slam_url,
+            headers={"Content-Type": "application/json"},
+            timeout=5,
+        )
+        if response.status_code == 200:
+            result = response.json()
+            logging.info(
+                f"SLAM started successfully: {result.get('message', 'Success')}"
+            )
+            return {
+                "status": "success",
+                "message": "SLAM process initiated",
+                "response": result,
+            }
+        else:
+            try:
+                error_info = response.json()
+            except Exception as _:
+                error_info = {"message": "Unknown error"}
+            logging.error(
+                f"Failed to start SLAM: {error_info.get('message', 'Unknown error')}"
+            )
+            raise Exception(
+                f"Failed to start SLAM: {error_info.get('message', 'Unknown error')}"
+            )
+
+    except HTTPClientError as e:
         logging.error(f"Error calling SLAM API: {str(e)}")
         raise Exception(f"Error calling SLAM API: {str(e)}")
 
@@ -70,66 +69,62 @@ async def stop_slam_hook(context: Dict[str, Any]):
     stop_slam_url = f"{base_url}/stop/slam"
 
     elevenlabs_provider: ElevenLabsTTSProvider = ElevenLabsTTSProvider()
+    http = HTTPClientProvider()
 
     try:
-        async with aiohttp.ClientSession() as session:
-            # Save the SLAM map before stopping
-            async with session.post(
-                save_slam_map_url,
-                json={"map_name": map_name},
-                headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as save_response:
-
-                if save_response.status == 200:
-                    save_result = await save_response.json()
-                    logging.info(
-                        f"SLAM map saved successfully: {save_result.get('message', 'Success')}"
-                    )
-                    elevenlabs_provider.add_pending_message(
-                        "Map has been saved successfully."
-                    )
-                else:
-                    try:
-                        error_info = await save_response.json()
-                    except Exception as _:
-                        error_info = {"message": "Unknown error"}
-                    logging.error(
-                        f"Failed to save SLAM map: {error_info.get('message', 'Unknown error')}"
-                    )
-                    raise Exception(
-                        f"Failed to save SLAM map: {error_info.get('message', 'Unknown error')}"
-                    )
-
-            # Stop the SLAM process
-            async with session.post(
-                stop_slam_url,
-                headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as response:
-
-                if response.status == 200:
-                    result = await response.json()
-                    logging.info(
-                        f"SLAM stopped successfully: {result.get('message', 'Success')}"
-                    )
-                    return {
-                        "status": "success",
-                        "message": "SLAM process stopped",
-                        "response": result,
-                    }
-                else:
-                    try:
-                        error_info = await response.json()
-                    except Exception as _:
-                        error_info = {"message": "Unknown error"}
-                    logging.error(
-                        f"Failed to stop SLAM: {error_info.get('message', 'Unknown error')}"
-                    )
-                    raise Exception(
-                        f"Failed to stop SLAM: {error_info.get('message', 'Unknown error')}"
-                    )
-
-    except aiohttp.ClientError as e:
+        # Save the SLAM map before stopping
+        save_response = await http.post(
+            save_slam_map_url,
+            json={"map_name": map_name},
+            headers={"Content-Type": "application/json"},
+            timeout=10,
+        )
+        if save_response.status_code == 200:
+            save_result = save_response.json()
+            logging.info(
+                f"SLAM map saved successfully: {save_result.get('message', 'Success')}"
+            )
+            elevenlabs_provider.add_pending_message("Map has been saved successfully.")
+        else:
+            try:
+                error_info = save_response.json()
+            except Exception as _:
+                error_info = {"message": "Unknown error"}
+            logging.error(
+                f"Failed to save SLAM map: {error_info.get('message', 'Unknown error')}"
+            )
+            raise Exception(
+                f"Failed to save SLAM map: {error_info.get('message', 'Unknown error')}"
+            )
+
+        # Stop the SLAM process
+        response = await http.post(
+            stop_slam_url,
+            headers={"Content-Type": "application/json"},
+            timeout=10,
+        )
+        if response.status_code == 200:
+            result = response.json()
+            logging.info(
+                f"SLAM stopped successfully: {result.get('message', 'Success')}"
+            )
+            return {
+                "status": "success",
+                "message": "SLAM process stopped",
+                "response": result,
+            }
+        else:
+            try:
+                error_info = response.json()
+            except Exception as _:
+                error_info = {"message": "Unknown error"}
+            logging.error(
+                f"Failed to stop SLAM: {error_info.get('message', 'Unknown error')}"
+            )
+            raise Exception(
+                f"Failed to stop SLAM: {error_info.get('message', 'Unknown error')}"
+            )
+
+    except HTTPClientError as e:
         logging.error(f"Error calling SLAM API: {str(e)}")
         raise Exception(f"Error calling SLAM API: {str(e)}")
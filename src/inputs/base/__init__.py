@@ -29,14 +29,23 @@ class Sensor(T.Generic[R]):
     --------------
     R
         The raw input type that this agent handles
+
+    Attributes
+    ----------
+    priority : int
+        Priority from the ``priority`` config key (default 0). When an input
+        wakes the cortex loop, an LLM request in flight for a tick of lower
+        priority is superseded by a new tick.
     """
 
+    priority: int = 0
+
     def __init__(self, config: SensorConfig):
         """
         Initialize an Sensor instance.
         """
         self.config = config
-        pass
+        self.priority = int(getattr(config, "priority", 0))
 
     async def _raw_to_text(self, raw_input: R) -> str:
         """
@@ -91,6 +100,20 @@ class Sensor(T.Generic[R]):
         """
         raise NotImplementedError
 
+    def buffer_changed(self) -> bool:
+        """
+        Whether the input received anything since its buffer was last read.
+
+        Called by the fuser before ``formatted_latest_buffer``. Inputs that
+        cannot tell report a change.
+
+        Returns
+        -------
+        bool
+            True if the buffer has new data
+        """
+        return True
+
     async def listen(self) -> T.AsyncIterator[R]:
         """
         Create an asynchronous iterator that yields raw input events.
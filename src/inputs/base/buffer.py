@@ -0,0 +1,134 @@
+import typing as T
+from collections import deque
+from enum import Enum
+
+M = T.TypeVar("M")
+
+
+class BufferPolicy(Enum):
+    """
+    How a MessageBuffer stores a new message.
+
+    LATEST keeps only the newest message, for inputs whose readings
+    supersede each other (vision, lidar, odometry, battery).
+    JOIN merges new messages into the last one until the buffer is read,
+    for inputs where every message counts (speech).
+    DEDUPE drops a message equal to the last one and keeps a short history,
+    for inputs that repeat the same value (governance rules).
+    """
+
+    LATEST = "latest"
+    JOIN = "join"
+    DEDUPE = "dedupe"
+
+
+def _message_key(message: T.Any) -> T.Any:
+    return getattr(message, "message", message)
+
+
+def _join_text(previous: T.Any, message: T.Any) -> T.Any:
+    return f"{previous} {message}"
+
+
+class MessageBuffer(T.Generic[M]):
+    """
+    Bounded buffer of the messages of an input.
+
+    It replaces the ``self.messages`` list of the input plugins and supports
+    the list operations they use (``append``, ``len``, ``[-1]``, iteration
+    and ``clear``), but never holds more than ``maxlen`` messages and stores
+    them according to ``policy``. It also records whether a message was
+    stored since it was last read, so the fuser can tell whether the input
+    changed since the previous tick.
+
+    Parameters
+    ----------
+    policy : BufferPolicy
+        How new messages are stored.
+    maxlen : int
+        Maximum number of messages kept; LATEST always keeps one.
+    join : Callable[[M, M], M], optional
+        Merges a new message into the last one for JOIN; joins the text with
+        a space by default.
+    key : Callable[[M], Any], optional
+        The part of a message compared for DEDUPE; the ``message`` attribute,
+        or the message itself, by default.
+    """
+
+    def __init__(
+        self,
+        policy: BufferPolicy = BufferPolicy.LATEST,
+        maxlen: int = 10,
+        join: T.Optional[T.Callable[[M, M], M]] = None,
+        key: T.Optional[T.Callable[[M], T.Any]] = None,
+    ):
+        self.policy = policy
+        self._messages: T.Deque[M] = deque(
+            maxlen=1 if policy is BufferPolicy.LATEST else maxlen
+        )
+        self._join = join or _join_text
+        self._key = key or _message_key
+        self._changed = False
+
+    def append(self, message: M) -> None:
+        """
+        Store a message according to the policy.
+
+        Parameters
+        ----------
+        message : M
+            The message.
+        """
+        if self._messages:
+            if self.policy is BufferPolicy.JOIN:
+                self._messages[-1] = self._join(self._messages[-1], message)
+                self._changed = True
+                return
+            if self.policy is BufferPolicy.DEDUPE and self._key(
+                self._messages[-1]
+            ) == self._key(message):
+                return
+        self._messages.append(message)
+        self._changed = True
+
+    @property
+    def changed(self) -> bool:
+        """
+        Whether a message was stored since the buffer was last read.
+        """
+        return self._changed
+
+    def mark_read(self) -> None:
+        """
+        Mark the buffer as read without dropping its messages.
+        """
+        self._changed = False
+
+    def clear(self) -> None:
+        """
+        Drop all messages and mark the buffer as read.
+        """
+        self._messages.clear()
+        self._changed = False
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __bool__(self) -> bool:
+        return bool(self._messages)
+
+    def __getitem__(self, index: int) -> M:
+        return self._messages[index]
+
+    def __iter__(self) -> T.Iterator[M]:
+        return iter(self._messages)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MessageBuffer):
+            return list(self._messages) == list(other._messages)
+        if isinstance(other, list):
+            return list(self._messages) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MessageBuffer({self.policy.value}, {list(self._messages)!r})"
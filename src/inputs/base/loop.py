@@ -1,6 +1,8 @@
 import typing as T
 
 from inputs.base import Sensor, SensorConfig
+from inputs.base.buffer import MessageBuffer
+from inputs.base.notifier import InputNotifier
 
 R = T.TypeVar("R")
 
@@ -11,25 +13,63 @@ class FuserInput(Sensor[R]):
 
     Repeatedly polls for input events in an async loop, yielding results
     as they become available.
+
+    Inputs whose provider can signal new data call ``use_notifier`` in their
+    constructor and call ``notifier.notify()`` after buffering data. The loop
+    then sleeps until notified and drains ``_poll`` until it returns None, so
+    ``_poll`` must not wait in that mode. The final None is yielded as well,
+    which tells the input that its buffer has been read, as an empty poll
+    would.
     """
 
+    notifier: T.Optional[InputNotifier] = None
+    _wakeups: int = 0
+    _events: int = 0
+
     def __init__(self, config: SensorConfig = SensorConfig()):
         """
         Initialize FuserInput instance.
         """
         super().__init__(config)
 
+    def use_notifier(self) -> InputNotifier:
+        """
+        Switch the input from periodic polling to push notifications.
+
+        Returns
+        -------
+        InputNotifier
+            The notifier to signal new data through.
+        """
+        self.notifier = InputNotifier()
+        return self.notifier
+
     async def _listen_loop(self) -> T.AsyncIterator[R]:
         """
-        Main polling loop that continuously yields input events.
+        Main loop that continuously yields input events.
 
         Yields
         ------
         R
-            Raw input events from polling
+            Raw input events, from polling or after a notification
         """
         while True:
-            yield await self._poll()
+            if self.notifier is None:
+                event = await self._poll()
+                self._wakeups += 1
+                if event is not None:
+                    self._events += 1
+                yield event
+                continue
+
+            await self.notifier.wait()
+            self._wakeups += 1
+            while True:
+                event = await self._poll()
+                yield event
+                if event is None:
+                    break
+                self._events += 1
 
     async def _poll(self) -> R:
         """
@@ -46,3 +86,40 @@ class FuserInput(Sensor[R]):
             Must be implemented by subclasses
         """
         raise NotImplementedError
+
+    def buffer_changed(self) -> bool:
+        """
+        Whether the input received anything since its buffer was last read.
+
+        Inputs that keep their ``messages`` in a MessageBuffer report whether
+        it changed; others report a change.
+
+        Returns
+        -------
+        bool
+            True if the buffer has new data
+        """
+        messages = getattr(self, "messages", None)
+        if isinstance(messages, MessageBuffer):
+            return messages.changed
+        return True
+
+    @property
+    def listen_stats(self) -> T.Dict[str, float]:
+        """
+        Get the listen loop metrics.
+
+        Returns
+        -------
+        Dict[str, float]
+            Loop wakeups and the events among them, whether the input is
+            push-notified, and the notifier metrics if it is.
+        """
+        stats: T.Dict[str, float] = {
+            "wakeups": self._wakeups,
+            "events": self._events,
+            "push": self.notifier is not None,
+        }
+        if self.notifier is not None:
+            stats.update(self.notifier.stats)
+        return stats
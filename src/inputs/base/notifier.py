@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+import typing as T
+from collections import deque
+
+
+class InputNotifier:
+    """
+    Thread-safe signal that an input has new data.
+
+    Providers call ``notify`` from their own threads (or callbacks) after
+    storing new data; the input awaits ``wait``, which returns only when
+    there is something to read instead of on a fixed polling period.
+    Notifications that arrive before the input wakes up are coalesced into
+    one wakeup. Wakeups are scheduled with ``loop.call_soon_threadsafe``, so
+    ``notify`` never blocks the provider.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: T.Optional[asyncio.AbstractEventLoop] = None
+        self._event: T.Optional[asyncio.Event] = None
+        # perf_counter of the oldest notification not yet waited for
+        self._pending_since: T.Optional[float] = None
+
+        self._latencies: T.Deque[float] = deque(maxlen=500)
+        self._notifications = 0
+        self._wakeups = 0
+
+    def notify(self) -> None:
+        """
+        Signal new data; safe to call from any thread.
+        """
+        with self._lock:
+            self._notifications += 1
+            if self._pending_since is not None:
+                return
+            self._pending_since = time.perf_counter()
+            loop, event = self._loop, self._event
+
+        if loop is None or event is None:
+            return
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # The loop is closed; the next ``wait`` sees the notification
+            pass
+
+    async def wait(self) -> None:
+        """
+        Wait until data has been signalled since the last call.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is not loop or self._event is None:
+                self._loop = loop
+                self._event = asyncio.Event()
+            event = self._event
+
+        while True:
+            with self._lock:
+                if self._pending_since is not None:
+                    self._latencies.append(time.perf_counter() - self._pending_since)
+                    self._pending_since = None
+                    self._wakeups += 1
+                    return
+                event.clear()
+            await event.wait()
+
+    @property
+    def stats(self) -> T.Dict[str, float]:
+        """
+        Get the notifier metrics.
+
+        Returns
+        -------
+        Dict[str, float]
+            Notifications, the wakeups they caused, and the mean and maximum
+            latency from a notification to the wakeup in milliseconds.
+        """
+        with self._lock:
+            latencies = list(self._latencies)
+            notifications, wakeups = self._notifications, self._wakeups
+        return {
+            "notifications": notifications,
+            "notified_wakeups": wakeups,
+            "latency_ms_mean": (
+                1000 * sum(latencies) / len(latencies) if latencies else 0.0
+            ),
+            "latency_ms_max": 1000 * max(latencies, default=0.0),
+        }
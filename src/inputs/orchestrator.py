@@ -1,6 +1,8 @@
 import asyncio
+import typing as T
 
 from inputs.base import Sensor
+from inputs.base.loop import FuserInput
 
 
 class InputOrchestrator:
@@ -46,3 +48,19 @@ class InputOrchestrator:
         """
         async for event in input.listen():
             await input.raw_to_text(event)
+
+    @property
+    def stats(self) -> T.List[T.Dict[str, T.Any]]:
+        """
+        Get the listen loop metrics of the inputs.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Per input, its class name and ``FuserInput.listen_stats``.
+        """
+        return [
+            {"input": type(input).__name__, **input.listen_stats}
+            for input in self.inputs
+            if isinstance(input, FuserInput)
+        ]
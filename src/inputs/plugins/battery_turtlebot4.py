@@ -7,6 +7,7 @@ from typing import List, Optional
 import zenoh
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers import BatteryStatus, IOProvider, TeleopsStatus, TeleopsStatusProvider
 from zenoh_msgs import open_zenoh_session, sensor_msgs
@@ -40,7 +41,7 @@ class TurtleBot4Battery(FuserInput[str]):
         self.status_provider = TeleopsStatusProvider(api_key=api_key)
 
         # Buffer for storing the final output
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         # Status variables
         self.battery_status = None
@@ -211,6 +212,6 @@ class TurtleBot4Battery(FuserInput[str]):
         self.io_provider.add_input(
             self.__class__.__name__, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers import BatteryStatus, IOProvider, TeleopsStatus, TeleopsStatusProvider
 
@@ -58,7 +59,7 @@ class UnitreeGo2Battery(FuserInput[str]):
         self.status_provider = TeleopsStatusProvider(api_key=api_key)
 
         # Messages buffer
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         # create subscriber
         self.low_state = None
@@ -209,6 +210,6 @@ class UnitreeGo2Battery(FuserInput[str]):
         self.io_provider.add_input(
             self.__class__.__name__, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
@@ -3,11 +3,12 @@ import logging
 import time
 from dataclasses import dataclass
 from queue import Queue
-from typing import List, Optional
+from typing import Optional
 
 from dimo import DIMO
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import BufferPolicy, MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 
@@ -51,7 +52,7 @@ class DIMOTesla(FuserInput[str]):
         self.io_provider = IOProvider()
 
         # Buffer for storing the final output
-        self.messages: List[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer(BufferPolicy.DEDUPE)
 
         # Buffer for storing messages
         self.message_buffer: Queue[str] = Queue()
@@ -216,11 +217,7 @@ class DIMOTesla(FuserInput[str]):
         """
         pending_message = await self._raw_to_text(raw_input)
         if pending_message is not None:
-            if len(self.messages) == 0:
-                self.messages.append(pending_message)
-            # only update if there has been a change
-            elif self.messages[-1].message != pending_message.message:
-                self.messages.append(pending_message)
+            self.messages.append(pending_message)
 
     def formatted_latest_buffer(self) -> Optional[str]:
         """
@@ -246,4 +243,5 @@ INPUT: {self.descriptor_for_LLM}
         self.io_provider.add_input(
             self.descriptor_for_LLM, latest_message.message, latest_message.timestamp
         )
+        self.messages.mark_read()
         return result
@@ -4,10 +4,10 @@ import time
 from dataclasses import dataclass
 from typing import Optional
 
-import requests
-
 from inputs.base import SensorConfig
+from inputs.base.buffer import BufferPolicy, MessageBuffer
 from inputs.base.loop import FuserInput
+from providers.http_client_provider import HTTPClientProvider
 from providers.io_provider import IOProvider
 
 # RULES are stored on the ETHEREUM HOLESKY testnet
@@ -65,7 +65,7 @@ class GovernanceEthereum(FuserInput[float]):
         }
 
         try:
-            response = requests.post(
+            response = self.http.post_sync(
                 self.rpc_url, json=payload, headers={"Content-Type": "application/json"}
             )
             logging.debug(f"Blockchain response status: {response.status_code}")
@@ -130,6 +130,7 @@ class GovernanceEthereum(FuserInput[float]):
         self.descriptor_for_LLM = "Universal Laws"
 
         self.io_provider = IOProvider()
+        self.http = HTTPClientProvider()
         self.POLL_INTERVAL = 5  # seconds
         self.rpc_url = "https://holesky.gateway.tenderly.co"  # Ethereum RPC URL
 
@@ -145,7 +146,7 @@ class GovernanceEthereum(FuserInput[float]):
         self.function_argument = "0000000000000000000000000000000000000000000000000000000000000002"  # Argument
 
         self.universal_rule = self.load_rules_from_blockchain()
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer(BufferPolicy.DEDUPE)
 
         logging.info(f"7777 rules: {self.universal_rule}")
 
@@ -156,7 +157,7 @@ class GovernanceEthereum(FuserInput[float]):
         await asyncio.sleep(self.POLL_INTERVAL)
 
         try:
-            rules = self.load_rules_from_blockchain()
+            rules = await asyncio.to_thread(self.load_rules_from_blockchain)
             logging.debug(f"7777 rules: {rules}")
             return rules
         except Exception as e:
@@ -181,11 +182,7 @@ class GovernanceEthereum(FuserInput[float]):
         pending_message = await self._raw_to_text(raw_input)
 
         if pending_message is not None:
-            if len(self.messages) == 0:
-                self.messages.append(pending_message)
-            # only update if there has been a change
-            elif self.messages[-1].message != pending_message.message:
-                self.messages.append(pending_message)
+            self.messages.append(pending_message)
 
     def formatted_latest_buffer(self) -> Optional[str]:
         """
@@ -212,5 +209,5 @@ INPUT: {self.descriptor_for_LLM}
             self.descriptor_for_LLM, latest_message.message, latest_message.timestamp
         )
         # no need to blank because we are only saving rare law changes
-        # self.messages = []
+        self.messages.mark_read()
         return result
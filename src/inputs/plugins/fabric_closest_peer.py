@@ -3,16 +3,12 @@ import logging
 import time
 from dataclasses import dataclass
 from queue import Queue
-from typing import List, Optional
-
-# `requests` is **optional** while we mock — keep import guarded
-try:
-    import requests  # type: ignore
-except ImportError:  # unit‑test env without requests installed
-    requests = None  # pylint: disable=invalid-name
+from typing import Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
+from providers.http_client_provider import HTTPClientProvider
 from providers.io_provider import IOProvider
 
 
@@ -36,7 +32,8 @@ class FabricClosestPeer(FuserInput[str]):
 
         self.descriptor_for_LLM = "Closest Peer from Fabric"
         self.io = IOProvider()
-        self.messages: List[str] = []
+        self.http = HTTPClientProvider()
+        self.messages: MessageBuffer[str] = MessageBuffer()
         self.msg_q: Queue[str] = Queue()
 
         # endpoint / mock toggle -------------------------------------------------
@@ -59,11 +56,6 @@ class FabricClosestPeer(FuserInput[str]):
                 f"FabricClosestPeer (mock): fabricated peer {peer_lat:.6f},{peer_lon:.6f}"
             )
         else:
-            if requests is None:
-                logging.error(
-                    "FabricClosestPeer: requests not available and mock_mode=False"
-                )
-                return None
             try:
                 lat = self.io.get_dynamic_variable("latitude")
                 lon = self.io.get_dynamic_variable("longitude")
@@ -73,7 +65,7 @@ class FabricClosestPeer(FuserInput[str]):
                 logging.info(
                     f"FabricClosestPeer: fetching closest peer for {lat:.6f}, {lon:.6f}"
                 )
-                resp = requests.post(
+                resp = await self.http.post(
                     self.fabric_endpoint,
                     json={
                         "method": "omp2p_findClosestPeer",
@@ -1,11 +1,11 @@
 import asyncio
 import time
-from collections import deque
 from dataclasses import dataclass
 from queue import Empty, Queue
-from typing import Deque, Optional
+from typing import Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.face_presence_provider import FacePresenceProvider
 from providers.io_provider import IOProvider
@@ -37,7 +37,7 @@ class FacePresence(FuserInput[str]):
     - Subscribe to the provider's callbacks and enqueue received text lines.
     - Poll the queue periodically (non-blocking) in `_poll()`.
     - Convert raw text into `Message` objects in `_raw_to_text()`.
-    - Keep a bounded in-memory history (`self.messages`, deque with maxlen=300).
+    - Keep only the latest message (`self.messages`, a latest-wins MessageBuffer).
     - Produce a compact, prompt-ready block via `formatted_latest_buffer()`.
     """
 
@@ -49,7 +49,7 @@ class FacePresence(FuserInput[str]):
 
         self.io_provider = IOProvider()
 
-        self.messages: Deque[Message] = deque(maxlen=300)
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         self.message_buffer: Queue[str] = Queue(maxsize=64)
 
@@ -58,9 +58,18 @@ class FacePresence(FuserInput[str]):
         recent_sec = float(getattr(self.config, "face_recent_sec", 2.0))
         fps = float(getattr(self.config, "face_poll_fps", 5.0))
 
+        subscribe = bool(getattr(self.config, "face_subscribe", False))
+
         self.provider: FacePresenceProvider = FacePresenceProvider(
-            base_url=base_url, recent_sec=recent_sec, fps=fps, timeout_s=2.0
+            base_url=base_url,
+            recent_sec=recent_sec,
+            fps=fps,
+            timeout_s=2.0,
+            subscribe=subscribe,
         )
+
+        # The provider only emits on change, so the last line stays current
+        self._latest_line: Optional[str] = None
         self._is_registered: bool = True
 
         self.provider.start()
@@ -104,13 +113,15 @@ class FacePresence(FuserInput[str]):
         Returns
         -------
         Optional[str]
-            The next message from the buffer if available, None otherwise
+            The next message from the buffer if available, otherwise the last
+            one, as presence has not changed since; None before the first
         """
         await asyncio.sleep(0.5)
         try:
-            return self.message_buffer.get_nowait()
+            self._latest_line = self.message_buffer.get_nowait()
         except Empty:
-            return None
+            pass
+        return self._latest_line
 
     async def _raw_to_text(self, raw_input: str) -> Message:
         """
@@ -1,11 +1,11 @@
 import asyncio
 import time
-from collections import deque
 from dataclasses import dataclass
 from queue import Empty, Queue
-from typing import Deque, Optional
+from typing import Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.gallery_identities_provider import GalleryIdentitiesProvider
 from providers.io_provider import IOProvider
@@ -37,7 +37,7 @@ class GalleryIdentities(FuserInput[str]):
     - Subscribe to the provider's callbacks and enqueue received text lines.
     - Poll the queue periodically (non-blocking) in `_poll()`.
     - Convert raw text into `Message` objects in `_raw_to_text()`.
-    - Keep a bounded in-memory history (`self.messages`, deque with maxlen=300).
+    - Keep only the latest message (`self.messages`, a latest-wins MessageBuffer).
     - Produce a compact, prompt-ready block via `formatted_latest_buffer()`.
     """
 
@@ -46,7 +46,7 @@ class GalleryIdentities(FuserInput[str]):
 
         Subscribes to `GalleryIdentitiesProvider` and adapts its messages into
         a compact INPUT block for the LLM (“Gallery Identities …”). Uses a small
-        in-memory queue and a bounded deque to hold the latest message.
+        in-memory queue and a latest-wins buffer to hold the latest message.
 
         Parameters
         ----------
@@ -54,6 +54,7 @@ class GalleryIdentities(FuserInput[str]):
             Runtime configuration. Supported (optional) fields:
             - face_http_base_url : str   Base URL of the face HTTP API (default "http://127.0.0.1:6793").
             - gallery_poll_fps   : float Polling rate in Hz (e.g., 0.5 → every 2 s).
+            - face_subscribe     : bool  Receive pushed updates instead of polling.
             - http_timeout_sec   : float HTTP timeout per request (seconds).
             - descriptor_for_LLM : str   Input block label (default "Gallery Identities").
 
@@ -62,16 +63,21 @@ class GalleryIdentities(FuserInput[str]):
 
         self.io_provider = IOProvider()
 
-        self.messages: Deque[Message] = deque(maxlen=300)
+        self.messages: MessageBuffer[Message] = MessageBuffer()
         self.message_buffer: Queue[str] = Queue(maxsize=64)
 
         # Config mirrors FacePresence input naming where possible
         base_url = getattr(self.config, "face_http_base_url", "http://127.0.0.1:6793")
         fps = float(getattr(self.config, "gallery_poll_fps", 1.0))  # default 1 Hz
 
+        subscribe = bool(getattr(self.config, "face_subscribe", False))
+
         self.provider: GalleryIdentitiesProvider = GalleryIdentitiesProvider(
-            base_url=base_url, fps=fps, timeout_s=2.0
+            base_url=base_url, fps=fps, timeout_s=2.0, subscribe=subscribe
         )
+
+        # The provider only emits on change, so the last line stays current
+        self._latest_line: Optional[str] = None
         self._is_registered: bool = True
 
         self.provider.start()
@@ -103,9 +109,10 @@ class GalleryIdentities(FuserInput[str]):
     async def _poll(self) -> Optional[str]:
         await asyncio.sleep(0.5)
         try:
-            return self.message_buffer.get_nowait()
+            self._latest_line = self.message_buffer.get_nowait()
         except Empty:
-            return None
+            pass
+        return self._latest_line
 
     async def _raw_to_text(self, raw_input: str) -> Message:
         """
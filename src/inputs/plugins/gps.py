@@ -6,6 +6,7 @@ from queue import Empty
 from typing import Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.gps_provider import GpsProvider
 from providers.io_provider import IOProvider
@@ -39,7 +40,7 @@ class Gps(FuserInput[str]):
 
         self.gps = GpsProvider()
         self.io_provider = IOProvider()
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
         self.descriptor_for_LLM = "GPS Location"
 
     async def _poll(self) -> Optional[dict]:
@@ -142,6 +143,6 @@ class Gps(FuserInput[str]):
         self.io_provider.add_input(
             self.__class__.__name__, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
@@ -2,9 +2,10 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.unitree_go2_lidar_localization_provider import (
@@ -55,7 +56,7 @@ class LidarLocalizationInput(FuserInput[str]):
         self.io_provider = IOProvider()
 
         # Message buffer
-        self.messages: List[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         # Descriptive text for LLM context
         self.descriptor_for_LLM = (
@@ -159,6 +160,6 @@ class LidarLocalizationInput(FuserInput[str]):
         self.io_provider.add_input(
             self.descriptor_for_LLM, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
@@ -4,11 +4,12 @@ import threading
 import time
 from dataclasses import dataclass
 from queue import Empty, Queue
-from typing import List, Optional
+from typing import Optional
 
 import websockets
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 
@@ -42,7 +43,7 @@ class MockInput(FuserInput[str]):
         super().__init__(config)
 
         # Buffer for storing the final output
-        self.messages: List[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         # Set IO Provider
         self.descriptor_for_LLM = getattr(self.config, "input_name", "Mock Input")
@@ -214,5 +215,5 @@ INPUT: {self.descriptor_for_LLM}
         self.io_provider.add_input(
             self.descriptor_for_LLM, self.messages[-1].message, time.time()
         )
-        self.messages = []
+        self.messages.clear()
         return result
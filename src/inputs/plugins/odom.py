@@ -3,9 +3,10 @@ import logging
 import time
 from dataclasses import dataclass
 from queue import Empty, Queue
-from typing import List, Optional
+from typing import Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.odom_provider import OdomProvider, RobotState
@@ -43,7 +44,7 @@ class Odom(FuserInput[str]):
         self.io_provider = IOProvider()
 
         # Buffer for storing the final output
-        self.messages: List[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         # Buffer for storing messages
         self.message_buffer: Queue[str] = Queue()
@@ -160,6 +161,6 @@ class Odom(FuserInput[str]):
         self.io_provider.add_input(
             self.descriptor_for_LLM, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
@@ -1,11 +1,11 @@
-import asyncio
 import json
 import logging
 import time
 from queue import Empty, Queue
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import BufferPolicy, MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.asr_provider import ASRProvider
 from providers.io_provider import IOProvider
@@ -27,7 +27,7 @@ class RivaASRInput(FuserInput[str]):
         super().__init__(config)
 
         # Buffer for storing the final output
-        self.messages: List[str] = []
+        self.messages: MessageBuffer[str] = MessageBuffer(BufferPolicy.JOIN)
 
         # Set IO Provider
         self.descriptor_for_LLM = "Voice"
@@ -36,6 +36,9 @@ class RivaASRInput(FuserInput[str]):
         # Buffer for storing messages
         self.message_buffer: Queue[str] = Queue()
 
+        # Signalled whenever a message is buffered
+        self.message_ready = self.use_notifier()
+
         # Initialize ASR provider
         api_key = getattr(self.config, "api_key", None)
         rate = getattr(self.config, "rate", 48000)
@@ -80,6 +83,7 @@ class RivaASRInput(FuserInput[str]):
                 asr_reply = json_message["asr_reply"]
                 if len(asr_reply.split()) > 1:
                     self.message_buffer.put(asr_reply)
+                    self.message_ready.notify()
                     logging.info("Detected ASR message: %s", asr_reply)
         except json.JSONDecodeError:
             pass
@@ -93,7 +97,6 @@ class RivaASRInput(FuserInput[str]):
         Optional[str]
             Message from the buffer if available, None otherwise
         """
-        await asyncio.sleep(0.1)
         try:
             message = self.message_buffer.get_nowait()
             return message
@@ -129,13 +132,10 @@ class RivaASRInput(FuserInput[str]):
         if pending_message is None:
             if len(self.messages) != 0:
                 # Skip sleep if there's already a message in the messages buffer
-                self.global_sleep_ticker_provider.skip_sleep = True
+                self.global_sleep_ticker_provider.wake(self.priority)
 
         if pending_message is not None:
-            if len(self.messages) == 0:
-                self.messages.append(pending_message)
-            else:
-                self.messages[-1] = f"{self.messages[-1]} {pending_message}"
+            self.messages.append(pending_message)
 
     def formatted_latest_buffer(self) -> Optional[str]:
         """
@@ -158,5 +158,5 @@ INPUT: {self.descriptor_for_LLM}
         self.io_provider.add_input(
             self.descriptor_for_LLM, self.messages[-1], time.time()
         )
-        self.messages = []
+        self.messages.clear()
         return result
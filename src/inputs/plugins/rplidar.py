@@ -2,9 +2,10 @@ import asyncio
 import time
 from dataclasses import dataclass
 from queue import Empty, Queue
-from typing import List, Optional
+from typing import Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.rplidar_provider import RPLidarProvider
@@ -42,7 +43,7 @@ class RPLidar(FuserInput[str]):
         self.io_provider = IOProvider()
 
         # Buffer for storing the final output
-        self.messages: List[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         # Buffer for storing messages
         self.message_buffer: Queue[str] = Queue()
@@ -142,7 +143,7 @@ class RPLidar(FuserInput[str]):
         self.io_provider.add_input(
             self.descriptor_for_LLM, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
 
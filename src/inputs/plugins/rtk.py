@@ -6,6 +6,7 @@ from queue import Empty
 from typing import Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.rtk_provider import RtkProvider
@@ -38,7 +39,7 @@ class Rtk(FuserInput[str]):
 
         self.rtk = RtkProvider()
         self.io_provider = IOProvider()
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
         self.descriptor_for_LLM = "Precision Location"
 
     async def _poll(self) -> Optional[dict]:
@@ -141,6 +142,6 @@ class Rtk(FuserInput[str]):
         self.io_provider.add_input(
             self.__class__.__name__, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
@@ -2,11 +2,11 @@
 
 import asyncio
 import time
-from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Optional
+from typing import Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 
@@ -33,7 +33,7 @@ class SelfieStatus(FuserInput[str]):
     def __init__(self, config: SensorConfig = SensorConfig()):
         super().__init__(config)
         self.io_provider = IOProvider()
-        self.messages: Deque[Message] = deque(maxlen=50)
+        self.messages: MessageBuffer[Message] = MessageBuffer()
         self._last_ts_seen: float = 0.0
         self.descriptor_for_LLM = "SelfieStatus"
 
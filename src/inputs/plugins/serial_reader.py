@@ -7,6 +7,7 @@ from typing import Optional
 import serial
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 
@@ -75,7 +76,7 @@ class SerialReader(FuserInput[str]):
         self.io_provider = IOProvider()
 
         # Messages buffer
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         self.descriptor_for_LLM = "Heart Rate and Grip Strength"
 
@@ -160,6 +161,6 @@ INPUT: {self.descriptor_for_LLM}
         self.io_provider.add_input(
             self.__class__.__name__, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
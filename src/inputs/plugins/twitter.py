@@ -3,10 +3,9 @@ import logging
 from queue import Empty, Queue
 from typing import AsyncIterator, List, Optional
 
-import aiohttp
-
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
+from providers.http_client_provider import HTTPClientProvider
 
 
 class TwitterInput(FuserInput[str]):
@@ -31,7 +30,7 @@ class TwitterInput(FuserInput[str]):
         self.buffer: List[str] = []
         self.message_buffer: Queue[str] = Queue()
         self.api_url = "https://api.openmind.org/api/core/query"
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.http = HTTPClientProvider()
         self.context: Optional[str] = None
 
         # Use getattr instead of .get() since config is an object, not a dict
@@ -39,48 +38,37 @@ class TwitterInput(FuserInput[str]):
 
     async def __aenter__(self):
         """Async context manager entry"""
-        await self._init_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
-            await self.session.close()
-
-    async def _init_session(self):
-        """Initialize aiohttp session if not exists."""
-        if self.session is None:
-            timeout = aiohttp.ClientTimeout(total=10)
-            self.session = aiohttp.ClientSession(timeout=timeout)
 
     async def _query_context(self, query: str):
         """Perform context query to RAG endpoint."""
-        await self._init_session()
-
         try:
-            async with self.session.post(  # type: ignore
+            response = await self.http.post(
                 self.api_url,
                 json={"query": query},
                 headers={"Content-Type": "application/json"},
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if "results" in data:
-                        documents = data["results"]
-                        context = "\n\n".join(
-                            [
-                                r.get("content", {}).get("text", "")
-                                for r in documents
-                                if r.get("content", {}).get("text", "")
-                            ]
-                        )
-                        self.context = context
-                        self.buffer = [context]  # Replace buffer with context
-                else:
-                    error_text = await response.text()
-                    logging.error(
-                        f"Query failed with status {response.status}: {error_text}"
+                timeout=10,
+            )
+            if response.status_code == 200:
+                data = response.json()
+                if "results" in data:
+                    documents = data["results"]
+                    context = "\n\n".join(
+                        [
+                            r.get("content", {}).get("text", "")
+                            for r in documents
+                            if r.get("content", {}).get("text", "")
+                        ]
                     )
+                    self.context = context
+                    self.buffer = [context]  # Replace buffer with context
+            else:
+                logging.error(
+                    f"Query failed with status {response.status_code}: {response.text}"
+                )
 
         except Exception as e:
             logging.error(f"Error querying context: {str(e)}")
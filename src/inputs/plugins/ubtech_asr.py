@@ -1,10 +1,10 @@
-import asyncio
 import logging
 import time
 from queue import Empty, Queue
-from typing import List, Optional
+from typing import Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import BufferPolicy, MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.sleep_ticker_provider import SleepTickerProvider
@@ -24,10 +24,13 @@ class UbtechASRInput(FuserInput[str]):
 
     def __init__(self, config: SensorConfig = SensorConfig()):
         super().__init__(config)
-        self.messages: List[str] = []
+        self.messages: MessageBuffer[str] = MessageBuffer(BufferPolicy.JOIN)
         self.descriptor_for_LLM = "Voice"
         self.io_provider = IOProvider()
         self.message_buffer: Queue[str] = Queue()
+
+        # Signalled whenever a message is buffered
+        self.message_ready = self.use_notifier()
         self.global_sleep_ticker_provider = SleepTickerProvider()
         # MODIFIED: Tracks the last time ASR resume was triggered
         self.last_asr_resume_trigger_time = time.time()
@@ -52,12 +55,12 @@ class UbtechASRInput(FuserInput[str]):
         if message and len(message.split()) >= 1:
             logging.info("Detected ASR message: %s", message)
             self.message_buffer.put(message)
+            self.message_ready.notify()
         else:
             logging.debug("Ignored empty or malformed ASR message: %s", message)
 
     async def _poll(self) -> Optional[str]:
         """Poll for new messages. Resume ASR only if its cooldown period has passed since last resume trigger."""
-        await asyncio.sleep(0.1)
         try:
             # Attempt to get a message from the buffer that the provider has left.
             message = self.message_buffer.get_nowait()
@@ -100,12 +103,9 @@ class UbtechASRInput(FuserInput[str]):
         pending_message = await self._raw_to_text(raw_input)
         if pending_message is None:
             if len(self.messages) != 0:
-                self.global_sleep_ticker_provider.skip_sleep = True
+                self.global_sleep_ticker_provider.wake(self.priority)
         else:
-            if len(self.messages) == 0:
-                self.messages.append(pending_message)
-            else:
-                self.messages[-1] = f"{self.messages[-1]} {pending_message}"
+            self.messages.append(pending_message)
 
     def formatted_latest_buffer(self) -> Optional[str]:
         if len(self.messages) == 0:
@@ -120,5 +120,5 @@ INPUT: {self.descriptor_for_LLM}
         self.io_provider.add_input(
             self.descriptor_for_LLM, self.messages[-1], time.time()
         )
-        self.messages = []
+        self.messages.clear()
         return result
@@ -1,12 +1,12 @@
-import asyncio
 import json
 import logging
 import time
 from dataclasses import dataclass
 from queue import Empty, Queue
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.ubtech_vlm_provider import UbtechVLMProvider
@@ -41,11 +41,14 @@ class UbtechCameraVLMInput(FuserInput[str]):
         self.descriptor_for_LLM = "Your Eyes"
         self.robot_ip = getattr(self.config, "robot_ip", "")
         # Buffer for storing the final output
-        self.messages: List[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         # Buffer for storing messages
         self.message_buffer: Queue[str] = Queue()
 
+        # Signalled whenever a message is buffered
+        self.message_ready = self.use_notifier()
+
         # Initialize VLM provider
         base_url = getattr(self.config, "base_url", "wss://api-vila.openmind.org")
         self.vlm: UbtechVLMProvider = UbtechVLMProvider(
@@ -71,6 +74,7 @@ class UbtechCameraVLMInput(FuserInput[str]):
             if "vlm_reply" in json_message:
                 vlm_reply = json_message["vlm_reply"]
                 self.message_buffer.put(vlm_reply)
+                self.message_ready.notify()
                 logging.info("Detected VLM message: %s", vlm_reply)
         except json.JSONDecodeError:
             pass
@@ -79,15 +83,13 @@ class UbtechCameraVLMInput(FuserInput[str]):
         """
         Poll for new messages from the VLM service.
 
-        Checks the message buffer for new messages with a brief delay
-        to prevent excessive CPU usage.
+        Returns immediately; the listen loop calls it when notified.
 
         Returns
         -------
         Optional[str]
             The next message from the buffer if available, None otherwise
         """
-        await asyncio.sleep(0.5)
         try:
             message = self.message_buffer.get_nowait()
             return message
@@ -163,6 +165,6 @@ INPUT: {self.descriptor_for_LLM}
         self.io_provider.add_input(
             self.descriptor_for_LLM, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
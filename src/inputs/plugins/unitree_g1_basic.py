@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers import BatteryStatus, IOProvider, TeleopsStatus, TeleopsStatusProvider
 
@@ -89,7 +90,7 @@ class UnitreeG1Basic(FuserInput[str]):
         self.status_provider = TeleopsStatusProvider(api_key=api_key)
 
         # Messages buffer
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         # create subscriber
         self.low_state = None
@@ -233,6 +234,6 @@ INPUT: {self.descriptor_for_LLM}
         self.io_provider.add_input(
             self.descriptor_for_LLM, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
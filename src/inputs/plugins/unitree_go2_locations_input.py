@@ -2,9 +2,10 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.unitree_go2_locations_provider import UnitreeGo2LocationsProvider
@@ -47,7 +48,7 @@ class UnitreeGo2LocationsInput(FuserInput[str]):
         )
         self.io_provider = IOProvider()
 
-        self.messages: List[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
         self.descriptor_for_LLM = "These are the saved locations you can navigate to."
 
     async def _poll(self) -> Optional[str]:
@@ -133,5 +134,5 @@ INPUT: {self.descriptor_for_LLM}
         )
 
         # Reset messages buffer
-        self.messages = []
+        self.messages.clear()
         return result
@@ -12,6 +12,7 @@ from PIL import Image
 from torchvision.models import detection as detection_model
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 
@@ -73,7 +74,7 @@ class VLM_COCO_Local(FuserInput[Image.Image]):
         self.io_provider = IOProvider()
 
         # Messages buffer
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         # Simple description of sensor output to help LLM understand its importance and utility
         self.descriptor_for_LLM = "Object Detector"
@@ -252,6 +253,6 @@ INPUT: {self.descriptor_for_LLM}
         self.io_provider.add_input(
             self.descriptor_for_LLM, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
@@ -7,6 +7,7 @@ from typing import Optional
 from PIL import Image
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 
@@ -46,7 +47,7 @@ class DummyVLMLocal(FuserInput[Image.Image]):
         self.io_provider = IOProvider()
 
         # Messages buffer
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         self.descriptor_for_LLM = "Vision"
 
@@ -134,6 +135,6 @@ INPUT: {self.descriptor_for_LLM}
         self.io_provider.add_input(
             self.descriptor_for_LLM, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
@@ -1,13 +1,13 @@
-import asyncio
 import logging
 import time
 from dataclasses import dataclass
 from queue import Empty, Queue
-from typing import List, Optional
+from typing import Optional
 
 from openai.types.chat import ChatCompletion
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.vlm_gemini_provider import VLMGeminiProvider
@@ -55,11 +55,14 @@ class VLMGemini(FuserInput[str]):
         self.io_provider = IOProvider()
 
         # Buffer for storing the final output
-        self.messages: List[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         # Buffer for storing messages
         self.message_buffer: Queue[str] = Queue()
 
+        # Signalled whenever a message is buffered
+        self.message_ready = self.use_notifier()
+
         # Initialize VLM provider
         api_key = getattr(self.config, "api_key", None)
 
@@ -103,6 +106,7 @@ class VLMGemini(FuserInput[str]):
         if content is not None:
             logging.info(f"VLM Gemini received message: {content}")
             self.message_buffer.put(content)
+            self.message_ready.notify()
         else:
             logging.warning("VLM Gemini received message with None content")
 
@@ -110,15 +114,13 @@ class VLMGemini(FuserInput[str]):
         """
         Poll for new messages from the VLM service.
 
-        Checks the message buffer for new messages with a brief delay
-        to prevent excessive CPU usage.
+        Returns immediately; the listen loop calls it when notified.
 
         Returns
         -------
         Optional[str]
             The next message from the buffer if available, None otherwise
         """
-        await asyncio.sleep(0.5)
         try:
             message = self.message_buffer.get_nowait()
             return message
@@ -194,6 +196,6 @@ INPUT: {self.descriptor_for_LLM}
         self.io_provider.add_input(
             self.__class__.__name__, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
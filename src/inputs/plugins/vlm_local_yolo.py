@@ -1,7 +1,5 @@
 import asyncio
-import json
 import logging
-import os
 import time
 from dataclasses import dataclass
 from typing import List, Optional
@@ -10,9 +8,11 @@ import cv2
 from ultralytics import YOLO
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.odom_provider import OdomProvider
+from providers.sensor_log_provider import SensorLogProvider
 
 # Common resolutions to test (width, height), ordered high to low
 RESOLUTIONS = [
@@ -96,7 +96,7 @@ class VLM_Local_YOLO(FuserInput[str]):
         self.io_provider = IOProvider()
 
         # Messages buffer
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
         # Simple description of sensor output to help LLM understand its importance and utility
         self.descriptor_for_LLM = "Eyes"
@@ -108,13 +108,12 @@ class VLM_Local_YOLO(FuserInput[str]):
         if getattr(self.config, "log_file", None):
             self.write_to_local_file = getattr(self.config, "log_file", False)
 
-        self.filename_current = None
-        self.max_file_size_bytes = 1024 * 1024
-
-        # Create timestamped log filename
+        # Detections are handed to the shared background log writer
+        self.sensor_log: Optional[SensorLogProvider] = None
         if self.write_to_local_file:
-            self.filename_current = self.update_filename()
-            logging.info(f"YOLO Logging to {self.filename_current}")
+            self.sensor_log = SensorLogProvider()
+            self.sensor_log.acquire(self)
+            logging.info("YOLO Logging to the yolo sensor log")
 
         self.width, self.height = check_webcam(self.camera_index)
 
@@ -145,13 +144,6 @@ class VLM_Local_YOLO(FuserInput[str]):
         self.odom_yaw_0_360 = 0.0
         self.odom_yaw_m180_p180 = 0.0
 
-    def update_filename(self):
-        unix_ts = round(time.time(), 6)
-        logging.info(f"YOLO time: {unix_ts}")
-        unix_ts = str(unix_ts).replace(".", "_")
-        filename = f"dump/yolo_{unix_ts}Z.jsonl"
-        return filename
-
     def get_top_detection(self, detections):
         """
         Returns the class label and bbox of the detection with the highest confidence.
@@ -222,53 +214,24 @@ class VLM_Local_YOLO(FuserInput[str]):
                 f"\nFrame {self.frame_index} @ {timestamp} — {len(detections)} objects:"
             )
 
-            if self.write_to_local_file:
-                try:
-                    json_line = json.dumps(
-                        {
-                            "frame": self.frame_index,
-                            "timestamp": timestamp,
-                            "detections": detections,
-                            "odom_rockchip_ts": self.odom_rockchip_ts,
-                            "odom_subscriber_ts": self.odom_subscriber_ts,
-                            "odom_x": self.odom_x,
-                            "odom_y": self.odom_y,
-                            "odom_yaw_0_360": self.odom_yaw_0_360,
-                            "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
-                        }
-                    )
-                    self.write_str_to_file(json_line)
-                    logging.info(f"YOLO wrote to {self.filename_current}")
-                except Exception as e:
-                    logging.error(f"Error saving YOLO: {str(e)}")
+            if self.sensor_log is not None:
+                self.sensor_log.log(
+                    "yolo",
+                    {
+                        "frame": self.frame_index,
+                        "timestamp": timestamp,
+                        "detections": detections,
+                        "odom_rockchip_ts": self.odom_rockchip_ts,
+                        "odom_subscriber_ts": self.odom_subscriber_ts,
+                        "odom_x": self.odom_x,
+                        "odom_y": self.odom_y,
+                        "odom_yaw_0_360": self.odom_yaw_0_360,
+                        "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
+                    },
+                )
 
             return detections
 
-    def write_str_to_file(self, json_line: str):
-        """
-        Writes a dictionary to a file in JSON lines format. If the file exceeds max_file_size_bytes,
-        creates a new file with a timestamp.
-
-        Parameters:
-        - data: Dictionary to write
-        """
-
-        if not isinstance(json_line, str):
-            raise ValueError("Provided json_line must be a json string.")
-
-        if (
-            self.filename_current is not None
-            and os.path.exists(self.filename_current)
-            and os.path.getsize(self.filename_current) > self.max_file_size_bytes
-        ):
-            self.filename_current = self.update_filename()
-            logging.info(f"New yolo file name: {self.filename_current}")
-
-        if self.filename_current is not None:
-            with open(self.filename_current, "a", encoding="utf-8") as f:
-                f.write(json_line + "\n")
-                f.flush()
-
     async def _raw_to_text(self, raw_input: Optional[List]) -> Optional[Message]:
         """
         Process raw image input to generate text description.
@@ -350,6 +313,17 @@ class VLM_Local_YOLO(FuserInput[str]):
         self.io_provider.add_input(
             self.descriptor_for_LLM, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
+
+    def stop(self):
+        """
+        Stop the YOLO input, releasing the webcam and the sensor log.
+        """
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+        if self.sensor_log is not None:
+            self.sensor_log.release(self)
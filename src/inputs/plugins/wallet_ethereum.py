@@ -9,6 +9,7 @@ from typing import List, Optional
 from web3 import Web3
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 
@@ -57,7 +58,7 @@ class WalletEthereum(FuserInput[float]):
         self.balance_eth = 0
         self.balance_change = 0
 
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
         self.eth_info = ""
 
         self.PROVIDER_URL = "https://eth.llamarpc.com"
@@ -183,5 +184,5 @@ class WalletEthereum(FuserInput[float]):
         self.io_provider.add_input(
             self.__class__.__name__, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
         return result
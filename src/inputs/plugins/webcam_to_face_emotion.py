@@ -15,6 +15,7 @@ import cv2
 from deepface import DeepFace
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 
@@ -81,7 +82,7 @@ class FaceEmotionCapture(FuserInput[cv2.typing.MatLike]):
         self.emotion = ""
 
         # Messages buffer
-        self.messages: list[Message] = []
+        self.messages: MessageBuffer[Message] = MessageBuffer()
 
     async def _poll(self) -> Optional[cv2.typing.MatLike]:
         """
@@ -192,6 +193,6 @@ class FaceEmotionCapture(FuserInput[cv2.typing.MatLike]):
         self.io_provider.add_input(
             self.__class__.__name__, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
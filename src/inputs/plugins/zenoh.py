@@ -1,13 +1,13 @@
-import asyncio
 import json
 import logging
 import time
 from queue import Empty, Queue
-from typing import List, Optional
+from typing import Optional
 
 import zenoh
 
 from inputs.base import SensorConfig
+from inputs.base.buffer import BufferPolicy, MessageBuffer
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.sleep_ticker_provider import SleepTickerProvider
@@ -29,7 +29,7 @@ class ZenohListener(FuserInput[str]):
         super().__init__(config)
 
         # Buffer for storing the final output
-        self.messages: List[str] = []
+        self.messages: MessageBuffer[str] = MessageBuffer(BufferPolicy.JOIN)
 
         # Set IO Provider
         self.descriptor_for_message = "Message"
@@ -38,6 +38,9 @@ class ZenohListener(FuserInput[str]):
         # Buffer for storing messages
         self.message_buffer: Queue[str] = Queue()
 
+        # Signalled whenever a message is buffered
+        self.message_ready = self.use_notifier()
+
         # Initialize ZenohListenerProvider provider
         listen_topic = getattr(self.config, "listen_topic", None)
         if listen_topic is None:
@@ -69,6 +72,7 @@ class ZenohListener(FuserInput[str]):
             if "message" in zenoh_message:
                 heard_message = zenoh_message["message"]
                 self.message_buffer.put(heard_message)
+                self.message_ready.notify()
                 logging.info("Heard Zenoh message: %s", heard_message)
             else:
                 logging.error("Deserialized payload does not have message")
@@ -84,7 +88,6 @@ class ZenohListener(FuserInput[str]):
         Optional[str]
             Message from the buffer if available, None otherwise
         """
-        await asyncio.sleep(0.1)
         try:
             message = self.message_buffer.get_nowait()
             return message
@@ -120,13 +123,10 @@ class ZenohListener(FuserInput[str]):
         if pending_message is None:
             if len(self.messages) != 0:
                 # Skip sleep if there's already a message in the messages buffer
-                self.global_sleep_ticker_provider.skip_sleep = True
+                self.global_sleep_ticker_provider.wake(self.priority)
 
         if pending_message is not None:
-            if len(self.messages) == 0:
-                self.messages.append(pending_message)
-            else:
-                self.messages[-1] = f"{self.messages[-1]} {pending_message}"
+            self.messages.append(pending_message)
 
     def formatted_latest_buffer(self) -> Optional[str]:
         """
@@ -149,5 +149,5 @@ class ZenohListener(FuserInput[str]):
         self.io_provider.add_input(
             self.descriptor_for_message, self.messages[-1], time.time()
         )
-        self.messages = []
+        self.messages.clear()
         return result
@@ -27,6 +27,12 @@ class LLMConfig(BaseModel):
         Name of the LLM model to use
     history_length : int, optional
         Number of interactions to store in the history buffer
+    compact_prompt : bool, optional
+        Leave the action descriptions out of the prompt when the LLM receives
+        them as tools, and minimize the descriptions of the tools
+    token_report : bool, optional
+        Count the tokens of every prompt section on each tick; they are
+        always counted while debug logging is enabled
     extra_params : dict, optional
         Additional parameters for the LLM API request
     """
@@ -39,6 +45,8 @@ class LLMConfig(BaseModel):
     timeout: T.Optional[int] = 10
     agent_name: T.Optional[str] = "IRIS"
     history_length: T.Optional[int] = 0
+    compact_prompt: T.Optional[bool] = False
+    token_report: T.Optional[bool] = False
     extra_params: T.Dict[str, T.Any] = Field(default_factory=dict)
 
     def __getitem__(self, item: str) -> T.Any:
@@ -91,8 +99,16 @@ class LLM(T.Generic[R]):
         Configuration settings for the LLM
     available_actions : list, optional
         List of available actions for function calling
+
+    Attributes
+    ----------
+    supports_tools : bool
+        Whether the implementation sends ``function_schemas`` as tools;
+        set by the plugins that do.
     """
 
+    supports_tools: bool = False
+
     def __init__(
         self,
         config: LLMConfig = LLMConfig(),
@@ -106,7 +122,7 @@ class LLM(T.Generic[R]):
         self.function_schemas = []
         if self._available_actions:
             self.function_schemas = generate_function_schemas_from_actions(
-                self._available_actions
+                self._available_actions, compact=bool(config.compact_prompt)
             )
             logging.info(
                 f"LLM initialized with {len(self.function_schemas)} function schemas"
@@ -115,6 +131,35 @@ class LLM(T.Generic[R]):
         # Set up the IO provider
         self.io_provider = IOProvider()
 
+    @property
+    def tools_describe_actions(self) -> bool:
+        """
+        Whether the tools carry the action descriptions, so the prompt can
+        leave them out.
+
+        Returns
+        -------
+        bool
+            True if the LLM sends tools and compact_prompt is enabled.
+        """
+        return (
+            self.supports_tools
+            and bool(self._config.compact_prompt)
+            and bool(self.function_schemas)
+        )
+
+    @property
+    def reports_tokens(self) -> bool:
+        """
+        Whether the fuser should count the tokens of the prompts.
+
+        Returns
+        -------
+        bool
+            True if token_report is enabled.
+        """
+        return bool(self._config.token_report)
+
     async def ask(self, prompt: str, messages: T.List[T.Dict[str, str]] = []) -> R:
         """
         Send a prompt to the LLM and receive a typed response.
@@ -12,7 +12,7 @@ from typing import get_type_hints
 from llm.output_model import Action
 
 
-def generate_function_schema_from_action(action) -> dict:
+def generate_function_schema_from_action(action, compact: bool = False) -> dict:
     """
     Generate OpenAI function schema from an AgentAction.
 
@@ -20,6 +20,10 @@ def generate_function_schema_from_action(action) -> dict:
     ----------
     action : AgentAction
         The action to generate a function schema for.
+    compact : bool
+        Minimize the descriptions: collapse the whitespace of the docstring
+        and leave out parameter descriptions, which only repeat the name and
+        the enum values.
 
     Returns
     -------
@@ -30,7 +34,10 @@ def generate_function_schema_from_action(action) -> dict:
     input_interface = get_type_hints(interface)["input"]
 
     doc = interface.__doc__ or ""
-    doc = doc.replace("\n", " ").strip()
+    if compact:
+        doc = " ".join(doc.split())
+    else:
+        doc = doc.replace("\n", " ").strip()
 
     properties = {}
     required = []
@@ -69,6 +76,9 @@ def generate_function_schema_from_action(action) -> dict:
                 "description": f"The {field_name} parameter",
             }
 
+        if compact:
+            properties[field_name].pop("description")
+
         required.append(field_name)
 
     return {
@@ -87,7 +97,9 @@ def generate_function_schema_from_action(action) -> dict:
     }
 
 
-def generate_function_schemas_from_actions(actions: list) -> list[dict]:
+def generate_function_schemas_from_actions(
+    actions: list, compact: bool = False
+) -> list[dict]:
     """
     Generate OpenAI function schemas from a list of AgentActions.
 
@@ -95,6 +107,8 @@ def generate_function_schemas_from_actions(actions: list) -> list[dict]:
     ----------
     actions : list
         List of actions to generate function schemas for.
+    compact : bool
+        Minimize the descriptions (see generate_function_schema_from_action).
 
     Returns
     -------
@@ -105,7 +119,7 @@ def generate_function_schemas_from_actions(actions: list) -> list[dict]:
     for action in actions:
         if not action.exclude_from_prompt:
             try:
-                schema = generate_function_schema_from_action(action)
+                schema = generate_function_schema_from_action(action, compact)
                 schemas.append(schema)
                 logging.debug(
                     f"Generated function schema for {action.llm_label}: {schema}"
@@ -30,6 +30,8 @@ class DeepSeekLLM(LLM[R]):
         List of available actions for function call generation. If provided.
     """
 
+    supports_tools = True
+
     def __init__(
         self,
         config: LLMConfig = LLMConfig(),
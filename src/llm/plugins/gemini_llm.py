@@ -29,6 +29,8 @@ class GeminiLLM(LLM[R]):
         List of available actions for function call generation. If provided.
     """
 
+    supports_tools = True
+
     def __init__(
         self,
         config: LLMConfig = LLMConfig(),
@@ -32,6 +32,8 @@ class OpenRouter(LLM[R]):
         the LLM will use function calls instead of structured JSON output.
     """
 
+    supports_tools = True
+
     def __init__(
         self,
         config: LLMConfig = LLMConfig(),
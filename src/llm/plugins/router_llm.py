@@ -0,0 +1,305 @@
+import asyncio
+import logging
+import time
+import typing as T
+from collections import deque
+from dataclasses import dataclass, field
+
+from pydantic import BaseModel
+
+from llm import LLM, LLMConfig, load_llm
+from llm.output_model import CortexOutputModel
+
+R = T.TypeVar("R", bound=BaseModel)
+
+# Settings of the router passed on to backends that do not set them
+_INHERITED = ("api_key", "agent_name", "history_length", "compact_prompt")
+
+
+@dataclass
+class _Backend:
+    """
+    A backend LLM with its rolling statistics and circuit breaker.
+    """
+
+    name: str
+    llm: LLM
+    latencies: T.Deque[float] = field(default_factory=deque)
+    requests: int = 0
+    failures: int = 0
+    wins: int = 0
+    consecutive_failures: int = 0
+    opened_at: T.Optional[float] = None
+    trial_in_flight: bool = False
+
+    def expected_latency(self) -> float:
+        """
+        Mean of the recent latencies; 0 for an untried backend, so it is tried.
+        """
+        if not self.latencies:
+            return 0.0
+        return sum(self.latencies) / len(self.latencies)
+
+    def circuit(self, recovery_time: float) -> str:
+        """
+        State of the circuit breaker: "closed", "open" while the backend is
+        skipped, or "half-open" once it may get a trial request.
+        """
+        if self.opened_at is None:
+            return "closed"
+        if time.time() - self.opened_at < recovery_time:
+            return "open"
+        return "half-open"
+
+
+class RouterLLM(LLM[R]):
+    """
+    Routes each request to the fastest healthy of several backend LLMs.
+
+    The router keeps rolling latency and error statistics per backend and
+    sends a request to the backend with the lowest recent latency whose
+    circuit breaker is closed. If no valid response arrives within
+    ``hedge_delay`` seconds, or the backend fails, the request is also sent
+    to the next backend, and the first valid response wins; the others are
+    cancelled. No request waits longer than ``timeout`` seconds in total.
+
+    A request that is cancelled because another backend answered first is
+    not a failure; its run time is only recorded as a lower bound of its
+    latency if it exceeds the recent mean. A request cut off by the timeout
+    counts as a failure that took at least as long as it ran. A
+    backend that fails ``failure_threshold`` times in a row is skipped for
+    ``recovery_time`` seconds, then gets one trial request at a time until
+    one succeeds and closes its circuit again. While every circuit is open,
+    requests fail right away.
+
+    Each backend keeps its own history.
+
+    Parameters
+    ----------
+    config : LLMConfig
+        Configuration with ``backends``, a list of ``{"type", "config"}``
+        LLM entries, and optionally ``hedge_delay`` (default 1.0),
+        ``failure_threshold`` (default 3), ``recovery_time`` (default 30.0)
+        and ``latency_window`` (default 20).
+    available_actions : list[AgentAction], optional
+        List of available actions, passed on to the backends.
+    """
+
+    def __init__(
+        self,
+        config: LLMConfig = LLMConfig(),
+        available_actions: T.Optional[T.List] = None,
+    ):
+        """
+        Initialize the router and its backends.
+
+        Parameters
+        ----------
+        config : LLMConfig, optional
+            Configuration settings for the router and its backends.
+        available_actions : list[AgentAction], optional
+            List of available actions for function calling.
+        """
+        super().__init__(config, available_actions)
+
+        backends = getattr(config, "backends", None) or []
+        if not backends:
+            logging.error("Router: config file missing backends")
+
+        self.hedge_delay = float(getattr(config, "hedge_delay", 1.0))
+        self.failure_threshold = int(getattr(config, "failure_threshold", 3))
+        self.recovery_time = float(getattr(config, "recovery_time", 30.0))
+        latency_window = int(getattr(config, "latency_window", 20))
+
+        self._backends: T.List[_Backend] = []
+        for entry in backends:
+            backend_config = dict(entry.get("config", {}))
+            for key in _INHERITED:
+                if key not in backend_config and getattr(config, key) is not None:
+                    backend_config[key] = getattr(config, key)
+
+            llm = load_llm(entry["type"])(
+                config=LLMConfig(**backend_config),
+                available_actions=available_actions,
+            )
+            name = backend_config.get("name") or entry["type"]
+            self._backends.append(
+                _Backend(name=name, llm=llm, latencies=deque(maxlen=latency_window))
+            )
+
+        # The prompt can leave the actions to the tools only if every backend
+        # receives them
+        self.supports_tools = bool(self._backends) and all(
+            b.llm.supports_tools for b in self._backends
+        )
+
+    def _available(self, backend: _Backend) -> bool:
+        """
+        Whether a backend may get a request: its circuit is closed, or it is
+        half-open and no trial request is in flight.
+        """
+        state = backend.circuit(self.recovery_time)
+        return state == "closed" or (
+            state == "half-open" and not backend.trial_in_flight
+        )
+
+    def _ranked(self) -> T.List[_Backend]:
+        """
+        Order the available backends to try by expected latency.
+        """
+        available = [b for b in self._backends if self._available(b)]
+        available.sort(key=lambda b: b.expected_latency())
+        return available
+
+    def _record(
+        self, backend: _Backend, latency: float, output: T.Optional[T.Any]
+    ) -> None:
+        """
+        Record the outcome of a finished request to a backend.
+        """
+        if isinstance(output, CortexOutputModel):
+            backend.latencies.append(latency)
+            backend.consecutive_failures = 0
+            if backend.opened_at is not None:
+                logging.info(f"Router: closing the circuit of {backend.name}")
+            backend.opened_at = None
+            return
+
+        backend.failures += 1
+        backend.consecutive_failures += 1
+        if backend.consecutive_failures >= self.failure_threshold:
+            if backend.opened_at is None:
+                logging.warning(f"Router: opening the circuit of {backend.name}")
+            backend.opened_at = time.time()
+
+    def _record_cancelled(
+        self, backend: _Backend, latency: float, timed_out: bool
+    ) -> None:
+        """
+        Record a request that was cancelled because another backend answered
+        first or the timeout elapsed.
+        """
+        # The request would have taken at least this long, which only tells
+        # something if it is longer than the backend usually takes
+        if timed_out or latency > backend.expected_latency():
+            backend.latencies.append(latency)
+        if timed_out:
+            self._record(backend, latency, None)
+
+    async def _ask_backend(
+        self, backend: _Backend, prompt: str
+    ) -> T.Tuple[_Backend, T.Optional[T.Any]]:
+        """
+        Ask one backend, recording its latency and outcome.
+        """
+        backend.requests += 1
+        start = time.perf_counter()
+        try:
+            output = await backend.llm.ask(prompt)
+        except Exception as e:
+            logging.error(f"Router: {backend.name} failed: {e}")
+            output = None
+        finally:
+            backend.trial_in_flight = False
+        self._record(backend, time.perf_counter() - start, output)
+        return backend, output
+
+    async def ask(
+        self, prompt: str, messages: T.List[T.Dict[str, str]] = []
+    ) -> R | None:
+        """
+        Send a prompt to the backends and return the first valid response.
+
+        Parameters
+        ----------
+        prompt : str
+            The input prompt to send to the model.
+        messages : List[Dict[str, str]]
+            Unused; each backend keeps its own history.
+
+        Returns
+        -------
+        R or None
+            The first valid response, or None if every backend failed or the
+            timeout elapsed.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (self._config.timeout or 10)
+        waiting = self._ranked()
+        if not waiting and self._backends:
+            logging.error("Router: the circuits of all backends are open")
+            return None
+
+        pending: T.Set[asyncio.Task] = set()
+        started: T.Dict[asyncio.Task, T.Tuple[_Backend, float]] = {}
+        caller_cancelled = False
+        timed_out = False
+
+        try:
+            while waiting or pending:
+                if waiting:
+                    backend = waiting.pop(0)
+                    # Another request may have taken the trial meanwhile
+                    if not self._available(backend):
+                        continue
+                    backend.trial_in_flight = backend.opened_at is not None
+                    task = asyncio.create_task(self._ask_backend(backend, prompt))
+                    started[task] = (backend, time.perf_counter())
+                    pending.add(task)
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    timed_out = True
+                    break
+
+                # Hedge with the next backend if this one takes too long
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=min(self.hedge_delay, remaining) if waiting else remaining,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    winner, output = task.result()
+                    if isinstance(output, CortexOutputModel):
+                        winner.wins += 1
+                        return T.cast(R, output)
+
+            logging.error("Router: no backend returned a valid response")
+            return None
+        except asyncio.CancelledError:
+            # The caller gave up, e.g. on a superseded tick; not the backends
+            caller_cancelled = True
+            raise
+        finally:
+            for task in pending:
+                task.cancel()
+                backend, start = started[task]
+                backend.trial_in_flight = False
+                if not caller_cancelled:
+                    self._record_cancelled(
+                        backend, time.perf_counter() - start, timed_out
+                    )
+
+    @property
+    def stats(self) -> T.List[T.Dict[str, T.Any]]:
+        """
+        Get the statistics of every backend.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Per backend: requests, failures, wins, mean recent latency in
+            milliseconds, whether its circuit is open and the circuit state.
+        """
+        return [
+            {
+                "backend": backend.name,
+                "requests": backend.requests,
+                "failures": backend.failures,
+                "wins": backend.wins,
+                "latency_ms": 1000 * backend.expected_latency(),
+                "circuit_open": backend.circuit(self.recovery_time) == "open",
+                "circuit": backend.circuit(self.recovery_time),
+            }
+            for backend in self._backends
+        ]
@@ -0,0 +1,77 @@
+"""
+Token accounting for the prompts sent to the LLMs.
+
+Counts use tiktoken when it is installed and its encoding can be loaded, and
+an estimate of four characters per token otherwise, which is close enough to
+compare prompt sections.
+"""
+
+import json
+import logging
+import typing as T
+
+try:
+    import tiktoken
+except ImportError:
+    logging.debug("tiktoken not found; estimating token counts from characters")
+    tiktoken = None
+
+_encoding: T.Any = None
+_encoding_failed = False
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens of a text.
+
+    Parameters
+    ----------
+    text : str
+        The text.
+
+    Returns
+    -------
+    int
+        The number of tokens, or an estimate without tiktoken.
+    """
+    global _encoding, _encoding_failed
+
+    if not text:
+        return 0
+    if _encoding is None and tiktoken is not None and not _encoding_failed:
+        try:
+            # Downloads the encoding on first use
+            _encoding = tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            logging.warning(
+                f"tiktoken encoding unavailable, estimating token counts: {e}"
+            )
+            _encoding_failed = True
+    if _encoding is None:
+        return (len(text) + 3) // 4
+    return len(_encoding.encode(text))
+
+
+def token_report(
+    sections: T.Dict[str, str], tools: T.Optional[T.List[dict]] = None
+) -> T.Dict[str, int]:
+    """
+    Count the tokens of each section of a prompt.
+
+    Parameters
+    ----------
+    sections : Dict[str, str]
+        The prompt sections by name.
+    tools : List[dict], optional
+        The tool schemas sent with the prompt, counted as their JSON.
+
+    Returns
+    -------
+    Dict[str, int]
+        Tokens per section, ``tools`` if given, and the ``total``.
+    """
+    report = {name: count_tokens(text) for name, text in sections.items()}
+    if tools:
+        report["tools"] = count_tokens(json.dumps(tools, separators=(",", ":")))
+    report["total"] = sum(report.values())
+    return report
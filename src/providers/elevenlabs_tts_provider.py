@@ -1,9 +1,121 @@
+import json
 import logging
-from typing import Callable, Optional, Union
+import re
+import threading
+import uuid
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from om1_speech import AudioOutputStream
 
+from .http_client_provider import HTTPClientError, HTTPClientProvider
 from .singleton import singleton
+from .tts_audio_cache import TTSAudioCache
+
+# Split after sentence punctuation followed by whitespace
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+")
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences.
+
+    Parameters
+    ----------
+    text : str
+        The text to split.
+
+    Returns
+    -------
+    List[str]
+        The non-empty sentences, in order.
+    """
+    return [s.strip() for s in _SENTENCE_END.split(text) if s.strip()]
+
+
+class _SentenceRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves synthesized sentences to the audio output streams.
+
+    A stream POSTs the requests it was given in order and plays the
+    ``response`` of each, so it waits here until a sentence is synthesized.
+    """
+
+    server: "_SentenceServer"
+
+    def do_POST(self):
+        provider = self.server.providers.get(self.path.rsplit("/", 1)[-1])
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            sentence_id = request["sentence_id"]
+        except (ValueError, KeyError, TypeError) as e:
+            logging.error(f"Invalid TTS sentence request: {e}")
+            provider = None
+
+        audio = provider._take_sentence(sentence_id) if provider else None
+
+        if audio is None:
+            self.send_error(404)
+            return
+
+        body = json.dumps({"response": audio}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.debug(f"TTS sentence server: {format % args}")
+
+
+class _SentenceServer(ThreadingHTTPServer):
+    """
+    Loopback HTTP server the audio output streams fetch sentences from.
+
+    One server is shared by every provider of the process. It is started
+    when the first provider needs it, and providers are looked up by the
+    token in the URL path of their stream.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SentenceRequestHandler)
+        self.providers: "weakref.WeakValueDictionary[str, ElevenLabsTTSProvider]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    def url(self, token: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/sentence/{token}"
+
+
+_sentence_server: Optional[_SentenceServer] = None
+_sentence_server_lock = threading.Lock()
+
+
+def _get_sentence_server() -> _SentenceServer:
+    """
+    Get the shared sentence server, starting it on first use.
+
+    Returns
+    -------
+    _SentenceServer
+        The running sentence server.
+    """
+    global _sentence_server
+    with _sentence_server_lock:
+        if _sentence_server is None:
+            _sentence_server = _SentenceServer()
+            threading.Thread(
+                target=_sentence_server.serve_forever,
+                name="tts-sentence-server",
+                daemon=True,
+            ).start()
+        return _sentence_server
 
 
 @singleton
@@ -14,6 +126,15 @@ class ElevenLabsTTSProvider:
     A singleton class that handles text-to-speech conversion and audio output
     through a dedicated thread.
 
+    Messages are split into sentences that are synthesized concurrently by a
+    small thread pool. Each sentence is queued on the audio stream, which
+    fetches it from a loopback endpoint as soon as it is ready and plays the
+    sentences in order, so the first sentence starts playing while later ones
+    are still being synthesized. The endpoint is shared by all providers and
+    only started when a provider is. With a ``cache_dir``, synthesized
+    sentences are kept in an on-disk LRU cache, so fixed phrases are only
+    synthesized once.
+
     Parameters
     ----------
     url : str
@@ -26,6 +147,12 @@ class ElevenLabsTTSProvider:
         The name of the model for Eleven Labs TTS service (default is eleven_multilingual
     output_format : str, optional
         The output format for the audio stream (default is mp3_44100_128)
+    cache_dir : str, optional
+        Directory of the phrase audio cache (default is None, no cache)
+    cache_max_mb : float
+        Maximum size of the phrase audio cache in megabytes (default is 64)
+    synthesis_workers : int
+        Number of sentences synthesized concurrently (default is 3)
     """
 
     def __init__(
@@ -36,6 +163,9 @@ class ElevenLabsTTSProvider:
         voice_id: Optional[str] = "JBFqnCBsd6RMkjVDRZzb",
         model_id: Optional[str] = "eleven_flash_v2_5",
         output_format: Optional[str] = "mp3_44100_128",
+        cache_dir: Optional[str] = None,
+        cache_max_mb: float = 64,
+        synthesis_workers: int = 3,
     ):
         """
         Initialize the TTS provider with given URL.
@@ -45,16 +175,30 @@ class ElevenLabsTTSProvider:
 
         # Initialize TTS provider
         self.running: bool = False
-        self._audio_stream: AudioOutputStream = AudioOutputStream(
-            url=url,
-            headers={"x-api-key": api_key} if api_key else None,
-        )
+        self._token = uuid.uuid4().hex
+        self._audio_stream: Optional[AudioOutputStream] = None
+        self._tts_state_callback: Optional[Callable] = None
 
         # Set Eleven Labs TTS parameters
         self._voice_id = voice_id
         self._model_id = model_id
         self._output_format = output_format
 
+        # Sentence synthesis pipeline
+        self.http = HTTPClientProvider()
+        self._url = url
+        self._headers = {"x-api-key": api_key} if api_key else None
+        self._cache_dir = cache_dir
+        self._cache_max_bytes = int(cache_max_mb * 1024 * 1024)
+        self._cache: Optional[TTSAudioCache] = None
+        self._synthesis_workers = synthesis_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._queued_sentences: Dict[int, Tuple[str, Future]] = {}
+        self._pending_lock = threading.Lock()
+        self._pending_sentences = 0
+        self._sentences = 0
+        self._synthesized = 0
+
     def configure(
         self,
         url: str = "https://api.openmind.org/api/core/elevenlabs/tts",
@@ -81,7 +225,7 @@ class ElevenLabsTTSProvider:
             The output format for the audio stream.
         """
         restart_needed = (
-            url != self._audio_stream._url
+            url != self._url
             or api_key != self.api_key
             or elevenlabs_api_key != self.elevenlabs_api_key
             or voice_id != self._voice_id
@@ -92,7 +236,8 @@ class ElevenLabsTTSProvider:
         if not restart_needed:
             return
 
-        if self.running:
+        was_running = self.running
+        if was_running:
             self.stop()
 
         self.api_key = api_key
@@ -100,12 +245,11 @@ class ElevenLabsTTSProvider:
         self._voice_id = voice_id
         self._model_id = model_id
         self._output_format = output_format
+        self._url = url
+        self._headers = {"x-api-key": api_key} if api_key else None
 
-        self._audio_stream: AudioOutputStream = AudioOutputStream(
-            url=url,
-            headers={"x-api-key": api_key} if api_key else None,
-        )
-        self._audio_stream.start()
+        if was_running:
+            self.start()
 
     def register_tts_state_callback(self, tts_state_callback: Optional[Callable]):
         """
@@ -116,7 +260,11 @@ class ElevenLabsTTSProvider:
         tts_state_callback : Optional[Callable]
             The callback function to receive TTS state changes.
         """
-        if tts_state_callback is not None:
+        if tts_state_callback is None:
+            return
+
+        self._tts_state_callback = tts_state_callback
+        if self._audio_stream is not None:
             self._audio_stream.set_tts_state_callback(tts_state_callback)
 
     def create_pending_message(self, text: str) -> dict:
@@ -164,7 +312,136 @@ class ElevenLabsTTSProvider:
 
         if isinstance(message, str):
             message = self.create_pending_message(message)
-        self._audio_stream.add_request(message)
+
+        executor = self._executor
+        audio_stream = self._audio_stream
+        if executor is None or audio_stream is None:
+            return
+
+        for sentence in split_sentences(message.get("text", "")):
+            future = executor.submit(self._synthesize, {**message, "text": sentence})
+            with self._pending_lock:
+                sentence_id = self._sentences
+                self._queued_sentences[sentence_id] = (sentence, future)
+                self._pending_sentences += 1
+                self._sentences += 1
+            audio_stream.add_request({"sentence_id": sentence_id})
+
+    def _synthesize(self, request: dict) -> Optional[str]:
+        """
+        Synthesize one sentence, using the phrase cache.
+
+        Parameters
+        ----------
+        request : dict
+            The TTS request of the sentence.
+
+        Returns
+        -------
+        str, optional
+            The base64 encoded audio, or None if synthesis failed.
+        """
+        key = None
+        if self._cache is not None:
+            key = TTSAudioCache.key(
+                request["voice_id"],
+                request["model_id"],
+                request["output_format"],
+                request["text"],
+            )
+            audio = self._cache.get(key)
+            if audio is not None:
+                return audio
+
+        try:
+            response = self.http.post_sync(
+                self._url, json=request, headers=self._headers, timeout=15
+            )
+            if not response.ok:
+                raise HTTPClientError(f"{response.status_code} {response.text}")
+            audio = response.json().get("response")
+        except (HTTPClientError, ValueError) as e:
+            logging.error(f"TTS synthesis failed for '{request['text']}': {e}")
+            return None
+
+        if not audio:
+            logging.error(f"TTS synthesis returned no audio for '{request['text']}'")
+            return None
+
+        with self._pending_lock:
+            self._synthesized += 1
+        if key is not None:
+            self._cache.put(key, audio)
+        return audio
+
+    def _take_sentence(self, sentence_id: int) -> Optional[str]:
+        """
+        Wait for a queued sentence to be synthesized, for the audio stream.
+
+        Parameters
+        ----------
+        sentence_id : int
+            The id the sentence was queued on the audio stream with.
+
+        Returns
+        -------
+        str, optional
+            The base64 encoded audio, or None if the sentence failed or the
+            provider was stopped.
+        """
+        with self._pending_lock:
+            item = self._queued_sentences.pop(sentence_id, None)
+        if item is None:
+            return None
+
+        sentence, future = item
+        try:
+            audio = future.result()
+        except Exception as e:
+            logging.error(f"Error playing '{sentence}': {e}")
+            audio = None
+        finally:
+            with self._pending_lock:
+                self._pending_sentences -= 1
+
+        if audio is None or not self.running:
+            return None
+        logging.debug(f"Playing: {sentence}")
+        return audio
+
+    def _sentence_url(self) -> str:
+        """
+        Get the URL the audio stream fetches the sentences of this provider
+        from, starting the shared sentence server if needed.
+
+        Returns
+        -------
+        str
+            The sentence URL of this provider.
+        """
+        server = _get_sentence_server()
+        server.providers[self._token] = self
+        return server.url(self._token)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the synthesis and phrase cache metrics.
+
+        Returns
+        -------
+        Dict[str, float]
+            Sentences queued and synthesized, and the cache hits, misses,
+            hit rate, evictions, entries and size in bytes.
+        """
+        with self._pending_lock:
+            stats: Dict[str, float] = {
+                "sentences": self._sentences,
+                "synthesized": self._synthesized,
+            }
+        if self._cache is not None:
+            stats.update(self._cache.stats)
+        return stats
 
     def get_pending_message_count(self) -> int:
         """
@@ -175,7 +452,8 @@ class ElevenLabsTTSProvider:
         int
             The number of pending messages.
         """
-        return self._audio_stream._pending_requests.qsize()
+        with self._pending_lock:
+            return self._pending_sentences
 
     def start(self):
         """
@@ -186,8 +464,22 @@ class ElevenLabsTTSProvider:
             return
 
         self.running = True
+        if self._audio_stream is None:
+            self._audio_stream = AudioOutputStream(url=self._sentence_url())
+            if self._tts_state_callback is not None:
+                self._audio_stream.set_tts_state_callback(self._tts_state_callback)
         self._audio_stream.start()
 
+        if self._cache is None and self._cache_dir:
+            try:
+                self._cache = TTSAudioCache(self._cache_dir, self._cache_max_bytes)
+            except OSError as e:
+                logging.warning(f"TTS phrase cache disabled: {e}")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._synthesis_workers, thread_name_prefix="tts-synthesis"
+        )
+
     def stop(self):
         """
         Stop the TTS provider and cleanup resources.
@@ -197,4 +489,17 @@ class ElevenLabsTTSProvider:
             return
 
         self.running = False
-        self._audio_stream.stop()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        with self._pending_lock:
+            self._pending_sentences -= len(self._queued_sentences)
+            self._queued_sentences.clear()
+
+        if self._audio_stream is not None:
+            self._audio_stream.stop()
+            self._audio_stream = None
+
+        if self._cache is not None:
+            logging.info(f"TTS phrase cache: {self._cache.stats}")
@@ -1,13 +1,15 @@
+import gzip
 import json
 import logging
 import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
-
-import requests
+from queue import Empty, Full, Queue
+from typing import Dict, List, Optional
 
+from .http_client_provider import HTTPClientProvider
+from .sensor_log_provider import SensorLogProvider
 from .singleton import singleton
 
 
@@ -167,6 +169,20 @@ class FabricData:
 class FabricDataSubmitter:
     """
     Allows a machine to locally log mapping data and submit data to FABRIC.
+
+    Records are queued for an uploader thread and delivered in batches of
+    ``batch_size`` records or ``batch_interval`` seconds, whichever comes
+    first. By default every record of a batch is POSTed as one JSON object,
+    which is what the FABRIC submit endpoint accepts. With ``batch_upload``
+    a batch is POSTed as one gzip-compressed JSON array
+    (``Content-Encoding: gzip``) instead; only enable it against an endpoint
+    that accepts arrays.
+
+    Records that cannot be delivered, and records shared while the queue is
+    full, are written to an on-disk spool and replayed in order once uploads
+    succeed again. After a failed upload the submitter backs off
+    exponentially up to ``max_backoff`` seconds; until then new batches go
+    straight to the spool without touching the network.
     """
 
     def __init__(
@@ -174,6 +190,14 @@ class FabricDataSubmitter:
         api_key: Optional[str] = None,
         base_url: str = "https://api.openmind.org/api/core/fabric/submit",
         write_to_local_file: bool = False,
+        batch_size: int = 10,
+        batch_interval: float = 5.0,
+        batch_upload: bool = False,
+        max_queue: int = 1000,
+        spool_dir: str = "dump/fabric_spool",
+        max_spool_bytes: int = 256 * 1024 * 1024,
+        max_backoff: float = 60.0,
+        timeout: float = 10.0,
     ):
         """
         Initialize the FabricDataSubmitter.
@@ -185,92 +209,427 @@ class FabricDataSubmitter:
         base_url : str
             Base URL for the teleops status API. Default is
             "https://api.openmind.org/api/core/fabric/submit".
+        write_to_local_file : bool
+            Whether to also log every record to a local JSONL file.
+        batch_size : int
+            Maximum number of records per batch. Default is 10.
+        batch_interval : float
+            Maximum number of seconds a record waits before its batch is
+            uploaded. Default is 5.0.
+        batch_upload : bool
+            Whether to upload a batch as one gzip-compressed JSON array
+            instead of one JSON object per request. Default is False.
+        max_queue : int
+            Maximum number of records waiting for the uploader; beyond it the
+            queued records are spilled to the spool. Default is 1000.
+        spool_dir : str
+            Directory for records that could not be delivered.
+        max_spool_bytes : int
+            Upper bound on the spool size; the oldest batches are dropped
+            beyond it.
+        max_backoff : float
+            Upper bound in seconds on the wait between upload attempts while
+            FABRIC is unreachable. Default is 60.0.
+        timeout : float
+            Timeout in seconds for each upload request.
         """
         self.api_key = api_key
         self.base_url = base_url
         self.write_to_local_file = write_to_local_file
-        self.filename_base = "dump/fabric"
-        self.filename_current = self.update_filename()
-        self.max_file_size_bytes = 1024 * 1024
-        self.executor = ThreadPoolExecutor(max_workers=1)
-
-    def update_filename(self):
-        unix_ts = time.time()
-        logging.info(f"fabric time: {unix_ts}")
-        unix_ts = str(unix_ts).replace(".", "_")
-        filename = f"{self.filename_base}_{unix_ts}Z.jsonl"
-        return filename
+        self.sensor_log = SensorLogProvider() if write_to_local_file else None
+        if self.sensor_log is not None:
+            self.sensor_log.acquire(self)
+
+        self.batch_size = max(1, batch_size)
+        self.batch_interval = batch_interval
+        self.batch_upload = batch_upload
+        self.spool_dir = spool_dir
+        self.max_spool_bytes = max_spool_bytes
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+
+        self.http = HTTPClientProvider()
+
+        self._queue: Queue[Optional[FabricData]] = Queue(maxsize=max(1, max_queue))
+        self._spool_lock = threading.Lock()
+        self._spool_seq = self._next_spool_seq()
+        self._backoff = 0.0
+        self._retry_at = 0.0
+
+        self._metrics_lock = threading.Lock()
+        self._metrics: Dict[str, float] = {
+            "records_queued": 0,
+            "records_spilled": 0,
+            "records_sent": 0,
+            "batches_sent": 0,
+            "batches_spooled": 0,
+            "batches_replayed": 0,
+            "batches_dropped": 0,
+            "upload_failures": 0,
+            "last_upload_ts": 0.0,
+        }
+
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
 
     def write_dict_to_file(self, data: dict):
         """
-        Writes a dictionary to a file in JSON lines format. If the file exceeds max_file_size_bytes,
-        creates a new file with a timestamp.
+        Queue a record for the shared "fabric" sensor log.
 
-        Parameters:
-        - data: Dictionary to write
+        Parameters
+        ----------
+        data : dict
+            Dictionary to write
         """
 
         if not isinstance(data, dict):
             raise ValueError("Provided data must be a dictionary.")
 
-        if (
-            os.path.exists(self.filename_current)
-            and os.path.getsize(self.filename_current) > self.max_file_size_bytes
-        ):
-            self.filename_current = self.update_filename()
-            logging.info(f"new file name: {self.filename_current}")
+        if self.sensor_log is not None:
+            self.sensor_log.log("fabric", data)
 
-        with open(self.filename_current, "a", encoding="utf-8") as f:
-            json_line = json.dumps(data)
-            f.write(json_line + "\n")
-            f.flush()
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """
+        Upload and backpressure metrics.
+
+        Returns
+        -------
+        Dict[str, float]
+            Counters for queued, spilled, sent, spooled, replayed and dropped
+            data, plus the current queue depth, spool size and backoff.
+        """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        metrics["queue_depth"] = self._queue.qsize()
+        files = self._spool_files()
+        metrics["spool_batches"] = len(files)
+        metrics["spool_bytes"] = sum(self._file_bytes(f) for f in files)
+        metrics["backoff"] = self._backoff
+        return metrics
+
+    def _count(self, key: str, value: float = 1) -> None:
+        with self._metrics_lock:
+            self._metrics[key] += value
+
+    def _run(self):
+        """
+        Collect queued records into batches and upload them.
+        """
+        while self.running:
+            batch = self._collect_batch()
+            if batch is None:
+                break
+            if batch:
+                self._process_batch(batch)
+            elif self._spool_files() and self._has_api_key() and self._may_upload():
+                self._replay_spool()
+
+    def _collect_batch(self) -> Optional[List[FabricData]]:
+        """
+        Block until a batch is full, the batch interval elapses or stop is
+        requested.
 
-    def _share_data_worker(self, data: FabricData):
+        Returns
+        -------
+        Optional[List[FabricData]]
+            The collected records, or None once the submitter is stopped and
+            the queue is drained.
+        """
+        batch: List[FabricData] = []
+        deadline = time.monotonic() + self.batch_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except Empty:
+                break
+            if item is None:
+                if batch:
+                    self._process_batch(batch)
+                return None
+            batch.append(item)
+        return batch
+
+    def _to_records(self, batch: List[FabricData]) -> List[dict]:
         """
-        Worker function to share data from the machine.
-        This function runs in a separate thread to avoid blocking the main thread.
+        Convert a batch to dictionaries and log them locally.
 
         Parameters
         ----------
-        data : FabricData
-            The data to be shared.
-        """
+        batch : List[FabricData]
+            The records to convert.
 
-        logging.info(f"_share_data_worker: {data}")
-        try:
-            json_dict = data.to_dict()
-        except Exception as e:
-            logging.error(f"Error converting to dict: {str(e)}")
+        Returns
+        -------
+        List[dict]
+            The records that could be converted.
+        """
+        records = []
+        for data in batch:
+            try:
+                records.append(data.to_dict())
+            except Exception as e:
+                logging.error(f"Error converting to dict: {str(e)}")
 
         if self.write_to_local_file:
-            self.write_dict_to_file(json_dict)
-            logging.info(f"FDS wrote to {self.filename_current}")
+            for record in records:
+                self.write_dict_to_file(record)
+
+        return records
 
-        if self.api_key is None or self.api_key == "":
+    def _process_batch(self, batch: List[FabricData]):
+        """
+        Log a batch locally and upload it, spooling what is not delivered.
+
+        Parameters
+        ----------
+        batch : List[FabricData]
+            The records to deliver.
+        """
+        records = self._to_records(batch)
+        if not records:
+            return
+
+        if not self._has_api_key():
             logging.error("API key missing. Cannot share data to FABRIC.")
             return
 
+        # Older records go first so records arrive in order
+        if not self._may_upload() or (self._spool_files() and not self._replay_spool()):
+            self._spool(records)
+            return
+
+        sent = self._deliver(records)
+        if sent:
+            self._count("records_sent", sent)
+            self._count("batches_sent")
+        if sent < len(records):
+            self._spool(records[sent:])
+
+    def _has_api_key(self) -> bool:
+        return self.api_key is not None and self.api_key != ""
+
+    def _may_upload(self) -> bool:
+        """
+        Whether the backoff after the last failed upload has elapsed.
+        """
+        return time.monotonic() >= self._retry_at
+
+    def _deliver(self, records: List[dict]) -> int:
+        """
+        Upload records in order, stopping at the first failure, and update
+        the backoff.
+
+        Parameters
+        ----------
+        records : List[dict]
+            The records to upload.
+
+        Returns
+        -------
+        int
+            Number of leading records that were accepted.
+        """
+        if self.batch_upload:
+            body = gzip.compress(json.dumps(records).encode("utf-8"))
+            sent = len(records) if self._post(data=body) else 0
+        else:
+            sent = 0
+            for record in records:
+                if not self._post(json=record):
+                    break
+                sent += 1
+
+        if sent == len(records):
+            self._backoff = 0.0
+            self._retry_at = 0.0
+        else:
+            self._backoff = min(
+                self.max_backoff, max(self.batch_interval, 2 * self._backoff)
+            )
+            self._retry_at = time.monotonic() + self._backoff
+            logging.warning(f"FDS offline, next upload in {self._backoff:.1f}s")
+        return sent
+
+    def _post(self, **kwargs) -> bool:
+        """
+        Upload one record, or one gzip-compressed batch in batch mode.
+
+        Parameters
+        ----------
+        **kwargs
+            ``json`` with a single record, or ``data`` with the compressed
+            JSON array of a batch.
+
+        Returns
+        -------
+        bool
+            True if the upload was accepted.
+        """
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        if "data" in kwargs:
+            headers["Content-Type"] = "application/json"
+            headers["Content-Encoding"] = "gzip"
         try:
-            request = requests.post(
+            # The spool and the backoff retry; don't stall the uploader here
+            response = self.http.post_sync(
                 self.base_url,
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json=json_dict,
+                headers=headers,
+                timeout=self.timeout,
+                retries=0,
+                **kwargs,
+            )
+            if response.status_code in (200, 201):
+                logging.debug(f"Data shared: {response.status_code}")
+                with self._metrics_lock:
+                    self._metrics["last_upload_ts"] = time.time()
+                return True
+            logging.error(
+                f"Failed to share data: {response.status_code} - {response.text}"
             )
-
-            if request.status_code == 201:
-                logging.debug(f"Data shared: {request.json()}")
-            else:
-                logging.error(
-                    f"Failed to share data: {request.status_code} - {request.text}"
-                )
         except Exception as e:
             logging.error(f"Error sharing data: {str(e)}")
 
+        self._count("upload_failures")
+        return False
+
+    def _next_spool_seq(self) -> int:
+        files = self._spool_files()
+        if not files:
+            return 0
+        return int(os.path.basename(files[-1]).split(".")[0]) + 1
+
+    def _spool_files(self) -> List[str]:
+        if not os.path.isdir(self.spool_dir):
+            return []
+        return sorted(
+            os.path.join(self.spool_dir, f)
+            for f in os.listdir(self.spool_dir)
+            if f.endswith(".json.gz")
+        )
+
+    @staticmethod
+    def _file_bytes(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _write_spool_file(path: str, records: List[dict]):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(gzip.compress(json.dumps(records).encode("utf-8")))
+        os.replace(tmp_path, path)
+
+    def _spool(self, records: List[dict]):
+        """
+        Append undelivered records to the on-disk spool.
+
+        The spool stores every batch as a gzip-compressed JSON array,
+        independent of ``batch_upload``.
+
+        Parameters
+        ----------
+        records : List[dict]
+            The records to keep for a later upload.
+        """
+        with self._spool_lock:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            path = os.path.join(self.spool_dir, f"{self._spool_seq:012d}.json.gz")
+            self._write_spool_file(path, records)
+            self._spool_seq += 1
+            self._count("batches_spooled")
+            logging.warning(f"FDS spooled {len(records)} records to {path}")
+
+            files = self._spool_files()
+            total = sum(self._file_bytes(f) for f in files)
+            while files and total > self.max_spool_bytes:
+                oldest = files.pop(0)
+                total -= self._file_bytes(oldest)
+                os.remove(oldest)
+                self._count("batches_dropped")
+                logging.warning(f"FDS spool full, dropped {oldest}")
+
+    def _replay_spool(self) -> bool:
+        """
+        Upload spooled batches in order, stopping at the first failure.
+
+        A partly delivered batch is rewritten with the records that are left.
+
+        Returns
+        -------
+        bool
+            True if the spool is now empty.
+        """
+        for path in self._spool_files():
+            try:
+                with open(path, "rb") as f:
+                    records = json.loads(gzip.decompress(f.read()))
+            except FileNotFoundError:
+                # Dropped by a concurrent spill into a full spool
+                continue
+            except Exception as e:
+                logging.error(f"FDS dropping unreadable spool file {path}: {e}")
+                os.remove(path)
+                self._count("batches_dropped")
+                continue
+
+            sent = self._deliver(records)
+            if sent:
+                self._count("records_sent", sent)
+            if sent < len(records):
+                if sent:
+                    with self._spool_lock:
+                        self._write_spool_file(path, records[sent:])
+                return False
+            with self._spool_lock:
+                if os.path.exists(path):
+                    os.remove(path)
+            self._count("batches_replayed")
+            logging.info(f"FDS replayed spooled batch {path}")
+        return True
+
+    def _spill(self, data: FabricData):
+        """
+        Move the queued records and ``data`` to the spool when the queue is
+        full, so that a stalled uploader never blocks the caller.
+
+        Parameters
+        ----------
+        data : FabricData
+            The record that did not fit into the queue.
+        """
+        batch: List[FabricData] = []
+        stop_requested = False
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except Empty:
+                break
+            if item is None:
+                stop_requested = True
+            else:
+                batch.append(item)
+        batch.append(data)
+        if stop_requested:
+            self._queue.put_nowait(None)
+
+        records = self._to_records(batch)
+        self._count("records_spilled", len(records))
+        if records and self._has_api_key():
+            self._spool(records)
+
     def share_data(self, data: FabricData):
         """
         Share mapping data.
-        This function submits mapping data collected by a machine to a thread pool executor
-        to run in a separate thread.
+        This function queues mapping data collected by a machine for the
+        uploader thread; it never blocks on network I/O and only writes to
+        the spool when the queue is full.
 
         Parameters
         ----------
@@ -278,4 +637,24 @@ class FabricDataSubmitter:
             A mapping data payload to submit.
         """
         logging.debug(f"share data: {data}")
-        self.executor.submit(self._share_data_worker, data)
+        self._count("records_queued")
+        try:
+            self._queue.put_nowait(data)
+        except Full:
+            self._spill(data)
+
+    def stop(self):
+        """
+        Flush queued records and stop the uploader thread.
+        """
+        if not self.running:
+            return
+        try:
+            self._queue.put(None, timeout=self.timeout + self.batch_interval)
+        except Full:
+            self.running = False
+        self._thread.join(timeout=self.timeout + self.batch_interval)
+        self.running = False
+
+        if self.sensor_log is not None:
+            self.sensor_log.release(self)
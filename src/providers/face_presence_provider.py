@@ -5,6 +5,7 @@ from typing import Callable, Dict, List, Optional
 
 import requests
 
+from .face_service_stream import FaceServiceStream, stream_url
 from .singleton import singleton
 
 
@@ -86,13 +87,16 @@ class PresenceSnapshot:
 @singleton
 class FacePresenceProvider:
     """
-    Singleton provider that polls `/who` at a fixed cadence and emits text lines.
+    Singleton provider that tracks `/who` and emits text lines when presence changes.
 
     Tasks
     ------------
-    - Spawns one background thread that periodically POSTs to `{base_url}/who`.
+    - Polling mode: one background thread periodically POSTs to `{base_url}/who`.
+    - Subscription mode: one background thread receives `/who` snapshots pushed by
+      the service over the `{base_url}/who/stream` websocket as presence changes.
     - Converts each JSON snapshot to a concise string via `PresenceSnapshot.to_text()`.
-    - Invokes every registered callback with that string (same polling thread).
+    - Invokes every registered callback with that string when it differs from the
+      previous one (same background thread).
     """
 
     def __init__(
@@ -106,6 +110,8 @@ class FacePresenceProvider:
         unknown_frac_threshold: float = 0.15,
         unknown_min_count: int = 6,
         min_obs_window: int = 24,
+        subscribe: bool = False,
+        reconnect_interval: float = 1.0,
     ) -> None:
         """
         Configure the provider (first construction establishes the singleton).
@@ -121,6 +127,10 @@ class FacePresenceProvider:
             Polling rate in events per second (e.g., 5.0 → every 0.2s).
         timeout_s : float, default 2.0
             HTTP request timeout in seconds.
+        subscribe : bool, default False
+            Receive snapshots pushed over `{base_url}/who/stream` instead of polling.
+        reconnect_interval : float, default 1.0
+            Seconds between stream connection attempts in subscription mode.
         """
 
         self.base_url = base_url.rstrip("/")
@@ -139,22 +149,48 @@ class FacePresenceProvider:
         self._session = requests.Session()
         self._unknown_faces: int = 0
 
+        self.subscribe = bool(subscribe)
+        self._stream = FaceServiceStream(
+            stream_url(self.base_url, "/who/stream"),
+            {"recent_sec": self.recent_sec},
+            self._on_stream_message,
+            name="face-presence-stream",
+            reconnect_interval=reconnect_interval,
+            open_timeout=self.timeout_s,
+        )
+
+        self._last_text: Optional[str] = None
+        self._snapshot: Optional[PresenceSnapshot] = None
+        self._snapshot_count = 0
+        self._snapshot_cond = threading.Condition()
+
     def set_recent_sec(self, sec: float) -> None:
         """Dynamically change the lookback window used for `/who`."""
         self.recent_sec = max(0.0, float(sec))
+        if self.subscribe:
+            self._stream.update({"recent_sec": self.recent_sec})
 
     def register_message_callback(self, fn: Callable[[str], None]) -> None:
         """
         Subscribe a consumer to receive each emitted presence line.
 
+        The current presence line, if any, is delivered immediately.
+
         Parameters
         ----------
         fn : Callable[[str], None]
             Function invoked from the polling thread with one formatted string.
         """
         with self._cb_lock:
-            if fn not in self._callbacks:
-                self._callbacks.append(fn)
+            if fn in self._callbacks:
+                return
+            self._callbacks.append(fn)
+            text = self._last_text
+        if text is not None:
+            try:
+                fn(text)
+            except Exception:
+                pass
 
     def unregister_message_callback(self, fn: Callable[[str], None]) -> None:
         """
@@ -171,8 +207,22 @@ class FacePresenceProvider:
             except ValueError:
                 pass
 
+    @property
+    def running(self) -> bool:
+        """Whether the provider is polling, or subscribed in subscription mode."""
+        if self.subscribe:
+            return self._stream.running
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and not self._stop.is_set()
+        )
+
     def start(self) -> None:
-        """Start the background polling thread"""
+        """Start the background polling thread, or the stream in subscription mode"""
+        if self.subscribe:
+            self._stream.start()
+            return
         if self._thread and self._thread.is_alive():
             return
         self._stop.clear()
@@ -184,6 +234,7 @@ class FacePresenceProvider:
     def stop(self, *, wait: bool = False) -> None:
         """Request the background thread to strop"""
         self._stop.set()
+        self._stream.stop(wait=wait)
         if wait and self._thread:
             self._thread.join(timeout=3.0)
 
@@ -194,18 +245,16 @@ class FacePresenceProvider:
         Tasks
         --------
         - Waits until the next scheduled time (based on `fps`).
-        - Calls `_fetch_snapshot()` → formats with `to_text()` → `_emit(text)`.
+        - Calls `_fetch_snapshot()` → `_publish(snap)`.
         """
         next_t = time.time()
         while not self._stop.is_set():
             now = time.time()
             if now < next_t:
-                time.sleep(min(0.02, next_t - now))
+                self._stop.wait(next_t - now)
                 continue
             try:
-                snap = self._fetch_snapshot()
-                text = snap.to_text()
-                self._emit(text)
+                self._publish(self._fetch_snapshot())
             except Exception:
                 pass
 
@@ -213,6 +262,81 @@ class FacePresenceProvider:
             if next_t < time.time() - self.period:
                 next_t = time.time()
 
+    def _on_stream_message(self, data: Dict) -> None:
+        """
+        Handle one `/who` snapshot pushed by the service.
+
+        Parameters
+        ----------
+        data : Dict
+            The snapshot, in the same shape as the `/who` response body.
+        """
+        try:
+            self._publish(self._parse_snapshot(data))
+        except Exception:
+            pass
+
+    def _publish(self, snap: PresenceSnapshot) -> None:
+        """
+        Record a new snapshot, wake `wait_for()` callers, and emit its text
+        line if it differs from the previous one.
+
+        Parameters
+        ----------
+        snap : PresenceSnapshot
+            The latest snapshot.
+        """
+        with self._snapshot_cond:
+            self._snapshot = snap
+            self._snapshot_count += 1
+            self._snapshot_cond.notify_all()
+
+        text = snap.to_text()
+        with self._cb_lock:
+            if text == self._last_text:
+                return
+            self._last_text = text
+        self._emit(text)
+
+    @property
+    def snapshot(self) -> Optional[PresenceSnapshot]:
+        """The most recent snapshot, or None before the first one arrives."""
+        return self._snapshot
+
+    def wait_for(
+        self, predicate: Callable[[PresenceSnapshot], bool], timeout: float
+    ) -> Optional[PresenceSnapshot]:
+        """
+        Block until a snapshot taken after the call satisfies `predicate`
+        (checked on every new snapshot).
+
+        In subscription mode the latest snapshot also counts while the stream
+        is connected, since the service pushes every change.
+
+        Parameters
+        ----------
+        predicate : Callable[[PresenceSnapshot], bool]
+            Condition on the snapshot.
+        timeout : float
+            Maximum time to wait in seconds.
+
+        Returns
+        -------
+        Optional[PresenceSnapshot]
+            The matching snapshot, or None on timeout.
+        """
+        with self._snapshot_cond:
+            seen = self._snapshot_count
+            if self.subscribe and self._stream.connected:
+                seen -= 1
+            matched = self._snapshot_cond.wait_for(
+                lambda: self._snapshot_count > seen
+                and self._snapshot is not None
+                and predicate(self._snapshot),
+                timeout=timeout,
+            )
+            return self._snapshot if matched else None
+
     def _emit(self, text: str) -> None:
         """
         Deliver one formatted presence line to all subscribers.
@@ -254,8 +378,23 @@ class FacePresenceProvider:
         url = f"{self.base_url}/who"
         r = self._session.post(url, json={"recent_sec": sec}, timeout=self.timeout_s)
         r.raise_for_status()
-        data: Dict = r.json() or {}
+        return self._parse_snapshot(r.json() or {})
+
+    def _parse_snapshot(self, data: Dict) -> PresenceSnapshot:
+        """
+        Build a snapshot from a `/who` response body, applying the frames-based
+        unknown suppression described in `_fetch_snapshot()`.
+
+        Parameters
+        ----------
+        data : Dict
+            The `/who` response body.
 
+        Returns
+        -------
+        PresenceSnapshot
+            The canonical presence snapshot.
+        """
         if self.prefer_recent:
 
             name_frames: Dict[str, int] = data.get("recent_name_frames", {}) or {}
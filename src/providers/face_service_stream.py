@@ -0,0 +1,157 @@
+import json
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+from websockets.exceptions import WebSocketException
+from websockets.sync.client import ClientConnection, connect
+
+
+def stream_url(base_url: str, path: str) -> str:
+    """
+    Build the websocket URL of a face service event stream.
+
+    Parameters
+    ----------
+    base_url : str
+        Base HTTP URL of the face service (e.g., "http://127.0.0.1:6793").
+    path : str
+        Stream path (e.g., "/who/stream").
+
+    Returns
+    -------
+    str
+        The URL with the scheme switched to ws/wss.
+    """
+    base = base_url.rstrip("/")
+    if base.startswith("https://"):
+        base = "wss://" + base[len("https://") :]
+    elif base.startswith("http://"):
+        base = "ws://" + base[len("http://") :]
+    return base + path
+
+
+class FaceServiceStream:
+    """
+    Subscription to an event stream of the face service.
+
+    A background thread connects to the websocket ``url``, sends the
+    ``subscribe`` message, and calls ``on_message`` with every JSON payload the
+    service pushes. The service pushes a payload when the state changes, in
+    the same shape as the matching HTTP endpoint. Lost connections are
+    re-established every ``reconnect_interval`` seconds.
+
+    Parameters
+    ----------
+    url : str
+        Websocket URL of the stream.
+    subscribe : Dict
+        Message sent after connecting (e.g., ``{"recent_sec": 2.0}``).
+    on_message : Callable[[Dict], None]
+        Called from the stream thread with each payload.
+    name : str
+        Name of the stream thread.
+    reconnect_interval : float
+        Seconds between connection attempts.
+    open_timeout : float
+        Timeout of the websocket handshake in seconds.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        subscribe: Dict,
+        on_message: Callable[[Dict], None],
+        name: str = "face-service-stream",
+        reconnect_interval: float = 1.0,
+        open_timeout: float = 2.0,
+    ) -> None:
+        self.url = url
+        self.subscribe = subscribe
+        self.on_message = on_message
+        self.name = name
+        self.reconnect_interval = reconnect_interval
+        self.open_timeout = open_timeout
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._ws: Optional[ClientConnection] = None
+        self._ws_lock = threading.Lock()
+
+    @property
+    def connected(self) -> bool:
+        """Whether the stream is currently connected."""
+        return self._ws is not None
+
+    @property
+    def running(self) -> bool:
+        """Whether the stream thread runs and has not been asked to stop."""
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and not self._stop.is_set()
+        )
+
+    def start(self) -> None:
+        """Start the stream thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, *, wait: bool = False) -> None:
+        """Close the connection and stop the stream thread."""
+        self._stop.set()
+        with self._ws_lock:
+            ws = self._ws
+        if ws is not None:
+            ws.close()
+        if wait and self._thread:
+            self._thread.join(timeout=3.0)
+
+    def update(self, subscribe: Dict) -> None:
+        """
+        Change the subscription, resending it if connected.
+
+        Parameters
+        ----------
+        subscribe : Dict
+            The new subscribe message.
+        """
+        self.subscribe = subscribe
+        with self._ws_lock:
+            ws = self._ws
+        if ws is None:
+            return
+        try:
+            ws.send(json.dumps(subscribe))
+        except (OSError, WebSocketException):
+            pass
+
+    def _run(self) -> None:
+        failing = False
+        while not self._stop.is_set():
+            try:
+                with connect(self.url, open_timeout=self.open_timeout) as ws:
+                    ws.send(json.dumps(self.subscribe))
+                    with self._ws_lock:
+                        self._ws = ws
+                    logging.info(f"{self.name}: subscribed to {self.url}")
+                    failing = False
+                    for raw in ws:
+                        try:
+                            data = json.loads(raw)
+                        except ValueError:
+                            logging.warning(f"{self.name}: bad payload {raw!r:.80}")
+                            continue
+                        if isinstance(data, dict):
+                            self.on_message(data)
+            except (OSError, WebSocketException) as e:
+                if not failing and not self._stop.is_set():
+                    logging.warning(f"{self.name}: stream {self.url} unavailable: {e}")
+                failing = True
+            finally:
+                with self._ws_lock:
+                    self._ws = None
+            self._stop.wait(self.reconnect_interval)
@@ -7,6 +7,7 @@ from typing import Callable, Dict, List, Optional
 
 import requests
 
+from .face_service_stream import FaceServiceStream, stream_url
 from .singleton import singleton
 
 
@@ -52,13 +53,17 @@ class IdentitiesSnapshot:
 @singleton
 class GalleryIdentitiesProvider:
     """
-    Singleton provider that polls `/gallery/identities` and emits text lines.
+    Singleton provider that tracks `/gallery/identities` and emits text lines
+    when the gallery changes.
 
     Tasks
     -----
-    - Background thread POSTs to `{base_url}/gallery/identities` at a cadence.
+    - Polling mode: background thread POSTs to `{base_url}/gallery/identities` at a cadence.
+    - Subscription mode: background thread receives gallery snapshots pushed by the
+      service over the `{base_url}/gallery/identities/stream` websocket.
     - Converts JSON to the concise string via `IdentitiesSnapshot.to_text()`.
-    - Invokes every registered callback with that string.
+    - Invokes every registered callback with that string when it differs from the
+      previous one.
     """
 
     def __init__(
@@ -67,6 +72,8 @@ class GalleryIdentitiesProvider:
         base_url: str = "http://127.0.0.1:6793",
         fps: float = 1.0,
         timeout_s: float = 2.0,
+        subscribe: bool = False,
+        reconnect_interval: float = 1.0,
     ) -> None:
         """
         Parameters
@@ -77,6 +84,11 @@ class GalleryIdentitiesProvider:
             Polling rate (events/sec). 1.0 → every 1s.
         timeout_s : float
             HTTP request timeout in seconds.
+        subscribe : bool
+            Receive snapshots pushed over `{base_url}/gallery/identities/stream`
+            instead of polling.
+        reconnect_interval : float
+            Seconds between stream connection attempts in subscription mode.
         """
         self.base_url = base_url.rstrip("/")
         self.period = 1.0 / max(1e-6, float(fps))
@@ -90,18 +102,38 @@ class GalleryIdentitiesProvider:
 
         self._session = requests.Session()
 
+        self.subscribe = bool(subscribe)
+        self._stream = FaceServiceStream(
+            stream_url(self.base_url, "/gallery/identities/stream"),
+            {},
+            self._on_stream_message,
+            name="gallery-identities-stream",
+            reconnect_interval=reconnect_interval,
+            open_timeout=self.timeout_s,
+        )
+        self._last_text: Optional[str] = None
+
     def register_message_callback(self, fn: Callable[[str], None]) -> None:
         """
         Subscribe a consumer to receive each emitted galleryidentities line.
 
+        The current gallery line, if any, is delivered immediately.
+
         Parameters
         ----------
         fn : Callable[[str], None]
             Function invoked from the polling thread with one formatted string.
         """
         with self._cb_lock:
-            if fn not in self._callbacks:
-                self._callbacks.append(fn)
+            if fn in self._callbacks:
+                return
+            self._callbacks.append(fn)
+            text = self._last_text
+        if text is not None:
+            try:
+                fn(text)
+            except Exception:
+                pass
 
     def unregister_message_callback(self, fn: Callable[[str], None]) -> None:
         """
@@ -119,7 +151,10 @@ class GalleryIdentitiesProvider:
                 pass
 
     def start(self) -> None:
-        """Start the background polling thread"""
+        """Start the background polling thread, or the stream in subscription mode"""
+        if self.subscribe:
+            self._stream.start()
+            return
         if self._thread and self._thread.is_alive():
             return
         self._stop.clear()
@@ -131,6 +166,7 @@ class GalleryIdentitiesProvider:
     def stop(self, *, wait: bool = False) -> None:
         """Request the background thread to strop"""
         self._stop.set()
+        self._stream.stop(wait=wait)
         if wait and self._thread:
             self._thread.join(timeout=3.0)
 
@@ -147,11 +183,10 @@ class GalleryIdentitiesProvider:
         while not self._stop.is_set():
             now = time.time()
             if now < next_t:
-                time.sleep(min(0.02, next_t - now))
+                self._stop.wait(next_t - now)
                 continue
             try:
-                snap = self._fetch_snapshot()
-                self._emit(snap.to_text())
+                self._emit_if_changed(self._fetch_snapshot().to_text())
             except Exception:
                 pass
 
@@ -159,6 +194,35 @@ class GalleryIdentitiesProvider:
             if next_t < time.time() - self.period:
                 next_t = time.time()
 
+    def _on_stream_message(self, data: Dict) -> None:
+        """
+        Handle one gallery snapshot pushed by the service.
+
+        Parameters
+        ----------
+        data : Dict
+            The snapshot, in the same shape as the `/gallery/identities` response body.
+        """
+        try:
+            self._emit_if_changed(self._parse_snapshot(data).to_text())
+        except Exception:
+            pass
+
+    def _emit_if_changed(self, text: str) -> None:
+        """
+        Emit a summary line unless it equals the previous one.
+
+        Parameters
+        ----------
+        text : str
+            Preformatted gallery line.
+        """
+        with self._cb_lock:
+            if text == self._last_text:
+                return
+            self._last_text = text
+        self._emit(text)
+
     def _emit(self, text: str) -> None:
         """
         Invoke all registered callbacks with the given summary line.
@@ -193,8 +257,22 @@ class GalleryIdentitiesProvider:
         url = f"{self.base_url}/gallery/identities"
         r = self._session.post(url, json={}, timeout=self.timeout_s)  # type: ignore
         r.raise_for_status()
-        data = r.json() or {}
+        return self._parse_snapshot(r.json() or {})
 
+    def _parse_snapshot(self, data: Dict) -> IdentitiesSnapshot:
+        """
+        Map a `/gallery/identities` response body to a structured record.
+
+        Parameters
+        ----------
+        data : Dict
+            The response body.
+
+        Returns
+        -------
+        IdentitiesSnapshot
+            Structured view of the current gallery.
+        """
         ok = bool(data.get("ok"))
         if not ok:
             # Graceful empty snapshot on bad response
@@ -1,14 +1,14 @@
 import logging
 import re
-import threading
 import time
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import serial
 
 from providers.fabric_map_provider import RFDataRaw
 
+from .serial_reader import Fix, SerialLineReader
 from .singleton import singleton
 
 
@@ -61,8 +61,11 @@ class GpsProvider:
 
         self.ble_scan: List[RFDataRaw] = []
 
+        self._fix: Optional[Fix] = None
+        self.garbled = 0
+
         self.running = False
-        self._thread: Optional[threading.Thread] = None
+        self._reader: Optional[SerialLineReader] = None
         self.start()
 
     def string_to_unix_timestamp(self, time_str):
@@ -88,6 +91,7 @@ class GpsProvider:
                     )
                     logging.debug(f"MAG: {self.yaw_mag_0_360}")
                 else:
+                    self.garbled += 1
                     logging.warning(f"Unable to parse heading: {data}")
             elif data.startswith("YPR:"):
                 yaw, pitch, roll = map(str.strip, data[4:].split(","))
@@ -105,9 +109,9 @@ class GpsProvider:
                     heading = parts[3].split(":")[1]
                     alt = parts[4].split(":")[1]
                     sat = parts[5].split(":")[1]
-                    time = parts[6][5:]
+                    gps_time = parts[6][5:]
                     # turn 25 into full year -> 2025, for example
-                    self.gps_unix_ts = self.string_to_unix_timestamp("20" + time)
+                    self.gps_unix_ts = self.string_to_unix_timestamp("20" + gps_time)
 
                     qua = 0
                     if len(parts) > 7:
@@ -131,6 +135,16 @@ class GpsProvider:
                     self.sat = int(sat)
                     self.qua = int(qua)
 
+                    self._fix = Fix(
+                        lat=self.lat,
+                        lon=self.lon,
+                        alt=self.alt,
+                        sat=self.sat,
+                        qua=self.qua,
+                        unix_ts=self.gps_unix_ts,
+                        received_ts=time.time(),
+                    )
+
                     logging.debug(
                         (
                             f"Current location is {self.lat}, {self.lon} at {alt}m altitude. "
@@ -140,14 +154,17 @@ class GpsProvider:
                         )
                     )
                 except Exception as e:
+                    self.garbled += 1
                     logging.warning(f"Failed to parse GPS: {data} ({e})")
             elif data.startswith("BLE:"):
                 try:
                     self.ble_scan = self.parse_ble_triang_string(data)
                     logging.debug(f"nRF BLE data {self.ble_scan}")
                 except Exception as e:
+                    self.garbled += 1
                     logging.warning(f"Failed to parse BLE: {data} ({e})")
         except Exception as e:
+            self.garbled += 1
             logging.warning(f"Error processing serial MAG/GPS/BLE input: {data} ({e})")
 
         self._gps = {
@@ -200,38 +217,67 @@ class GpsProvider:
 
     def start(self):
         """
-        Starts the GPS Provider and processing thread
+        Starts the GPS Provider and its serial reader thread
         if not already running.
         """
-        if self._thread and self._thread.is_alive():
+        if self._reader and self._reader.running:
             return
 
         self.running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        if self.serial_connection:
+            self._reader = SerialLineReader(
+                self.serial_connection, self._process_line, name="gps-serial"
+            )
+            self._reader.start()
 
-    def _run(self):
+    def _process_line(self, data: str):
         """
-        Main loop for the GPS provider.
-        WARNING: this assumes that the data from the Arduino are arriving
-        relatively slowly.
+        Process one line from the nav Arduino, as soon as it arrives.
+
+        Parameters
+        ----------
+        data : str
+            The line, without its terminator.
         """
-        while self.running:
-            if self.serial_connection:
-                # Read a line, decode, and remove whitespace
-                data = self.serial_connection.readline().decode("utf-8").strip()
-                logging.debug(f"Serial GPS/MAG: {data}")
-                self.magGPSProcessor(data)
-            time.sleep(0.1)
+        logging.debug(f"Serial GPS/MAG: {data}")
+        self.magGPSProcessor(data)
 
     def stop(self):
         """
         Stop the GPS provider.
         """
         self.running = False
-        if self._thread:
+        if self._reader:
             logging.info("Stopping GPS provider")
-            self._thread.join(timeout=5)
+            self._reader.stop()
+
+    @property
+    def fix(self) -> Optional[Fix]:
+        """
+        Get the latest GPS fix; its ``age`` tells how stale it is.
+
+        Returns
+        -------
+        Optional[Fix]
+            The latest fix, or None before the first one.
+        """
+        return self._fix
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the serial counters.
+
+        Returns
+        -------
+        Dict[str, int]
+            Bytes and lines read, and lines dropped or garbled.
+        """
+        stats = {"bytes": 0, "lines": 0, "dropped": 0, "garbled": 0}
+        if self._reader:
+            stats.update(self._reader.stats)
+        stats["garbled"] += self.garbled
+        return stats
 
     @property
     def data(self) -> Optional[dict]:
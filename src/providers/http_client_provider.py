@@ -0,0 +1,411 @@
+import asyncio
+import json as jsonlib
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from .singleton import singleton
+
+# Methods that are safe to retry by default
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _close_abandoned(session: aiohttp.ClientSession) -> None:
+    """
+    Close the session of an event loop that is closed.
+
+    ``ClientSession.close`` has to run on the loop of the session, so the
+    connector is closed synchronously instead. That releases its pooled
+    connections and marks the session as closed.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The session to close.
+    """
+    connector = session.connector
+    if connector is not None and not connector.closed:
+        connector._close()
+
+
+class HTTPClientError(Exception):
+    """
+    Raised when a request fails without a response, after all retries.
+    """
+
+
+class HTTPTimeoutError(HTTPClientError):
+    """
+    Raised when a request times out, after all retries.
+    """
+
+
+@dataclass
+class HTTPResponse:
+    """
+    A fully read HTTP response.
+
+    Parameters
+    ----------
+    status_code : int
+        HTTP status code.
+    content : bytes
+        Response body.
+    headers : Dict[str, str]
+        Response headers.
+    url : str
+        The requested URL.
+    """
+
+    status_code: int
+    content: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+    url: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the status code is 2xx.
+        """
+        return 200 <= self.status_code < 300
+
+    @property
+    def text(self) -> str:
+        """
+        The body decoded as UTF-8.
+        """
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """
+        The body parsed as JSON.
+        """
+        return jsonlib.loads(self.content)
+
+
+@singleton
+class HTTPClientProvider:
+    """
+    Process-wide HTTP client with pooled keep-alive connections.
+
+    Async code uses ``request``/``get``/``post``/``put``/``delete``, served by
+    one aiohttp session per event loop with a per-host connection pool, so
+    requests never block the loop and reuse connections (and TLS sessions)
+    to the same host. Thread-based code uses the ``*_sync`` variants, served
+    by a pooled ``requests.Session``.
+
+    Both retry failed connections, timeouts and 429/5xx responses with
+    exponential backoff and full jitter. Idempotent methods are retried by
+    default; other methods only when ``retries`` is passed explicitly.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        retries: int = 2,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 10.0,
+        pool_size_per_host: int = 8,
+        keepalive_timeout: float = 60.0,
+    ):
+        """
+        Initialize the HTTPClientProvider.
+
+        Parameters
+        ----------
+        timeout : float
+            Default total timeout per attempt in seconds.
+        retries : int
+            Default number of retries for idempotent methods.
+        backoff_factor : float
+            Base of the exponential backoff in seconds.
+        max_backoff : float
+            Maximum delay between attempts in seconds.
+        pool_size_per_host : int
+            Maximum number of pooled connections per host.
+        keepalive_timeout : float
+            Seconds an idle connection is kept open.
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.pool_size_per_host = pool_size_per_host
+        self.keepalive_timeout = keepalive_timeout
+
+        self._lock = threading.Lock()
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._sync_session: Optional[requests.Session] = None
+
+        self._stats = {"requests": 0, "retries": 0, "failures": 0}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Request, retry and failure counters plus the number of open sessions.
+        """
+        with self._lock:
+            return {**self._stats, "sessions": len(self._sessions)}
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _attempts(self, method: str, retries: Optional[int]) -> int:
+        if retries is None:
+            retries = self.retries if method in IDEMPOTENT_METHODS else 0
+        return retries + 1
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        delay = random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * (2**attempt))
+        )
+        if retry_after:
+            try:
+                delay = max(delay, min(self.max_backoff, float(retry_after)))
+            except ValueError:
+                pass
+        return delay
+
+    def _session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                # Close and drop the sessions of loops that are gone
+                for old_loop in [lp for lp in self._sessions if lp.is_closed()]:
+                    _close_abandoned(self._sessions.pop(old_loop))
+
+                connector = aiohttp.TCPConnector(
+                    limit_per_host=self.pool_size_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=300,
+                )
+                session = aiohttp.ClientSession(connector=connector)
+                self._sessions[loop] = session
+            return session
+
+    def _sync(self) -> requests.Session:
+        with self._lock:
+            if self._sync_session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=16, pool_maxsize=self.pool_size_per_host
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sync_session = session
+            return self._sync_session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        data: Any = None,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+    ) -> HTTPResponse:
+        """
+        Send a request from async code.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method.
+        url : str
+            The URL.
+        json : Any, optional
+            JSON body.
+        data : Any, optional
+            Raw body.
+        params : Mapping[str, Any], optional
+            Query parameters.
+        headers : Mapping[str, str], optional
+            Request headers.
+        timeout : float, optional
+            Total timeout per attempt in seconds.
+        retries : int, optional
+            Number of retries; defaults to the provider setting for idempotent
+            methods and 0 otherwise.
+
+        Returns
+        -------
+        HTTPResponse
+            The response of the last attempt.
+
+        Raises
+        ------
+        HTTPTimeoutError
+            If every attempt timed out.
+        HTTPClientError
+            If every attempt failed without a response.
+        """
+        method = method.upper()
+        attempts = self._attempts(method, retries)
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        self._count("requests")
+
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            try:
+                async with self._session().request(
+                    method,
+                    url,
+                    json=json,
+                    data=data,
+                    params=params,
+                    headers=headers,
+                    timeout=client_timeout,
+                ) as resp:
+                    response = HTTPResponse(
+                        status_code=resp.status,
+                        content=await resp.read(),
+                        headers=dict(resp.headers),
+                        url=url,
+                    )
+            except asyncio.TimeoutError as e:
+                if last:
+                    self._count("failures")
+                    raise HTTPTimeoutError(f"{method} {url} timed out") from e
+                delay = self._backoff(attempt)
+            except aiohttp.ClientError as e:
+                if last:
+                    self._count("failures")
+                    raise HTTPClientError(f"{method} {url} failed: {e}") from e
+                delay = self._backoff(attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES or last:
+                    return response
+                delay = self._backoff(attempt, response.headers.get("Retry-After"))
+
+            self._count("retries")
+            logging.debug(
+                f"HTTPClientProvider: retrying {method} {url} in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+
+        raise HTTPClientError(f"{method} {url} failed")
+
+    async def get(self, url: str, **kwargs) -> HTTPResponse:
+        """Send a GET request from async code. See ``request``."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> HTTPResponse:
+        """Send a POST request from async code. See ``request``."""
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> HTTPResponse:
+        """Send a PUT request from async code. See ``request``."""
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> HTTPResponse:
+        """Send a DELETE request from async code. See ``request``."""
+        return await self.request("DELETE", url, **kwargs)
+
+    def request_sync(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        data: Any = None,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+    ) -> HTTPResponse:
+        """
+        Send a request from a thread. Never call this on the event loop.
+
+        Takes the same arguments, returns the same response and raises the
+        same errors as ``request``.
+        """
+        method = method.upper()
+        attempts = self._attempts(method, retries)
+        self._count("requests")
+
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            try:
+                resp = self._sync().request(
+                    method,
+                    url,
+                    json=json,
+                    data=data,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout or self.timeout,
+                )
+                response = HTTPResponse(
+                    status_code=resp.status_code,
+                    content=resp.content,
+                    headers=dict(resp.headers),
+                    url=url,
+                )
+            except requests.Timeout as e:
+                if last:
+                    self._count("failures")
+                    raise HTTPTimeoutError(f"{method} {url} timed out") from e
+                delay = self._backoff(attempt)
+            except requests.RequestException as e:
+                if last:
+                    self._count("failures")
+                    raise HTTPClientError(f"{method} {url} failed: {e}") from e
+                delay = self._backoff(attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES or last:
+                    return response
+                delay = self._backoff(attempt, response.headers.get("Retry-After"))
+
+            self._count("retries")
+            logging.debug(
+                f"HTTPClientProvider: retrying {method} {url} in {delay:.2f}s"
+            )
+            time.sleep(delay)
+
+        raise HTTPClientError(f"{method} {url} failed")
+
+    def get_sync(self, url: str, **kwargs) -> HTTPResponse:
+        """Send a GET request from a thread. See ``request_sync``."""
+        return self.request_sync("GET", url, **kwargs)
+
+    def post_sync(self, url: str, **kwargs) -> HTTPResponse:
+        """Send a POST request from a thread. See ``request_sync``."""
+        return self.request_sync("POST", url, **kwargs)
+
+    def put_sync(self, url: str, **kwargs) -> HTTPResponse:
+        """Send a PUT request from a thread. See ``request_sync``."""
+        return self.request_sync("PUT", url, **kwargs)
+
+    async def close(self) -> None:
+        """
+        Close the session of the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.pop(loop, None)
+        if session is not None:
+            await session.close()
+
+    def close_sync(self) -> None:
+        """
+        Close the pooled connections of the sync facade.
+        """
+        with self._lock:
+            session, self._sync_session = self._sync_session, None
+        if session is not None:
+            session.close()
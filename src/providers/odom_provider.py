@@ -191,6 +191,10 @@ class OdomProvider:
         self.odom_rockchip_ts = 0.0
         self.odom_subscriber_ts = 0.0
 
+        # Incremented on every processed pose; waiters are notified
+        self._update_seq = 0
+        self._update_condition = threading.Condition()
+
         self.start()
 
     def start(self) -> None:
@@ -358,6 +362,44 @@ class OdomProvider:
                 f"odom: X:{self.x} Y:{self.y} W:{self.odom_yaw_m180_p180} H:{self.odom_yaw_0_360} T:{self.odom_rockchip_ts}"
             )
 
+            with self._update_condition:
+                self._update_seq += 1
+                self._update_condition.notify_all()
+
+    @property
+    def update_seq(self) -> int:
+        """
+        Get the number of poses processed so far.
+
+        Returns
+        -------
+        int
+            The sequence number of the latest pose.
+        """
+        return self._update_seq
+
+    def wait_for_update(self, seq: int, timeout: Optional[float] = None) -> int:
+        """
+        Block until a pose newer than ``seq`` has been processed.
+
+        Parameters
+        ----------
+        seq : int
+            The sequence number the caller has already seen.
+        timeout : float, optional
+            Maximum time to wait in seconds. Waits forever if None.
+
+        Returns
+        -------
+        int
+            The latest sequence number; equal to ``seq`` on timeout.
+        """
+        with self._update_condition:
+            self._update_condition.wait_for(
+                lambda: self._update_seq != seq, timeout=timeout
+            )
+            return self._update_seq
+
     @property
     def position(self) -> dict:
         """
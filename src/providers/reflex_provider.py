@@ -0,0 +1,117 @@
+import threading
+from typing import Callable, Dict, List, Optional
+
+from llm.output_model import Action
+
+from .singleton import singleton
+
+
+@singleton
+class ReflexProvider:
+    """
+    Shared state of the reflex layer.
+
+    The ReflexOrchestrator registers the vetoes of the active reflexes and
+    the messages of the reflexes that fired; the ActionOrchestrator drops the
+    vetoed actions and the Fuser adds the messages to the next prompt.
+    """
+
+    def __init__(self):
+        """
+        Initialize the ReflexProvider with no active reflexes.
+        """
+        self._lock: threading.Lock = threading.Lock()
+        self._vetoes: Dict[str, Callable[[Action], bool]] = {}
+        self._veto_counts: Dict[str, int] = {}
+        self._messages: List[str] = []
+
+    def activate(self, name: str, vetoes: Callable[[Action], bool]) -> None:
+        """
+        Register the veto of an active reflex.
+
+        Parameters
+        ----------
+        name : str
+            Name of the reflex.
+        vetoes : Callable[[Action], bool]
+            Returns True for the actions the reflex drops.
+        """
+        with self._lock:
+            self._vetoes[name] = vetoes
+
+    def deactivate(self, name: str) -> None:
+        """
+        Remove the veto of a reflex that is no longer active.
+
+        Parameters
+        ----------
+        name : str
+            Name of the reflex.
+        """
+        with self._lock:
+            self._vetoes.pop(name, None)
+
+    def vetoed_by(self, action: Action) -> Optional[str]:
+        """
+        Find the active reflex that drops an action.
+
+        Parameters
+        ----------
+        action : Action
+            The action about to be dispatched.
+
+        Returns
+        -------
+        Optional[str]
+            Name of the reflex, or None if the action may be dispatched.
+        """
+        with self._lock:
+            vetoes = list(self._vetoes.items())
+        for name, vetoes_action in vetoes:
+            if vetoes_action(action):
+                with self._lock:
+                    self._veto_counts[name] = self._veto_counts.get(name, 0) + 1
+                return name
+        return None
+
+    def veto_count(self, name: str) -> int:
+        """
+        Get the number of actions a reflex dropped.
+
+        Parameters
+        ----------
+        name : str
+            Name of the reflex.
+
+        Returns
+        -------
+        int
+            The number of vetoed actions.
+        """
+        with self._lock:
+            return self._veto_counts.get(name, 0)
+
+    def add_message(self, message: str) -> None:
+        """
+        Add a message for the next prompt.
+
+        Parameters
+        ----------
+        message : str
+            What the reflex did.
+        """
+        with self._lock:
+            self._messages.append(message)
+
+    def take_messages(self) -> List[str]:
+        """
+        Take the messages added since the last prompt.
+
+        Returns
+        -------
+        List[str]
+            The messages, oldest first.
+        """
+        with self._lock:
+            messages, self._messages = self._messages, []
+        return messages
@@ -1,8 +1,6 @@
-import json
 import logging
 import math
 import multiprocessing as mp
-import os
 import threading
 import time
 from dataclasses import dataclass
@@ -19,6 +17,7 @@ from zenoh_msgs import LaserScan, open_zenoh_session, sensor_msgs
 
 from .d435_provider import D435Provider
 from .rplidar_driver import RPDriver
+from .sensor_log_provider import SensorLogProvider
 from .singleton import singleton
 
 
@@ -228,13 +227,12 @@ class RPLidarProvider:
         if log_file:
             self.write_to_local_file = log_file
 
-        self.filename_current = None
-        self.max_file_size_bytes = 1024 * 1024
-
-        # Create timestamped log filename
+        # Frames are handed to the shared background log writer
+        self.sensor_log: Optional[SensorLogProvider] = None
         if self.write_to_local_file:
-            self.filename_current = self.update_filename()
-            logging.info(f"RPSCAN Logging to {self.filename_current}")
+            self.sensor_log = SensorLogProvider()
+            self.sensor_log.acquire(self)
+            logging.info("RPSCAN Logging to the lidar sensor log")
 
         # Initialize paths for path planning
         # Define 9 straight line paths separated by 15 degrees
@@ -287,38 +285,6 @@ class RPLidarProvider:
         # D435 Provider
         self.d435_provider = D435Provider()
 
-    def update_filename(self):
-        unix_ts = time.time()
-        logging.info(f"RPSCAN time: {unix_ts}")
-        unix_ts = str(unix_ts).replace(".", "_")
-        filename = f"dump/lidar_{unix_ts}Z.jsonl"
-        return filename
-
-    def write_str_to_file(self, json_line: str):
-        """
-        Writes a dictionary to a file in JSON lines format. If the file exceeds max_file_size_bytes,
-        creates a new file with a timestamp.
-
-        Parameters:
-        - data: Dictionary to write
-        """
-
-        if not isinstance(json_line, str):
-            raise ValueError("Provided json_line must be a json string.")
-
-        if (
-            self.filename_current is not None
-            and os.path.exists(self.filename_current)
-            and os.path.getsize(self.filename_current) > self.max_file_size_bytes
-        ):
-            self.filename_current = self.update_filename()
-            logging.info(f"New rpscan file name: {self.filename_current}")
-
-        if self.filename_current is not None:
-            with open(self.filename_current, "a", encoding="utf-8") as f:
-                f.write(json_line + "\n")
-                f.flush()
-
     def listen_scan(self, data: zenoh.Sample):
         """
         Zenoh scan handler.
@@ -485,23 +451,19 @@ class RPLidarProvider:
         raw_array = np.array(raw)
 
         # save_timestamp = time.time()
-        if self.write_to_local_file:
-            try:
-                json_line = json.dumps(
-                    {
-                        "odom_rockchip_ts": self.odom_rockchip_ts,
-                        "odom_subscriber_ts": self.odom_subscriber_ts,
-                        "odom_x": self.odom_x,
-                        "odom_y": self.odom_y,
-                        "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
-                        "odom_yaw_0_360": self.odom_yaw_0_360,
-                        "frame": raw_array.tolist(),
-                    }
-                )
-                self.write_str_to_file(json_line)
-                logging.debug(f"rplidar wrote to: {self.filename_current}")
-            except Exception as e:
-                logging.error(f"Error saving rplidar to file: {str(e)}")
+        if self.sensor_log is not None:
+            self.sensor_log.log(
+                "lidar",
+                {
+                    "odom_rockchip_ts": self.odom_rockchip_ts,
+                    "odom_subscriber_ts": self.odom_subscriber_ts,
+                    "odom_x": self.odom_x,
+                    "odom_y": self.odom_y,
+                    "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
+                    "odom_yaw_0_360": self.odom_yaw_0_360,
+                    "frame": raw_array,
+                },
+            )
 
         # sort data into strictly increasing angles to deal with sensor issues
         # the sensor sometimes reports part of the previous scan and part of the next scan
@@ -654,6 +616,9 @@ class RPLidarProvider:
             logging.info("Stopping RPLidar serial processor thread")
             self._serial_processor_thread.join(timeout=5)
 
+        if self.sensor_log is not None:
+            self.sensor_log.release(self)
+
     @property
     def valid_paths(self) -> Optional[list]:
         """
@@ -1,13 +1,12 @@
 import datetime as datetime
 import logging
-import re
-import threading
 import time
-from typing import Optional
+from typing import Dict, Optional
 
 import serial
 from pynmeagps import NMEAReader
 
+from .serial_reader import Fix, SerialLineReader, split_nmea
 from .singleton import singleton
 
 
@@ -53,8 +52,12 @@ class RtkProvider:
         self.qua = 0
         self.unix_ts = 0.0
 
+        self._fix: Optional[Fix] = None
+        self.sentences = 0
+        self.garbled = 0
+
         self.running = False
-        self._thread: Optional[threading.Thread] = None
+        self._reader: Optional[SerialLineReader] = None
         self.start()
 
     def utc_time_obj_to_unix(self, utc_time_obj):
@@ -76,33 +79,6 @@ class RtkProvider:
         # Convert to Unix timestamp
         return dt.timestamp()
 
-    def get_latest_gngga_message(self, nmea_data):
-
-        pattern = re.compile(
-            r"(\$GNGGA,(?P<time>\d{6}(?:\.\d+)?),[^*]*\*[0-9A-Fa-f]{2})", re.MULTILINE
-        )
-
-        gngga_entries = []
-
-        matches = pattern.finditer(nmea_data)
-
-        for match in matches:
-            # logging.info(f"matches: {match}")
-            full_msg = match.group(1)
-            time_str = match.group("time")
-            try:
-                time_val = float(time_str)
-                gngga_entries.append((time_val, full_msg))
-            except ValueError:
-                continue  # Skip if time field is malformed
-
-        # Sort by time and return the latest message
-        if gngga_entries:
-            most_recent = max(gngga_entries, key=lambda x: x[0])
-            # "most_recent" is a time and the message,
-            # the [1] just returns the message
-            return most_recent[1]
-
     def magRTKProcessor(self, msg):
 
         try:
@@ -129,6 +105,16 @@ class RtkProvider:
 
                         # the data look something like this: 23:12:25.300000
                         self.unix_ts = self.utc_time_obj_to_unix(msg.time)
+
+                        self._fix = Fix(
+                            lat=self.lat,
+                            lon=self.lon,
+                            alt=self.alt,
+                            sat=self.sat,
+                            qua=self.qua,
+                            unix_ts=self.unix_ts,
+                            received_ts=time.time(),
+                        )
                     logging.debug(
                         (
                             f"RTK:{self.lat},{self.lon},ALT:{self.alt},"
@@ -136,8 +122,10 @@ class RtkProvider:
                         )
                     )
                 except Exception as e:
+                    self.garbled += 1
                     logging.warning(f"Failed to parse GGA message: {msg} ({e})")
         except Exception as e:
+            self.garbled += 1
             logging.warning(f"Error processing serial RTK input: {msg} ({e})")
 
         self._rtk = {
@@ -151,44 +139,79 @@ class RtkProvider:
 
     def start(self):
         """
-        Starts the RTK Provider and processing thread
+        Starts the RTK Provider and its serial reader thread
         if not already running.
         """
-        if self._thread and self._thread.is_alive():
+        if self._reader and self._reader.running:
             return
 
         self.running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        if self.serial_connection:
+            self._reader = SerialLineReader(
+                self.serial_connection, self._process_line, name="rtk-serial"
+            )
+            self._reader.start()
 
-    def _run(self):
-        """
-        Main loop for the RTK provider.
+    def _process_line(self, line: str):
         """
-        while self.running:
+        Process one NMEA sentence, as soon as it arrives.
 
-            if self.serial_connection:
-                bytes_waiting = self.serial_connection.in_waiting
-                while bytes_waiting > 0:
-                    data = self.serial_connection.read(size=bytes_waiting)
-                    if data:
-                        data = data.decode("utf-8", errors="ignore")
-                        latest_GNGGA = self.get_latest_gngga_message(data)
-                        if latest_GNGGA:
-                            parsed_nema = NMEAReader.parse(latest_GNGGA)
-                            self.magRTKProcessor(parsed_nema)
-                    bytes_waiting = self.serial_connection.in_waiting
+        Only GNGGA sentences are parsed; sentences with a bad checksum are
+        counted as garbled.
+
+        Parameters
+        ----------
+        line : str
+            The sentence, without its terminator.
+        """
+        sentence = split_nmea(line)
+        if sentence is None:
+            self.garbled += 1
+            logging.debug(f"RTK garbled sentence: {line!r}")
+            return
 
-            time.sleep(0.1)
+        self.sentences += 1
+        if sentence.talker == "GN" and sentence.msg_id == "GGA":
+            self.magRTKProcessor(NMEAReader.parse(sentence.raw))
 
     def stop(self):
         """
         Stop the RTK provider.
         """
         self.running = False
-        if self._thread:
+        if self._reader:
             logging.info("Stopping RTK provider")
-            self._thread.join(timeout=5)
+            self._reader.stop()
+
+    @property
+    def fix(self) -> Optional[Fix]:
+        """
+        Get the latest RTK fix; its ``age`` tells how stale it is.
+
+        Returns
+        -------
+        Optional[Fix]
+            The latest fix, or None before the first one.
+        """
+        return self._fix
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the serial counters.
+
+        Returns
+        -------
+        Dict[str, int]
+            Bytes, lines and valid NMEA sentences read, and lines dropped
+            or garbled.
+        """
+        stats = {"bytes": 0, "lines": 0, "dropped": 0, "garbled": 0}
+        if self._reader:
+            stats.update(self._reader.stats)
+        stats["sentences"] = self.sentences
+        stats["garbled"] += self.garbled
+        return stats
 
     @property
     def data(self) -> Optional[dict]:
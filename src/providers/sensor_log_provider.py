@@ -0,0 +1,475 @@
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from queue import Empty, Full, Queue
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .singleton import singleton
+
+# File magic written at the start of every sensor log
+SENSOR_LOG_MAGIC = b"OM1SLOG1"
+
+# Frame header: total frame length, metadata length (both little-endian u32)
+_FRAME_HEADER = struct.Struct("<II")
+
+
+def encode_frame(record: Dict[str, Any]) -> bytes:
+    """
+    Encode a record as one length-prefixed binary frame.
+
+    Numpy arrays are stored as raw bytes after a compact JSON metadata
+    block; every other value must be JSON serializable.
+
+    Parameters
+    ----------
+    record : Dict[str, Any]
+        The record to encode.
+
+    Returns
+    -------
+    bytes
+        The encoded frame, including its length prefix.
+    """
+    fields: Dict[str, Any] = {}
+    arrays: Dict[str, list] = {}
+    blobs = []
+    offset = 0
+
+    for key, value in record.items():
+        if isinstance(value, np.ndarray):
+            data = np.ascontiguousarray(value)
+            arrays[key] = [data.dtype.str, list(data.shape), offset, data.nbytes]
+            blobs.append(data.tobytes())
+            offset += data.nbytes
+        else:
+            fields[key] = value
+
+    meta = json.dumps({"fields": fields, "arrays": arrays}, separators=(",", ":"))
+    meta_bytes = meta.encode("utf-8")
+    total = _FRAME_HEADER.size + len(meta_bytes) + offset
+    return b"".join([_FRAME_HEADER.pack(total, len(meta_bytes)), meta_bytes, *blobs])
+
+
+def decode_frame(frame: bytes) -> Dict[str, Any]:
+    """
+    Decode a frame produced by ``encode_frame``.
+
+    Parameters
+    ----------
+    frame : bytes
+        The frame, including its length prefix.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The record, with arrays restored as numpy arrays.
+    """
+    _, meta_len = _FRAME_HEADER.unpack_from(frame)
+    start = _FRAME_HEADER.size
+    meta = json.loads(frame[start : start + meta_len].decode("utf-8"))
+    payload = memoryview(frame)[start + meta_len :]
+
+    record = meta["fields"]
+    for key, (dtype, shape, offset, nbytes) in meta["arrays"].items():
+        record[key] = np.frombuffer(
+            payload[offset : offset + nbytes], dtype=np.dtype(dtype)
+        ).reshape(shape)
+    return record
+
+
+def read_sensor_log(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the records of a sensor log.
+
+    A truncated final frame, e.g. after a crash, is ignored.
+
+    Parameters
+    ----------
+    path : str
+        Path to a sensor log written by SensorLogProvider.
+
+    Yields
+    ------
+    Dict[str, Any]
+        Decoded records in the order they were written.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(SENSOR_LOG_MAGIC)) != SENSOR_LOG_MAGIC:
+            raise ValueError(f"{path} is not a sensor log")
+
+        while True:
+            header = f.read(_FRAME_HEADER.size)
+            if len(header) < _FRAME_HEADER.size:
+                return
+            total, _ = _FRAME_HEADER.unpack(header)
+            body = f.read(total - _FRAME_HEADER.size)
+            if len(body) < total - _FRAME_HEADER.size:
+                logging.warning(f"Truncated frame at the end of {path}")
+                return
+            yield decode_frame(header + body)
+
+
+def sensor_log_to_jsonl(path: str, output_path: Optional[str] = None) -> str:
+    """
+    Convert a sensor log to JSON lines, with arrays written as nested lists.
+
+    Parameters
+    ----------
+    path : str
+        Path to the sensor log.
+    output_path : str, optional
+        Destination file. Defaults to the log path with a .jsonl extension.
+
+    Returns
+    -------
+    str
+        The path of the written JSONL file.
+    """
+    if output_path is None:
+        output_path = os.path.splitext(path)[0] + ".jsonl"
+
+    with open(output_path, "w", encoding="utf-8") as out:
+        for record in read_sensor_log(path):
+            for key, value in record.items():
+                if isinstance(value, np.ndarray):
+                    record[key] = value.tolist()
+            out.write(json.dumps(record) + "\n")
+
+    return output_path
+
+
+@dataclass
+class _StreamFile:
+    """
+    An open log file for one stream.
+    """
+
+    path: str
+    handle: IO[bytes]
+    opened_at: float
+    size: int = 0
+    records: int = 0
+
+
+@dataclass
+class SensorLogStats:
+    """
+    Counters for the sensor log writer.
+
+    Parameters
+    ----------
+    queued : int
+        Records accepted by ``log``.
+    written : int
+        Records written to disk.
+    dropped : int
+        Records rejected because the queue was full.
+    errors : int
+        Records that could not be encoded or written.
+    rotations : int
+        Number of files closed because of size or age.
+    """
+
+    queued: int = 0
+    written: int = 0
+    dropped: int = 0
+    errors: int = 0
+    rotations: int = 0
+    files: Dict[str, str] = field(default_factory=dict)
+
+
+@singleton
+class SensorLogProvider:
+    """
+    Shared, buffered writer for high-rate sensor dumps.
+
+    Callers hand records to ``log`` which only enqueues them; a single
+    background thread encodes them into compact binary frames (numpy arrays
+    are stored raw) and writes one file per stream, rotating by size and age.
+    Use ``read_sensor_log`` or ``sensor_log_to_jsonl`` to read the files back.
+
+    Components that log call ``acquire`` when they start and ``release`` when
+    they stop; the writer is stopped once the last of them is released.
+    """
+
+    def __init__(
+        self,
+        directory: str = "dump",
+        max_file_size_bytes: int = 16 * 1024 * 1024,
+        max_file_age_seconds: float = 600.0,
+        queue_size: int = 1024,
+        flush_interval: float = 1.0,
+    ):
+        """
+        Initialize the SensorLogProvider.
+
+        Parameters
+        ----------
+        directory : str
+            Directory the log files are written to.
+        max_file_size_bytes : int
+            Rotate a stream's file once it grows beyond this size.
+        max_file_age_seconds : float
+            Rotate a stream's file once it has been open this long.
+        queue_size : int
+            Maximum number of records waiting to be written; further records
+            are dropped and counted rather than blocking the caller.
+        flush_interval : float
+            Maximum number of seconds buffered data stays unflushed.
+        """
+        self.directory = directory
+        self.max_file_size_bytes = max_file_size_bytes
+        self.max_file_age_seconds = max_file_age_seconds
+        self.flush_interval = flush_interval
+
+        self._queue: Queue[Optional[Tuple[str, Dict[str, Any]]]] = Queue(
+            maxsize=queue_size
+        )
+        # The writer thread owns the files; the lock guards the file table
+        # and the counters for readers on other threads
+        self._files: Dict[str, _StreamFile] = {}
+        self._stats = SensorLogStats()
+        self._state_lock = threading.Lock()
+
+        # Guards starting and stopping the writer against ``log``
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._owners: "weakref.WeakSet[object]" = weakref.WeakSet()
+        self._stopped = False
+        self.running = False
+
+    def start(self) -> None:
+        """
+        Start the background writer thread.
+        """
+        with self._lock:
+            self._start()
+
+    def _start(self) -> None:
+        """
+        Start the writer thread; the lock must be held.
+        """
+        self._stopped = False
+        if self._thread and self._thread.is_alive():
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def acquire(self, owner: object) -> None:
+        """
+        Register a component that logs, starting the writer.
+
+        Parameters
+        ----------
+        owner : object
+            The component; registering it again has no effect.
+        """
+        with self._lock:
+            self._owners.add(owner)
+            self._start()
+
+    def release(self, owner: object) -> None:
+        """
+        Unregister a component, stopping the writer if it was the last one.
+
+        Parameters
+        ----------
+        owner : object
+            The component passed to ``acquire``; releasing it again has no
+            effect.
+        """
+        with self._lock:
+            if owner not in self._owners:
+                return
+            self._owners.discard(owner)
+            if not self._owners:
+                self._stop()
+
+    def log(self, stream: str, record: Dict[str, Any]) -> bool:
+        """
+        Queue a record for writing.
+
+        Parameters
+        ----------
+        stream : str
+            Name of the stream, e.g. "lidar"; used as the file name prefix.
+        record : Dict[str, Any]
+            The record. The caller must not mutate it or its arrays afterwards.
+
+        Returns
+        -------
+        bool
+            True if the record was queued, False if it was dropped or the
+            writer was stopped.
+        """
+        with self._lock:
+            if self._stopped:
+                return False
+            if not self.running:
+                self._start()
+
+            try:
+                self._queue.put_nowait((stream, record))
+            except Full:
+                with self._state_lock:
+                    self._stats.dropped += 1
+                return False
+
+        with self._state_lock:
+            self._stats.queued += 1
+        return True
+
+    @property
+    def stats(self) -> SensorLogStats:
+        """
+        Get a snapshot of the writer counters.
+
+        Returns
+        -------
+        SensorLogStats
+            Queue, write and rotation counters plus the current file per
+            stream.
+        """
+        with self._state_lock:
+            return SensorLogStats(
+                queued=self._stats.queued,
+                written=self._stats.written,
+                dropped=self._stats.dropped,
+                errors=self._stats.errors,
+                rotations=self._stats.rotations,
+                files={name: f.path for name, f in self._files.items()},
+            )
+
+    def current_file(self, stream: str) -> Optional[str]:
+        """
+        Get the path of the file a stream is currently written to.
+
+        Parameters
+        ----------
+        stream : str
+            Name of the stream.
+
+        Returns
+        -------
+        Optional[str]
+            The file path, or None if nothing was written to the stream yet.
+        """
+        with self._state_lock:
+            stream_file = self._files.get(stream)
+        return stream_file.path if stream_file else None
+
+    def _run(self) -> None:
+        """
+        Writer loop: drain the queue, write frames and flush periodically.
+        """
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except Empty:
+                item = ()
+
+            if item is None:
+                break
+
+            if item:
+                stream, record = item
+                self._write(stream, record)
+
+            if time.monotonic() - last_flush >= self.flush_interval:
+                with self._state_lock:
+                    stream_files = list(self._files.values())
+                for stream_file in stream_files:
+                    stream_file.handle.flush()
+                last_flush = time.monotonic()
+
+        self._close_all()
+
+    def _write(self, stream: str, record: Dict[str, Any]) -> None:
+        try:
+            frame = encode_frame(record)
+            stream_file = self._stream_file(stream)
+            stream_file.handle.write(frame)
+            stream_file.size += len(frame)
+            stream_file.records += 1
+            with self._state_lock:
+                self._stats.written += 1
+        except Exception as e:
+            logging.error(f"Error writing {stream} sensor log: {e}")
+            with self._state_lock:
+                self._stats.errors += 1
+
+    def _stream_file(self, stream: str) -> _StreamFile:
+        """
+        Get the open file for a stream, rotating it if needed.
+        """
+        with self._state_lock:
+            stream_file = self._files.get(stream)
+        if stream_file is not None and (
+            stream_file.size > self.max_file_size_bytes
+            or time.time() - stream_file.opened_at > self.max_file_age_seconds
+        ):
+            stream_file.handle.close()
+            logging.info(
+                f"Rotating {stream} sensor log after {stream_file.records} records"
+            )
+            with self._state_lock:
+                self._stats.rotations += 1
+            stream_file = None
+
+        if stream_file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            unix_ts = str(round(time.time(), 6)).replace(".", "_")
+            path = os.path.join(self.directory, f"{stream}_{unix_ts}Z.slog")
+            handle = open(path, "wb", buffering=1024 * 1024)
+            handle.write(SENSOR_LOG_MAGIC)
+            stream_file = _StreamFile(
+                path=path,
+                handle=handle,
+                opened_at=time.time(),
+                size=len(SENSOR_LOG_MAGIC),
+            )
+            with self._state_lock:
+                self._files[stream] = stream_file
+            logging.info(f"{stream} sensor log: {path}")
+
+        return stream_file
+
+    def _close_all(self) -> None:
+        with self._state_lock:
+            stream_files, self._files = list(self._files.values()), {}
+        for stream_file in stream_files:
+            try:
+                stream_file.handle.close()
+            except Exception as e:
+                logging.error(f"Error closing {stream_file.path}: {e}")
+
+    def stop(self) -> None:
+        """
+        Write all queued records, close the files and stop the writer thread.
+
+        Records logged afterwards are dropped until the writer is started
+        again.
+        """
+        with self._lock:
+            self._stop()
+
+    def _stop(self) -> None:
+        """
+        Stop the writer thread; the lock must be held.
+        """
+        self._stopped = True
+        self.running = False
+        if not self._thread:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=10)
+        self._thread = None
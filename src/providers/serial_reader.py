@@ -0,0 +1,263 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from functools import reduce
+from typing import Callable, Dict, List, Optional
+
+import serial
+
+
+@dataclass
+class Fix:
+    """
+    Latest position fix of a GNSS source.
+
+    Parameters
+    ----------
+    lat : float
+        Latitude in degrees.
+    lon : float
+        Longitude in degrees.
+    alt : float
+        Altitude in meters.
+    sat : int
+        Number of satellites used.
+    qua : int
+        Fix quality.
+    unix_ts : float
+        Time of the fix according to the receiver.
+    received_ts : float
+        Local time the fix was received.
+    """
+
+    lat: float
+    lon: float
+    alt: float
+    sat: int
+    qua: int
+    unix_ts: float
+    received_ts: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the fix was received."""
+        return time.time() - self.received_ts
+
+
+@dataclass
+class NMEASentence:
+    """
+    A checksum-verified NMEA sentence.
+
+    Parameters
+    ----------
+    talker : str
+        Talker ID (e.g., "GN").
+    msg_id : str
+        Message ID (e.g., "GGA").
+    fields : List[str]
+        The comma separated data fields.
+    raw : str
+        The full sentence.
+    """
+
+    talker: str
+    msg_id: str
+    fields: List[str]
+    raw: str
+
+
+def split_nmea(line: str) -> Optional[NMEASentence]:
+    """
+    Tokenize one NMEA sentence and verify its checksum.
+
+    Parameters
+    ----------
+    line : str
+        A line such as ``$GNGGA,...*4F``.
+
+    Returns
+    -------
+    Optional[NMEASentence]
+        The sentence, or None if it is not a well formed NMEA sentence.
+    """
+    if not line.startswith("$") or len(line) < 9 or line[-3] != "*":
+        return None
+    body = line[1:-3]
+    try:
+        expected = int(line[-2:], 16)
+    except ValueError:
+        return None
+    if reduce(lambda acc, c: acc ^ ord(c), body, 0) != expected:
+        return None
+
+    address, _, data = body.partition(",")
+    if len(address) < 5:
+        return None
+    return NMEASentence(
+        talker=address[:2], msg_id=address[2:], fields=data.split(","), raw=line
+    )
+
+
+class LineFramer:
+    """
+    Incremental splitter of a byte stream into lines.
+
+    Bytes are appended to a bounded buffer and complete lines are returned as
+    soon as their terminator arrives; partial lines wait for the next chunk.
+    A line longer than ``max_line`` bytes is dropped, which resynchronizes
+    the framer on the next terminator.
+
+    Parameters
+    ----------
+    max_line : int
+        Maximum line length in bytes.
+    """
+
+    def __init__(self, max_line: int = 1024):
+        self.max_line = max_line
+        self._buffer = bytearray()
+        self._discarding = False
+        self.dropped = 0
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Add bytes and return the lines they complete.
+
+        Parameters
+        ----------
+        data : bytes
+            Bytes read from the stream.
+
+        Returns
+        -------
+        List[bytes]
+            Complete, non-empty lines without their terminators.
+        """
+        self._buffer += data
+        lines: List[bytes] = []
+        start = 0
+        while True:
+            end = self._buffer.find(b"\n", start)
+            if end < 0:
+                break
+            line = bytes(self._buffer[start:end]).strip()
+            start = end + 1
+            if self._discarding:
+                self._discarding = False
+                continue
+            if len(line) > self.max_line:
+                self.dropped += 1
+            elif line:
+                lines.append(line)
+        del self._buffer[:start]
+
+        if len(self._buffer) > self.max_line:
+            # Overlong line: drop what we have and skip to the next terminator
+            if not self._discarding:
+                self.dropped += 1
+            self._discarding = True
+            self._buffer.clear()
+        return lines
+
+
+class SerialLineReader:
+    """
+    Background thread that reads lines from a serial port as they arrive.
+
+    The thread blocks in ``read`` until data is available (up to the port
+    timeout) and reads everything that is waiting in one call, so it never
+    sleeps while data is waiting and falls behind only if ``on_line`` is
+    slower than the port. Lines are decoded as UTF-8; undecodable lines and
+    exceptions from ``on_line`` are counted as garbled.
+
+    Parameters
+    ----------
+    serial_connection : serial.Serial
+        An open serial port with a read timeout.
+    on_line : Callable[[str], None]
+        Called from the reader thread with each line.
+    name : str
+        Name of the reader thread.
+    max_line : int
+        Maximum line length in bytes; longer lines are dropped.
+    """
+
+    def __init__(
+        self,
+        serial_connection: serial.Serial,
+        on_line: Callable[[str], None],
+        name: str = "serial-reader",
+        max_line: int = 1024,
+    ):
+        self.serial_connection = serial_connection
+        self.on_line = on_line
+        self.name = name
+
+        self._framer = LineFramer(max_line)
+        self.running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.bytes_read = 0
+        self.lines = 0
+        self.garbled = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the reader counters.
+
+        Returns
+        -------
+        Dict[str, int]
+            Bytes read, lines delivered, and lines dropped or garbled.
+        """
+        return {
+            "bytes": self.bytes_read,
+            "lines": self.lines,
+            "dropped": self._framer.dropped,
+            "garbled": self.garbled,
+        }
+
+    def start(self) -> None:
+        """Start the reader thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the reader thread; it exits within one port timeout."""
+        self.running = False
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while self.running:
+            try:
+                chunk = self.serial_connection.read(
+                    max(1, self.serial_connection.in_waiting)
+                )
+            except (serial.SerialException, OSError) as e:
+                logging.error(f"{self.name}: serial read failed: {e}")
+                time.sleep(1.0)
+                continue
+
+            if not chunk:
+                continue
+            self.bytes_read += len(chunk)
+
+            for raw in self._framer.feed(chunk):
+                try:
+                    line = raw.decode("utf-8")
+                except UnicodeDecodeError:
+                    self.garbled += 1
+                    continue
+                self.lines += 1
+                try:
+                    self.on_line(line)
+                except Exception as e:
+                    self.garbled += 1
+                    logging.warning(f"{self.name}: cannot process {line!r}: {e}")
@@ -1,5 +1,39 @@
 import threading
-from typing import Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+_scope: ContextVar[Optional[Dict[type, Any]]] = ContextVar(
+    "provider_scope", default=None
+)
+
+
+@contextmanager
+def provider_scope(
+    instances: Optional[Dict[type, Any]] = None,
+) -> Iterator[Dict[type, Any]]:
+    """
+    Give the current context its own set of singleton instances.
+
+    Inside the scope, every ``@singleton`` class resolves to an instance
+    owned by the scope instead of the process-wide one, so several runtimes
+    can share a process without sharing providers. The scope follows the
+    context: asyncio tasks created inside it, and functions run with
+    ``contextvars.copy_context().run``, see the same instances.
+
+    Args:
+        instances: The instances of the scope; a new, empty scope if None.
+
+    Yields:
+        dict: The instances of the scope, keyed by class.
+    """
+    if instances is None:
+        instances = {}
+    token = _scope.set(instances)
+    try:
+        yield instances
+    finally:
+        _scope.reset(token)
 
 
 def singleton(cls):
@@ -8,7 +42,7 @@ def singleton(cls):
 
     This decorator implements a singleton pattern with thread safety using a lock.
     Multiple threads attempting to create an instance will be synchronized to prevent
-    race conditions.
+    race conditions. Within a ``provider_scope`` there is one instance per scope.
 
     Args:
         cls: The class to be converted into a singleton.
@@ -34,9 +68,34 @@ def singleton(cls):
         Returns:
             Any: The singleton instance of the decorated class.
         """
+        instances = _scope.get()
+        if instances is None:
+            instances = singleton.instances
         with lock:
-            if cls not in singleton.instances:
-                singleton.instances[cls] = cls(*args, **kwargs)
-            return singleton.instances[cls]
+            if cls not in instances:
+                instances[cls] = cls(*args, **kwargs)
+            return instances[cls]
 
     return get_instance
+
+
+def find_instance(name: str) -> Optional[Any]:
+    """
+    Find the instance of a ``@singleton`` class by class name.
+
+    Looks in the current ``provider_scope``, or the process-wide instances
+    outside one, and never creates an instance.
+
+    Args:
+        name: The class name, such as ``"RPLidarProvider"``.
+
+    Returns:
+        Any: The instance, or None if the class has no instance yet.
+    """
+    instances = _scope.get()
+    if instances is None:
+        instances = getattr(singleton, "instances", {})
+    for cls, instance in list(instances.items()):
+        if cls.__name__ == name:
+            return instance
+    return None
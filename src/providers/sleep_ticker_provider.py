@@ -1,9 +1,11 @@
 import asyncio
 import threading
-from typing import Optional
+from typing import Awaitable, Callable, Optional, Tuple, TypeVar
 
 from .singleton import singleton
 
+R = TypeVar("R")
+
 
 @singleton
 class SleepTickerProvider:
@@ -13,6 +15,11 @@ class SleepTickerProvider:
     This class provides a thread-safe way to manage sleep operations that can be
     skipped/cancelled. It uses a lock mechanism to ensure thread safety when
     modifying the skip state.
+
+    Inputs wake the cortex loop with ``wake``, which may be called from any
+    thread: the sleep task is cancelled on the event loop that runs it. A wake
+    carries the priority of the input, so the runtime can supersede an LLM
+    request started for a lower-priority tick (see ``until_woken``).
     """
 
     def __init__(self):
@@ -26,6 +33,11 @@ class SleepTickerProvider:
         self._skip_sleep: bool = False
         self._current_sleep_task: Optional[asyncio.Task] = None
 
+        # Highest priority woken with since the last tick started
+        self._wake_priority: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake_event: Optional[asyncio.Event] = None
+
     @property
     def skip_sleep(self) -> bool:
         """
@@ -50,10 +62,133 @@ class SleepTickerProvider:
             The new skip sleep state. If True and there's an active sleep task,
             the task will be cancelled.
         """
+        if value:
+            self.wake()
+            return
+        with self._lock:
+            self._skip_sleep = False
+            self._wake_priority = None
+
+    def wake(self, priority: int = 0) -> None:
+        """
+        Wake the cortex loop; safe to call from any thread.
+
+        Parameters
+        ----------
+        priority : int
+            Priority of the input that has new data. An LLM request started
+            for a tick of lower priority is superseded.
+        """
+        with self._lock:
+            self._skip_sleep = True
+            if self._wake_priority is None or priority > self._wake_priority:
+                self._wake_priority = priority
+            loop = self._loop
+
+        if loop is not None:
+            self._call_in_loop(loop, self._on_wake)
+
+    def take_wake(self) -> int:
+        """
+        Consume the pending wake when a tick starts.
+
+        Returns
+        -------
+        int
+            Priority of the pending wake, or 0 if the tick was not woken.
+        """
         with self._lock:
-            self._skip_sleep = value
-            if value and self._current_sleep_task:
-                self._current_sleep_task.cancel()
+            priority = self._wake_priority or 0
+            self._skip_sleep = False
+            self._wake_priority = None
+        return priority
+
+    async def until_woken(
+        self, awaitable: Awaitable[R], priority: int
+    ) -> Tuple[Optional[R], bool]:
+        """
+        Await a result unless a wake of higher priority arrives first.
+
+        Parameters
+        ----------
+        awaitable : Awaitable[R]
+            The work to run, typically an LLM request.
+        priority : int
+            Priority of the tick the work belongs to.
+
+        Returns
+        -------
+        Tuple[Optional[R], bool]
+            The result and False, or None and True if the work was superseded
+            and cancelled.
+        """
+        work = asyncio.ensure_future(awaitable)
+        woken = asyncio.create_task(self._wait_for_wake(priority))
+        try:
+            await asyncio.wait({work, woken}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            work.cancel()
+            raise
+        finally:
+            woken.cancel()
+
+        if work.done():
+            return work.result(), False
+
+        work.cancel()
+        return None, True
+
+    async def _wait_for_wake(self, priority: int) -> None:
+        """
+        Wait for a wake with a priority higher than ``priority``.
+        """
+        event = self._bind(asyncio.get_running_loop())
+        while True:
+            with self._lock:
+                if self._wake_priority is not None and self._wake_priority > priority:
+                    return
+                event.clear()
+            await event.wait()
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> asyncio.Event:
+        """
+        Bind the provider to the event loop of the cortex loop.
+        """
+        with self._lock:
+            if self._loop is not loop or self._wake_event is None:
+                self._loop = loop
+                self._wake_event = asyncio.Event()
+            return self._wake_event
+
+    def _on_wake(self) -> None:
+        """
+        Interrupt the sleep and the waiters; runs on the bound event loop.
+        """
+        if self._current_sleep_task:
+            self._current_sleep_task.cancel()
+        if self._wake_event is not None:
+            self._wake_event.set()
+
+    @staticmethod
+    def _call_in_loop(
+        loop: asyncio.AbstractEventLoop, callback: Callable[[], None]
+    ) -> None:
+        """
+        Run a callback on the loop, directly if already on its thread.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            callback()
+            return
+        try:
+            loop.call_soon_threadsafe(callback)
+        except RuntimeError:
+            # The loop is closed; the next tick sees the wake
+            pass
 
     async def sleep(self, duration: float) -> None:
         """
@@ -74,12 +209,18 @@ class SleepTickerProvider:
         Raises
         ------
         asyncio.CancelledError
-            If the sleep operation is cancelled, though this is caught internally.
+            If the caller is cancelled; a wake ends the sleep without raising.
         """
+        self._bind(asyncio.get_running_loop())
+        sleep_task = asyncio.create_task(asyncio.sleep(duration))
+        self._current_sleep_task = sleep_task
         try:
-            self._current_sleep_task = asyncio.create_task(asyncio.sleep(duration))
-            await self._current_sleep_task
-        except asyncio.CancelledError:
-            pass
+            # A wake from another thread may have landed before the loop was bound
+            if self.skip_sleep:
+                sleep_task.cancel()
+            # A wake cancels the sleep task, which ``wait`` does not raise;
+            # cancelling the caller still does
+            await asyncio.wait([sleep_task])
         finally:
+            sleep_task.cancel()
             self._current_sleep_task = None
@@ -5,8 +5,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
-import requests
-
+from .http_client_provider import HTTPClientProvider
 from .singleton import singleton
 
 
@@ -47,6 +46,7 @@ class TeleopsConversationProvider:
     ):
         self.api_key = api_key
         self.base_url = base_url
+        self.http = HTTPClientProvider()
         self.executor = ThreadPoolExecutor(max_workers=1)
 
     def store_user_message(self, content: str) -> None:
@@ -75,7 +75,7 @@ class TeleopsConversationProvider:
             return
 
         try:
-            request = requests.post(
+            request = self.http.post_sync(
                 self.base_url,
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 json=message.to_dict(),
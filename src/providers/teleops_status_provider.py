@@ -5,8 +5,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
-import requests
-
+from .http_client_provider import HTTPClientProvider
 from .singleton import singleton
 
 
@@ -226,6 +225,7 @@ class TeleopsStatusProvider:
         """
         self.api_key = api_key
         self.base_url = base_url
+        self.http = HTTPClientProvider()
         self.executor = ThreadPoolExecutor(max_workers=1)
 
     def get_status(self) -> dict:
@@ -237,7 +237,7 @@ class TeleopsStatusProvider:
             return {}
 
         api_key_id = self.api_key[9:25] if len(self.api_key) > 25 else self.api_key
-        request = requests.get(
+        request = self.http.get_sync(
             f"{self.base_url}/{api_key_id}",
             headers={"Authorization": f"Bearer {self.api_key}"},
         )
@@ -264,7 +264,7 @@ class TeleopsStatusProvider:
             return
 
         try:
-            request = requests.post(
+            request = self.http.post_sync(
                 self.base_url,
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 json=status.to_dict(),
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class TTSAudioCache:
+    """
+    On-disk LRU cache of synthesized speech.
+
+    Each entry is one file named after the hash of its key. The index of
+    entries and their sizes is kept in memory in least recently used order
+    and rebuilt from the file modification times on start, so the cache
+    survives restarts. When the total size exceeds ``max_bytes``, the least
+    recently used entries are deleted.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory the audio files are stored in.
+    max_bytes : int
+        Maximum total size of the cached audio in bytes.
+    """
+
+    SUFFIX = ".audio"
+
+    def __init__(self, cache_dir: str, max_bytes: int = 64 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load()
+
+    @staticmethod
+    def key(voice_id: str, model_id: str, output_format: str, text: str) -> str:
+        """
+        Build the cache key of a synthesis request.
+
+        Parameters
+        ----------
+        voice_id : str
+            The voice.
+        model_id : str
+            The TTS model.
+        output_format : str
+            The audio format.
+        text : str
+            The text that is spoken.
+
+        Returns
+        -------
+        str
+            The key.
+        """
+        raw = json.dumps([voice_id, model_id, output_format, text])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.SUFFIX)
+
+    def _load(self) -> None:
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self.SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, name[: -len(self.SUFFIX)], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+        self._evict()
+
+        if self._index:
+            logging.info(
+                f"TTSAudioCache: {len(self._index)} phrases ({self._size} bytes) in {self.cache_dir}"
+            )
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._size -= size
+            self._evictions += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get cached audio and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        str, optional
+            The audio, or None on a miss.
+        """
+        with self._lock:
+            if key not in self._index:
+                self._misses += 1
+                return None
+            self._index.move_to_end(key)
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="ascii") as f:
+                audio = f.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._size -= self._index.pop(key, 0)
+                self._misses += 1
+            return None
+
+        with self._lock:
+            self._hits += 1
+        return audio
+
+    def put(self, key: str, audio: str) -> None:
+        """
+        Store audio in the cache.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        audio : str
+            The base64 encoded audio.
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="ascii") as f:
+                f.write(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"TTSAudioCache: cannot store audio: {e}")
+            return
+
+        with self._lock:
+            self._size -= self._index.pop(key, 0)
+            self._index[key] = len(audio)
+            self._size += len(audio)
+            self._evict()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the cache metrics.
+
+        Returns
+        -------
+        Dict[str, float]
+            Hits, misses, hit rate, evictions, entries and size in bytes.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "entries": len(self._index),
+                "bytes": self._size,
+            }
@@ -1,7 +1,7 @@
 import json
 import logging
 
-import requests
+from .http_client_provider import HTTPClientError, HTTPClientProvider
 
 
 class UbTtsProvider:
@@ -12,22 +12,26 @@ class UbTtsProvider:
     def __init__(self, url: str):
         self.tts_url = url
         self.headers = {"Content-Type": "application/json"}
+        self.http = HTTPClientProvider()
         logging.info(f"Ubtech TTS Provider initialized for URL: {self.tts_url}")
 
     def speak(self, tts: str, interrupt: bool = True, timestamp: int = 0) -> bool:
         """Sends a request to the TTS service. Returns True on success."""
         payload = {"tts": tts, "interrupt": interrupt, "timestamp": timestamp}
         try:
-            response = requests.put(
-                url=self.tts_url,
+            # A retried utterance would be spoken late, so never retry
+            response = self.http.put_sync(
+                self.tts_url,
                 data=json.dumps(payload),
                 headers=self.headers,
                 timeout=5,
+                retries=0,
             )
-            response.raise_for_status()
+            if not response.ok:
+                raise HTTPClientError(f"{response.status_code} {response.text}")
             res = response.json()
             return res.get("code") == 0
-        except requests.exceptions.RequestException as e:
+        except (HTTPClientError, ValueError) as e:
             logging.error(f"Failed to send TTS command: {e}")
             return False
 
@@ -38,12 +42,12 @@ class UbTtsProvider:
         """
         try:
             params = {"timestamp": timestamp}
-            response = requests.get(
-                url=self.tts_url, headers=self.headers, params=params, timeout=2
+            response = self.http.get_sync(
+                self.tts_url, headers=self.headers, params=params, timeout=2, retries=0
             )
             res = response.json()
             if res.get("code") == 0:
                 return res.get("status", "error")
             return "error"
-        except requests.exceptions.RequestException:
+        except (HTTPClientError, ValueError):
             return "error"
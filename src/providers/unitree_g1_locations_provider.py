@@ -3,8 +3,7 @@ import logging
 import threading
 from typing import Dict, List, Optional, Union
 
-import requests
-
+from .http_client_provider import HTTPClientProvider
 from .io_provider import IOProvider
 from .singleton import singleton
 
@@ -48,6 +47,7 @@ class UnitreeG1LocationsProvider:
         """
         self.base_url = base_url
         self.timeout = timeout
+        self.http = HTTPClientProvider()
         self.refresh_interval = refresh_interval
         self._locations: Dict[str, Dict] = {}
         self._thread: Optional[threading.Thread] = None
@@ -93,7 +93,7 @@ class UnitreeG1LocationsProvider:
         if not self.base_url:
             return
         try:
-            resp = requests.get(self.base_url, timeout=self.timeout)
+            resp = self.http.get_sync(self.base_url, timeout=self.timeout)
             if resp.status_code < 200 or resp.status_code >= 300:
                 logging.error(
                     f"Location list API returned {resp.status_code}: {resp.text}"
@@ -3,8 +3,7 @@ import logging
 import threading
 from typing import Dict, List, Optional, Union
 
-import requests
-
+from .http_client_provider import HTTPClientProvider
 from .io_provider import IOProvider
 from .singleton import singleton
 
@@ -35,6 +34,7 @@ class UnitreeGo2LocationsProvider:
         """
         self.base_url = base_url
         self.timeout = timeout
+        self.http = HTTPClientProvider()
         self.refresh_interval = refresh_interval
         self._locations: Dict[str, Dict] = {}
         self._thread: Optional[threading.Thread] = None
@@ -84,7 +84,7 @@ class UnitreeGo2LocationsProvider:
             return
 
         try:
-            resp = requests.get(self.base_url, timeout=self.timeout)
+            resp = self.http.get_sync(self.base_url, timeout=self.timeout)
 
             if resp.status_code < 200 or resp.status_code >= 300:
                 logging.error(
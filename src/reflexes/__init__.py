@@ -0,0 +1,38 @@
+import typing as T
+
+from llm.output_model import Action
+from reflexes.base import Reflex
+
+
+def load_reflex(raw: T.Dict[str, T.Any]) -> Reflex:
+    """
+    Build a reflex from its configuration.
+
+    Parameters
+    ----------
+    raw : Dict[str, Any]
+        The reflex entry of the configuration.
+
+    Returns
+    -------
+    Reflex
+        The reflex
+
+    Raises
+    ------
+    ValueError
+        If a required key is missing.
+    """
+    for key in ("name", "provider", "conditions"):
+        if key not in raw:
+            raise ValueError(f"Reflex is missing the required key '{key}': {raw}")
+
+    return Reflex(
+        name=raw["name"],
+        provider=raw["provider"],
+        conditions=raw["conditions"],
+        actions=[Action(**action) for action in raw.get("actions", [])],
+        veto=raw.get("veto", []),
+        message=raw.get("message"),
+        cooldown=raw.get("cooldown", 1.0),
+    )
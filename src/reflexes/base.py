@@ -0,0 +1,174 @@
+import typing as T
+from dataclasses import dataclass, field
+
+from llm.output_model import Action
+
+_MISSING = object()
+
+
+def evaluate_condition(actual: T.Any, expected: T.Any) -> bool:
+    """
+    Evaluate one declarative condition against a value.
+
+    The vocabulary is shared with the context conditions of mode transitions:
+    a dict with ``min``/``max`` for a numeric range, ``contains`` for a
+    case-insensitive substring, ``one_of`` for membership, ``not`` for
+    inequality or ``empty`` for an empty (true) or non-empty (false)
+    collection; a list for membership; anything else for equality.
+
+    Parameters
+    ----------
+    actual : Any
+        The observed value.
+    expected : Any
+        The condition.
+
+    Returns
+    -------
+    bool
+        True if the condition is satisfied, False otherwise
+    """
+    if actual is _MISSING:
+        return False
+
+    if isinstance(expected, dict):
+        if "min" in expected or "max" in expected:
+            if not isinstance(actual, (int, float)):
+                return False
+            if "min" in expected and actual < expected["min"]:
+                return False
+            if "max" in expected and actual > expected["max"]:
+                return False
+            return True
+
+        elif "contains" in expected:
+            if not isinstance(actual, str):
+                return False
+            return expected["contains"].lower() in actual.lower()
+
+        elif "one_of" in expected:
+            return actual in expected["one_of"]
+
+        elif "not" in expected:
+            return actual != expected["not"]
+
+        elif "empty" in expected:
+            if not isinstance(actual, (str, list, tuple, dict, set)):
+                return False
+            return (len(actual) == 0) == bool(expected["empty"])
+
+    elif isinstance(expected, list):
+        return actual in expected
+
+    else:
+        return actual == expected
+
+    return False
+
+
+def read_path(target: T.Any, path: str) -> T.Any:
+    """
+    Read a dotted attribute path, such as ``movement_options.advance``.
+
+    Parameters
+    ----------
+    target : Any
+        The object to read from; dict entries are read by key.
+    path : str
+        The dotted path.
+
+    Returns
+    -------
+    Any
+        The value, or a sentinel that satisfies no condition if a part of
+        the path is missing.
+    """
+    for part in path.split("."):
+        if isinstance(target, dict):
+            target = target.get(part, _MISSING)
+        else:
+            target = getattr(target, part, _MISSING)
+        if target is _MISSING:
+            break
+    return target
+
+
+@dataclass
+class Reflex:
+    """
+    A declarative rule that reacts to provider state without the LLM.
+
+    While all ``conditions`` hold on the provider, the reflex is active: when
+    it becomes active it dispatches ``actions`` immediately, and while it is
+    active the actions matching ``veto`` are dropped. Its ``message`` is
+    added to the next prompt, so the LLM knows what happened.
+
+    Parameters
+    ----------
+    name : str
+        Name of the reflex, used in logs and metrics.
+    provider : str
+        Class name of the provider whose state is read, such as
+        ``RPLidarProvider``.
+    conditions : Dict[str, Any]
+        Dotted attribute paths on the provider mapped to the conditions they
+        must satisfy (see ``evaluate_condition``).
+    actions : List[Action]
+        Actions dispatched when the reflex fires.
+    veto : List[Dict[str, Any]]
+        Conditions on the ``type`` and ``value`` of an action; an action
+        matching any of them is dropped while the reflex is active.
+    message : str, optional
+        Text added to the next prompt when the reflex fires.
+    cooldown : float
+        Minimum seconds between two firings.
+    """
+
+    name: str
+    provider: str
+    conditions: T.Dict[str, T.Any]
+    actions: T.List[Action] = field(default_factory=list)
+    veto: T.List[T.Dict[str, T.Any]] = field(default_factory=list)
+    message: T.Optional[str] = None
+    cooldown: float = 1.0
+
+    def matches(self, provider: T.Any) -> bool:
+        """
+        Whether the provider state satisfies all conditions.
+
+        Parameters
+        ----------
+        provider : Any
+            The provider instance.
+
+        Returns
+        -------
+        bool
+            True if every condition holds.
+        """
+        return all(
+            evaluate_condition(read_path(provider, path), expected)
+            for path, expected in self.conditions.items()
+        )
+
+    def vetoes(self, action: Action) -> bool:
+        """
+        Whether the reflex drops an action while it is active.
+
+        Parameters
+        ----------
+        action : Action
+            The action.
+
+        Returns
+        -------
+        bool
+            True if the action matches a veto.
+        """
+        return any(
+            all(
+                evaluate_condition(read_path(action, key), expected)
+                for key, expected in veto.items()
+            )
+            for veto in self.veto
+        )
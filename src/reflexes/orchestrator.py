@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import time
+import typing as T
+
+from actions.orchestrator import ActionOrchestrator
+from providers.reflex_provider import ReflexProvider
+from providers.singleton import find_instance
+from reflexes.base import Reflex
+from runtime.single_mode.config import RuntimeConfig
+
+
+class ReflexOrchestrator:
+    """
+    Evaluates the reflexes between the inputs and the ActionOrchestrator.
+
+    The reflexes are evaluated on the event loop at ``hertz``, independently
+    of the cortex tick, so a reflex reacts to provider state in milliseconds
+    instead of after the next LLM round-trip.
+    """
+
+    _config: RuntimeConfig
+    _action_orchestrator: ActionOrchestrator
+    _reflex_provider: ReflexProvider
+
+    def __init__(
+        self,
+        config: RuntimeConfig,
+        action_orchestrator: ActionOrchestrator,
+        hertz: float = 50.0,
+    ):
+        """
+        Initialize the ReflexOrchestrator.
+
+        Parameters
+        ----------
+        config : RuntimeConfig
+            Configuration object for the runtime.
+        action_orchestrator : ActionOrchestrator
+            Dispatches the actions of the reflexes.
+        hertz : float
+            Rate at which the reflexes are evaluated.
+        """
+        self._config = config
+        self._action_orchestrator = action_orchestrator
+        self._reflex_provider = ReflexProvider()
+        self._period = 1.0 / hertz
+
+        self._active: T.Set[str] = set()
+        self._last_fired: T.Dict[str, float] = {}
+        self._firings: T.Dict[str, int] = {}
+        self._reaction_ms: T.Dict[str, float] = {}
+
+    def start(self) -> T.Union[asyncio.Task, asyncio.Future]:
+        """
+        Start evaluating the reflexes.
+
+        Returns
+        -------
+        Union[asyncio.Task, asyncio.Future]
+            The evaluation task, or a pending future if there are no reflexes.
+        """
+        if not self._config.reflexes:
+            return asyncio.Future()
+        return asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """
+        Evaluate the reflexes until cancelled.
+        """
+        try:
+            while True:
+                await self.evaluate()
+                await asyncio.sleep(self._period)
+        finally:
+            self.stop()
+
+    async def evaluate(self) -> None:
+        """
+        Evaluate every reflex once, firing those that became active.
+        """
+        for reflex in self._config.reflexes:
+            try:
+                await self._evaluate_reflex(reflex)
+            except Exception as e:
+                logging.error(f"Error in reflex {reflex.name}: {e}")
+
+    async def _evaluate_reflex(self, reflex: Reflex) -> None:
+        """
+        Evaluate one reflex and handle its activation edges.
+
+        Parameters
+        ----------
+        reflex : Reflex
+            The reflex.
+        """
+        start = time.perf_counter()
+        provider = find_instance(reflex.provider)
+        matched = provider is not None and reflex.matches(provider)
+
+        if not matched:
+            if reflex.name in self._active:
+                self._active.discard(reflex.name)
+                self._reflex_provider.deactivate(reflex.name)
+                logging.debug(f"Reflex {reflex.name} released")
+            return
+
+        if reflex.name in self._active:
+            return
+        self._active.add(reflex.name)
+        self._reflex_provider.activate(reflex.name, reflex.vetoes)
+
+        now = time.time()
+        if now - self._last_fired.get(reflex.name, 0.0) < reflex.cooldown:
+            return
+        self._last_fired[reflex.name] = now
+
+        if reflex.actions:
+            await self._action_orchestrator.promise(
+                [action.model_copy() for action in reflex.actions],
+                ignore_vetoes=True,
+            )
+        if reflex.message:
+            self._reflex_provider.add_message(reflex.message)
+
+        self._firings[reflex.name] = self._firings.get(reflex.name, 0) + 1
+        self._reaction_ms[reflex.name] = 1000 * (time.perf_counter() - start)
+        logging.info(
+            f"Reflex {reflex.name} fired in {self._reaction_ms[reflex.name]:.2f} ms"
+        )
+
+    def stop(self) -> None:
+        """
+        Release the vetoes of all active reflexes.
+        """
+        for name in self._active:
+            self._reflex_provider.deactivate(name)
+        self._active.clear()
+
+    @property
+    def stats(self) -> T.List[T.Dict[str, T.Any]]:
+        """
+        Get the metrics of every reflex.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Per reflex: whether it is active, its firings, the actions it
+            vetoed, and the milliseconds from evaluation to dispatch at its
+            last firing.
+        """
+        return [
+            {
+                "reflex": reflex.name,
+                "active": reflex.name in self._active,
+                "firings": self._firings.get(reflex.name, 0),
+                "vetoed": self._reflex_provider.veto_count(reflex.name),
+                "reaction_ms": self._reaction_ms.get(reflex.name),
+            }
+            for reflex in self._config.reflexes
+        ]
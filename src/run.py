@@ -3,17 +3,19 @@ import logging
 import multiprocessing as mp
 import os
 import shutil
-from typing import Optional, Tuple
+import time
+from typing import Optional, Tuple, Union
 
 import dotenv
-import json5
 import typer
 
+from runtime.config_cache import is_mode_config, load_raw_config
 from runtime.logging import setup_logging
 from runtime.multi_mode.config import load_mode_config
 from runtime.multi_mode.cortex import ModeCortexRuntime
 from runtime.single_mode.config import load_config
 from runtime.single_mode.cortex import CortexRuntime
+from runtime.watchdog import LoopWatchdog
 
 app = typer.Typer()
 
@@ -61,6 +63,23 @@ def setup_config_file(config_name: Optional[str]) -> Tuple[str, str]:
     return config_name, config_path
 
 
+async def run_watched(
+    runtime: Union[CortexRuntime, ModeCortexRuntime], watchdog: LoopWatchdog
+) -> None:
+    """
+    Run a runtime under an event loop watchdog.
+
+    Parameters
+    ----------
+    runtime : CortexRuntime or ModeCortexRuntime
+        The runtime to run.
+    watchdog : LoopWatchdog
+        The watchdog, which reports on shutdown.
+    """
+    async with watchdog:
+        await runtime.run()
+
+
 @app.command()
 def start(
     config_name: Optional[str] = typer.Argument(
@@ -76,6 +95,13 @@ def start(
     ),
     log_level: str = typer.Option("INFO", help="The logging level to use."),
     log_to_file: bool = typer.Option(False, help="Whether to log output to a file."),
+    watchdog: bool = typer.Option(
+        False,
+        help="Detect event loop stalls and write a ranked report to logs/ on shutdown.",
+    ),
+    stall_threshold_ms: int = typer.Option(
+        100, help="Event loop lag in milliseconds reported as a stall."
+    ),
 ) -> None:
     """
     Start the OM1 agent with a specific configuration.
@@ -93,15 +119,19 @@ def start(
         The logging level to use (default is "INFO").
     log_to_file : bool, optional
         Whether to log output to a file (default is False).
+    watchdog : bool, optional
+        Detect event loop stalls and report the plugins causing them
+        (default is False).
+    stall_threshold_ms : int, optional
+        Event loop lag in milliseconds reported as a stall (default is 100).
     """
     config_name, config_path = setup_config_file(config_name)
     setup_logging(config_name, log_level, log_to_file)
 
     try:
-        with open(config_path, "r") as f:
-            raw_config = json5.load(f)
+        raw_config = load_raw_config(config_path)
 
-        if "modes" in raw_config and "default_mode" in raw_config:
+        if is_mode_config(raw_config):
             mode_config = load_mode_config(config_name)
             runtime = ModeCortexRuntime(
                 mode_config,
@@ -127,7 +157,18 @@ def start(
                 f"Hot-reload enabled (check interval: {check_interval} seconds)"
             )
 
-        asyncio.run(runtime.run())
+        if watchdog:
+            report_path = (
+                f"logs/{config_name}_stalls_{time.strftime('%Y-%m-%d_%H-%M-%S')}.txt"
+            )
+            asyncio.run(
+                run_watched(
+                    runtime,
+                    LoopWatchdog(stall_threshold_ms / 1000, report_path=report_path),
+                )
+            )
+        else:
+            asyncio.run(runtime.run())
 
     except FileNotFoundError:
         logging.error(f"Configuration file not found: {config_path}")
@@ -0,0 +1,188 @@
+import contextvars
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+@dataclass
+class _Component:
+    """
+    A component to build and the components it waits for.
+    """
+
+    name: str
+    build: Callable[[], Any]
+    depends_on: List[str] = field(default_factory=list)
+
+
+class ComponentBuilder:
+    """
+    Builds the components of a configuration concurrently.
+
+    Constructors open sessions, serial ports and cameras, or load models, and
+    mostly wait on I/O, so independent components are built in a thread pool.
+    A component is only started once the components it depends on are built.
+    Each build runs in a copy of the caller's context, so ``provider_scope``
+    applies to the providers it creates.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Maximum number of components built at once; 1 builds them one at a
+        time on the calling thread.
+    """
+
+    def __init__(self, max_workers: Optional[int] = 8):
+        """
+        Initialize the ComponentBuilder with no components.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Maximum number of components built at once.
+        """
+        self.max_workers = max_workers
+        self._components: Dict[str, _Component] = {}
+        self._results: Dict[str, Any] = {}
+        self.timings: Dict[str, float] = {}
+
+    def add(
+        self,
+        name: str,
+        build: Callable[[], Any],
+        depends_on: Sequence[str] = (),
+    ) -> str:
+        """
+        Add a component to build.
+
+        Parameters
+        ----------
+        name : str
+            Unique name of the component, used for dependencies and timings.
+        build : Callable[[], Any]
+            Builds the component; may read its dependencies with ``result``.
+        depends_on : Sequence[str]
+            Names of the components that must be built first.
+
+        Returns
+        -------
+        str
+            The name of the component.
+        """
+        if name in self._components:
+            raise ValueError(f"Component {name} added twice")
+        for dependency in depends_on:
+            if dependency not in self._components:
+                raise ValueError(f"Component {name} depends on unknown {dependency}")
+        self._components[name] = _Component(name, build, list(depends_on))
+        return name
+
+    def result(self, name: str) -> Any:
+        """
+        Get a built component.
+
+        Parameters
+        ----------
+        name : str
+            Name of the component.
+
+        Returns
+        -------
+        Any
+            The component.
+        """
+        return self._results[name]
+
+    def results(self, names: Sequence[str]) -> List[Any]:
+        """
+        Get several built components, in the given order.
+
+        Parameters
+        ----------
+        names : Sequence[str]
+            Names of the components.
+
+        Returns
+        -------
+        List[Any]
+            The components.
+        """
+        return [self._results[name] for name in names]
+
+    def _timed(self, component: _Component) -> Any:
+        """
+        Build a component and record how long it took.
+        """
+        start = time.perf_counter()
+        result = component.build()
+        self.timings[component.name] = time.perf_counter() - start
+        return result
+
+    def build(self) -> Dict[str, Any]:
+        """
+        Build all components.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The components by name, in the order they were added.
+
+        Raises
+        ------
+        Exception
+            The error of the first component that failed to build; the
+            components already started are built before it is raised.
+        """
+        start = time.perf_counter()
+        if self.max_workers == 1:
+            # Components are added after their dependencies
+            for component in self._components.values():
+                self._results[component.name] = self._timed(component)
+        else:
+            self._build_concurrently()
+
+        self._report(time.perf_counter() - start)
+        return {name: self._results[name] for name in self._components}
+
+    def _build_concurrently(self) -> None:
+        """
+        Build the components in a thread pool as their dependencies finish.
+        """
+        waiting = list(self._components.values())
+        running: Dict[Future, _Component] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="build"
+        ) as executor:
+            while waiting or running:
+                for component in list(waiting):
+                    if all(d in self._results for d in component.depends_on):
+                        waiting.remove(component)
+                        context = contextvars.copy_context()
+                        future = executor.submit(context.run, self._timed, component)
+                        running[future] = component
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    component = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        logging.error(f"Failed to build {component.name}: {error}")
+                        wait(running)
+                        raise error
+                    self._results[component.name] = future.result()
+
+    def _report(self, elapsed: float) -> None:
+        """
+        Log the build time of each component.
+        """
+        if not self.timings:
+            return
+        for name, seconds in sorted(self.timings.items(), key=lambda item: -item[1]):
+            logging.debug(f"Built {name} in {1000 * seconds:.1f} ms")
+        logging.info(
+            f"Built {len(self.timings)} components in {1000 * elapsed:.1f} ms "
+            f"({1000 * sum(self.timings.values()):.1f} ms of construction)"
+        )
@@ -0,0 +1,254 @@
+"""
+Cached loading of the JSON5 configuration files.
+
+Parsing JSON5 with the pure-Python ``json5`` library takes tens of
+milliseconds for the larger configurations, and startup, hot reload and the
+CLI parse the same files again and again. A configuration is parsed and
+validated against ``config/schema`` once; its normalized JSON and schema
+errors are stored under the hash of the file content and read with the C JSON
+parser afterwards. Only the most recently used ``CACHE_MAX_ENTRIES`` entries
+are kept.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List
+
+import json5
+
+try:
+    import jsonschema
+except ImportError:
+    logging.debug("jsonschema not found; configurations are not validated")
+    jsonschema = None
+
+# Bump when the cached form changes, so stale entries are ignored
+CACHE_VERSION = 2
+
+CONFIG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../config"))
+CACHE_DIR = os.path.join(CONFIG_DIR, "memory", ".cache")
+CACHE_MAX_ENTRIES = 64
+
+_lock = threading.Lock()
+_memory: Dict[str, str] = {}
+_schemas: Dict[str, Any] = {}
+
+
+def parse_json5(text: str) -> Any:
+    """
+    Parse JSON5 text.
+
+    Plain JSON, such as the runtime files written by the runtimes, is parsed
+    with the C JSON parser; anything else with the ``json5`` library.
+
+    Parameters
+    ----------
+    text : str
+        The JSON5 text.
+
+    Returns
+    -------
+    Any
+        The parsed value.
+
+    Raises
+    ------
+    ValueError
+        If the text is not valid JSON5.
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return json5.loads(text)
+
+
+def is_mode_config(raw_config: Dict[str, Any]) -> bool:
+    """
+    Whether a configuration is a mode-aware configuration.
+
+    Parameters
+    ----------
+    raw_config : Dict[str, Any]
+        The parsed configuration.
+
+    Returns
+    -------
+    bool
+        True if the configuration defines modes.
+    """
+    return "modes" in raw_config and "default_mode" in raw_config
+
+
+def validate_config(raw_config: Dict[str, Any]) -> List[str]:
+    """
+    Validate a configuration against its schema in ``config/schema``.
+
+    Parameters
+    ----------
+    raw_config : Dict[str, Any]
+        The parsed configuration.
+
+    Returns
+    -------
+    List[str]
+        The validation errors; empty if the configuration is valid or
+        jsonschema is not installed.
+    """
+    if jsonschema is None:
+        return []
+
+    name = "multi_mode_schema" if is_mode_config(raw_config) else "single_mode_schema"
+    if name not in _schemas:
+        with open(os.path.join(CONFIG_DIR, "schema", f"{name}.json"), "r") as f:
+            _schemas[name] = json.load(f)
+
+    validator = jsonschema.Draft7Validator(_schemas[name])
+    return [
+        f"{'.'.join(str(p) for p in error.absolute_path) or '<root>'}: {error.message}"
+        for error in validator.iter_errors(raw_config)
+    ]
+
+
+def _cache_path(digest: str) -> str:
+    """
+    Path of the cache entry of a configuration.
+    """
+    return os.path.join(CACHE_DIR, f"{digest}.json")
+
+
+def _compile(text: str, config_path: str) -> str:
+    """
+    Parse and validate a configuration, returning the JSON of its cache entry.
+    """
+    raw_config = parse_json5(text)
+    if not isinstance(raw_config, dict):
+        raise ValueError(f"{config_path} does not contain a JSON object")
+
+    try:
+        errors = validate_config(raw_config)
+    except Exception as e:
+        errors = [f"could not validate: {e}"]
+
+    return json.dumps({"errors": errors, "config": raw_config}, separators=(",", ":"))
+
+
+def _read_entry(compiled: str, config_path: str) -> Dict[str, Any]:
+    """
+    Parse a cache entry, logging the schema errors stored with it.
+
+    Raises
+    ------
+    ValueError
+        If the entry is not a valid cache entry.
+    """
+    try:
+        entry = json.loads(compiled)
+        errors, raw_config = entry["errors"], entry["config"]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"invalid config cache entry: {e}") from e
+    if not isinstance(raw_config, dict):
+        raise ValueError("invalid config cache entry")
+
+    for error in errors:
+        logging.warning(f"Configuration {config_path} is invalid at {error}")
+    return raw_config
+
+
+def _store(digest: str, compiled: str) -> None:
+    """
+    Write a cache entry; the cache is an optimization, so failures are ignored.
+    """
+    path = _cache_path(digest)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(compiled)
+        os.replace(tmp_path, path)
+        _prune()
+    except Exception as e:
+        logging.debug(f"Could not write config cache {path}: {e}")
+
+
+def _prune() -> None:
+    """
+    Remove all but the ``CACHE_MAX_ENTRIES`` most recently used cache entries.
+    """
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            entries.append((os.path.getmtime(path), path))
+        except OSError:
+            continue
+
+    entries.sort(reverse=True)
+    for _, path in entries[CACHE_MAX_ENTRIES:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def load_raw_config(config_path: str, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Load a JSON5 configuration file, using the compiled cache.
+
+    Every call returns a new object, so callers may modify it.
+
+    Parameters
+    ----------
+    config_path : str
+        Path of the configuration file.
+    use_cache : bool
+        Whether to read and write the compiled cache.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The parsed configuration.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the configuration file does not exist
+    ValueError
+        If the configuration file is not valid JSON5
+    """
+    with open(config_path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    if not use_cache:
+        return _read_entry(_compile(text, config_path), config_path)
+
+    digest = hashlib.sha256(f"{CACHE_VERSION}\0{text}".encode("utf-8")).hexdigest()
+
+    with _lock:
+        compiled = _memory.get(digest)
+    if compiled is not None:
+        return _read_entry(compiled, config_path)
+
+    path = _cache_path(digest)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            compiled = f.read()
+        raw_config = _read_entry(compiled, config_path)
+        logging.debug(f"Loaded {config_path} from the config cache")
+        try:
+            # Mark the entry as recently used, so pruning keeps it
+            os.utime(path)
+        except OSError:
+            pass
+    except (OSError, ValueError):
+        compiled = _compile(text, config_path)
+        raw_config = _read_entry(compiled, config_path)
+        _store(digest, compiled)
+
+    with _lock:
+        _memory[digest] = compiled
+    return raw_config
@@ -4,8 +4,6 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-import json5
-
 from actions import load_action
 from actions.base import AgentAction
 from backgrounds import load_background
@@ -13,6 +11,10 @@ from backgrounds.base import Background, BackgroundConfig
 from inputs import load_input
 from inputs.base import Sensor, SensorConfig
 from llm import LLM, LLMConfig, load_llm
+from reflexes import load_reflex
+from reflexes.base import Reflex
+from runtime.builder import ComponentBuilder
+from runtime.config_cache import load_raw_config
 from runtime.multi_mode.hook import (
     LifecycleHook,
     LifecycleHookType,
@@ -94,6 +96,7 @@ class ModeConfig:
     timeout_seconds: Optional[float] = None
     remember_locations: bool = False
     save_interactions: bool = False
+    skip_unchanged_ticks: bool = False
 
     lifecycle_hooks: List[LifecycleHook] = field(default_factory=list)
     _raw_lifecycle_hooks: List[Dict] = field(default_factory=list)
@@ -103,12 +106,14 @@ class ModeConfig:
     simulators: List[Simulator] = field(default_factory=list)
     agent_actions: List[AgentAction] = field(default_factory=list)
     backgrounds: List[Background] = field(default_factory=list)
+    reflexes: List[Reflex] = field(default_factory=list)
 
     _raw_inputs: List[Dict] = field(default_factory=list)
     _raw_llm: Optional[Dict] = None
     _raw_simulators: List[Dict] = field(default_factory=list)
     _raw_actions: List[Dict] = field(default_factory=list)
     _raw_backgrounds: List[Dict] = field(default_factory=list)
+    _raw_reflexes: List[Dict] = field(default_factory=list)
 
     def to_runtime_config(self, global_config: "ModeSystemConfig") -> RuntimeConfig:
         """
@@ -140,10 +145,12 @@ class ModeConfig:
             simulators=self.simulators,
             agent_actions=self.agent_actions,
             backgrounds=self.backgrounds,
+            reflexes=self.reflexes,
             robot_ip=global_config.robot_ip,
             api_key=global_config.api_key,
             URID=global_config.URID,
             unitree_ethernet=global_config.unitree_ethernet,
+            skip_unchanged_ticks=self.skip_unchanged_ticks,
         )
 
     def load_components(self, system_config: "ModeSystemConfig"):
@@ -178,7 +185,10 @@ class ModeConfig:
         )
 
     async def execute_lifecycle_hooks(
-        self, hook_type: LifecycleHookType, context: Optional[Dict[str, Any]] = None
+        self,
+        hook_type: LifecycleHookType,
+        context: Optional[Dict[str, Any]] = None,
+        timings: Optional[Dict[str, float]] = None,
     ) -> bool:
         """
         Execute all lifecycle hooks of the specified type for this mode.
@@ -189,6 +199,8 @@ class ModeConfig:
             The type of lifecycle hooks to execute
         context : Optional[Dict[str, Any]]
             Context information to pass to the hooks
+        timings : Optional[Dict[str, float]]
+            If given, filled with the duration in seconds of each hook
 
         Returns
         -------
@@ -206,7 +218,9 @@ class ModeConfig:
             }
         )
 
-        return await execute_lifecycle_hooks(self.lifecycle_hooks, hook_type, context)
+        return await execute_lifecycle_hooks(
+            self.lifecycle_hooks, hook_type, context, timings
+        )
 
 
 @dataclass
@@ -242,7 +256,10 @@ class ModeSystemConfig:
     transition_rules: List[TransitionRule] = field(default_factory=list)
 
     async def execute_global_lifecycle_hooks(
-        self, hook_type: LifecycleHookType, context: Optional[Dict[str, Any]] = None
+        self,
+        hook_type: LifecycleHookType,
+        context: Optional[Dict[str, Any]] = None,
+        timings: Optional[Dict[str, float]] = None,
     ) -> bool:
         """
         Execute all global lifecycle hooks of the specified type.
@@ -253,6 +270,8 @@ class ModeSystemConfig:
             The type of lifecycle hooks to execute
         context : Optional[Dict[str, Any]]
             Context information to pass to the hooks
+        timings : Optional[Dict[str, float]]
+            If given, filled with the duration in seconds of each hook
 
         Returns
         -------
@@ -265,7 +284,7 @@ class ModeSystemConfig:
         context.update({"system_name": self.name, "is_global_hook": True})
 
         return await execute_lifecycle_hooks(
-            self.global_lifecycle_hooks, hook_type, context
+            self.global_lifecycle_hooks, hook_type, context, timings
         )
 
 
@@ -296,8 +315,7 @@ def load_mode_config(
         else mode_soure_path
     )
 
-    with open(config_path, "r") as f:
-        raw_config = json5.load(f)
+    raw_config = load_raw_config(config_path)
 
     config_version = raw_config.get("version")
     verify_runtime_version(config_version, config_name)
@@ -361,11 +379,13 @@ def load_mode_config(
             timeout_seconds=mode_data.get("timeout_seconds"),
             remember_locations=mode_data.get("remember_locations", False),
             save_interactions=mode_data.get("save_interactions", False),
+            skip_unchanged_ticks=mode_data.get("skip_unchanged_ticks", False),
             _raw_inputs=mode_data.get("agent_inputs", []),
             _raw_llm=mode_data.get("cortex_llm"),
             _raw_simulators=mode_data.get("simulators", []),
             _raw_actions=mode_data.get("agent_actions", []),
             _raw_backgrounds=mode_data.get("backgrounds", []),
+            _raw_reflexes=mode_data.get("reflexes", []),
             _raw_lifecycle_hooks=mode_data.get("lifecycle_hooks", []),
         )
 
@@ -404,81 +424,106 @@ def _load_mode_components(mode_config: ModeConfig, system_config: ModeSystemConf
     g_robot_ip = system_config.robot_ip
     g_mode = mode_config.name
 
-    # Load inputs
-    mode_config.agent_inputs = [
-        load_input(inp["type"])(
-            config=SensorConfig(
-                **add_meta(
-                    inp.get("config", {}),
-                    g_api_key,
-                    g_ut_eth,
-                    g_URID,
-                    g_robot_ip,
-                    g_mode,
+    llm_config = mode_config._raw_llm or system_config.global_cortex_llm
+    if not llm_config:
+        raise ValueError(f"No LLM configuration found for mode {mode_config.name}")
+
+    # Build in stages, in the order of the config: backgrounds, inputs,
+    # simulators, actions, then the LLM that calls the actions. Components of
+    # one stage are built concurrently. Singleton providers are configured by
+    # the first component that creates them, so a later stage must not race
+    # an earlier one for them.
+    builder = ComponentBuilder()
+
+    # Load backgrounds
+    backgrounds = [
+        builder.add(
+            f"{g_mode}.backgrounds[{i}] {bg['type']}",
+            lambda bg=bg: load_background(bg["type"])(
+                config=BackgroundConfig(
+                    **add_meta(
+                        bg.get("config", {}),
+                        g_api_key,
+                        g_ut_eth,
+                        g_URID,
+                        g_robot_ip,
+                        g_mode,
+                    )
                 )
-            )
+            ),
         )
-        for inp in mode_config._raw_inputs
+        for i, bg in enumerate(mode_config._raw_backgrounds)
     ]
 
-    # Load simulators
-    mode_config.simulators = [
-        load_simulator(sim["type"])(
-            config=SimulatorConfig(
-                name=sim["type"],
-                **add_meta(
-                    sim.get("config", {}),
-                    g_api_key,
-                    g_ut_eth,
-                    g_URID,
-                    g_robot_ip,
-                    g_mode,
-                ),
-            )
+    # Load inputs
+    agent_inputs = [
+        builder.add(
+            f"{g_mode}.agent_inputs[{i}] {inp['type']}",
+            lambda inp=inp: load_input(inp["type"])(
+                config=SensorConfig(
+                    **add_meta(
+                        inp.get("config", {}),
+                        g_api_key,
+                        g_ut_eth,
+                        g_URID,
+                        g_robot_ip,
+                        g_mode,
+                    )
+                )
+            ),
+            depends_on=backgrounds,
         )
-        for sim in mode_config._raw_simulators
+        for i, inp in enumerate(mode_config._raw_inputs)
     ]
 
-    # Load actions
-    mode_config.agent_actions = [
-        load_action(
-            {
-                **action,
-                "config": add_meta(
-                    action.get("config", {}),
-                    g_api_key,
-                    g_ut_eth,
-                    g_URID,
-                    g_robot_ip,
-                    g_mode,
-                ),
-            }
+    # Load simulators
+    simulators = [
+        builder.add(
+            f"{g_mode}.simulators[{i}] {sim['type']}",
+            lambda sim=sim: load_simulator(sim["type"])(
+                config=SimulatorConfig(
+                    name=sim["type"],
+                    **add_meta(
+                        sim.get("config", {}),
+                        g_api_key,
+                        g_ut_eth,
+                        g_URID,
+                        g_robot_ip,
+                        g_mode,
+                    ),
+                )
+            ),
+            depends_on=backgrounds + agent_inputs,
         )
-        for action in mode_config._raw_actions
+        for i, sim in enumerate(mode_config._raw_simulators)
     ]
 
-    # Load backgrounds
-    mode_config.backgrounds = [
-        load_background(bg["type"])(
-            config=BackgroundConfig(
-                **add_meta(
-                    bg.get("config", {}),
-                    g_api_key,
-                    g_ut_eth,
-                    g_URID,
-                    g_robot_ip,
-                    g_mode,
-                )
-            )
+    # Load actions
+    agent_actions = [
+        builder.add(
+            f"{g_mode}.agent_actions[{i}] {action.get('name')}",
+            lambda action=action: load_action(
+                {
+                    **action,
+                    "config": add_meta(
+                        action.get("config", {}),
+                        g_api_key,
+                        g_ut_eth,
+                        g_URID,
+                        g_robot_ip,
+                        g_mode,
+                    ),
+                }
+            ),
+            depends_on=backgrounds + agent_inputs + simulators,
         )
-        for bg in mode_config._raw_backgrounds
+        for i, action in enumerate(mode_config._raw_actions)
     ]
 
     # Load LLM
-    llm_config = mode_config._raw_llm or system_config.global_cortex_llm
-    if llm_config:
-        llm_class = load_llm(llm_config["type"])
-        mode_config.cortex_llm = llm_class(
+    cortex_llm = builder.add(
+        f"{g_mode}.cortex_llm {llm_config['type']}",
+        lambda: load_llm(llm_config["type"])(
             config=LLMConfig(
                 **add_meta(  # type: ignore
                     llm_config.get("config", {}),
@@ -489,10 +534,20 @@ def _load_mode_components(mode_config: ModeConfig, system_config: ModeSystemConf
                     g_mode,
                 )
             ),
-            available_actions=mode_config.agent_actions,
-        )
-    else:
-        raise ValueError(f"No LLM configuration found for mode {mode_config.name}")
+            available_actions=builder.results(agent_actions),
+        ),
+        depends_on=backgrounds + agent_inputs + simulators + agent_actions,
+    )
+
+    builder.build()
+    mode_config.backgrounds = builder.results(backgrounds)
+    mode_config.agent_inputs = builder.results(agent_inputs)
+    mode_config.simulators = builder.results(simulators)
+    mode_config.agent_actions = builder.results(agent_actions)
+    mode_config.cortex_llm = builder.result(cortex_llm)
+
+    # Load reflexes
+    mode_config.reflexes = [load_reflex(reflex) for reflex in mode_config._raw_reflexes]
 
 
 def mode_config_to_dict(config: ModeSystemConfig) -> Dict[str, Any]:
@@ -521,11 +576,13 @@ def mode_config_to_dict(config: ModeSystemConfig) -> Dict[str, Any]:
                 "timeout_seconds": mode_config.timeout_seconds,
                 "remember_locations": mode_config.remember_locations,
                 "save_interactions": mode_config.save_interactions,
+                "skip_unchanged_ticks": mode_config.skip_unchanged_ticks,
                 "agent_inputs": mode_config._raw_inputs,
                 "cortex_llm": mode_config._raw_llm,
                 "simulators": mode_config._raw_simulators,
                 "agent_actions": mode_config._raw_actions,
                 "backgrounds": mode_config._raw_backgrounds,
+                "reflexes": mode_config._raw_reflexes,
                 "lifecycle_hooks": mode_config._raw_lifecycle_hooks,
             }
 
@@ -7,10 +7,13 @@ from typing import List, Optional, Union
 from actions.orchestrator import ActionOrchestrator
 from backgrounds.orchestrator import BackgroundOrchestrator
 from fuser import Fuser
+from inputs.base import Sensor
 from inputs.orchestrator import InputOrchestrator
 from providers.config_provider import ConfigProvider
 from providers.io_provider import IOProvider
+from providers.singleton import find_instance
 from providers.sleep_ticker_provider import SleepTickerProvider
+from reflexes.orchestrator import ReflexOrchestrator
 from runtime.multi_mode.config import (
     LifecycleHookType,
     ModeSystemConfig,
@@ -39,6 +42,7 @@ class ModeCortexRuntime:
     action_orchestrator: Optional[ActionOrchestrator]
     simulator_orchestrator: Optional[SimulatorOrchestrator]
     background_orchestrator: Optional[BackgroundOrchestrator]
+    reflex_orchestrator: Optional[ReflexOrchestrator]
     input_orchestrator: Optional[InputOrchestrator]
 
     def __init__(
@@ -89,6 +93,7 @@ class ModeCortexRuntime:
         self.action_orchestrator: Optional[ActionOrchestrator] = None
         self.simulator_orchestrator: Optional[SimulatorOrchestrator] = None
         self.background_orchestrator: Optional[BackgroundOrchestrator] = None
+        self.reflex_orchestrator: Optional[ReflexOrchestrator] = None
         self.input_orchestrator: Optional[InputOrchestrator] = None
 
         # Tasks for orchestrators
@@ -96,6 +101,7 @@ class ModeCortexRuntime:
         self.simulator_task: Optional[asyncio.Future] = None
         self.action_task: Optional[asyncio.Future] = None
         self.background_task: Optional[asyncio.Future] = None
+        self.reflex_task: Optional[Union[asyncio.Task, asyncio.Future]] = None
         self.cortex_loop_task: Optional[asyncio.Task] = None
         self.mode_transition_task: Optional[asyncio.Task] = None
 
@@ -108,6 +114,9 @@ class ModeCortexRuntime:
         # Flag to track if a reload is in progress
         self._is_reloading = False
 
+        # Priority of the wake that started the current tick
+        self._tick_priority = 0
+
         # Event for handling mode transitions
         self._mode_transition_event = asyncio.Event()
         self._pending_mode_transition: Optional[str] = None
@@ -134,6 +143,9 @@ class ModeCortexRuntime:
         self.action_orchestrator = ActionOrchestrator(self.current_config)
         self.simulator_orchestrator = SimulatorOrchestrator(self.current_config)
         self.background_orchestrator = BackgroundOrchestrator(self.current_config)
+        self.reflex_orchestrator = ReflexOrchestrator(
+            self.current_config, self.action_orchestrator
+        )
 
         logging.info(f"Mode '{mode_name}' initialized successfully")
 
@@ -243,6 +255,10 @@ class ModeCortexRuntime:
             logging.debug("Cancelling background task")
             tasks_to_cancel["background"] = self.background_task
 
+        if self.reflex_task and not self.reflex_task.done():
+            logging.debug("Cancelling reflex task")
+            tasks_to_cancel["reflex"] = self.reflex_task
+
         # Cancel all tasks
         for name, task in tasks_to_cancel.items():
             task.cancel()
@@ -297,6 +313,7 @@ class ModeCortexRuntime:
         self.simulator_task = None
         self.action_task = None
         self.background_task = None
+        self.reflex_task = None
 
     async def _start_orchestrators(self):
         """
@@ -316,6 +333,8 @@ class ModeCortexRuntime:
             self.action_task = self.action_orchestrator.start()
         if self.background_orchestrator:
             self.background_task = self.background_orchestrator.start()
+        if self.reflex_orchestrator:
+            self.reflex_task = self.reflex_orchestrator.start()
 
         # Start cortex task
         self.cortex_loop_task = asyncio.create_task(self._run_cortex_loop())
@@ -348,6 +367,8 @@ class ModeCortexRuntime:
             tasks_to_cancel.append(self.action_task)
         if self.background_task and not self.background_task.done():
             tasks_to_cancel.append(self.background_task)
+        if self.reflex_task and not self.reflex_task.done():
+            tasks_to_cancel.append(self.reflex_task)
 
         # Cancel all tasks
         for task in tasks_to_cancel:
@@ -363,6 +384,12 @@ class ModeCortexRuntime:
         # Stop ConfigProvider
         self.config_provider.stop()
 
+        # Close the pooled HTTP connections, if anything opened them
+        http_client = find_instance("HTTPClientProvider")
+        if http_client is not None:
+            await http_client.close()
+            http_client.close_sync()
+
         logging.debug("Tasks cleaned up successfully")
 
     async def run(self) -> None:
@@ -424,6 +451,8 @@ class ModeCortexRuntime:
                         awaitables.append(self.action_task)
                     if self.background_task and not self.background_task.done():
                         awaitables.append(self.background_task)
+                    if self.reflex_task and not self.reflex_task.done():
+                        awaitables.append(self.reflex_task)
 
                     await asyncio.gather(*awaitables)
 
@@ -482,8 +511,9 @@ class ModeCortexRuntime:
                 # Helper to yield control to event loop
                 await asyncio.sleep(0)
 
+                # Wakes that arrive during the tick start the next one
+                self._tick_priority = self.sleep_ticker_provider.take_wake()
                 await self._tick()
-                self.sleep_ticker_provider.skip_sleep = False
         except asyncio.CancelledError:
             logging.info(
                 f"Cortex loop for mode '{current_mode}' cancelled, exiting gracefully"
@@ -495,6 +525,22 @@ class ModeCortexRuntime:
             )
             raise
 
+    def _supersedable(self, inputs: List[Sensor]) -> bool:
+        """
+        Whether an input could supersede the LLM request of the current tick.
+
+        Parameters
+        ----------
+        inputs : List[Sensor]
+            The agent inputs of the current mode.
+
+        Returns
+        -------
+        bool
+            True if an input has a higher priority than the tick.
+        """
+        return any(input.priority > self._tick_priority for input in inputs)
+
     async def _tick(self) -> None:
         """
         Execute a single tick of the mode-aware cortex processing cycle.
@@ -530,7 +576,17 @@ class ModeCortexRuntime:
             )
             return
 
-        output = await self.current_config.cortex_llm.ask(prompt)
+        if self._supersedable(self.current_config.agent_inputs):
+            output, superseded = await self.sleep_ticker_provider.until_woken(
+                self.current_config.cortex_llm.ask(prompt), self._tick_priority
+            )
+            if superseded:
+                logging.info("LLM request superseded by a higher-priority input")
+                # The stale prompt consumed the buffers of the other inputs
+                self.fuser.keep_inputs()
+                return
+        else:
+            output = await self.current_config.cortex_llm.ask(prompt)
         if output is None:
             logging.debug("No output from LLM")
             return
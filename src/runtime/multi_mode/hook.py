@@ -3,9 +3,11 @@ import importlib
 import logging
 import os
 import re
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from itertools import groupby
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
 
@@ -150,8 +152,13 @@ class CommandHookHandler(LifecycleHookHandler):
 class FunctionHookHandler(LifecycleHookHandler):
     """
     Handler that calls a Python function from a specified module.
+
+    Resolved functions are cached per (module, function), so the hook file is
+    only searched the first time the hook runs.
     """
 
+    _functions: Dict[Tuple[str, str], Callable] = {}
+
     async def execute(self, context: Dict[str, Any]) -> bool:
         module_name = self.config.get("module_name")
         function_name = self.config.get("function")
@@ -165,9 +172,12 @@ class FunctionHookHandler(LifecycleHookHandler):
             return False
 
         try:
-            func = self._find_function_in_module(module_name, function_name)
-            if not func:
-                return False
+            func = self._functions.get((module_name, function_name))
+            if func is None:
+                func = self._find_function_in_module(module_name, function_name)
+                if not func:
+                    return False
+                self._functions[(module_name, function_name)] = func
 
             if asyncio.iscoroutinefunction(func):
                 result = await func(context)
@@ -353,14 +363,114 @@ def parse_lifecycle_hooks(raw_hooks: List[Dict]) -> List[LifecycleHook]:
     return hooks
 
 
+def describe_hook(hook: LifecycleHook) -> str:
+    """
+    Name a hook for logs and timing reports.
+
+    Parameters
+    ----------
+    hook : LifecycleHook
+        The lifecycle hook
+
+    Returns
+    -------
+    str
+        The handler type and what it runs, such as ``function:nav2.start_nav2``
+    """
+    config = hook.handler_config
+    if hook.handler_type.lower() == "function":
+        target = f"{config.get('module_name')}.{config.get('function')}"
+    else:
+        target = (
+            config.get("command") or config.get("action_type") or config.get("message")
+        )
+    return f"{hook.handler_type}:{target}"
+
+
+async def _execute_hook(hook: LifecycleHook, context: Dict[str, Any]) -> bool:
+    """
+    Execute one lifecycle hook, honoring its timeout.
+
+    Parameters
+    ----------
+    hook : LifecycleHook
+        The lifecycle hook
+    context : Dict[str, Any]
+        Context information to pass to the hook
+
+    Returns
+    -------
+    bool
+        True if the hook executed successfully, False otherwise
+    """
+    try:
+        handler = create_hook_handler(hook)
+        if not handler:
+            logging.error(
+                f"Failed to create handler for lifecycle hook: {hook.handler_type}"
+            )
+            return False
+
+        if hook.async_execution and hook.timeout_seconds:
+            return await asyncio.wait_for(
+                handler.execute(context), timeout=hook.timeout_seconds
+            )
+        return await handler.execute(context)
+
+    except asyncio.TimeoutError:
+        logging.error(f"Lifecycle hook timed out after {hook.timeout_seconds} seconds")
+        return False
+    except Exception as e:
+        logging.error(f"Error executing lifecycle hook: {e}")
+        return False
+
+
+def _batches(hooks: List[LifecycleHook]) -> List[List[LifecycleHook]]:
+    """
+    Split hooks, sorted by priority, into batches that run concurrently.
+
+    Asynchronous hooks of the same priority share a batch; a synchronous hook,
+    or one whose failure aborts the others, runs in a batch of its own.
+
+    Parameters
+    ----------
+    hooks : List[LifecycleHook]
+        The hooks, highest priority first
+
+    Returns
+    -------
+    List[List[LifecycleHook]]
+        The batches, in execution order
+    """
+    batches: List[List[LifecycleHook]] = []
+    for _, group in groupby(hooks, key=lambda h: h.priority):
+        batch: List[LifecycleHook] = []
+        for hook in group:
+            if hook.async_execution and hook.on_failure != "abort":
+                batch.append(hook)
+                continue
+            if batch:
+                batches.append(batch)
+                batch = []
+            batches.append([hook])
+        if batch:
+            batches.append(batch)
+    return batches
+
+
 async def execute_lifecycle_hooks(
     hooks: List[LifecycleHook],
     hook_type: LifecycleHookType,
     context: Optional[Dict[str, Any]] = None,
+    timings: Optional[Dict[str, float]] = None,
 ) -> bool:
     """
     Execute all lifecycle hooks of the specified type.
 
+    Hooks run by priority, highest first. Asynchronous hooks of the same
+    priority run concurrently; synchronous hooks and hooks with the abort
+    policy run alone, and a failed abort hook stops the remaining hooks.
+
     Parameters
     ----------
     hooks : List[LifecycleHook]
@@ -369,6 +479,9 @@ async def execute_lifecycle_hooks(
         The type of lifecycle hooks to execute
     context : Optional[Dict[str, Any]]
         Context information to pass to the hooks
+    timings : Optional[Dict[str, float]]
+        If given, filled with the duration in seconds of each executed hook,
+        keyed by ``describe_hook``
 
     Returns
     -------
@@ -388,48 +501,26 @@ async def execute_lifecycle_hooks(
 
     logging.info(f"Executing {len(relevant_hooks)} {hook_type.value} hooks")
 
-    all_successful = True
-
-    for hook in relevant_hooks:
+    async def timed(hook: LifecycleHook) -> bool:
+        start = time.perf_counter()
         try:
-            handler = create_hook_handler(hook)
-            if handler:
-                if hook.async_execution:
-                    if hook.timeout_seconds:
-                        success = await asyncio.wait_for(
-                            handler.execute(context), timeout=hook.timeout_seconds
-                        )
-                    else:
-                        success = await handler.execute(context)
-                else:
-                    success = await handler.execute(context)
+            return await _execute_hook(hook, context)
+        finally:
+            if timings is not None:
+                timings[describe_hook(hook)] = time.perf_counter() - start
 
-                if not success:
-                    all_successful = False
-                    if hook.on_failure == "abort":
-                        logging.error(
-                            "Lifecycle hook failed with abort policy, stopping execution"
-                        )
-                        return False
-                    if hook.on_failure == "ignore":
-                        pass
-            else:
-                logging.error(
-                    f"Failed to create handler for lifecycle hook: {hook.handler_type}"
-                )
-                all_successful = False
+    all_successful = True
 
-        except asyncio.TimeoutError:
-            logging.error(
-                f"Lifecycle hook timed out after {hook.timeout_seconds} seconds"
-            )
-            all_successful = False
-            if hook.on_failure == "abort":
-                return False
-        except Exception as e:
-            logging.error(f"Error executing lifecycle hook: {e}")
+    for batch in _batches(relevant_hooks):
+        results = await asyncio.gather(*(timed(hook) for hook in batch))
+        for hook, success in zip(batch, results):
+            if success:
+                continue
             all_successful = False
             if hook.on_failure == "abort":
+                logging.error(
+                    "Lifecycle hook failed with abort policy, stopping execution"
+                )
                 return False
 
     return all_successful
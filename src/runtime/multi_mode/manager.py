@@ -6,9 +6,9 @@ import time
 from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional
 
-import json5
 import zenoh
 
+from reflexes.base import evaluate_condition
 from runtime.multi_mode.config import (
     LifecycleHookType,
     ModeConfig,
@@ -77,6 +77,7 @@ class ModeManager:
         self._main_event_loop: Optional[asyncio.AbstractEventLoop] = None
         self._transition_lock = asyncio.Lock()
         self._is_transitioning = False
+        self.last_transition_report: Optional[Dict] = None
 
         # Validate configuration
         if config.default_mode not in config.modes:
@@ -146,7 +147,7 @@ class ModeManager:
 
             temp_file = runtime_config_path + ".tmp"
             with open(temp_file, "w") as f:
-                json5.dump(runtime_config, f, indent=2)
+                json.dump(runtime_config, f, indent=2)
 
             os.rename(temp_file, runtime_config_path)
             logging.debug(f"Runtime config file created/updated: {runtime_config_path}")
@@ -439,44 +440,7 @@ class ModeManager:
         if key not in user_context:
             return False
 
-        actual_value = user_context[key]
-
-        # Handle different condition types
-        if isinstance(expected_value, dict):
-            # Support for complex conditions like {"min": 5, "max": 10} or {"contains": "pattern"}
-            if "min" in expected_value or "max" in expected_value:
-                # Numeric range condition
-                if not isinstance(actual_value, (int, float)):
-                    return False
-                if "min" in expected_value and actual_value < expected_value["min"]:
-                    return False
-                if "max" in expected_value and actual_value > expected_value["max"]:
-                    return False
-                return True
-
-            elif "contains" in expected_value:
-                # String contains condition
-                if not isinstance(actual_value, str):
-                    return False
-                return expected_value["contains"].lower() in actual_value.lower()
-
-            elif "one_of" in expected_value:
-                # Value must be one of the specified options
-                return actual_value in expected_value["one_of"]
-
-            elif "not" in expected_value:
-                # Negation condition
-                return actual_value != expected_value["not"]
-
-        elif isinstance(expected_value, list):
-            # List membership condition
-            return actual_value in expected_value
-
-        else:
-            # Simple equality condition
-            return actual_value == expected_value
-
-        return False
+        return evaluate_condition(user_context[key], expected_value)
 
     async def request_transition(
         self, target_mode: str, reason: str = "manual"
@@ -550,6 +514,14 @@ class ModeManager:
             from_config = self.config.modes.get(from_mode)
             to_config = self.config.modes[target_mode]
 
+            started = time.perf_counter()
+            hook_timings: Dict[str, Dict[str, float]] = {
+                "exit": {},
+                "global_exit": {},
+                "entry": {},
+                "global_entry": {},
+            }
+
             transition_context = {
                 "from_mode": from_mode,
                 "to_mode": target_mode,
@@ -562,14 +534,18 @@ class ModeManager:
             if from_config:
                 logging.debug(f"Executing exit hooks for mode: {from_mode}")
                 exit_success = await from_config.execute_lifecycle_hooks(
-                    LifecycleHookType.ON_EXIT, transition_context.copy()
+                    LifecycleHookType.ON_EXIT,
+                    transition_context.copy(),
+                    hook_timings["exit"],
                 )
                 if not exit_success:
                     logging.warning(f"Some exit hooks failed for mode: {from_mode}")
 
             # Execute global exit hooks
             global_exit_success = await self.config.execute_global_lifecycle_hooks(
-                LifecycleHookType.ON_EXIT, transition_context.copy()
+                LifecycleHookType.ON_EXIT,
+                transition_context.copy(),
+                hook_timings["global_exit"],
             )
             if not global_exit_success:
                 logging.warning("Some global exit hooks failed")
@@ -591,18 +567,36 @@ class ModeManager:
             # Execute entry hooks for the new mode
             logging.debug(f"Executing entry hooks for mode: {target_mode}")
             entry_success = await to_config.execute_lifecycle_hooks(
-                LifecycleHookType.ON_ENTRY, transition_context.copy()
+                LifecycleHookType.ON_ENTRY,
+                transition_context.copy(),
+                hook_timings["entry"],
             )
             if not entry_success:
                 logging.warning(f"Some entry hooks failed for mode: {target_mode}")
 
             # Execute global entry hooks
             global_entry_success = await self.config.execute_global_lifecycle_hooks(
-                LifecycleHookType.ON_ENTRY, transition_context.copy()
+                LifecycleHookType.ON_ENTRY,
+                transition_context.copy(),
+                hook_timings["global_entry"],
             )
             if not global_entry_success:
                 logging.warning("Some global entry hooks failed")
 
+            self.last_transition_report = {
+                "transition": transition_key,
+                "reason": reason,
+                "duration": time.perf_counter() - started,
+                "hooks": hook_timings,
+            }
+            logging.info(
+                f"Mode transition {transition_key} took "
+                f"{1000 * self.last_transition_report['duration']:.1f} ms"
+            )
+            for phase, timings in hook_timings.items():
+                for hook, duration in timings.items():
+                    logging.debug(f"{phase} hook {hook}: {1000 * duration:.1f} ms")
+
             await self._notify_transition_callbacks(from_mode, target_mode)
 
             self._save_mode_state()
@@ -657,6 +651,7 @@ class ModeManager:
             "available_transitions": self.get_available_transitions(),
             "all_modes": list(self.config.modes.keys()),
             "transition_history": self.state.transition_history[-5:],
+            "last_transition": self.last_transition_report,
             "timeout_seconds": current_config.timeout_seconds,
             "time_remaining": (
                 current_config.timeout_seconds - mode_duration
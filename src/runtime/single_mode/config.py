@@ -1,10 +1,8 @@
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
-import json5
-
 from actions import load_action
 from actions.base import AgentAction
 from backgrounds import load_background
@@ -12,7 +10,12 @@ from backgrounds.base import Background, BackgroundConfig
 from inputs import load_input
 from inputs.base import Sensor, SensorConfig
 from llm import LLM, LLMConfig, load_llm
+from reflexes import load_reflex
+from reflexes.base import Reflex
+from runtime.builder import ComponentBuilder
+from runtime.config_cache import load_raw_config
 from runtime.robotics import load_unitree
+from runtime.topology import Topology
 from runtime.version import verify_runtime_version
 from simulators import load_simulator
 from simulators.base import Simulator, SimulatorConfig
@@ -51,6 +54,15 @@ class RuntimeConfig:
     # Optional mode information for multi-mode runtime configurations
     mode: Optional[str] = None
 
+    # Reflexes evaluated between the inputs and the actions
+    reflexes: List[Reflex] = field(default_factory=list)
+
+    # Optional worker processes running some of the inputs and backgrounds
+    topology: Optional[Topology] = None
+
+    # Skip the LLM call of ticks where no input changed since the previous one
+    skip_unchanged_ticks: bool = False
+
     @classmethod
     def load(cls, config_name: str) -> "RuntimeConfig":
         """Load a runtime configuration from a file."""
@@ -96,8 +108,7 @@ def load_config(
         else config_source_path
     )
 
-    with open(config_path, "r+") as f:
-        raw_config = json5.load(f)
+    raw_config = load_raw_config(config_path)
 
     config_version = raw_config.get("version")
     verify_runtime_version(config_version, config_name)
@@ -158,30 +169,76 @@ def load_config(
     conf = raw_config["cortex_llm"].get("config", {})
     logging.debug(f"config.py: {conf}")
 
-    parsed_config = {
-        **raw_config,
-        "backgrounds": [
-            load_background(bg["type"])(
+    # Inputs and backgrounds placed into worker processes are not built here;
+    # a RemoteInput stands in for each such input
+    topology = None
+    remote_inputs: Dict[int, Sensor] = {}
+    local_backgrounds = raw_config.get("backgrounds", [])
+    if raw_config.get("topology"):
+        topology = Topology.from_config(raw_config["topology"])
+        for i, input in enumerate(raw_config.get("agent_inputs", [])):
+            remote_input = topology.place_input(
+                input["type"],
+                add_meta(
+                    input.get("config", {}), g_api_key, g_ut_eth, g_URID, g_robot_ip
+                ),
+            )
+            if remote_input is not None:
+                remote_inputs[i] = remote_input
+        local_backgrounds = [
+            bg
+            for bg in local_backgrounds
+            if not topology.place_background(
+                bg["type"],
+                add_meta(bg.get("config", {}), g_api_key, g_ut_eth, g_URID, g_robot_ip),
+            )
+        ]
+
+    # Build in stages, in the order of the config: backgrounds, inputs,
+    # simulators, actions, then the LLM that calls the actions. Components of
+    # one stage are built concurrently. Singleton providers are configured by
+    # the first component that creates them, so a later stage must not race
+    # an earlier one for them.
+    builder = ComponentBuilder()
+    backgrounds = [
+        builder.add(
+            f"backgrounds[{i}] {bg['type']}",
+            lambda bg=bg: load_background(bg["type"])(
                 config=BackgroundConfig(
                     **add_meta(
                         bg.get("config", {}), g_api_key, g_ut_eth, g_URID, g_robot_ip
                     )
                 )
-            )
-            for bg in raw_config.get("backgrounds", [])
-        ],
-        "agent_inputs": [
-            load_input(input["type"])(
-                config=SensorConfig(
-                    **add_meta(
-                        input.get("config", {}), g_api_key, g_ut_eth, g_URID, g_robot_ip
+            ),
+        )
+        for i, bg in enumerate(local_backgrounds)
+    ]
+    agent_inputs = [
+        builder.add(
+            f"agent_inputs[{i}] {input['type']}",
+            (
+                (lambda i=i: remote_inputs[i])
+                if i in remote_inputs
+                else lambda input=input: load_input(input["type"])(
+                    config=SensorConfig(
+                        **add_meta(
+                            input.get("config", {}),
+                            g_api_key,
+                            g_ut_eth,
+                            g_URID,
+                            g_robot_ip,
+                        )
                     )
                 )
-            )
-            for input in raw_config.get("agent_inputs", [])
-        ],
-        "simulators": [
-            load_simulator(simulator["type"])(
+            ),
+            depends_on=backgrounds,
+        )
+        for i, input in enumerate(raw_config.get("agent_inputs", []))
+    ]
+    simulators = [
+        builder.add(
+            f"simulators[{i}] {simulator['type']}",
+            lambda simulator=simulator: load_simulator(simulator["type"])(
                 config=SimulatorConfig(
                     name=simulator["type"],
                     **add_meta(
@@ -192,11 +249,15 @@ def load_config(
                         g_robot_ip,
                     ),
                 )
-            )
-            for simulator in raw_config.get("simulators", [])
-        ],
-        "agent_actions": [
-            load_action(
+            ),
+            depends_on=backgrounds + agent_inputs,
+        )
+        for i, simulator in enumerate(raw_config.get("simulators", []))
+    ]
+    agent_actions = [
+        builder.add(
+            f"agent_actions[{i}] {action.get('name')}",
+            lambda action=action: load_action(
                 {
                     **action,
                     "config": add_meta(
@@ -207,13 +268,14 @@ def load_config(
                         g_robot_ip,
                     ),
                 }
-            )
-            for action in raw_config.get("agent_actions", [])
-        ],
-    }
-
-    cortex_llm = (
-        load_llm(raw_config["cortex_llm"]["type"])(
+            ),
+            depends_on=backgrounds + agent_inputs + simulators,
+        )
+        for i, action in enumerate(raw_config.get("agent_actions", []))
+    ]
+    cortex_llm = builder.add(
+        f"cortex_llm {raw_config['cortex_llm']['type']}",
+        lambda: load_llm(raw_config["cortex_llm"]["type"])(
             config=LLMConfig(
                 **add_meta(  # type: ignore
                     raw_config["cortex_llm"].get("config", {}),
@@ -223,14 +285,22 @@ def load_config(
                     g_robot_ip,
                 )
             ),
-            available_actions=parsed_config["agent_actions"],
+            available_actions=builder.results(agent_actions),
         ),
+        depends_on=backgrounds + agent_inputs + simulators + agent_actions,
     )
+    builder.build()
 
-    if len(cortex_llm) != 1:
-        raise ValueError("Expected exactly one cortex_llm instance.")
-
-    parsed_config["cortex_llm"] = cortex_llm[0]
+    parsed_config = {
+        **raw_config,
+        "backgrounds": builder.results(backgrounds),
+        "agent_inputs": builder.results(agent_inputs),
+        "simulators": builder.results(simulators),
+        "agent_actions": builder.results(agent_actions),
+        "cortex_llm": builder.result(cortex_llm),
+        "reflexes": [load_reflex(reflex) for reflex in raw_config.get("reflexes", [])],
+        "topology": topology,
+    }
 
     return RuntimeConfig(**parsed_config)
 
@@ -346,4 +416,5 @@ def build_runtime_config_from_test_case(config: dict) -> RuntimeConfig:
         simulators=simulators,
         agent_actions=agent_actions,
         backgrounds=backgrounds,
+        reflexes=[load_reflex(reflex) for reflex in config.get("reflexes", [])],
     )
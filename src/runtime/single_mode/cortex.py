@@ -1,18 +1,22 @@
 import asyncio
+import json
 import logging
 import os
 from typing import List, Optional, Union
 
-import json5
-
 from actions.orchestrator import ActionOrchestrator
 from backgrounds.orchestrator import BackgroundOrchestrator
 from fuser import Fuser
+from inputs.base import Sensor
 from inputs.orchestrator import InputOrchestrator
 from providers.config_provider import ConfigProvider
 from providers.io_provider import IOProvider
+from providers.singleton import find_instance
 from providers.sleep_ticker_provider import SleepTickerProvider
+from reflexes.orchestrator import ReflexOrchestrator
+from runtime.config_cache import load_raw_config
 from runtime.single_mode.config import RuntimeConfig, load_config
+from runtime.topology import TopologySupervisor
 from simulators.orchestrator import SimulatorOrchestrator
 
 
@@ -36,6 +40,7 @@ class CortexRuntime:
     action_orchestrator: ActionOrchestrator
     simulator_orchestrator: SimulatorOrchestrator
     background_orchestrator: BackgroundOrchestrator
+    reflex_orchestrator: ReflexOrchestrator
     sleep_ticker_provider: SleepTickerProvider
     io_provider: IOProvider
     config_provider: ConfigProvider
@@ -70,6 +75,7 @@ class CortexRuntime:
         self.action_orchestrator = ActionOrchestrator(config)
         self.simulator_orchestrator = SimulatorOrchestrator(config)
         self.background_orchestrator = BackgroundOrchestrator(config)
+        self.reflex_orchestrator = ReflexOrchestrator(config, self.action_orchestrator)
         self.sleep_ticker_provider = SleepTickerProvider()
         self.io_provider = IOProvider()
         self.config_provider = ConfigProvider()
@@ -80,9 +86,16 @@ class CortexRuntime:
         self.simulator_task: Optional[Union[asyncio.Task, asyncio.Future]] = None
         self.action_task: Optional[Union[asyncio.Task, asyncio.Future]] = None
         self.background_task: Optional[Union[asyncio.Task, asyncio.Future]] = None
+        self.reflex_task: Optional[Union[asyncio.Task, asyncio.Future]] = None
+        self.topology_task: Optional[asyncio.Task] = None
         self.cortex_loop_task: Optional[asyncio.Task] = None
 
+        # Supervisor of the worker processes of the config topology, if any
+        self.topology_supervisor: Optional[TopologySupervisor] = None
+
         self._is_reloading = False
+        # Priority of the wake that started the current tick
+        self._tick_priority = 0
 
         if self.hot_reload:
             self.config_path = self._create_runtime_config_file()
@@ -130,12 +143,11 @@ class CortexRuntime:
 
         try:
             if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    raw = json5.load(f)
+                raw = load_raw_config(config_path)
 
                 tmp_path = runtime_config_path + ".tmp"
                 with open(tmp_path, "w") as wf:
-                    json5.dump(raw, wf, indent=2)
+                    json.dump(raw, wf, indent=2)
                 os.replace(tmp_path, runtime_config_path)
                 logging.debug(f"Wrote runtime config to: {runtime_config_path}")
             else:
@@ -182,6 +194,10 @@ class CortexRuntime:
                         awaitables.append(self.action_task)
                     if self.background_task and not self.background_task.done():
                         awaitables.append(self.background_task)
+                    if self.reflex_task and not self.reflex_task.done():
+                        awaitables.append(self.reflex_task)
+                    if self.topology_task and not self.topology_task.done():
+                        awaitables.append(self.topology_task)
 
                     await asyncio.gather(*awaitables)
 
@@ -267,6 +283,9 @@ class CortexRuntime:
             self.action_orchestrator = ActionOrchestrator(new_config)
             self.simulator_orchestrator = SimulatorOrchestrator(new_config)
             self.background_orchestrator = BackgroundOrchestrator(new_config)
+            self.reflex_orchestrator = ReflexOrchestrator(
+                new_config, self.action_orchestrator
+            )
 
             await self._start_orchestrators()
 
@@ -310,6 +329,14 @@ class CortexRuntime:
             logging.debug("Cancelling background task")
             tasks_to_cancel["background"] = self.background_task
 
+        if self.reflex_task and not self.reflex_task.done():
+            logging.debug("Cancelling reflex task")
+            tasks_to_cancel["reflex"] = self.reflex_task
+
+        if self.topology_task and not self.topology_task.done():
+            logging.debug("Cancelling topology task")
+            tasks_to_cancel["topology"] = self.topology_task
+
         # Cancel all tasks
         for name, task in tasks_to_cancel.items():
             task.cancel()
@@ -364,6 +391,10 @@ class CortexRuntime:
         self.simulator_task = None
         self.action_task = None
         self.background_task = None
+        self.reflex_task = None
+        self.topology_task = None
+
+        await self._stop_topology()
 
     async def _start_orchestrators(self) -> None:
         """
@@ -380,9 +411,24 @@ class CortexRuntime:
             self.action_task = self.action_orchestrator.start()
         if self.background_orchestrator:
             self.background_task = self.background_orchestrator.start()
+        if self.reflex_orchestrator:
+            self.reflex_task = self.reflex_orchestrator.start()
+        if self.config.topology and self.config.topology.active_workers:
+            self.topology_supervisor = TopologySupervisor(self.config.topology)
+            self.topology_task = self.topology_supervisor.start()
 
         logging.debug("Orchestrators started successfully")
 
+    async def _stop_topology(self) -> None:
+        """
+        Stop the worker processes of the config topology, if any.
+        """
+        if self.topology_supervisor is None:
+            return
+
+        supervisor, self.topology_supervisor = self.topology_supervisor, None
+        await asyncio.to_thread(supervisor.stop)
+
     async def _cleanup_tasks(self) -> None:
         """
         Cleanup all running tasks gracefully.
@@ -401,6 +447,10 @@ class CortexRuntime:
             tasks_to_cancel.append(self.action_task)
         if self.background_task and not self.background_task.done():
             tasks_to_cancel.append(self.background_task)
+        if self.reflex_task and not self.reflex_task.done():
+            tasks_to_cancel.append(self.reflex_task)
+        if self.topology_task and not self.topology_task.done():
+            tasks_to_cancel.append(self.topology_task)
 
         # Cancel all tasks
         for task in tasks_to_cancel:
@@ -413,9 +463,17 @@ class CortexRuntime:
             except Exception as e:
                 logging.warning(f"Error during final cleanup: {e}")
 
+        await self._stop_topology()
+
         # Stop ConfigProvider
         self.config_provider.stop()
 
+        # Close the pooled HTTP connections, if anything opened them
+        http_client = find_instance("HTTPClientProvider")
+        if http_client is not None:
+            await http_client.close()
+            http_client.close_sync()
+
         logging.debug("Tasks cleaned up successfully")
 
     async def _start_input_listeners(self) -> asyncio.Task:
@@ -462,8 +520,9 @@ class CortexRuntime:
                 # Helper to yield control to event loop
                 await asyncio.sleep(0)
 
+                # Wakes that arrive during the tick start the next one
+                self._tick_priority = self.sleep_ticker_provider.take_wake()
                 await self._tick()
-                self.sleep_ticker_provider.skip_sleep = False
         except asyncio.CancelledError:
             logging.info("Cortex loop cancelled, exiting gracefully")
             raise
@@ -471,6 +530,22 @@ class CortexRuntime:
             logging.error(f"Unexpected error in cortex loop: {e}")
             raise
 
+    def _supersedable(self, inputs: List[Sensor]) -> bool:
+        """
+        Whether an input could supersede the LLM request of the current tick.
+
+        Parameters
+        ----------
+        inputs : List[Sensor]
+            The agent inputs.
+
+        Returns
+        -------
+        bool
+            True if an input has a higher priority than the tick.
+        """
+        return any(input.priority > self._tick_priority for input in inputs)
+
     async def _tick(self) -> None:
         """
         Execute a single tick of the cortex processing cycle.
@@ -496,8 +571,22 @@ class CortexRuntime:
                 logging.debug("No prompt to fuse")
                 return
 
+            if self.config.skip_unchanged_ticks and not self.fuser.inputs_changed:
+                logging.debug("Skipping tick without new inputs")
+                return
+
             # if there is a prompt, send to the AIs
-            output = await self.config.cortex_llm.ask(prompt)
+            if self._supersedable(self.config.agent_inputs):
+                output, superseded = await self.sleep_ticker_provider.until_woken(
+                    self.config.cortex_llm.ask(prompt), self._tick_priority
+                )
+                if superseded:
+                    logging.info("LLM request superseded by a higher-priority input")
+                    # The stale prompt consumed the buffers of the other inputs
+                    self.fuser.keep_inputs()
+                    return
+            else:
+                output = await self.config.cortex_llm.ask(prompt)
             if output is None:
                 logging.debug("No output from LLM")
                 return
@@ -0,0 +1,768 @@
+"""
+Process topology: running chosen inputs and backgrounds in worker processes.
+
+Everything in the runtime shares one interpreter, so a CPU-heavy input, such
+as a local vision model, holds the GIL and delays the cortex loop. The
+``topology`` section of a configuration places such inputs and backgrounds
+into worker processes:
+
+.. code-block:: json5
+
+    topology: {
+      processes: {
+        perception: {
+          inputs: ["VLM_Local_YOLO"],
+          backgrounds: ["Gps"],
+          state: { GpsProvider: ["lat", "lon"] },
+        },
+      },
+    }
+
+A worker runs the listen loops of its inputs and the loops of its
+backgrounds, and sends the formatted text of each input to the cortex,
+where a ``RemoteInput`` stands in for the input. Wakes are forwarded to the
+cortex loop, and the ``state`` attributes of the worker providers are
+mirrored into providers of the same name, so reflexes can read them.
+Workers are supervised and restarted when they exit.
+"""
+
+import asyncio
+import contextvars
+import importlib
+import logging
+import multiprocessing as mp
+import pickle
+import threading
+import time
+import typing as T
+from dataclasses import dataclass, field
+from queue import Empty
+
+from backgrounds import load_background
+from backgrounds.base import BackgroundConfig
+from inputs import load_input
+from inputs.base import SensorConfig
+from inputs.base.buffer import BufferPolicy
+from inputs.base.loop import FuserInput
+from providers.io_provider import IOProvider
+from providers.singleton import find_instance, singleton
+from providers.sleep_ticker_provider import SleepTickerProvider
+from runtime.logging import LoggingConfig, get_logging_config, setup_logging
+
+
+@dataclass
+class WorkerSpec:
+    """
+    The inputs and backgrounds of a worker process.
+
+    Entries are ``{"type": ..., "config": {...}}`` dicts with the metadata of
+    the configuration already added. An entry may name the ``module`` of its
+    class, for classes outside the plugin packages.
+
+    Parameters
+    ----------
+    name : str
+        Name of the worker process.
+    inputs : List[Dict[str, Any]]
+        The inputs run by the worker.
+    backgrounds : List[Dict[str, Any]]
+        The backgrounds run by the worker.
+    state : Dict[str, List[str]]
+        Attributes of the worker providers to mirror, by provider class name.
+    state_hz : float
+        How often the provider state is sent, per second.
+    """
+
+    name: str
+    inputs: T.List[T.Dict[str, T.Any]] = field(default_factory=list)
+    backgrounds: T.List[T.Dict[str, T.Any]] = field(default_factory=list)
+    state: T.Dict[str, T.List[str]] = field(default_factory=dict)
+    state_hz: float = 10.0
+
+
+class RemoteInput(FuserInput[str]):
+    """
+    Stand-in for an input that runs in a worker process.
+
+    The worker sends the formatted buffer of the input whenever it changes.
+    The latest text is returned, once, by ``formatted_latest_buffer``, which
+    records the IO provider inputs the worker recorded with it. Texts of
+    inputs that join their messages, such as speech, are kept until read, so
+    no utterance is lost between two ticks.
+    """
+
+    def __init__(self, config: SensorConfig, worker: str, index: int):
+        """
+        Initialize the stand-in for the input ``index`` of ``worker``.
+        """
+        super().__init__(config)
+        self.worker = worker
+        self.index = index
+        self.input_type = getattr(config, "input_type", "RemoteInput")
+
+        self.io_provider = IOProvider()
+        self.use_notifier()
+
+        self._lock = threading.Lock()
+        self._text: T.Optional[str] = None
+        self._records: T.List[T.Tuple[str, str, T.Optional[float]]] = []
+
+    def receive(
+        self,
+        text: str,
+        records: T.List[T.Tuple[str, str, T.Optional[float]]],
+        join: bool = False,
+    ) -> None:
+        """
+        Store the latest text of the input; safe to call from any thread.
+
+        Parameters
+        ----------
+        text : str
+            The formatted buffer of the input.
+        records : List[Tuple[str, str, Optional[float]]]
+            The IO provider inputs recorded with it, as key, value and
+            timestamp.
+        join : bool
+            Whether to append the text to the unread text instead of
+            replacing it.
+        """
+        with self._lock:
+            if join and self._text is not None:
+                self._text = f"{self._text}\n{text}"
+            else:
+                self._text = text
+            self._records.extend(records)
+        if self.notifier is not None:
+            self.notifier.notify()
+
+    async def _poll(self) -> None:
+        """
+        Nothing to poll; the text arrives with ``receive``.
+        """
+        return None
+
+    async def raw_to_text(self, raw_input: T.Optional[str]) -> None:
+        """
+        Nothing to convert; the worker sends formatted text.
+        """
+        pass
+
+    def buffer_changed(self) -> bool:
+        """
+        Whether text arrived since the buffer was last read.
+
+        Returns
+        -------
+        bool
+            True if there is unread text
+        """
+        with self._lock:
+            return self._text is not None
+
+    def formatted_latest_buffer(self) -> T.Optional[str]:
+        """
+        Return and clear the latest text sent by the worker.
+
+        Returns
+        -------
+        Optional[str]
+            The formatted buffer of the input, or None if nothing arrived
+        """
+        with self._lock:
+            text, self._text = self._text, None
+            records, self._records = self._records, []
+
+        for key, value, timestamp in records:
+            self.io_provider.add_input(key, value, timestamp)
+        return text
+
+
+class ProviderMirror:
+    """
+    Provider state sent by a worker process.
+
+    Mirrors are ``@singleton`` classes named after the provider they mirror,
+    so ``find_instance`` finds them as it would find the provider.
+    """
+
+    def update(self, state: T.Dict[str, T.Any]) -> None:
+        """
+        Set the mirrored attributes.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            Attribute values by name.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+_mirror_classes: T.Dict[str, T.Callable[[], ProviderMirror]] = {}
+
+
+def provider_mirror(name: str) -> ProviderMirror:
+    """
+    Get the mirror of a provider of a worker process.
+
+    Parameters
+    ----------
+    name : str
+        Class name of the provider.
+
+    Returns
+    -------
+    ProviderMirror
+        The mirror, registered like a provider instance of that name.
+    """
+    if name not in _mirror_classes:
+        _mirror_classes[name] = singleton(type(name, (ProviderMirror,), {}))
+    return _mirror_classes[name]()
+
+
+@dataclass
+class Topology:
+    """
+    The worker processes of a runtime configuration.
+
+    Parameters
+    ----------
+    workers : List[WorkerSpec]
+        The worker processes.
+    restart_delay : float
+        Seconds before restarting a worker that exited, doubled on every
+        restart.
+    max_restarts : int
+        Restarts of a worker before it is given up.
+    """
+
+    workers: T.List[WorkerSpec]
+    restart_delay: float = 1.0
+    max_restarts: int = 5
+
+    # Stand-ins for the inputs placed into the workers
+    remote_inputs: T.List[RemoteInput] = field(default_factory=list, init=False)
+    _input_workers: T.Dict[str, WorkerSpec] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _background_workers: T.Dict[str, WorkerSpec] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    @classmethod
+    def from_config(cls, config: T.Dict[str, T.Any]) -> "Topology":
+        """
+        Create the topology from the ``topology`` section of a configuration.
+
+        Parameters
+        ----------
+        config : Dict[str, Any]
+            The ``topology`` section.
+
+        Returns
+        -------
+        Topology
+            The topology, with no inputs or backgrounds placed yet.
+
+        Raises
+        ------
+        ValueError
+            If an input or background is placed into two processes
+        """
+        topology = cls(
+            workers=[],
+            restart_delay=float(config.get("restart_delay", 1.0)),
+            max_restarts=int(config.get("max_restarts", 5)),
+        )
+        for name, process in config.get("processes", {}).items():
+            worker = WorkerSpec(
+                name=name,
+                state={
+                    provider: list(attributes)
+                    for provider, attributes in process.get("state", {}).items()
+                },
+                state_hz=float(process.get("state_hz", 10.0)),
+            )
+            topology.workers.append(worker)
+            for kind, placed in (
+                ("inputs", topology._input_workers),
+                ("backgrounds", topology._background_workers),
+            ):
+                for type_name in process.get(kind, []):
+                    if type_name in placed:
+                        raise ValueError(
+                            f"{type_name} is placed into processes "
+                            f"{placed[type_name].name} and {name}"
+                        )
+                    placed[type_name] = worker
+        return topology
+
+    def place_input(
+        self, input_type: str, config: T.Dict[str, T.Any]
+    ) -> T.Optional[RemoteInput]:
+        """
+        Place an input into its worker process, if it has one.
+
+        Parameters
+        ----------
+        input_type : str
+            Class name of the input.
+        config : Dict[str, Any]
+            Configuration of the input.
+
+        Returns
+        -------
+        Optional[RemoteInput]
+            The stand-in for the input, or None if it runs in the cortex
+            process.
+        """
+        worker = self._input_workers.get(input_type)
+        if worker is None:
+            return None
+
+        worker.inputs.append({"type": input_type, "config": config})
+        remote_input = RemoteInput(
+            SensorConfig(**config, input_type=input_type),
+            worker.name,
+            len(worker.inputs) - 1,
+        )
+        self.remote_inputs.append(remote_input)
+        return remote_input
+
+    def place_background(
+        self, background_type: str, config: T.Dict[str, T.Any]
+    ) -> bool:
+        """
+        Place a background into its worker process, if it has one.
+
+        Parameters
+        ----------
+        background_type : str
+            Class name of the background.
+        config : Dict[str, Any]
+            Configuration of the background.
+
+        Returns
+        -------
+        bool
+            True if the background runs in a worker process.
+        """
+        worker = self._background_workers.get(background_type)
+        if worker is None:
+            return False
+
+        worker.backgrounds.append({"type": background_type, "config": config})
+        return True
+
+    @property
+    def active_workers(self) -> T.List[WorkerSpec]:
+        """
+        The workers with anything to run.
+        """
+        return [
+            worker for worker in self.workers if worker.inputs or worker.backgrounds
+        ]
+
+
+def _load_class(entry: T.Dict[str, T.Any], load: T.Callable[[str], type]) -> type:
+    """
+    Load the class of a worker entry from its ``module`` or the plugins.
+    """
+    if "module" in entry:
+        return getattr(importlib.import_module(entry["module"]), entry["type"])
+    return load(entry["type"])
+
+
+class _Worker:
+    """
+    The event loop of a worker process.
+    """
+
+    def __init__(self, spec: WorkerSpec, data_queue: mp.Queue, control_queue: mp.Queue):
+        self.spec = spec
+        self.data_queue = data_queue
+        self.control_queue = control_queue
+        self.io_provider = IOProvider()
+        self.sleep_ticker_provider = SleepTickerProvider()
+        self._stop_event = threading.Event()
+
+    def _send(self, message: T.Tuple) -> None:
+        """
+        Send a message to the cortex process.
+        """
+        try:
+            pickle.dumps(message)
+        except Exception as e:
+            logging.warning(f"Worker {self.spec.name} cannot send {message[0]}: {e}")
+            return
+        self.data_queue.put(message)
+
+    def _forward_wake(self) -> None:
+        """
+        Forward a wake of the worker ticker to the cortex loop.
+        """
+        if self.sleep_ticker_provider.skip_sleep:
+            self._send(("wake", self.sleep_ticker_provider.take_wake()))
+
+    def _run_background(self, background: T.Any) -> None:
+        """
+        Run a background in a loop, as the background orchestrator does.
+        """
+        while not self._stop_event.is_set():
+            try:
+                background.run()
+            except Exception as e:
+                logging.error(f"Error in background {background.name}: {e}")
+                time.sleep(0.1)
+
+    async def _listen(self, index: int, input: T.Any) -> None:
+        """
+        Listen to an input and send its text whenever its buffer changes.
+
+        Inputs that join their messages wake the cortex while they hold unread
+        messages. The worker reads them right away, so it wakes the cortex for
+        them whenever it sends their text.
+        """
+        join = (
+            getattr(getattr(input, "messages", None), "policy", None)
+            is BufferPolicy.JOIN
+        )
+        async for event in input.listen():
+            await input.raw_to_text(event)
+            if input.buffer_changed():
+                before = self.io_provider.inputs
+                text = input.formatted_latest_buffer()
+                if text is not None:
+                    records = [
+                        (key, value.input, value.timestamp)
+                        for key, value in self.io_provider.inputs.items()
+                        if before.get(key) != value
+                    ]
+                    self._send(("input", index, text, records, join))
+                    if join:
+                        self.sleep_ticker_provider.wake(input.priority)
+            self._forward_wake()
+
+    def _state(self) -> T.Dict[str, T.Dict[str, T.Any]]:
+        """
+        Read the mirrored attributes of the worker providers.
+        """
+        state = {}
+        for name, attributes in self.spec.state.items():
+            provider = find_instance(name)
+            if provider is not None:
+                state[name] = {
+                    attribute: getattr(provider, attribute, None)
+                    for attribute in attributes
+                }
+        return state
+
+    async def _supervise(self) -> None:
+        """
+        Send provider state until told to stop or the cortex process exits.
+        """
+        parent = mp.parent_process()
+        interval = 1 / self.spec.state_hz if self.spec.state_hz > 0 else None
+        next_state = time.monotonic()
+        while True:
+            try:
+                if self.control_queue.get_nowait() == "stop":
+                    return
+            except Empty:
+                pass
+            if parent is not None and not parent.is_alive():
+                return
+
+            if self.spec.state and interval and time.monotonic() >= next_state:
+                self._send(("state", self._state()))
+                next_state = time.monotonic() + interval
+            self._forward_wake()
+            await asyncio.sleep(0.05)
+
+    async def run(self) -> None:
+        """
+        Build the inputs and backgrounds and run them until stopped.
+        """
+        backgrounds = [
+            _load_class(entry, load_background)(
+                config=BackgroundConfig(**entry.get("config", {}))
+            )
+            for entry in self.spec.backgrounds
+        ]
+        inputs = [
+            _load_class(entry, load_input)(
+                config=SensorConfig(**entry.get("config", {}))
+            )
+            for entry in self.spec.inputs
+        ]
+
+        for background in backgrounds:
+            threading.Thread(
+                target=self._run_background, args=(background,), daemon=True
+            ).start()
+
+        listeners = [
+            asyncio.create_task(self._listen(index, input))
+            for index, input in enumerate(inputs)
+        ]
+        try:
+            await self._supervise()
+        finally:
+            self._stop_event.set()
+            for listener in listeners:
+                listener.cancel()
+
+
+def run_worker(
+    spec: WorkerSpec,
+    data_queue: mp.Queue,
+    control_queue: mp.Queue,
+    logging_config: T.Optional[LoggingConfig] = None,
+) -> None:
+    """
+    Entry point of a worker process.
+
+    Parameters
+    ----------
+    spec : WorkerSpec
+        The inputs and backgrounds to run.
+    data_queue : mp.Queue
+        Queue for sending input text, wakes and provider state.
+    control_queue : mp.Queue
+        Queue for receiving control commands.
+    logging_config : Optional[LoggingConfig]
+        Optional logging configuration. If provided, it will override the default logging settings.
+    """
+    setup_logging(f"worker_{spec.name}", logging_config=logging_config)
+    try:
+        asyncio.run(_Worker(spec, data_queue, control_queue).run())
+    except KeyboardInterrupt:
+        pass
+    logging.info(f"Worker {spec.name} stopped")
+
+
+@dataclass
+class _Process:
+    """
+    The current incarnation of a worker process.
+    """
+
+    spec: WorkerSpec
+    process: T.Any = None
+    data_queue: T.Any = None
+    control_queue: T.Any = None
+    reader: T.Optional[threading.Thread] = None
+    restarts: int = 0
+    messages: int = 0
+    restart_at: T.Optional[float] = None
+    failed: bool = False
+
+
+class TopologySupervisor:
+    """
+    Starts the worker processes of a topology and restarts them on exit.
+
+    Messages of a worker are read on a thread of its own and handed to the
+    ``RemoteInput`` stand-ins, the sleep ticker and the provider mirrors.
+    """
+
+    def __init__(self, topology: Topology):
+        """
+        Initialize the supervisor.
+
+        Parameters
+        ----------
+        topology : Topology
+            The topology to run.
+        """
+        self.topology = topology
+        self.sleep_ticker_provider = SleepTickerProvider()
+        self._context = mp.get_context("spawn")
+        self._remote_inputs = {
+            (remote_input.worker, remote_input.index): remote_input
+            for remote_input in topology.remote_inputs
+        }
+        self._processes = [_Process(spec) for spec in topology.active_workers]
+        self._mirrors: T.Dict[str, ProviderMirror] = {}
+        self._stopping = threading.Event()
+
+        for spec in topology.active_workers:
+            for name in spec.state:
+                provider = find_instance(name)
+                if provider is not None and not isinstance(provider, ProviderMirror):
+                    logging.warning(
+                        f"{name} also runs in the cortex process; "
+                        f"the state of worker {spec.name} is not mirrored"
+                    )
+                    continue
+                self._mirrors[name] = provider_mirror(name)
+
+    def _spawn(self, worker: _Process) -> None:
+        """
+        Start a new incarnation of a worker, with new queues.
+        """
+        worker.data_queue = self._context.Queue()
+        worker.control_queue = self._context.Queue()
+        worker.process = self._context.Process(
+            target=run_worker,
+            args=(
+                worker.spec,
+                worker.data_queue,
+                worker.control_queue,
+                get_logging_config(),
+            ),
+            name=f"worker_{worker.spec.name}",
+            daemon=True,
+        )
+        worker.process.start()
+        worker.reader = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._read, worker, worker.process, worker.data_queue),
+            daemon=True,
+        )
+        worker.reader.start()
+        logging.info(
+            f"Started worker {worker.spec.name} (pid {worker.process.pid}) with "
+            f"{[entry['type'] for entry in worker.spec.inputs + worker.spec.backgrounds]}"
+        )
+
+    def _read(self, worker: _Process, process: T.Any, data_queue: T.Any) -> None:
+        """
+        Handle the messages of a worker incarnation until it exits.
+        """
+        while not self._stopping.is_set():
+            try:
+                message = data_queue.get(timeout=0.2)
+            except Empty:
+                if not process.is_alive():
+                    return
+                continue
+            except (EOFError, OSError):
+                return
+
+            worker.messages += 1
+            try:
+                self._handle(worker.spec.name, message)
+            except Exception as e:
+                logging.error(
+                    f"Error handling {message[0]} of worker {worker.spec.name}: {e}"
+                )
+
+    def _handle(self, name: str, message: T.Tuple) -> None:
+        """
+        Hand a worker message to the cortex process.
+        """
+        kind = message[0]
+        if kind == "input":
+            _, index, text, records, join = message
+            self._remote_inputs[(name, index)].receive(text, records, join)
+        elif kind == "wake":
+            self.sleep_ticker_provider.wake(message[1])
+        elif kind == "state":
+            for provider, state in message[1].items():
+                if provider in self._mirrors:
+                    self._mirrors[provider].update(state)
+
+    def _check(self) -> None:
+        """
+        Restart the workers that exited, with backoff, up to ``max_restarts``.
+        """
+        for worker in self._processes:
+            if worker.failed or worker.process is None or worker.process.is_alive():
+                continue
+
+            now = time.monotonic()
+            if worker.restart_at is None:
+                if worker.restarts >= self.topology.max_restarts:
+                    worker.failed = True
+                    logging.error(
+                        f"Worker {worker.spec.name} exited with code "
+                        f"{worker.process.exitcode} and was restarted "
+                        f"{worker.restarts} times; giving up"
+                    )
+                    continue
+                delay = self.topology.restart_delay * 2**worker.restarts
+                worker.restart_at = now + delay
+                logging.warning(
+                    f"Worker {worker.spec.name} exited with code "
+                    f"{worker.process.exitcode}; restarting in {delay:.1f}s"
+                )
+            elif now >= worker.restart_at:
+                worker.restart_at = None
+                worker.restarts += 1
+                self._spawn(worker)
+
+    async def _watch(self) -> None:
+        """
+        Check the workers until cancelled.
+        """
+        while True:
+            self._check()
+            await asyncio.sleep(0.2)
+
+    def start(self) -> asyncio.Task:
+        """
+        Start the worker processes and the task that restarts them.
+
+        Returns
+        -------
+        asyncio.Task
+            The task that restarts the workers.
+        """
+        self._stopping.clear()
+        for worker in self._processes:
+            if worker.process is None:
+                self._spawn(worker)
+        return asyncio.create_task(self._watch())
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stop the worker processes, terminating those that do not exit.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for each worker to exit.
+        """
+        for worker in self._processes:
+            if worker.process is not None and worker.process.is_alive():
+                worker.control_queue.put("stop")
+        for worker in self._processes:
+            if worker.process is None:
+                continue
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                logging.warning(f"Terminating worker {worker.spec.name}")
+                worker.process.terminate()
+                worker.process.join(timeout)
+        self._stopping.set()
+        for worker in self._processes:
+            if worker.reader is not None:
+                worker.reader.join(timeout)
+            if worker.process is not None:
+                worker.data_queue.close()
+                worker.control_queue.close()
+            worker.process = None
+
+    @property
+    def stats(self) -> T.Dict[str, T.Dict[str, T.Any]]:
+        """
+        Get the worker metrics.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Per worker, its pid, whether it is alive, its restarts, the
+            messages received from it and whether it was given up.
+        """
+        return {
+            worker.spec.name: {
+                "pid": worker.process.pid if worker.process is not None else None,
+                "alive": worker.process is not None and worker.process.is_alive(),
+                "restarts": worker.restarts,
+                "messages": worker.messages,
+                "failed": worker.failed,
+            }
+            for worker in self._processes
+        }
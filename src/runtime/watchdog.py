@@ -0,0 +1,312 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Deque, Dict, List, Optional, Tuple
+
+# Frames of these modules only drive plugins, so stalls are not blamed on them
+_DRIVER_PREFIXES = ("__main__", "runtime.")
+_DRIVER_SUFFIXES = (".orchestrator",)
+
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+UNKNOWN_CULPRIT = "<unknown>"
+
+
+@dataclass
+class StallStats:
+    """
+    Stalls attributed to one culprit.
+
+    Parameters
+    ----------
+    culprit : str
+        Plugin class name, or ``module.function`` for code outside a class.
+    count : int
+        Number of stalls.
+    total : float
+        Total stall time in seconds.
+    worst : float
+        Longest stall in seconds.
+    stack : List[str]
+        Stack of the loop thread during the longest stall.
+    """
+
+    culprit: str
+    count: int = 0
+    total: float = 0.0
+    worst: float = 0.0
+    stack: List[str] = field(default_factory=list)
+
+
+def attribute_stack(frame: Optional[FrameType]) -> Tuple[str, List[str]]:
+    """
+    Find the plugin responsible for a stack.
+
+    The culprit is the innermost frame from this code base that is not part of
+    the runtime or an orchestrator, named after the class of its ``self`` (so
+    base class methods are blamed on the plugin subclass) or, for plain
+    functions, as ``module.function``.
+
+    Parameters
+    ----------
+    frame : FrameType, optional
+        The innermost frame of the stalled thread.
+
+    Returns
+    -------
+    Tuple[str, List[str]]
+        The culprit and the formatted stack, outermost frame first.
+    """
+    if frame is None:
+        return UNKNOWN_CULPRIT, []
+
+    stack = traceback.format_stack(frame)
+    culprit = UNKNOWN_CULPRIT
+
+    f: Optional[FrameType] = frame
+    while f is not None:
+        module = f.f_globals.get("__name__", "")
+        if (
+            f.f_code.co_filename.startswith(_SRC_DIR)
+            and not module.startswith(_DRIVER_PREFIXES)
+            and not module.endswith(_DRIVER_SUFFIXES)
+        ):
+            owner = f.f_locals.get("self")
+            if owner is not None:
+                culprit = type(owner).__name__
+            else:
+                culprit = f"{module}.{f.f_code.co_name}"
+            break
+        f = f.f_back
+
+    return culprit, stack
+
+
+class LoopWatchdog:
+    """
+    Measures event loop lag and attributes stalls to the plugins causing them.
+
+    A heartbeat coroutine sleeps ``interval`` seconds at a time and records how
+    late it wakes up. A monitor thread checks the heartbeat; when it is more
+    than ``threshold`` seconds overdue, the loop is blocked and the monitor
+    captures the stack of the loop thread, which is the stack of the callback
+    or task that is blocking it. When the heartbeat resumes, the stall is
+    recorded against the plugin found in that stack.
+
+    Use it as an async context manager around the runtime; on exit the ranked
+    report is logged and, if ``report_path`` is set, written to that file.
+
+    Parameters
+    ----------
+    threshold : float
+        Lag in seconds above which the loop counts as stalled.
+    interval : float
+        Heartbeat period in seconds.
+    report_path : str, optional
+        File the report is written to on exit.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        interval: float = 0.02,
+        report_path: Optional[str] = None,
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        self.report_path = report_path
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._monitor_thread: Optional[threading.Thread] = None
+
+        self._last_beat = 0.0
+        self._pending: Optional[Tuple[str, List[str]]] = None
+
+        self._lags: Deque[float] = deque(maxlen=10000)
+        self._max_lag = 0.0
+        self._started_at = 0.0
+        self.stalls: Dict[str, StallStats] = {}
+
+    def start(self) -> None:
+        """
+        Start watching the running event loop.
+        """
+        self._loop_thread_id = threading.get_ident()
+        self._started_at = time.monotonic()
+        self._last_beat = self._started_at
+        self._stop_event.clear()
+
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        self._monitor_thread = threading.Thread(
+            target=self._monitor, name="loop-watchdog", daemon=True
+        )
+        self._monitor_thread.start()
+        logging.info(
+            f"LoopWatchdog: watching event loop (threshold {self.threshold * 1000:.0f} ms)"
+        )
+
+    async def stop(self) -> None:
+        """
+        Stop watching the event loop.
+        """
+        self._stop_event.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if self._monitor_thread is not None:
+            self._monitor_thread.join(timeout=1.0)
+            self._monitor_thread = None
+
+    async def __aenter__(self) -> "LoopWatchdog":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+        report = self.report()
+        logging.info(f"LoopWatchdog report:\n{report}")
+        if self.report_path:
+            directory = os.path.dirname(self.report_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.report_path, "w", encoding="utf-8") as f:
+                f.write(report + "\n")
+            logging.info(f"LoopWatchdog: report written to {self.report_path}")
+
+    async def _heartbeat(self) -> None:
+        while True:
+            before = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - before - self.interval)
+
+            with self._lock:
+                self._last_beat = now
+                self._lags.append(lag)
+                self._max_lag = max(self._max_lag, lag)
+                pending, self._pending = self._pending, None
+
+            if lag >= self.threshold:
+                self._record(lag, pending)
+
+    def _monitor(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            with self._lock:
+                overdue = time.monotonic() - self._last_beat - self.interval
+                if overdue < self.threshold or self._pending is not None:
+                    continue
+
+            # Sample outside the lock; the loop thread is blocked anyway
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            sample = attribute_stack(frame)
+            del frame
+
+            with self._lock:
+                if self._pending is None:
+                    self._pending = sample
+
+    def _record(self, lag: float, sample: Optional[Tuple[str, List[str]]]) -> None:
+        culprit, stack = sample or (UNKNOWN_CULPRIT, [])
+        stats = self.stalls.setdefault(culprit, StallStats(culprit))
+        stats.count += 1
+        stats.total += lag
+        if lag > stats.worst:
+            stats.worst = lag
+            stats.stack = stack
+
+        logging.warning(
+            f"LoopWatchdog: event loop blocked for {lag * 1000:.0f} ms by {culprit}"
+        )
+
+    def ranked(self) -> List[StallStats]:
+        """
+        Get the stall statistics, worst culprit first.
+
+        Returns
+        -------
+        List[StallStats]
+            Stats per culprit, by total stall time.
+        """
+        return sorted(self.stalls.values(), key=lambda s: s.total, reverse=True)
+
+    def lag_summary(self) -> Dict[str, float]:
+        """
+        Summarize the measured loop lag.
+
+        Returns
+        -------
+        Dict[str, float]
+            Number of samples and p50, p99 and max lag in milliseconds.
+        """
+        with self._lock:
+            lags = sorted(self._lags)
+            max_lag = self._max_lag
+        if not lags:
+            return {"samples": 0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        return {
+            "samples": len(lags),
+            "p50_ms": lags[len(lags) // 2] * 1000,
+            "p99_ms": lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000,
+            "max_ms": max_lag * 1000,
+        }
+
+    def report(self, stack_depth: int = 12) -> str:
+        """
+        Format the ranked stall report.
+
+        Parameters
+        ----------
+        stack_depth : int
+            Number of innermost frames shown per culprit.
+
+        Returns
+        -------
+        str
+            The report.
+        """
+        lag = self.lag_summary()
+        uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+        lines = [
+            f"Event loop lag over {uptime:.0f} s ({lag['samples']} samples): "
+            f"p50 {lag['p50_ms']:.1f} ms, p99 {lag['p99_ms']:.1f} ms, "
+            f"max {lag['max_ms']:.1f} ms",
+        ]
+
+        ranked = self.ranked()
+        if not ranked:
+            lines.append(f"No stalls above {self.threshold * 1000:.0f} ms.")
+            return "\n".join(lines)
+
+        width = max(len("culprit"), *(len(s.culprit) for s in ranked))
+        lines.append("")
+        lines.append(
+            f"{'culprit':<{width}} {'stalls':>7} {'total ms':>10} {'worst ms':>10}"
+        )
+        for s in ranked:
+            lines.append(
+                f"{s.culprit:<{width}} {s.count:>7d} {s.total * 1000:>10.0f} "
+                f"{s.worst * 1000:>10.0f}"
+            )
+
+        for s in ranked:
+            if not s.stack:
+                continue
+            lines.append("")
+            lines.append(f"Worst stall of {s.culprit} ({s.worst * 1000:.0f} ms):")
+            lines.append("".join(s.stack[-stack_depth:]).rstrip())
+
+        return "\n".join(lines)
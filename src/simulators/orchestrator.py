@@ -1,4 +1,5 @@
 import asyncio
+import contextvars
 import logging
 import threading
 import typing as T
@@ -44,7 +45,9 @@ class SimulatorOrchestrator:
                     f"Simulator {simulator.name} already submitted, skipping."
                 )
                 continue
-            self._simulator_executor.submit(self._run_simulator_loop, simulator)
+            self._simulator_executor.submit(
+                contextvars.copy_context().run, self._run_simulator_loop, simulator
+            )
             self._submitted_simulators.add(simulator.name)
 
         return asyncio.Future()
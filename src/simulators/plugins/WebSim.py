@@ -3,8 +3,9 @@ import logging
 import os
 import threading
 import time
+from contextlib import asynccontextmanager
 from dataclasses import asdict, dataclass
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import uvicorn
 from fastapi import FastAPI, WebSocket
@@ -28,6 +29,84 @@ class SimulatorState:
         return asdict(self)
 
 
+def _escape_pointer(key: str) -> str:
+    """Escape a key for use as a JSON pointer segment (RFC 6901)."""
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def json_patch(old: Any, new: Any, path: str = "") -> List[dict]:
+    """
+    Compute a JSON patch (RFC 6902) transforming ``old`` into ``new``.
+
+    Dicts are diffed per key and lists per index, so only the fields that
+    actually changed are emitted. Any other change replaces the value at
+    ``path`` wholesale.
+
+    Parameters
+    ----------
+    old : Any
+        The state previously sent to the client.
+    new : Any
+        The latest state.
+    path : str
+        JSON pointer of the values being compared.
+
+    Returns
+    -------
+    List[dict]
+        Patch operations; empty if nothing changed.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[dict] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape_pointer(key)}"})
+        for key, value in new.items():
+            key_path = f"{path}/{_escape_pointer(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": key_path, "value": value})
+            else:
+                ops.extend(json_patch(old[key], value, key_path))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for i in range(common):
+            ops.extend(json_patch(old[i], new[i], f"{path}/{i}"))
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        return ops
+
+    if type(old) is not type(new) or old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+
+    return []
+
+
+class _WebSimClient:
+    """
+    A connected dashboard and the state it last received.
+
+    Updates for a slow client are coalesced: only the latest pending
+    state is kept while a send is in flight.
+    """
+
+    def __init__(self, websocket: WebSocket, state: dict):
+        self.websocket = websocket
+        self.last_sent: dict = state
+        self.pending: Optional[dict] = None
+        self.ready = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def offer(self, state: dict) -> None:
+        """Replace any pending state with the latest one."""
+        self.pending = state
+        self.ready.set()
+
+
 class WebSim(Simulator):
     """
     WebSim simulator class for visualizing simulation data in a web interface.
@@ -40,8 +119,17 @@ class WebSim(Simulator):
 
         self._initialized = False
         self._lock = threading.Lock()
-        self._last_tick = time.time()
-        self._tick_interval = 0.1  # 100ms tick rate
+        self._tick_interval = 0.5
+
+        # Maximum number of state broadcasts per second (0 disables the limit)
+        self._max_update_hz = float(getattr(config, "max_update_hz", 10.0))
+        self.port = getattr(config, "port", 8000)
+
+        # Broadcasting runs on the uvicorn event loop; these are created there
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._state_queue: Optional[asyncio.Queue] = None
+        self._broadcast_task: Optional[asyncio.Task] = None
+        self._clients: List[_WebSimClient] = []
 
         self.state_dict = {}
         # Initialize state
@@ -61,7 +149,7 @@ class WebSim(Simulator):
         logging.info("Initializing WebSim...")
 
         # Initialize FastAPI app
-        self.app = FastAPI()
+        self.app = FastAPI(lifespan=self._lifespan)
 
         # Mount assets directory
         assets_path = os.path.join(os.path.dirname(__file__), "assets")
@@ -74,13 +162,10 @@ class WebSim(Simulator):
         if not os.path.exists(logo_path):
             logging.warning(f"Logo not found at {logo_path}")
 
-        self.active_connections: List[WebSocket] = []
-
         # Setup routes
         @self.app.get("/")
         async def get_index():
-            return HTMLResponse(
-                """
+            return HTMLResponse("""
             <!DOCTYPE html>
             <html>
                 <head>
@@ -214,6 +299,36 @@ class WebSim(Simulator):
                 <body class="bg-gray-50">
                     <div id="root"></div>
                     <script type="text/babel">
+                        function applyPatch(doc, ops) {
+                            let next = JSON.parse(JSON.stringify(doc));
+                            ops.forEach(({ op, path, value }) => {
+                                if (path === '') {
+                                    next = value;
+                                    return;
+                                }
+                                const keys = path.split('/').slice(1).map(
+                                    k => k.replace(/~1/g, '/').replace(/~0/g, '~')
+                                );
+                                const last = keys.pop();
+                                const parent = keys.reduce((node, k) => node[k], next);
+                                if (Array.isArray(parent)) {
+                                    const index = Number(last);
+                                    if (op === 'remove') {
+                                        parent.splice(index, 1);
+                                    } else if (op === 'add') {
+                                        parent.splice(index, 0, value);
+                                    } else {
+                                        parent[index] = value;
+                                    }
+                                } else if (op === 'remove') {
+                                    delete parent[last];
+                                } else {
+                                    parent[last] = value;
+                                }
+                            });
+                            return next;
+                        }
+
                         function App() {
                             const [state, setState] = React.useState({
                                 inputs: {},
@@ -267,7 +382,11 @@ class WebSim(Simulator):
 
                                 ws.onmessage = (event) => {
                                     const data = JSON.parse(event.data);
-                                    setState(data);
+                                    if (data.type === 'snapshot') {
+                                        setState(data.state);
+                                    } else if (data.type === 'patch') {
+                                        setState(prev => applyPatch(prev, data.ops));
+                                    }
                                 };
 
                                 ws.onerror = (error) => {
@@ -458,21 +577,27 @@ class WebSim(Simulator):
                     </script>
                 </body>
             </html>
-            """
-            )
+            """)
 
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
             await websocket.accept()
-            self.active_connections.append(websocket)
+            with self._lock:
+                snapshot = self.state_dict or self.state.to_dict()
+            client = _WebSimClient(websocket, snapshot)
             try:
-                await websocket.send_json(self.state.to_dict())
+                await websocket.send_json({"type": "snapshot", "state": snapshot})
+                self._clients.append(client)
+                client.task = asyncio.create_task(self._send_to_client(client))
                 while True:
                     await websocket.receive_text()
             except Exception as e:
                 logging.error(f"WebSocket error: {e}")
             finally:
-                self.active_connections.remove(websocket)
+                if client in self._clients:
+                    self._clients.remove(client)
+                if client.task:
+                    client.task.cancel()
 
         # Start server thread
         try:
@@ -484,7 +609,7 @@ class WebSim(Simulator):
             if self.server_thread.is_alive():
                 # Using ANSI color codes for cyan text and bold
                 logging.info(
-                    "\033[1;36mWebSim server started successfully - Open http://localhost:8000 in your browser\033[0m"
+                    f"\033[1;36mWebSim server started successfully - Open http://localhost:{self.port} in your browser\033[0m"
                 )
                 self._initialized = True
             else:
@@ -492,12 +617,30 @@ class WebSim(Simulator):
         except Exception as e:
             logging.error(f"Error starting WebSim server thread: {e}")
 
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """Start the state broadcaster on the server's own event loop"""
+        self._loop = asyncio.get_running_loop()
+        self._state_queue = asyncio.Queue(maxsize=1)
+        self._broadcast_task = asyncio.create_task(self._broadcast_loop())
+
+        with self._lock:
+            latest = self.state_dict
+        if latest:
+            self._enqueue_state(latest)
+
+        try:
+            yield
+        finally:
+            self._broadcast_task.cancel()
+            self._loop = None
+
     def _run_server(self):
         """Run the FastAPI server"""
         config = uvicorn.Config(
             app=self.app,
             host="0.0.0.0",  # Still bind to all interfaces
-            port=8000,
+            port=self.port,
             log_level="error",
             server_header=False,
             # Override the default startup message
@@ -526,30 +669,73 @@ class WebSim(Simulator):
         server = uvicorn.Server(config)
         server.run()
 
-    async def broadcast_state(self):
-        """Broadcast current state to all connected clients"""
-        if not self.active_connections:
-            return
+    def _publish_state(self, state: dict) -> None:
+        """
+        Hand a new state over to the server loop.
 
+        Safe to call from any thread; never blocks the caller.
+        """
+        loop = self._loop
+        if loop is None:
+            return
         try:
+            loop.call_soon_threadsafe(self._enqueue_state, state)
+        except RuntimeError:
+            # Server loop already closed
+            pass
+
+    def _enqueue_state(self, state: dict) -> None:
+        """Queue the latest state, dropping any older one not yet broadcast"""
+        if self._state_queue is None:
+            return
+        if self._state_queue.full():
+            self._state_queue.get_nowait()
+        self._state_queue.put_nowait(state)
+
+    async def _broadcast_loop(self) -> None:
+        """Fan out state updates to clients at no more than max_update_hz"""
+        min_interval = 1.0 / self._max_update_hz if self._max_update_hz > 0 else 0.0
+        last_broadcast = 0.0
+
+        while True:
+            assert self._state_queue is not None
+            state = await self._state_queue.get()
+
+            delay = last_broadcast + min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                # Coalesce anything that arrived while rate limited
+                while not self._state_queue.empty():
+                    state = self._state_queue.get_nowait()
+
+            last_broadcast = time.monotonic()
+            for client in self._clients:
+                client.offer(state)
+
+    async def _send_to_client(self, client: _WebSimClient) -> None:
+        """Send JSON patches to one client, always diffing against what it has"""
+        while True:
+            await client.ready.wait()
+            client.ready.clear()
+
+            state = client.pending
+            client.pending = None
+            if state is None:
+                continue
 
-            # Broadcast to all clients
-            disconnected = []
-            for connection in self.active_connections:
-                try:
-                    await connection.send_json(self.state_dict)
-                except Exception as e:
-                    logging.error(f"Error broadcasting to client: {e}")
-                    disconnected.append(connection)
-
-            for connection in disconnected:
-                try:
-                    self.active_connections.remove(connection)
-                except ValueError:
-                    pass
+            ops = json_patch(client.last_sent, state)
+            if not ops:
+                continue
 
-        except Exception as e:
-            logging.error(f"Error in broadcast_state: {e}")
+            try:
+                await client.websocket.send_json({"type": "patch", "ops": ops})
+            except Exception as e:
+                logging.error(f"Error broadcasting to client: {e}")
+                if client in self._clients:
+                    self._clients.remove(client)
+                return
+
+            client.last_sent = state
 
     def get_earliest_time(self, inputs: Dict[str, Input]) -> float:
         """Get earliest timestamp from inputs"""
@@ -566,26 +752,8 @@ class WebSim(Simulator):
         return earliest_time if earliest_time != float("inf") else 0.0
 
     def tick(self) -> None:
-        """Update simulator state"""
-        if self._initialized:
-            try:
-                # Get or create event loop
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                try:
-                    loop.run_until_complete(self.broadcast_state())
-                except Exception:
-                    loop = asyncio.get_event_loop()
-                    loop.create_task(self.broadcast_state())
-
-            except Exception as e:
-                logging.error(f"Error in tick: {e}")
-
-            time.sleep(0.5)
+        """Idle; state is pushed to clients from the server loop as it changes"""
+        time.sleep(self._tick_interval)
 
     def sim(self, actions: List[Action]) -> None:
         """Handle simulation updates from commands"""
@@ -594,7 +762,6 @@ class WebSim(Simulator):
             return
 
         try:
-            updated = False
             with self._lock:
                 earliest_time = self.get_earliest_time(self.io_provider.inputs)
                 logging.debug(f"earliest_time: {earliest_time}")
@@ -637,20 +804,11 @@ class WebSim(Simulator):
 
                 for action in actions:
                     if action.type == "move":
-                        new_action = action.value
-                        if new_action != self.state.current_action:
-                            self.state.current_action = new_action
-                            updated = True
+                        self.state.current_action = action.value
                     elif action.type == "speak":
-                        new_speech = action.value
-                        if new_speech != self.state.last_speech:
-                            self.state.last_speech = new_speech
-                            updated = True
+                        self.state.last_speech = action.value
                     elif action.type == "emotion":
-                        new_emotion = action.value
-                        if new_emotion != self.state.current_emotion:
-                            self.state.current_emotion = new_emotion
-                            updated = True
+                        self.state.current_emotion = action.value
 
                 self.state_dict = {
                     "current_action": self.state.current_action,
@@ -659,24 +817,43 @@ class WebSim(Simulator):
                     "system_latency": system_latency,
                     "inputs": input_rezeroed,
                 }
+                state_dict = self.state_dict
 
                 logging.info(f"Inputs and LLM Outputs: {self.state_dict}")
 
-            if updated:
-                self._last_tick = 0
-                self.tick()
+            self._publish_state(state_dict)
 
         except Exception as e:
             logging.error(f"Error in sim update: {e}")
 
+    async def _close_clients(self) -> None:
+        """Close the client connections; runs on the server loop"""
+        for client in self._clients[:]:
+            if client.task:
+                client.task.cancel()
+            try:
+                await client.websocket.close()
+            except Exception as e:
+                logging.error(f"Error closing connection: {e}")
+        self._clients.clear()
+
     async def cleanup(self):
         """Clean up resources"""
         logging.info("Cleaning up WebSim...")
         self._initialized = False
 
-        for connection in self.active_connections[:]:
-            try:
-                await connection.close()
-            except Exception as e:
-                logging.error(f"Error closing connection: {e}")
-        self.active_connections.clear()
+        # The clients belong to the server loop, so they are closed there
+        loop = self._loop
+        if loop is None:
+            self._clients.clear()
+            return
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._close_clients(), loop)
+        except RuntimeError:
+            # Server loop already closed
+            self._clients.clear()
+            return
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(future), timeout=5.0)
+        except Exception as e:
+            logging.error(f"Error closing WebSim connections: {e}")
@@ -0,0 +1,153 @@
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from actions.base import ActionConfig
+from providers.odom_provider import RobotState
+
+# The Unitree SDK is only available on the robot
+_SDK_MODULES = [
+    "unitree.unitree_sdk2py",
+    "unitree.unitree_sdk2py.go2",
+    "unitree.unitree_sdk2py.go2.sport",
+    "unitree.unitree_sdk2py.go2.sport.sport_client",
+]
+
+UP = 1
+XBOX_IDLE = [0] * 16
+
+
+def _xbox_report(lt=0, rt=0, d_pad=0, button=0):
+    data = list(XBOX_IDLE)
+    data[9], data[11], data[13], data[14] = lt, rt, d_pad, button
+    return bytes(data)
+
+
+class FakeGamepad:
+    """Returns queued reports, or nothing after the read timeout."""
+
+    def __init__(self):
+        self.reports = []
+
+    def read(self, size, timeout):
+        if self.reports:
+            return self.reports.pop(0)
+        time.sleep(timeout / 1000)
+        return b""
+
+
+@pytest.fixture
+def connector():
+    with patch.dict(sys.modules, {name: MagicMock() for name in _SDK_MODULES}):
+        sys.modules.pop(
+            "actions.move_game_controller.connector.go2_game_controller", None
+        )
+        from actions.move_game_controller.connector import go2_game_controller
+
+        with (
+            patch.object(go2_game_controller, "hid", None),
+            patch.object(go2_game_controller, "open_zenoh_session"),
+            patch.object(go2_game_controller, "OdomProvider"),
+            patch.object(go2_game_controller, "UnitreeGo2StateProvider"),
+        ):
+            c = go2_game_controller.Go2GameControllerConnector(
+                ActionConfig(
+                    command_hz=200,
+                    keepalive_interval=0.05,
+                    read_timeout_ms=5,
+                    reconnect_interval=0.01,
+                )
+            )
+
+    c.sport_client = MagicMock()
+    c.odom.position = {"body_attitude": RobotState.STANDING}
+    c.unitree_state_provider.state = "standing"
+    c.gamepad = FakeGamepad()
+    c.xbox = True
+
+    stop = threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            c.tick()
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    yield c
+    stop.set()
+    thread.join()
+
+
+def _moves(c):
+    return [call.args for call in c.sport_client.Move.call_args_list]
+
+
+def _wait_for(predicate, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_change_is_sent_immediately_and_kept_alive(connector):
+    # Without keepalives only the change itself can send a command
+    connector.keepalive_interval = 60.0
+    connector.gamepad.reports.append(_xbox_report(d_pad=UP))
+    assert _wait_for(lambda: len(_moves(connector)) >= 1)
+    assert _moves(connector) == [(0.9, 0.0, 0.0)]
+
+    # Held D-pad: no new reports, only keepalives of the same command
+    connector.keepalive_interval = 0.05
+    assert _wait_for(lambda: len(_moves(connector)) >= 3)
+    assert set(_moves(connector)) == {(0.9, 0.0, 0.0)}
+
+    connector.gamepad.reports.append(_xbox_report())
+    assert _wait_for(lambda: _moves(connector)[-1] == (0.0, 0.0, 0.0))
+
+    # Stopped: nothing more is sent
+    count = len(_moves(connector))
+    time.sleep(0.1)
+    assert len(_moves(connector)) == count
+
+
+def test_repeated_reports_do_not_resend(connector):
+    connector.keepalive_interval = 60.0
+    connector.gamepad.reports.extend([_xbox_report(lt=255)] * 5)
+    assert _wait_for(lambda: len(_moves(connector)) >= 1)
+    assert _wait_for(lambda: not connector.gamepad.reports)
+    time.sleep(0.02)
+    assert _moves(connector) == [(0.0, 0.0, 0.6)]
+
+
+def test_button_press_is_debounced(connector):
+    with patch.object(connector, "_execute_sport_command_sync") as command:
+        connector.gamepad.reports.extend([_xbox_report(button=1)] * 5)
+        assert _wait_for(lambda: not connector.gamepad.reports)
+        time.sleep(0.02)
+    command.assert_called_once_with("StandUp")
+
+
+def test_robot_stops_when_controller_disconnects(connector):
+    connector.gamepad.reports.append(_xbox_report(d_pad=UP))
+    assert _wait_for(lambda: len(_moves(connector)) >= 1)
+
+    connector.gamepad = None
+    assert _wait_for(lambda: _moves(connector)[-1] == (0.0, 0.0, 0.0))
+
+
+def test_publisher_stops_robot_when_reader_stops(connector):
+    # Slow reconnects keep tick from running, like a stopped orchestrator
+    connector.reconnect_interval = 1.0
+    connector.reader_timeout = 0.05
+    connector.gamepad.reports.append(_xbox_report(d_pad=UP))
+    assert _wait_for(lambda: len(_moves(connector)) >= 1)
+
+    with patch.object(connector, "_init_controller"):
+        connector.gamepad = None
+        assert _wait_for(lambda: _moves(connector)[-1] == (0.0, 0.0, 0.0))
+        assert _wait_for(lambda: not connector._publisher_thread.is_alive())
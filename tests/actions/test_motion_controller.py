@@ -0,0 +1,193 @@
+import threading
+import time
+
+import pytest
+
+from actions.base import MoveCommand
+from actions.motion_controller import MotionController, StepResult
+
+
+class FakeOdom:
+    """A robot on a line, publishing its pose at ``odom_hz``."""
+
+    def __init__(self, odom_hz=200.0):
+        self.odom_subscriber_ts = time.time()
+        self._x0 = 0.0
+        self._vx = 0.0
+        self._since = time.monotonic()
+        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._seq = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._publish, args=(1.0 / odom_hz,), daemon=True
+        )
+        self._thread.start()
+
+    def _publish(self, period):
+        while not self._stop.wait(period):
+            self.odom_subscriber_ts = time.time()
+            with self._condition:
+                self._seq += 1
+                self._condition.notify_all()
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+
+    @property
+    def x(self):
+        with self._lock:
+            return self._x0 + self._vx * (time.monotonic() - self._since)
+
+    def move(self, vx):
+        with self._lock:
+            now = time.monotonic()
+            self._x0 += self._vx * (now - self._since)
+            self._vx, self._since = vx, now
+
+    @property
+    def update_seq(self):
+        return self._seq
+
+    def wait_for_update(self, seq, timeout=None):
+        with self._condition:
+            self._condition.wait_for(lambda: self._seq != seq, timeout=timeout)
+            return self._seq
+
+
+@pytest.fixture
+def odom():
+    o = FakeOdom()
+    yield o
+    o.close()
+
+
+def _advance(odom, tolerance=0.01, speed=0.5):
+    """Control law of an advance to ``dx`` in metres, like the connectors."""
+
+    def step(cmd: MoveCommand) -> StepResult:
+        remaining = cmd.dx - odom.x
+        if abs(remaining) <= tolerance:
+            odom.move(0.0)
+            return StepResult.DONE
+        odom.move(speed if remaining > 0 else -0.2)
+        return StepResult.CONTINUE
+
+    return step
+
+
+def _run(controller, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while controller.busy and time.monotonic() < deadline:
+        controller.tick(idle_timeout=0.01)
+
+
+def test_busy_and_clear(odom):
+    controller = MotionController(odom, lambda cmd: StepResult.CONTINUE)
+    assert not controller.busy
+
+    controller.submit(MoveCommand(dx=0.5, yaw=0.0))
+    controller.submit(MoveCommand(dx=0.5, yaw=0.0))
+    assert controller.busy
+
+    controller.tick()
+    controller.clear()
+    assert not controller.busy
+
+
+def test_idle_tick_returns(odom):
+    controller = MotionController(odom, lambda cmd: StepResult.CONTINUE)
+    start = time.monotonic()
+    controller.tick(idle_timeout=0.02)
+    assert time.monotonic() - start < 0.5
+    assert controller.metrics["steps"] == 0
+
+
+def test_commands_run_in_order(odom):
+    seen = []
+
+    def step(cmd):
+        seen.append(cmd.dx)
+        return StepResult.DONE
+
+    controller = MotionController(odom, step)
+    for dx in (0.1, 0.2, 0.3):
+        controller.submit(MoveCommand(dx=dx, yaw=0.0))
+    _run(controller)
+
+    assert seen == [0.1, 0.2, 0.3]
+    assert controller.metrics["completed"] == 3
+
+
+def test_advance_converges_at_control_rate(odom):
+    controller = MotionController(odom, _advance(odom), rate_hz=50.0)
+    controller.submit(MoveCommand(dx=0.2, yaw=0.0))
+    _run(controller)
+
+    assert not controller.busy
+    assert abs(odom.x - 0.2) <= 0.02
+
+    metrics = controller.metrics
+    assert metrics["completed"] == 1
+    # 0.2 m at 0.5 m/s, not a whole number of 100 ms ticks
+    assert metrics["command_s_last"] < 0.6
+    assert 15 <= metrics["period_ms_mean"] <= 30
+    assert metrics["odom_age_ms_max"] < 100
+
+
+def test_steps_wait_for_fresh_odom():
+    odom = FakeOdom(odom_hz=20.0)
+    try:
+        controller = MotionController(odom, lambda cmd: StepResult.CONTINUE)
+        controller.submit(MoveCommand(dx=0.5, yaw=0.0))
+        start = time.monotonic()
+        while time.monotonic() - start < 0.3:
+            controller.tick()
+        # Bounded by the odometry rate, not the 50 Hz control rate
+        assert controller.metrics["steps"] <= 8
+        assert controller.metrics["period_ms_mean"] >= 40
+    finally:
+        odom.close()
+
+
+def test_stale_odom_still_steps():
+    odom = FakeOdom(odom_hz=1.0)
+    try:
+        controller = MotionController(
+            odom, lambda cmd: StepResult.CONTINUE, odom_timeout=0.02
+        )
+        controller.submit(MoveCommand(dx=0.5, yaw=0.0))
+        for _ in range(3):
+            controller.tick()
+        assert controller.metrics["stale_steps"] >= 2
+    finally:
+        odom.close()
+
+
+def test_command_timeout_stops_robot(odom):
+    stopped = threading.Event()
+    controller = MotionController(
+        odom,
+        lambda cmd: StepResult.CONTINUE,
+        stop=stopped.set,
+        command_timeout=0.1,
+    )
+    controller.submit(MoveCommand(dx=0.5, yaw=0.0))
+    _run(controller, timeout=1.0)
+
+    assert not controller.busy
+    assert stopped.is_set()
+    assert controller.metrics["timed_out"] == 1
+
+
+def test_aborted_command_moves_on(odom):
+    results = iter([StepResult.ABORTED, StepResult.DONE])
+    controller = MotionController(odom, lambda cmd: next(results))
+    controller.submit(MoveCommand(dx=0.5, yaw=0.0))
+    controller.submit(MoveCommand(dx=0.5, yaw=0.0))
+    _run(controller)
+
+    metrics = controller.metrics
+    assert metrics["aborted"] == 1
+    assert metrics["completed"] == 1
@@ -0,0 +1,69 @@
+from backgrounds.plugins.rf_mapper import BLEDeviceTable
+
+
+def _see(table, address, rssi=-70, name=None, mfgval=""):
+    return table.update(address, name, rssi, None, "", "", mfgval)
+
+
+def test_scan_delta_is_top_k_plus_named():
+    table = BLEDeviceTable(top_k=2)
+    _see(table, "a", rssi=-40)
+    _see(table, "b", rssi=-90, name="tag")
+    _see(table, "c", rssi=-50)
+    _see(table, "d", rssi=-80)
+
+    delta = table.end_scan()
+    assert [d.address for d in delta] == ["a", "c", "b"]
+
+    # Only devices seen during the scan are reported
+    _see(table, "d", rssi=-60)
+    assert [d.address for d in table.end_scan()] == ["d"]
+
+
+def test_delta_is_a_snapshot():
+    table = BLEDeviceTable()
+    _see(table, "a", rssi=-40)
+    delta = table.end_scan()
+    _see(table, "a", rssi=-99)
+    assert delta[0].rssi == -40
+    assert table.get("a").rssi == -99
+
+
+def test_update_keeps_resolved_fields():
+    table = BLEDeviceTable()
+    _see(table, "a", name="watch", mfgval="ABCDEF")
+    _see(table, "a", name="other", mfgval="AB")
+    device = table.get("a")
+    assert device.name == "watch"
+    assert device.mfgval == "ABCDEF"
+
+
+def test_devices_expire_after_ttl_scans():
+    table = BLEDeviceTable(ttl_scans=2)
+    _see(table, "old")
+    table.end_scan()
+    _see(table, "new")
+    table.end_scan()
+    assert "old" in table
+
+    table.end_scan()
+    assert "old" not in table
+    assert "new" in table
+    table.end_scan()
+    assert len(table) == 0
+    assert table.evicted == 2
+
+
+def test_table_is_bounded():
+    table = BLEDeviceTable(max_devices=100, ttl_scans=1000)
+    for scan in range(50):
+        for i in range(20):
+            _see(table, f"{scan}-{i}", rssi=-i)
+        _see(table, "beacon", rssi=-30)
+        table.end_scan()
+        assert len(table) <= 100
+
+    # The device seen every scan survives, the least recently seen are gone
+    assert "beacon" in table
+    assert "0-0" not in table
+    assert table.evicted == 50 * 20 + 1 - 100
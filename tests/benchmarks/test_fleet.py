@@ -0,0 +1,54 @@
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.modules.setdefault("om1_speech", MagicMock())
+
+from benchmarks.fleet import build_fleet, format_fleet, run_fleet  # noqa: E402
+from providers.io_provider import IOProvider  # noqa: E402
+from providers.singleton import singleton  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    singleton.instances = {}
+    yield
+    singleton.instances = {}
+
+
+def test_runtimes_do_not_share_providers():
+    fleet = build_fleet(
+        runtimes=3, inputs=2, actions=3, hertz=10, base_url="http://127.0.0.1:1/v1"
+    )
+
+    io_providers = [instance.runtime.io_provider for instance in fleet]
+    assert len({id(p) for p in io_providers}) == 3
+    for instance in fleet:
+        assert instance.runtime.io_provider in instance.providers.values()
+        assert instance.runtime.config.agent_inputs[0].io_provider is (
+            instance.runtime.io_provider
+        )
+    assert IOProvider() not in io_providers
+
+
+async def test_fleet_reports_throughput_and_latency():
+    result = await run_fleet(
+        runtimes=4,
+        duration=0.5,
+        hertz=20,
+        inputs=2,
+        actions=3,
+        llm_latency=0.01,
+        input_period=0.05,
+    )
+
+    assert result.runtimes == 4
+    assert result.min_runtime_ticks >= 2
+    assert result.ticks >= 4 * result.min_runtime_ticks
+    assert result.ticks_per_sec > 0
+    assert 10 <= result.p50_ms <= result.p99_ms <= result.max_ms
+    # Every tick with new input text asks the stub LLM server
+    assert result.llm_requests_per_sec > 0
+    assert result.memory_per_runtime > 0
+    assert "ticks/s" in format_fleet(result)
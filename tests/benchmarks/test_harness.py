@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from benchmarks import harness
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare,
+    format_results,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(harness, "_REGISTRY", [])
+
+
+def _result(name="bench", ops=1000.0, peak=10000.0):
+    return BenchmarkResult(
+        name=name,
+        ops_per_sec=ops,
+        mean_us=1e6 / ops,
+        allocated_blocks=0.0,
+        peak_bytes=peak,
+        ops=100,
+    )
+
+
+def test_parameter_grid_is_expanded():
+    @harness.benchmark("grid", a=[1, 2], b=["x"])
+    def factory(a, b):
+        return lambda: None
+
+    assert [b.name for b in harness.registered()] == [
+        "grid[a=1,b=x]",
+        "grid[a=2,b=x]",
+    ]
+    assert [b.name for b in harness.registered("a=2")] == ["grid[a=2,b=x]"]
+
+
+def test_run_sync_and_async_benchmarks():
+    calls = []
+
+    @harness.benchmark("sync")
+    def sync_factory():
+        return lambda: calls.append(1)
+
+    @harness.benchmark("async")
+    async def async_factory():
+        async def op():
+            await asyncio.sleep(0)
+
+        return op
+
+    results = [run_benchmark(b, min_time=0.01, rounds=2) for b in harness.registered()]
+
+    assert [r.name for r in results] == ["sync", "async"]
+    assert all(r.ops_per_sec > 0 for r in results)
+    assert len(calls) >= results[0].ops
+
+
+def test_retained_allocations_are_counted():
+    retained = []
+
+    @harness.benchmark("leak")
+    def factory():
+        return lambda: retained.append(object())
+
+    result = run_benchmark(harness.registered()[0], min_time=0.01, rounds=1)
+
+    assert result.allocated_blocks >= 0.9
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        "fast": _result("fast", ops=1000.0),
+        "lean": _result("lean", peak=10000.0),
+        "same": _result("same"),
+    }
+    results = [
+        _result("fast", ops=800.0),
+        _result("lean", peak=20000.0),
+        _result("same", ops=950.0, peak=10500.0),
+        _result("new"),
+    ]
+
+    comparisons = {c.name: c for c in compare(results, baseline, threshold=0.15)}
+
+    assert comparisons["fast"].regressed
+    assert comparisons["lean"].regressed
+    assert not comparisons["same"].regressed
+    assert comparisons["same"].peak_change == 0.0
+    assert "new" not in comparisons
+    assert "REGRESSED" in format_results(results, list(comparisons.values()))
+
+
+def test_baseline_roundtrip(tmp_path):
+    path = str(tmp_path / "baselines" / "main.json")
+    save_baseline([_result("a"), _result("b", ops=5.0)], path)
+
+    baseline = load_baseline(path)
+
+    assert baseline["b"] == _result("b", ops=5.0)
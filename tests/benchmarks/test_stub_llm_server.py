@@ -0,0 +1,146 @@
+import json
+import random
+import time
+from pathlib import Path
+
+import openai
+import pytest
+
+from benchmarks.fakes import make_actions
+from benchmarks.stub_llm_server import (
+    LatencyModel,
+    StubLLMServer,
+    StubResponse,
+    load_script,
+)
+from llm.function_schemas import (
+    convert_function_calls_to_actions,
+    generate_function_schemas_from_actions,
+)
+
+TEST_CASES = Path(__file__).parent.parent / "integration" / "data" / "test_cases"
+MESSAGES = [{"role": "user", "content": "A person is waving at you."}]
+
+
+@pytest.fixture
+async def serve():
+    servers = []
+
+    async def start(**kwargs):
+        server = StubLLMServer(**kwargs)
+        base_url = await server.start()
+        servers.append(server)
+        client = openai.AsyncClient(base_url=base_url, api_key="stub", max_retries=0)
+        return server, client
+
+    yield start
+    for server in servers:
+        await server.stop()
+
+
+def _tools(count=3):
+    return generate_function_schemas_from_actions(make_actions(count))
+
+
+async def test_default_answer_calls_every_tool(serve):
+    server, client = await serve()
+    response = await client.chat.completions.create(
+        model="stub", messages=MESSAGES, tools=_tools(), tool_choice="auto"
+    )
+
+    calls = [
+        {"function": {"name": tc.function.name, "arguments": tc.function.arguments}}
+        for tc in response.choices[0].message.tool_calls
+    ]
+    actions = convert_function_calls_to_actions(calls)
+    assert [a.type for a in actions] == ["speak", "move", "emotion"]
+    assert all(a.value for a in actions)
+    assert response.usage.completion_tokens > 0
+    assert server.stats["requests"] == 1
+    assert server.requests[0]["messages"] == MESSAGES
+
+
+async def test_script_is_served_in_order(serve):
+    script = [
+        StubResponse(tool_calls=[{"name": "move", "arguments": {"action": "sit"}}]),
+        StubResponse(content="No tools today."),
+        StubResponse(tool_calls=[{"name": "dance", "arguments": {"action": "x"}}]),
+    ]
+    _, client = await serve(script=script)
+
+    messages = []
+    for _ in range(4):
+        response = await client.chat.completions.create(
+            model="stub", messages=MESSAGES, tools=_tools()
+        )
+        messages.append(response.choices[0].message)
+
+    assert json.loads(messages[0].tool_calls[0].function.arguments) == {"action": "sit"}
+    assert messages[1].content == "No tools today."
+    # Tools the request does not offer are never called
+    assert not messages[2].tool_calls
+    assert messages[3].tool_calls[0].function.name == "move"
+
+
+async def test_streamed_tool_calls(serve):
+    _, client = await serve(tokens_per_sec=1000)
+    stream = await client.chat.completions.create(
+        model="stub", messages=MESSAGES, tools=_tools(2), stream=True
+    )
+
+    names = {}
+    arguments = {}
+    finish_reason = None
+    async for chunk in stream:
+        choice = chunk.choices[0]
+        for tc in choice.delta.tool_calls or []:
+            if tc.function.name:
+                names[tc.index] = tc.function.name
+            arguments[tc.index] = arguments.get(tc.index, "") + (
+                tc.function.arguments or ""
+            )
+        finish_reason = choice.finish_reason or finish_reason
+
+    assert names == {0: "speak", 1: "move"}
+    assert all(json.loads(a)["action"] for a in arguments.values())
+    assert finish_reason == "tool_calls"
+
+
+async def test_latency_and_throughput(serve):
+    _, client = await serve(latency=LatencyModel("fixed", 0.1), tokens_per_sec=200)
+    start = time.monotonic()
+    response = await client.chat.completions.create(
+        model="stub", messages=MESSAGES, tools=_tools()
+    )
+    elapsed = time.monotonic() - start
+
+    expected = 0.1 + response.usage.completion_tokens / 200
+    assert expected <= elapsed < expected + 0.5
+
+
+async def test_injected_errors(serve):
+    server, client = await serve(error_rate=1.0, error_statuses=[503])
+    with pytest.raises(openai.InternalServerError):
+        await client.chat.completions.create(
+            model="stub", messages=MESSAGES, tools=_tools()
+        )
+    assert server.stats["errors"] == 1
+
+
+def test_latency_distributions_are_seeded():
+    for distribution in ("fixed", "uniform", "normal", "lognormal"):
+        model = LatencyModel(distribution, mean=0.2, spread=0.05)
+        first = [model.sample(random.Random(1)) for _ in range(3)]
+        assert first == [model.sample(random.Random(1)) for _ in range(3)]
+        assert all(v >= 0 for v in first)
+
+    with pytest.raises(ValueError):
+        LatencyModel("pareto")
+
+
+def test_script_from_integration_test_case():
+    script = load_script(str(TEST_CASES / "open_ai_indoor_test.json5"))
+
+    assert script
+    names = [call["name"] for call in script[0].tool_calls]
+    assert "move" in names
@@ -0,0 +1,34 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.modules.setdefault("om1_speech", MagicMock())
+
+from benchmarks.topology import run_jitter  # noqa: E402
+from providers.singleton import singleton  # noqa: E402
+from runtime.logging import LoggingConfig  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    singleton.instances = {}
+    yield
+    singleton.instances = {}
+
+
+@pytest.fixture(autouse=True)
+def console_logging():
+    # The log file handler of pytest would make the workers log to files
+    with patch("runtime.topology.get_logging_config", return_value=LoggingConfig()):
+        yield
+
+
+@pytest.mark.parametrize("placement", ["cortex", "worker"])
+async def test_jitter_reports_tick_lateness(placement):
+    result = await run_jitter(placement, duration=2.0, hertz=20, period=0.1, work_ms=5)
+
+    assert result.placement == placement
+    assert result.ticks >= 5
+    assert result.frames >= 1
+    assert 0 <= result.p50_ms <= result.p99_ms <= result.max_ms
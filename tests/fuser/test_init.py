@@ -4,7 +4,12 @@ from unittest.mock import patch
 
 from fuser import Fuser
 from inputs.base import Sensor
+from inputs.base.buffer import MessageBuffer
+from inputs.base.loop import FuserInput
+from llm import LLM, LLMConfig
 from providers.io_provider import IOProvider
+from providers.reflex_provider import ReflexProvider
+from providers.singleton import provider_scope
 
 
 @dataclass
@@ -84,3 +89,131 @@ def test_fuser_with_inputs_and_actions(mock_describe):
             io_provider.fuser_available_actions
             == "AVAILABLE ACTIONS:\naction description\n\naction description\n\n\n\nWhat will you do? Actions:"
         )
+
+
+class ToolLLM(LLM):
+    supports_tools = True
+
+
+@patch("fuser.describe_action")
+def test_fuser_compact_prompt_leaves_actions_to_tools(mock_describe):
+    config = MockConfig(agent_actions=[MockAction("action1")])
+    config.cortex_llm = ToolLLM(LLMConfig(compact_prompt=True, token_report=True))
+    config.cortex_llm.function_schemas = [
+        {"type": "function", "function": {"name": "action1"}}
+    ]
+
+    with patch("fuser.IOProvider", return_value=IOProvider()):
+        fuser = Fuser(config)
+        result = fuser.fuse([MockSensor()], [])
+
+    mock_describe.assert_not_called()
+    assert "AVAILABLE ACTIONS" not in result
+    assert result.endswith(
+        "test input\nWhat will you do? Call the tools for your actions."
+    )
+    assert fuser.token_report["actions"] == 0
+    assert fuser.token_report["tools"] > 0
+    assert fuser.token_report["total"] == sum(
+        tokens for section, tokens in fuser.token_report.items() if section != "total"
+    )
+
+
+def test_fuser_counts_tokens_only_when_enabled():
+    config = MockConfig()
+    config.cortex_llm = ToolLLM(LLMConfig())
+
+    with (
+        patch("fuser.IOProvider", return_value=IOProvider()),
+        patch("fuser.token_report") as report,
+    ):
+        fuser = Fuser(config)
+        fuser.fuse([MockSensor()], [])
+        report.assert_not_called()
+
+        config.cortex_llm = ToolLLM(LLMConfig(token_report=True))
+        fuser.fuse([MockSensor()], [])
+        report.assert_called_once()
+
+
+class BufferedInput(FuserInput[str]):
+    def __init__(self):
+        super().__init__()
+        self.messages: MessageBuffer[str] = MessageBuffer()
+
+    def formatted_latest_buffer(self):
+        if not self.messages:
+            return None
+        latest = self.messages[-1]
+        self.messages.clear()
+        return latest
+
+
+def test_fuser_reports_changed_inputs():
+    config = MockConfig()
+    buffered = BufferedInput()
+
+    with provider_scope():
+        fuser = Fuser(config)
+
+        fuser.fuse([buffered], [])
+        assert not fuser.inputs_changed
+
+        buffered.messages.append("a person waves")
+        fuser.fuse([buffered], [])
+        assert fuser.inputs_changed
+        assert not buffered.buffer_changed()
+
+        fuser.fuse([buffered], ["finished"])
+        assert fuser.inputs_changed
+
+        ReflexProvider().add_message("You stopped for an obstacle.")
+        fuser.fuse([buffered], [])
+        assert fuser.inputs_changed
+
+        # Inputs that cannot tell always count as changed
+        fuser.fuse([buffered, MockSensor()], [])
+        assert fuser.inputs_changed
+
+
+def test_fuser_adds_reflex_messages_once():
+    config = MockConfig()
+
+    with provider_scope():
+        fuser = Fuser(config)
+        ReflexProvider().add_message("You stopped for an obstacle.")
+
+        prompt = fuser.fuse([MockSensor()], [])
+        assert "INPUT: Reflexes\n// START\nYou stopped for an obstacle." in prompt
+        assert "Reflexes" not in fuser.fuse([MockSensor()], [])
+
+
+class OnceSensor(Sensor):
+    def __init__(self, text):
+        self.text = text
+
+    def formatted_latest_buffer(self):
+        text, self.text = self.text, None
+        return text
+
+
+def test_fuser_keeps_inputs_of_superseded_prompt():
+    config = MockConfig()
+    vision = OnceSensor("a person waves")
+    voice = OnceSensor("hello")
+
+    with provider_scope():
+        fuser = Fuser(config)
+        ReflexProvider().add_message("You stopped for an obstacle.")
+        fuser.fuse([vision, voice], [])
+        fuser.keep_inputs()
+
+        voice.text = "stop"
+        prompt = fuser.fuse([vision, voice], [])
+        assert "a person waves" in prompt
+        assert "stop" in prompt
+        assert "hello" not in prompt
+        assert "You stopped for an obstacle." in prompt
+
+        # Kept inputs are used once
+        assert "a person waves" not in fuser.fuse([vision, voice], [])
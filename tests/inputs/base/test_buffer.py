@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+
+from inputs.base.buffer import BufferPolicy, MessageBuffer
+
+
+@dataclass
+class Message:
+    timestamp: float
+    message: str
+
+
+def test_latest_keeps_one_message():
+    buffer: MessageBuffer[Message] = MessageBuffer()
+    assert buffer == [] and not buffer.changed
+
+    for i in range(100):
+        buffer.append(Message(timestamp=i, message=f"reading {i}"))
+
+    assert len(buffer) == 1
+    assert buffer[-1].message == "reading 99"
+    assert buffer.changed
+
+    buffer.clear()
+    assert buffer == [] and not buffer.changed
+
+
+def test_join_merges_until_read():
+    buffer: MessageBuffer[str] = MessageBuffer(BufferPolicy.JOIN)
+    buffer.append("hello")
+    buffer.append("there")
+    assert buffer == ["hello there"]
+
+    buffer.clear()
+    buffer.append("again")
+    assert buffer == ["again"]
+
+
+def test_dedupe_drops_repeats_and_is_bounded():
+    buffer: MessageBuffer[Message] = MessageBuffer(BufferPolicy.DEDUPE, maxlen=3)
+    buffer.append(Message(timestamp=1, message="law 1"))
+    buffer.mark_read()
+
+    # The same rules polled again are not a change
+    buffer.append(Message(timestamp=2, message="law 1"))
+    assert len(buffer) == 1
+    assert buffer[-1].timestamp == 1
+    assert not buffer.changed
+
+    for i in range(2, 10):
+        buffer.append(Message(timestamp=i, message=f"law {i}"))
+    assert [m.message for m in buffer] == ["law 7", "law 8", "law 9"]
+    assert buffer.changed
+
+    # Reading without clearing keeps the rules for the next prompt
+    buffer.mark_read()
+    assert buffer[-1].message == "law 9" and not buffer.changed
@@ -13,16 +13,9 @@ def governance():
 
 
 @pytest.fixture
-def mock_requests_get():
-    """Patch `requests.get` to simulate API responses."""
-    with patch("requests.get") as mock:
-        yield mock
-
-
-@pytest.fixture
-def mock_requests_post():
-    """Patch `requests.post` to simulate blockchain responses."""
-    with patch("requests.post") as mock:
+def mock_requests_post(governance):
+    """Patch the shared HTTP client to simulate blockchain responses."""
+    with patch.object(governance.http, "post_sync") as mock:
         yield mock
 
 
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+from queue import Empty, Queue
+
+from inputs.base.loop import FuserInput
+from inputs.base.notifier import InputNotifier
+from inputs.orchestrator import InputOrchestrator
+
+
+class PushInput(FuserInput[str]):
+    def __init__(self):
+        super().__init__()
+        self.message_buffer: Queue[str] = Queue()
+        self.message_ready = self.use_notifier()
+        self.seen = []
+
+    def on_message(self, message: str):
+        self.message_buffer.put(message)
+        self.message_ready.notify()
+
+    async def _poll(self):
+        try:
+            return self.message_buffer.get_nowait()
+        except Empty:
+            return None
+
+    async def raw_to_text(self, raw_input):
+        self.seen.append(raw_input)
+
+
+class PollInput(PushInput):
+    def __init__(self):
+        super().__init__()
+        self.notifier = None
+
+    async def _poll(self):
+        await asyncio.sleep(0.01)
+        return await super()._poll()
+
+
+async def test_notify_before_wait_is_not_lost():
+    notifier = InputNotifier()
+    notifier.notify()
+    await asyncio.wait_for(notifier.wait(), timeout=1.0)
+    assert notifier.stats["notified_wakeups"] == 1
+
+
+async def test_notifications_from_threads_are_coalesced():
+    notifier = InputNotifier()
+    waiter = asyncio.create_task(notifier.wait())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    threads = [threading.Thread(target=notifier.notify) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    await asyncio.wait_for(waiter, timeout=1.0)
+
+    stats = notifier.stats
+    assert stats["notifications"] == 5
+    assert stats["notified_wakeups"] == 1
+    assert stats["latency_ms_max"] < 100
+
+
+async def test_push_input_wakes_only_on_data():
+    push = PushInput()
+    orchestrator = InputOrchestrator([push])
+    task = asyncio.create_task(orchestrator.listen())
+
+    await asyncio.sleep(0.1)
+    assert push.listen_stats["wakeups"] == 0
+
+    sent = time.perf_counter()
+    threading.Thread(target=lambda: [push.on_message(m) for m in "abc"]).start()
+    while len(push.seen) - push.seen.count(None) < 3 or push.seen[-1] is not None:
+        assert time.perf_counter() - sent < 1.0
+        await asyncio.sleep(0.001)
+    task.cancel()
+
+    # Each wakeup drains the buffer in order and ends with an empty read
+    assert [m for m in push.seen if m is not None] == ["a", "b", "c"]
+    assert push.seen[-1] is None
+    stats = orchestrator.stats[0]
+    assert push.seen.count(None) == stats["wakeups"]
+    assert stats["input"] == "PushInput"
+    assert stats["push"] is True
+    assert stats["events"] == 3
+    assert stats["wakeups"] <= 3
+    assert stats["latency_ms_max"] < 100
+
+
+async def test_poll_input_still_polls():
+    poll = PollInput()
+    task = asyncio.create_task(InputOrchestrator([poll]).listen())
+    poll.on_message("hello")
+    await asyncio.sleep(0.1)
+    task.cancel()
+
+    assert "hello" in poll.seen
+    stats = poll.listen_stats
+    assert stats["push"] is False
+    assert stats["events"] == 1
+    assert stats["wakeups"] > 1
@@ -67,9 +67,11 @@ async def test_raw_to_text_buffer_management(vlm_input):
     assert len(vlm_input.messages) == 1
     assert vlm_input.messages[0].message == "first message"
 
+    # Only the latest reading is kept
     await vlm_input.raw_to_text("second message")
-    assert len(vlm_input.messages) == 2
-    assert vlm_input.messages[1].message == "second message"
+    assert len(vlm_input.messages) == 1
+    assert vlm_input.messages[0].message == "second message"
+    assert vlm_input.buffer_changed()
 
 
 def test_formatted_latest_buffer(vlm_input):
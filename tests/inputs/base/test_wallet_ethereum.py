@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from inputs.base.buffer import MessageBuffer
 from inputs.plugins.wallet_ethereum import Message, WalletEthereum
 
 
@@ -36,7 +37,7 @@ def wallet_eth(mock_web3, mock_io_provider):
 def test_init(wallet_eth, mock_web3, mock_io_provider):
     assert wallet_eth.ETH_balance == 0
     assert wallet_eth.ETH_balance_previous == 0
-    assert isinstance(wallet_eth.messages, list)
+    assert isinstance(wallet_eth.messages, MessageBuffer)
     assert wallet_eth.ACCOUNT_ADDRESS == "0xTestAddress"
     assert wallet_eth.web3 is not None
     mock_web3.is_connected.assert_called_once()
@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch
 import numpy as np
 import pytest
 
+from inputs.base.buffer import MessageBuffer
 from inputs.plugins.webcam_to_face_emotion import FaceEmotionCapture, Message
 
 
@@ -46,7 +47,7 @@ def face_emotion(mock_cv2, mock_io_provider, mock_deepface):
 
 
 def test_init(face_emotion, mock_cv2):
-    assert isinstance(face_emotion.messages, list)
+    assert isinstance(face_emotion.messages, MessageBuffer)
     assert face_emotion.emotion == ""
     mock_cv2.CascadeClassifier.assert_called_once()
     mock_cv2.VideoCapture.assert_called_once_with(0)
@@ -0,0 +1,238 @@
+import logging
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from providers.sensor_log_provider import (
+    SENSOR_LOG_MAGIC,
+    encode_frame,
+    read_sensor_log,
+)
+
+
+@dataclass
+class SessionRecording:
+    """
+    Everything a CortexRuntime session saw, in the order it happened.
+
+    Parameters
+    ----------
+    meta : Dict[str, Any]
+        Runtime settings needed to rebuild the session: name, hertz,
+        system prompts, inputs and actions.
+    events : List[Dict[str, Any]]
+        Timestamped events. Every event has a ``kind`` ("input", "buffer",
+        "fuse", "llm", "actions" or "tick") and ``t``, seconds since the
+        start of the recording.
+    """
+
+    meta: Dict[str, Any] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+    def save(self, path: str) -> None:
+        """
+        Write the recording using the sensor log frame format.
+
+        Parameters
+        ----------
+        path : str
+            Destination file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(path, "wb") as f:
+            f.write(SENSOR_LOG_MAGIC)
+            f.write(encode_frame({"kind": "meta", **self.meta}))
+            for event in self.events:
+                f.write(encode_frame(event))
+
+        logging.info(f"Saved session recording with {len(self.events)} events")
+
+    @classmethod
+    def load(cls, path: str) -> "SessionRecording":
+        """
+        Read a recording written by ``save``.
+
+        Parameters
+        ----------
+        path : str
+            Path to the recording.
+
+        Returns
+        -------
+        SessionRecording
+            The loaded recording.
+        """
+        recording = cls()
+        for record in read_sensor_log(path):
+            if record.get("kind") == "meta":
+                record.pop("kind")
+                recording.meta = record
+            else:
+                recording.events.append(record)
+        return recording
+
+    def of_kind(self, kind: str) -> List[Dict[str, Any]]:
+        """
+        Get all events of one kind.
+
+        Parameters
+        ----------
+        kind : str
+            The event kind, e.g. "llm".
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Matching events in recorded order.
+        """
+        return [e for e in self.events if e["kind"] == kind]
+
+    @property
+    def duration(self) -> float:
+        """
+        Length of the recording in seconds.
+        """
+        return self.events[-1]["t"] if self.events else 0.0
+
+    @property
+    def tick_count(self) -> int:
+        """
+        Number of cortex ticks in which inputs were fused.
+        """
+        return len(self.of_kind("fuse"))
+
+
+# This is a singleton class that will store and serve recorded input buffers
+class MockRecordingProvider:
+    """
+    Singleton class to serve recorded input buffers to replay inputs.
+
+    Buffers can be served by tick, for deterministic lockstep replay, or by
+    time, for replay against the running cortex loop.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(MockRecordingProvider, cls).__new__(cls)
+            cls._instance.recording = SessionRecording()
+            cls._instance.buffers = {}
+            cls._instance.current_tick = 0
+            cls._instance.speed = 1.0
+            cls._instance.started_at = None
+            logging.info("Initialized MockRecordingProvider singleton")
+        return cls._instance
+
+    def load_recording(self, recording: SessionRecording, speed: float = 1.0):
+        """
+        Load a recording to replay.
+
+        Parameters
+        ----------
+        recording : SessionRecording
+            The recording to serve.
+        speed : float
+            Replay speed relative to real time, used for time-based replay.
+        """
+        self.recording = recording
+        self.speed = speed
+        self.current_tick = 0
+        self.started_at = None
+
+        buffers: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for event in recording.of_kind("buffer"):
+            buffers[event["input"]].append(event)
+        self.buffers = dict(buffers)
+
+        logging.info(
+            f"MockRecordingProvider loaded {len(recording.events)} events "
+            f"for {len(self.buffers)} inputs"
+        )
+
+    def set_tick(self, tick: int):
+        """
+        Select the tick whose buffers are served in lockstep replay.
+
+        Parameters
+        ----------
+        tick : int
+            Index of the recorded tick.
+        """
+        self.current_tick = tick
+
+    def start_clock(self):
+        """
+        Start the replay clock for time-based replay.
+        """
+        self.started_at = time.monotonic()
+
+    def elapsed(self) -> float:
+        """
+        Recording time reached by the replay clock.
+
+        Returns
+        -------
+        float
+            Seconds of recording time replayed so far.
+        """
+        if self.started_at is None:
+            return 0.0
+        return (time.monotonic() - self.started_at) * self.speed
+
+    def buffer_for_tick(self, input_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the buffer an input produced in the current tick.
+
+        Parameters
+        ----------
+        input_name : str
+            The recorded input name.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The buffer event, or None if the input had nothing new that tick.
+        """
+        for event in self.buffers.get(input_name, []):
+            if event["tick"] == self.current_tick:
+                return event
+        return None
+
+    def buffers_for(self, input_name: str) -> List[Dict[str, Any]]:
+        """
+        Get all recorded buffers of an input.
+
+        Parameters
+        ----------
+        input_name : str
+            The recorded input name.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Buffer events in recorded order.
+        """
+        return self.buffers.get(input_name, [])
+
+    def reset(self):
+        """Reset the provider to the start of the recording."""
+        self.current_tick = 0
+        self.started_at = None
+
+
+# Helper functions to access the singleton
+def get_recording_provider() -> MockRecordingProvider:
+    """Get the singleton recording provider instance."""
+    return MockRecordingProvider()
+
+
+def load_recording(recording: SessionRecording, speed: float = 1.0):
+    """Load a session recording into the provider."""
+    provider = get_recording_provider()
+    provider.load_recording(recording, speed)
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from inputs.base import SensorConfig
+from inputs.base.loop import FuserInput
+from providers.io_provider import IOProvider
+from tests.integration.mock_inputs.data_providers.mock_recording_provider import (
+    get_recording_provider,
+)
+
+
+class MockReplayInput(FuserInput[Dict[str, Any]]):
+    """
+    Input that replays what a recorded input handed to the fuser.
+
+    In lockstep replay the buffer recorded for the current tick is served
+    directly. In timed replay the recorded buffers are polled as the replay
+    clock reaches them, so the cortex loop sees them at the recorded pace
+    scaled by the replay speed.
+
+    The config must contain ``input_name``, the name used in the recording,
+    and may contain ``descriptor``.
+    """
+
+    def __init__(self, config: SensorConfig = SensorConfig()):
+        """
+        Initialize the replay input.
+
+        Parameters
+        ----------
+        config : SensorConfig, optional
+            Configuration for the sensor
+        """
+        super().__init__(config)
+
+        self.input_name: str = getattr(config, "input_name")
+        self.descriptor_for_LLM = getattr(config, "descriptor", self.input_name)
+        self.io_provider = IOProvider()
+        self.provider = get_recording_provider()
+
+        self._next_index = 0
+        self.messages: List[Dict[str, Any]] = []
+
+    async def _poll(self) -> Optional[Dict[str, Any]]:
+        """
+        Wait until the replay clock reaches the next recorded buffer.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The next buffer event, or None once the recording is exhausted.
+        """
+        buffers = self.provider.buffers_for(self.input_name)
+        if self._next_index >= len(buffers):
+            await asyncio.sleep(0.1)
+            return None
+
+        event = buffers[self._next_index]
+        delay = (event["t"] - self.provider.elapsed()) / self.provider.speed
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        self._next_index += 1
+        return event
+
+    async def raw_to_text(self, raw_input: Optional[Dict[str, Any]]):
+        """
+        Queue a polled buffer event for the next fuse.
+
+        Parameters
+        ----------
+        raw_input : Optional[Dict[str, Any]]
+            Buffer event to queue
+        """
+        if raw_input is not None:
+            self.messages.append(raw_input)
+
+    def formatted_latest_buffer(self) -> Optional[str]:
+        """
+        Return the recorded buffer text and replay its IOProvider entries.
+
+        Returns
+        -------
+        Optional[str]
+            The recorded formatted buffer, or None if there is none.
+        """
+        if self.provider.started_at is None:
+            event = self.provider.buffer_for_tick(self.input_name)
+        else:
+            event = self.messages.pop() if self.messages else None
+            self.messages = []
+
+        if event is None:
+            return None
+
+        for key, value in event.get("io_inputs", {}).items():
+            self.io_provider.add_input(key, value, time.time())
+
+        logging.debug(f"MockReplayInput {self.input_name}: {event['text']}")
+        return event["text"]
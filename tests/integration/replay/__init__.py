@@ -0,0 +1,19 @@
+"""
+Record-and-replay harness for CortexRuntime sessions.
+
+Record a live session with ``SessionRecorder``, then replay it without a
+robot or an LLM with ``replay_session``; both produce a per-component
+throughput and latency report.
+"""
+
+from tests.integration.replay.recorder import SessionRecorder
+from tests.integration.replay.replay import ReplayResult, replay_session
+from tests.integration.replay.report import build_report, format_report
+
+__all__ = [
+    "SessionRecorder",
+    "ReplayResult",
+    "replay_session",
+    "build_report",
+    "format_report",
+]
@@ -0,0 +1,68 @@
+"""
+Record a live session or replay a recording.
+
+    PYTHONPATH=src uv run python -m tests.integration.replay record spot --duration 60
+    PYTHONPATH=src uv run python -m tests.integration.replay replay recordings/spot.slog --speed 20
+"""
+
+import asyncio
+import logging
+import time
+
+import typer
+
+from runtime.single_mode.config import load_config
+from runtime.single_mode.cortex import CortexRuntime
+from tests.integration.mock_inputs.data_providers.mock_recording_provider import (
+    SessionRecording,
+)
+from tests.integration.replay.recorder import SessionRecorder
+from tests.integration.replay.replay import replay_session, run_for
+from tests.integration.replay.report import build_report, format_report
+
+app = typer.Typer()
+
+
+@app.command()
+def record(
+    config_name: str,
+    duration: float = 60.0,
+    output: str = "",
+    record_raw: bool = False,
+) -> None:
+    """
+    Run a configuration for a while and record the session.
+    """
+    output = output or f"recordings/{config_name}_{int(time.time())}.slog"
+    config = load_config(config_name)
+    cortex = CortexRuntime(config, config_name, hot_reload=False)
+    recorder = SessionRecorder(cortex, record_raw=record_raw).attach()
+
+    try:
+        asyncio.run(run_for(cortex, duration))
+    finally:
+        recording = recorder.detach()
+        recording.save(output)
+
+    print(format_report(build_report(recording)))
+    print(f"Recording saved to {output}")
+
+
+@app.command()
+def replay(path: str, mode: str = "lockstep", speed: float = 10.0) -> None:
+    """
+    Replay a recording and print the per-component report.
+    """
+    recording = SessionRecording.load(path)
+    result = asyncio.run(replay_session(recording, mode, speed))
+
+    print(format_report(result.report))
+    print(f"Prompt match rate: {result.match_rate:.2%}")
+    print(
+        f"Ticks: {recording.tick_count} recorded, {result.recording.tick_count} replayed"
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    app()
@@ -0,0 +1,279 @@
+import hashlib
+import logging
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from inputs.base import Sensor
+from runtime.single_mode.cortex import CortexRuntime
+from tests.integration.mock_inputs.data_providers.mock_recording_provider import (
+    SessionRecording,
+)
+
+
+def prompt_hash(prompt: str) -> str:
+    """
+    Stable key used to match a replayed prompt to a recorded LLM response.
+
+    Parameters
+    ----------
+    prompt : str
+        The fused prompt.
+
+    Returns
+    -------
+    str
+        Hex digest of the prompt.
+    """
+    return hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+
+
+def input_names(inputs: List[Sensor]) -> List[str]:
+    """
+    Name the inputs of a runtime, disambiguating repeated classes.
+
+    Parameters
+    ----------
+    inputs : List[Sensor]
+        The runtime inputs.
+
+    Returns
+    -------
+    List[str]
+        One unique name per input, in order.
+    """
+    names = []
+    for sensor in inputs:
+        name = getattr(sensor, "input_name", type(sensor).__name__)
+        candidate, suffix = name, 1
+        while candidate in names:
+            suffix += 1
+            candidate = f"{name}#{suffix}"
+        names.append(candidate)
+    return names
+
+
+class SessionRecorder:
+    """
+    Records everything a CortexRuntime session sees, with timing.
+
+    The recorder wraps the runtime's boundaries on the instance: every input's
+    ``raw_to_text`` and ``formatted_latest_buffer``, ``fuser.fuse``,
+    ``cortex_llm.ask``, ``action_orchestrator.promise`` and ``_tick``. Sensor
+    data (Zenoh samples, lidar frames, odom, ASR text, VLM results) is
+    captured where it enters the cortex loop, so a recording can be replayed
+    without a robot, a Zenoh router or an LLM.
+
+    Parameters
+    ----------
+    cortex : CortexRuntime
+        The runtime to record.
+    record_raw : bool
+        Also store raw input events. Numpy arrays such as lidar frames are
+        stored as raw binary, strings and numbers as they are; other values
+        are skipped.
+    """
+
+    def __init__(self, cortex: CortexRuntime, record_raw: bool = False):
+        self.cortex = cortex
+        self.record_raw = record_raw
+        self.recording = SessionRecording()
+
+        self._start = time.monotonic()
+        self._tick_index = -1
+        self._attached: List[Any] = []
+
+    def _now(self) -> float:
+        return time.monotonic() - self._start
+
+    def _event(self, kind: str, **fields) -> Dict[str, Any]:
+        event = {"kind": kind, "t": self._now(), **fields}
+        self.recording.events.append(event)
+        return event
+
+    def attach(self) -> "SessionRecorder":
+        """
+        Start recording the runtime.
+
+        Returns
+        -------
+        SessionRecorder
+            The recorder, for chaining.
+        """
+        config = self.cortex.config
+        names = input_names(config.agent_inputs)
+
+        self.recording.meta = {
+            "name": config.name,
+            "version": config.version,
+            "hertz": config.hertz,
+            "system_prompt_base": config.system_prompt_base,
+            "system_governance": config.system_governance,
+            "system_prompt_examples": config.system_prompt_examples,
+            "inputs": [
+                {
+                    "name": name,
+                    "type": type(sensor).__name__,
+                    "descriptor": getattr(sensor, "descriptor_for_LLM", name),
+                }
+                for name, sensor in zip(names, config.agent_inputs)
+            ],
+            "actions": [
+                {
+                    "name": action.name,
+                    "llm_label": action.llm_label,
+                    "exclude_from_prompt": action.exclude_from_prompt,
+                }
+                for action in config.agent_actions
+            ],
+        }
+
+        for name, sensor in zip(names, config.agent_inputs):
+            self._wrap_input(name, sensor)
+
+        self._wrap_fuser()
+        self._wrap_llm()
+        self._wrap_actions()
+        self._wrap_tick()
+
+        self._start = time.monotonic()
+        logging.info(f"Recording {len(names)} inputs of {config.name}")
+        return self
+
+    def detach(self) -> SessionRecording:
+        """
+        Stop recording and restore the runtime.
+
+        Returns
+        -------
+        SessionRecording
+            The recording.
+        """
+        for target, attr in self._attached:
+            try:
+                delattr(target, attr)
+            except AttributeError:
+                pass
+        self._attached = []
+        return self.recording
+
+    def save(self, path: str) -> None:
+        """
+        Save the recording.
+
+        Parameters
+        ----------
+        path : str
+            Destination file.
+        """
+        self.recording.save(path)
+
+    def _patch(self, target: Any, attr: str, wrapper: Any) -> None:
+        setattr(target, attr, wrapper)
+        self._attached.append((target, attr))
+
+    def _wrap_input(self, name: str, sensor: Sensor) -> None:
+        raw_to_text = sensor.raw_to_text
+        formatted_latest_buffer = sensor.formatted_latest_buffer
+        io_provider = self.cortex.io_provider
+
+        async def recorded_raw_to_text(raw_input):
+            if raw_input is None:
+                return await raw_to_text(raw_input)
+
+            start = time.perf_counter()
+            try:
+                return await raw_to_text(raw_input)
+            finally:
+                event: Dict[str, Any] = {
+                    "input": name,
+                    "latency": time.perf_counter() - start,
+                }
+                if self.record_raw:
+                    if isinstance(raw_input, (np.ndarray, str, int, float, bool)):
+                        event["raw"] = raw_input
+                self._event("input", **event)
+
+        def recorded_formatted_latest_buffer():
+            before = {k: v.input for k, v in io_provider.inputs.items()}
+            text = formatted_latest_buffer()
+            if text is not None:
+                after = io_provider.inputs
+                io_inputs = {
+                    k: v.input for k, v in after.items() if before.get(k) != v.input
+                }
+                self._event(
+                    "buffer",
+                    input=name,
+                    tick=self._tick_index,
+                    text=text,
+                    io_inputs=io_inputs,
+                )
+            return text
+
+        self._patch(sensor, "raw_to_text", recorded_raw_to_text)
+        self._patch(sensor, "formatted_latest_buffer", recorded_formatted_latest_buffer)
+
+    def _wrap_fuser(self) -> None:
+        fuser = self.cortex.fuser
+        fuse = fuser.fuse
+
+        def recorded_fuse(inputs, finished_promises):
+            self._tick_index += 1
+            start = time.perf_counter()
+            prompt = fuse(inputs, finished_promises)
+            self._event(
+                "fuse",
+                tick=self._tick_index,
+                latency=time.perf_counter() - start,
+                prompt_chars=len(prompt) if prompt else 0,
+            )
+            return prompt
+
+        self._patch(fuser, "fuse", recorded_fuse)
+
+    def _wrap_llm(self) -> None:
+        llm = self.cortex.config.cortex_llm
+        ask = llm.ask
+
+        async def recorded_ask(prompt: str, *args, **kwargs):
+            start = time.perf_counter()
+            output = await ask(prompt, *args, **kwargs)
+            self._event(
+                "llm",
+                tick=self._tick_index,
+                latency=time.perf_counter() - start,
+                prompt_hash=prompt_hash(prompt),
+                prompt=prompt,
+                output=output.model_dump() if output is not None else None,
+            )
+            return output
+
+        self._patch(llm, "ask", recorded_ask)
+
+    def _wrap_actions(self) -> None:
+        orchestrator = self.cortex.action_orchestrator
+        promise = orchestrator.promise
+
+        async def recorded_promise(actions):
+            start = time.perf_counter()
+            await promise(actions)
+            self._event(
+                "actions",
+                tick=self._tick_index,
+                latency=time.perf_counter() - start,
+                actions=[action.model_dump() for action in actions],
+            )
+
+        self._patch(orchestrator, "promise", recorded_promise)
+
+    def _wrap_tick(self) -> None:
+        tick = self.cortex._tick
+
+        async def recorded_tick():
+            start = time.perf_counter()
+            await tick()
+            self._event("tick", latency=time.perf_counter() - start)
+
+        self._patch(self.cortex, "_tick", recorded_tick)
@@ -0,0 +1,326 @@
+import asyncio
+import importlib
+import logging
+import time
+import typing as T
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from unittest.mock import MagicMock, patch
+
+from actions.base import ActionConfig, ActionConnector, AgentAction, Interface
+from inputs.base import SensorConfig
+from llm import LLM, LLMConfig
+from llm.output_model import CortexOutputModel
+from runtime.single_mode.config import RuntimeConfig
+from runtime.single_mode.cortex import CortexRuntime
+from tests.integration.mock_inputs.data_providers.mock_recording_provider import (
+    SessionRecording,
+    get_recording_provider,
+    load_recording,
+)
+from tests.integration.mock_inputs.mock_replay_input import MockReplayInput
+from tests.integration.replay.recorder import SessionRecorder, prompt_hash
+from tests.integration.replay.report import ComponentStats, build_report
+
+
+class ReplayLLM(LLM[CortexOutputModel]):
+    """
+    Stub LLM that returns the responses of a recording.
+
+    A prompt is answered with the next recorded response to the identical
+    prompt. Prompts that were never recorded (e.g. after changing the fuser)
+    fall back to the next recorded response in order, and are counted as
+    misses.
+
+    Parameters
+    ----------
+    recording : SessionRecording
+        The recording to answer from.
+    speed : float
+        Recorded LLM latency is divided by this factor; 0 answers instantly.
+    """
+
+    def __init__(
+        self,
+        recording: SessionRecording,
+        speed: float = 0.0,
+        config: LLMConfig = LLMConfig(),
+        available_actions: T.Optional[list] = None,
+    ):
+        super().__init__(config, available_actions)
+
+        self.speed = speed
+        self.responses = recording.of_kind("llm")
+        self.by_prompt: T.Dict[str, T.Deque[T.Dict[str, T.Any]]] = defaultdict(deque)
+        for event in self.responses:
+            self.by_prompt[event["prompt_hash"]].append(event)
+
+        self._next = 0
+        self.hits = 0
+        self.misses = 0
+        self.exhausted = False
+
+    async def ask(
+        self, prompt: str, messages: T.List[T.Dict[str, str]] = []
+    ) -> T.Optional[CortexOutputModel]:
+        """
+        Answer a prompt with a recorded response.
+
+        Parameters
+        ----------
+        prompt : str
+            The fused prompt.
+        messages : List[Dict[str, str]]
+            Ignored.
+
+        Returns
+        -------
+        CortexOutputModel or None
+            The recorded output, or None when the recording is exhausted.
+        """
+        self.io_provider.llm_start_time = time.time()
+        self.io_provider.set_llm_prompt(prompt)
+
+        matches = self.by_prompt.get(prompt_hash(prompt))
+        if matches:
+            event = matches.popleft()
+            self.hits += 1
+        elif self._next < len(self.responses):
+            event = self.responses[self._next]
+            self.misses += 1
+        else:
+            if not self.exhausted:
+                logging.warning("ReplayLLM: recording exhausted")
+            self.exhausted = True
+            return None
+        self._next = self.responses.index(event) + 1
+
+        if self.speed > 0:
+            await asyncio.sleep(event["latency"] / self.speed)
+
+        self.io_provider.llm_end_time = time.time()
+        if event["output"] is None:
+            return None
+        return CortexOutputModel(**event["output"])
+
+    @property
+    def match_rate(self) -> float:
+        """
+        Fraction of prompts that matched a recorded prompt exactly.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 1.0
+
+
+class ReplayConnector(ActionConnector[T.Any]):
+    """
+    Connector that records the actions it receives instead of executing them.
+    """
+
+    def __init__(self, config: ActionConfig):
+        super().__init__(config)
+        self.received: T.List[T.Any] = []
+
+    async def connect(self, input_protocol: T.Any) -> None:
+        self.received.append(input_protocol)
+
+    def tick(self) -> None:
+        time.sleep(0.1)
+
+
+def _load_interface(action_name: str) -> T.Type[Interface]:
+    module = importlib.import_module(f"actions.{action_name}.interface")
+    for _, obj in module.__dict__.items():
+        if isinstance(obj, type) and issubclass(obj, Interface) and obj != Interface:
+            return obj
+    raise ValueError(f"No interface found for action {action_name}")
+
+
+def build_replay_config(
+    recording: SessionRecording, llm_speed: float = 0.0
+) -> RuntimeConfig:
+    """
+    Rebuild the runtime configuration of a recording.
+
+    Inputs are replaced by MockReplayInput, the LLM by ReplayLLM and every
+    action connector by ReplayConnector; action interfaces are the real ones,
+    so prompts are fused exactly as in the recorded session.
+
+    Parameters
+    ----------
+    recording : SessionRecording
+        The recording.
+    llm_speed : float
+        Replay speed for recorded LLM latency; 0 answers instantly.
+
+    Returns
+    -------
+    RuntimeConfig
+        The replay configuration.
+    """
+    meta = recording.meta
+
+    agent_inputs = [
+        MockReplayInput(
+            SensorConfig(input_name=inp["name"], descriptor=inp["descriptor"])
+        )
+        for inp in meta["inputs"]
+    ]
+    agent_actions = [
+        AgentAction(
+            name=action["name"],
+            llm_label=action["llm_label"],
+            interface=_load_interface(action["name"]),
+            connector=ReplayConnector(ActionConfig()),
+            exclude_from_prompt=action["exclude_from_prompt"],
+        )
+        for action in meta["actions"]
+    ]
+
+    return RuntimeConfig(
+        version=meta.get("version", "v1.0.0"),
+        hertz=meta["hertz"],
+        name=meta["name"],
+        system_prompt_base=meta["system_prompt_base"],
+        system_governance=meta["system_governance"],
+        system_prompt_examples=meta["system_prompt_examples"],
+        agent_inputs=agent_inputs,  # type: ignore
+        cortex_llm=ReplayLLM(recording, llm_speed, available_actions=agent_actions),
+        simulators=[],
+        agent_actions=agent_actions,
+        backgrounds=[],
+    )
+
+
+@dataclass
+class ReplayResult:
+    """
+    Outcome of a replay.
+
+    Parameters
+    ----------
+    recording : SessionRecording
+        Recording of the replayed session itself.
+    report : Dict[str, ComponentStats]
+        Per-component throughput and latency of the replay.
+    actions : List[List[Dict[str, str]]]
+        Actions promised in each tick, in order.
+    match_rate : float
+        Fraction of prompts that matched a recorded prompt exactly.
+    """
+
+    recording: SessionRecording
+    report: T.Dict[str, ComponentStats]
+    actions: T.List[T.List[T.Dict[str, str]]] = field(default_factory=list)
+    match_rate: float = 1.0
+
+
+def recorded_actions(recording: SessionRecording) -> T.List[T.List[T.Dict[str, str]]]:
+    """
+    Get the actions promised in each tick of a recording.
+
+    Parameters
+    ----------
+    recording : SessionRecording
+        The recording.
+
+    Returns
+    -------
+    List[List[Dict[str, str]]]
+        One list of actions per tick that produced actions.
+    """
+    return [event["actions"] for event in recording.of_kind("actions")]
+
+
+def _replay_runtime(config: RuntimeConfig) -> CortexRuntime:
+    # The replay never talks to Zenoh
+    with patch("runtime.single_mode.cortex.ConfigProvider", MagicMock()):
+        return CortexRuntime(config, config.name, hot_reload=False)
+
+
+async def run_for(cortex: CortexRuntime, duration: float) -> None:
+    """
+    Run a CortexRuntime for a fixed time and shut it down.
+
+    The runtime's orchestrators are started as in ``CortexRuntime.run``, but
+    the ticks are driven here: the cortex loop swallows cancellations that
+    land in its tick sleep, so it cannot be stopped reliably from outside.
+
+    Parameters
+    ----------
+    cortex : CortexRuntime
+        The runtime.
+    duration : float
+        Seconds to run for.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+
+    await cortex._start_orchestrators()
+    try:
+        while loop.time() < deadline:
+            await asyncio.sleep(1 / cortex.config.hertz)
+            await cortex._tick()
+    finally:
+        await cortex._cleanup_tasks()
+
+
+async def replay_session(
+    recording: SessionRecording, mode: str = "lockstep", speed: float = 10.0
+) -> ReplayResult:
+    """
+    Replay a recording into a CortexRuntime.
+
+    ``lockstep`` runs one cortex tick per recorded tick with the recorded
+    buffers and no LLM latency, which is deterministic and as fast as the
+    runtime allows. ``timed`` runs the real cortex loop against inputs and
+    LLM latency replayed at ``speed`` times real time.
+
+    Parameters
+    ----------
+    recording : SessionRecording
+        The recording to replay.
+    mode : str
+        "lockstep" or "timed".
+    speed : float
+        Replay speed for timed mode.
+
+    Returns
+    -------
+    ReplayResult
+        The replayed actions and per-component report.
+    """
+    if mode not in ("lockstep", "timed"):
+        raise ValueError(f"Unknown replay mode: {mode}")
+
+    load_recording(recording, speed)
+    provider = get_recording_provider()
+
+    config = build_replay_config(recording, speed if mode == "timed" else 0.0)
+    cortex = _replay_runtime(config)
+    recorder = SessionRecorder(cortex).attach()
+
+    try:
+        if mode == "lockstep":
+            for tick in range(recording.tick_count):
+                provider.set_tick(tick)
+                await cortex._tick()
+        else:
+            config.hertz = config.hertz * speed
+            provider.start_clock()
+            await run_for(cortex, recording.duration / speed)
+
+        await asyncio.sleep(0)
+        await cortex.action_orchestrator.flush_promises()
+    finally:
+        replayed = recorder.detach()
+        cortex.action_orchestrator.stop()
+        provider.reset()
+
+    llm = T.cast(ReplayLLM, config.cortex_llm)
+    return ReplayResult(
+        recording=replayed,
+        report=build_report(replayed),
+        actions=recorded_actions(replayed),
+        match_rate=llm.match_rate,
+    )
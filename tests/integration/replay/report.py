@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from tests.integration.mock_inputs.data_providers.mock_recording_provider import (
+    SessionRecording,
+)
+
+
+@dataclass
+class ComponentStats:
+    """
+    Throughput and latency of one component of a session.
+
+    Parameters
+    ----------
+    count : int
+        Number of calls.
+    throughput_hz : float
+        Calls per second of session time.
+    p50_ms : float
+        Median latency in milliseconds.
+    p95_ms : float
+        95th percentile latency in milliseconds.
+    max_ms : float
+        Maximum latency in milliseconds.
+    """
+
+    count: int
+    throughput_hz: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+def _stats(latencies: List[float], duration: float) -> ComponentStats:
+    ms = np.asarray(latencies) * 1000.0
+    return ComponentStats(
+        count=len(latencies),
+        throughput_hz=len(latencies) / duration if duration > 0 else 0.0,
+        p50_ms=float(np.percentile(ms, 50)),
+        p95_ms=float(np.percentile(ms, 95)),
+        max_ms=float(ms.max()),
+    )
+
+
+def build_report(recording: SessionRecording) -> Dict[str, ComponentStats]:
+    """
+    Compute per-component throughput and latency of a session.
+
+    Inputs are reported as ``input:<name>`` for their ``raw_to_text`` calls;
+    the cortex loop as ``fuse``, ``llm``, ``actions`` and ``tick``.
+
+    Parameters
+    ----------
+    recording : SessionRecording
+        A recording, e.g. of a live session or of a replay.
+
+    Returns
+    -------
+    Dict[str, ComponentStats]
+        Stats per component that was called at least once.
+    """
+    latencies: Dict[str, List[float]] = {}
+    for event in recording.events:
+        component = event["kind"]
+        if component == "buffer":
+            continue
+        if component == "input":
+            component = f"input:{event['input']}"
+        latencies.setdefault(component, []).append(event["latency"])
+
+    duration = recording.duration
+    return {
+        component: _stats(values, duration)
+        for component, values in sorted(latencies.items())
+    }
+
+
+def format_report(report: Dict[str, ComponentStats]) -> str:
+    """
+    Format a report as a plain text table.
+
+    Parameters
+    ----------
+    report : Dict[str, ComponentStats]
+        Report from ``build_report``.
+
+    Returns
+    -------
+    str
+        The table.
+    """
+    width = max([len("component")] + [len(name) for name in report])
+    lines = [
+        f"{'component':<{width}} {'count':>7} {'hz':>9} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}"
+    ]
+    for name, stats in report.items():
+        lines.append(
+            f"{name:<{width}} {stats.count:>7d} {stats.throughput_hz:>9.2f} "
+            f"{stats.p50_ms:>9.2f} {stats.p95_ms:>9.2f} {stats.max_ms:>9.2f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,152 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from actions.base import ActionConfig, AgentAction
+from actions.speak.interface import Speak
+from inputs.base import SensorConfig
+from inputs.base.loop import FuserInput
+from llm import LLM
+from llm.output_model import Action, CortexOutputModel
+from providers.io_provider import IOProvider
+from runtime.single_mode.config import RuntimeConfig
+from runtime.single_mode.cortex import CortexRuntime
+from tests.integration.mock_inputs.data_providers.mock_recording_provider import (
+    SessionRecording,
+)
+from tests.integration.replay import SessionRecorder, format_report, replay_session
+from tests.integration.replay.replay import ReplayConnector
+
+
+class FakeASRInput(FuserInput[str]):
+    def __init__(self, config: SensorConfig = SensorConfig()):
+        super().__init__(config)
+        self.descriptor_for_LLM = "Voice"
+        self.messages = []
+
+    async def raw_to_text(self, raw_input):
+        self.messages.append(raw_input)
+
+    def formatted_latest_buffer(self):
+        if not self.messages:
+            return None
+        message = self.messages.pop()
+        self.messages = []
+        IOProvider().add_input("Voice", message, None)
+        return f"\nINPUT: Voice\n// START\n{message}\n// END\n"
+
+
+class FakeLLM(LLM[CortexOutputModel]):
+    async def ask(self, prompt, messages=[]):
+        await asyncio.sleep(0.001)
+        heard = (
+            prompt.split("// START\n")[1].split("\n")[0] if "// START" in prompt else ""
+        )
+        return CortexOutputModel(
+            actions=[Action(type="speak", value=f"I heard {heard}")]
+        )
+
+
+def _runtime():
+    actions = [
+        AgentAction(
+            name="speak",
+            llm_label="speak",
+            interface=Speak,
+            connector=ReplayConnector(ActionConfig()),
+            exclude_from_prompt=False,
+        )
+    ]
+    config = RuntimeConfig(
+        version="v1.0.0",
+        hertz=1,
+        name="replay_test",
+        system_prompt_base="You are a dog.",
+        system_governance="Be nice.",
+        system_prompt_examples="",
+        agent_inputs=[FakeASRInput()],
+        cortex_llm=FakeLLM(available_actions=actions),
+        simulators=[],
+        agent_actions=actions,
+        backgrounds=[],
+    )
+    with patch("runtime.single_mode.cortex.ConfigProvider", MagicMock()):
+        return CortexRuntime(config, config.name, hot_reload=False)
+
+
+async def _record_session(path):
+    cortex = _runtime()
+    recorder = SessionRecorder(cortex, record_raw=True).attach()
+    sensor = cortex.config.agent_inputs[0]
+
+    for i, text in enumerate(["hello", None, "sit", "good dog"]):
+        if text is not None:
+            await sensor.raw_to_text(text)
+        await cortex._tick()
+        await asyncio.sleep(0)
+
+    recording = recorder.detach()
+    cortex.action_orchestrator.stop()
+    recording.save(str(path))
+    return recording
+
+
+@pytest.mark.asyncio
+async def test_record_and_lockstep_replay(tmp_path):
+    path = tmp_path / "session.slog"
+    recorded = await _record_session(path)
+
+    recording = SessionRecording.load(str(path))
+    assert recording.meta["inputs"][0]["name"] == "FakeASRInput"
+    assert recording.tick_count == 4
+    assert [e["raw"] for e in recording.of_kind("input")] == [
+        "hello",
+        "sit",
+        "good dog",
+    ]
+
+    result = await replay_session(recording, mode="lockstep")
+
+    assert result.match_rate == 1.0
+    assert result.actions == [e["actions"] for e in recorded.of_kind("actions")]
+    assert result.actions[0] == [{"type": "speak", "value": "I heard hello"}]
+    assert result.recording.tick_count == recording.tick_count
+    for component in ("fuse", "llm", "actions", "tick"):
+        assert result.report[component].count == 4
+    assert "llm" in format_report(result.report)
+
+
+@pytest.mark.asyncio
+async def test_replay_misses_fall_back_to_recorded_order(tmp_path):
+    path = tmp_path / "session.slog"
+    await _record_session(path)
+
+    recording = SessionRecording.load(str(path))
+    recording.meta["system_prompt_base"] = "You are a cat."
+
+    result = await replay_session(recording, mode="lockstep")
+
+    assert result.match_rate == 0.0
+    assert result.actions[2] == [{"type": "speak", "value": "I heard sit"}]
+
+
+def test_recording_stores_arrays_raw(tmp_path):
+    recording = SessionRecording(
+        meta={"name": "scan"},
+        events=[
+            {
+                "kind": "input",
+                "t": 0.0,
+                "input": "RPLidar",
+                "latency": 0.001,
+                "raw": np.arange(4.0),
+            }
+        ],
+    )
+    recording.save(str(tmp_path / "scan.slog"))
+
+    loaded = SessionRecording.load(str(tmp_path / "scan.slog"))
+    assert loaded.meta == {"name": "scan"}
+    np.testing.assert_array_equal(loaded.events[0]["raw"], np.arange(4.0))
@@ -0,0 +1,208 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from llm import LLM, LLMConfig
+from llm.output_model import Action, CortexOutputModel
+from llm.plugins.router_llm import RouterLLM
+
+
+def make_backend(delay: float = 0.0, fails: bool = False, tools: bool = False):
+    class FakeLLM(LLM[CortexOutputModel]):
+        supports_tools = tools
+        calls = 0
+
+        async def ask(self, prompt, messages=[]):
+            type(self).calls += 1
+            await asyncio.sleep(delay)
+            if fails:
+                return None
+            return CortexOutputModel(
+                actions=[Action(type="speak", value=self._config.model)]
+            )
+
+    return FakeLLM
+
+
+def make_router(backends, **kwargs):
+    config = LLMConfig(
+        api_key="key",
+        backends=[{"type": name, "config": {"model": name}} for name in backends],
+        **kwargs,
+    )
+    with patch("llm.plugins.router_llm.load_llm", side_effect=backends.__getitem__):
+        return RouterLLM(config=config)
+
+
+@pytest.mark.asyncio
+async def test_without_backends():
+    router = RouterLLM(config=LLMConfig())
+
+    assert router.supports_tools is False
+    assert await router.ask("prompt") is None
+
+
+def test_backends_inherit_settings():
+    router = make_router({"a": make_backend(tools=True), "b": make_backend()})
+
+    assert router._backends[0].llm._config.api_key == "key"
+    assert router._backends[0].llm._config.model == "a"
+    assert router.supports_tools is False
+
+
+@pytest.mark.asyncio
+async def test_routes_to_fastest_backend():
+    router = make_router(
+        {"slow": make_backend(delay=0.05), "fast": make_backend()}, hedge_delay=1.0
+    )
+    router._backends[0].latencies.append(0.5)
+    router._backends[1].latencies.append(0.01)
+
+    result = await router.ask("prompt")
+
+    assert result.actions[0].value == "fast"
+    assert router._backends[0].requests == 0
+
+
+@pytest.mark.asyncio
+async def test_hedges_slow_backend():
+    slow, fast = make_backend(delay=1.0), make_backend()
+    router = make_router({"slow": slow, "fast": fast}, hedge_delay=0.05)
+
+    result = await router.ask("prompt")
+
+    assert result.actions[0].value == "fast"
+    assert slow.calls == 1 and fast.calls == 1
+    assert router.stats[1]["wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fails_over_without_waiting():
+    router = make_router(
+        {"broken": make_backend(fails=True), "ok": make_backend()}, hedge_delay=5.0
+    )
+
+    result = await asyncio.wait_for(router.ask("prompt"), timeout=1.0)
+
+    assert result.actions[0].value == "ok"
+    assert router.stats[0]["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_returns_none_on_timeout():
+    router = make_router(
+        {"a": make_backend(delay=5.0), "b": make_backend(delay=5.0)},
+        hedge_delay=0.01,
+        timeout=1,
+    )
+
+    assert await router.ask("prompt") is None
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_skips_failing_backend():
+    broken, ok = make_backend(fails=True), make_backend()
+    router = make_router(
+        {"broken": broken, "ok": ok}, failure_threshold=2, recovery_time=60.0
+    )
+
+    for _ in range(2):
+        await router.ask("prompt")
+    assert router.stats[0]["circuit_open"] is True
+
+    await router.ask("prompt")
+
+    assert broken.calls == 2
+    assert ok.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_circuit_half_opens_after_recovery():
+    broken = make_backend(fails=True)
+    router = make_router(
+        {"broken": broken, "ok": make_backend()},
+        failure_threshold=1,
+        recovery_time=0.0,
+    )
+
+    await router.ask("prompt")
+    await router.ask("prompt")
+
+    assert broken.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_counts_as_slow():
+    hung, fast = make_backend(delay=10.0), make_backend()
+    router = make_router({"hung": hung, "fast": fast}, hedge_delay=0.05)
+
+    await router.ask("prompt")
+
+    assert router.stats[0]["failures"] == 0
+    assert router.stats[0]["latency_ms"] >= 50
+    # The hung backend is no longer tried first
+    await router.ask("prompt")
+    assert hung.calls == 1 and fast.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_backend_losing_hedges_stays_healthy():
+    router = make_router(
+        {"fast": make_backend(delay=0.1), "slow": make_backend(delay=0.5)},
+        hedge_delay=0.02,
+        failure_threshold=3,
+    )
+    router._backends[0].latencies.append(0.1)
+    router._backends[1].latencies.append(0.5)
+
+    for _ in range(4):
+        result = await router.ask("prompt")
+        assert result.actions[0].value == "fast"
+
+    assert router.stats[1]["requests"] == 4
+    assert router.stats[1]["failures"] == 0
+    assert router.stats[1]["latency_ms"] == pytest.approx(500)
+    assert router.stats[1]["circuit"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_timed_out_request_counts_as_failure():
+    router = make_router({"hung": make_backend(delay=5.0)}, timeout=1)
+
+    assert await router.ask("prompt") is None
+    assert router.stats[0]["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_is_not_used():
+    broken = make_backend(fails=True)
+    router = make_router({"broken": broken}, failure_threshold=1, recovery_time=60.0)
+
+    await router.ask("prompt")
+    assert router.stats[0]["circuit"] == "open"
+
+    assert await router.ask("prompt") is None
+    assert broken.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_half_open_circuit_gets_one_trial():
+    flaky = make_backend(delay=0.05)
+    router = make_router(
+        {"flaky": flaky, "ok": make_backend(delay=0.1)},
+        failure_threshold=1,
+        recovery_time=60.0,
+        hedge_delay=5.0,
+    )
+    backend = router._backends[0]
+    backend.consecutive_failures = 1
+    backend.opened_at = time.time() - 60.0
+    assert router.stats[0]["circuit"] == "half-open"
+
+    results = await asyncio.gather(router.ask("prompt"), router.ask("prompt"))
+
+    assert [r.actions[0].value for r in results] == ["flaky", "ok"]
+    assert flaky.calls == 1
+    assert router.stats[0]["circuit"] == "closed"
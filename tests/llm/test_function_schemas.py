@@ -75,3 +75,12 @@ def test_generate_function_schema_from_action(agent_action):
 
     assert params["required"] == ["value"]
     assert fn["description"].startswith("SampleInterface(")
+
+
+def test_generate_compact_function_schema(agent_action):
+    schema = generate_function_schema_from_action(agent_action, compact=True)
+
+    fn = schema["function"]
+    assert "  " not in fn["description"]
+    assert fn["parameters"]["properties"]["value"] == {"type": "string"}
+    assert fn["parameters"]["required"] == ["value"]
@@ -0,0 +1,46 @@
+from unittest.mock import MagicMock, patch
+
+from llm import tokens
+from llm.tokens import count_tokens, token_report
+
+
+def test_count_tokens_estimates_without_tiktoken():
+    with (
+        patch.object(tokens, "tiktoken", None),
+        patch.object(tokens, "_encoding", None),
+    ):
+        assert count_tokens("") == 0
+        assert count_tokens("abcd") == 1
+        assert count_tokens("abcde") == 2
+
+
+def test_token_report_sections_and_tools():
+    with (
+        patch.object(tokens, "tiktoken", None),
+        patch.object(tokens, "_encoding", None),
+    ):
+        report = token_report(
+            {"inputs": "a" * 8, "actions": ""},
+            [{"type": "function", "function": {"name": "move"}}],
+        )
+
+    assert report["inputs"] == 2
+    assert report["actions"] == 0
+    assert report["tools"] > 0
+    assert report["total"] == report["inputs"] + report["tools"]
+
+
+def test_count_tokens_estimates_when_encoding_cannot_load():
+    tiktoken = MagicMock()
+    tiktoken.get_encoding.side_effect = OSError("no network")
+
+    with (
+        patch.object(tokens, "tiktoken", tiktoken),
+        patch.object(tokens, "_encoding", None),
+        patch.object(tokens, "_encoding_failed", False),
+    ):
+        assert count_tokens("abcd") == 1
+        assert count_tokens("abcde") == 2
+
+    # The download is only attempted once
+    tiktoken.get_encoding.assert_called_once()
@@ -1,7 +1,12 @@
+import json
 import sys
+import threading
+import time
+from queue import Queue
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 mock_om1_speech = MagicMock()
 mock_om1_speech.AudioOutputStream = MagicMock()
@@ -18,7 +23,12 @@ mock_pyaudio.PyAudio.return_value = mock_instance
 sys.modules["pyaudio"] = mock_pyaudio
 
 # Import after mocking
-from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider  # noqa: E402
+import providers.elevenlabs_tts_provider as tts_module  # noqa: E402
+from providers.elevenlabs_tts_provider import (  # noqa: E402
+    ElevenLabsTTSProvider,
+    split_sentences,
+)
+from providers.http_client_provider import HTTPClientError  # noqa: E402
 from providers.singleton import singleton  # noqa: E402
 
 
@@ -134,8 +144,6 @@ def test_configure_no_restart_when_same_parameters():
     )
     provider.running = True
 
-    provider._audio_stream._url = url
-
     with patch.object(provider, "stop") as mock_stop:
         provider.configure(
             url=url,
@@ -156,3 +164,155 @@ def test_start_stop():
 
     provider.stop()
     assert provider.running is False
+
+
+class _FakeResponse:
+    def __init__(self, audio):
+        self.ok = True
+        self.status_code = 200
+        self.text = ""
+        self._audio = audio
+
+    def json(self):
+        return {"response": self._audio}
+
+
+def _slow_tts(calls, delay=0.1):
+    def post_sync(url, json, headers, timeout):
+        calls.append(json["text"])
+        time.sleep(delay)
+        return _FakeResponse(f"audio:{json['text']}")
+
+    return post_sync
+
+
+class _FakeAudioStream:
+    """
+    Fetches queued requests from the stream URL in order and records the
+    audio, like AudioOutputStream.
+    """
+
+    def __init__(self, url):
+        self.url = url
+        self.played = []
+        self.requests = Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        while True:
+            request = self.requests.get()
+            response = requests.post(self.url, data=json.dumps(request), timeout=5)
+            if response.status_code == 200:
+                self.played.append(response.json()["response"])
+            self.requests.task_done()
+
+    def add_request(self, request):
+        self.requests.put(request)
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+def _pipelined_provider(tmp_path):
+    provider = ElevenLabsTTSProvider(cache_dir=str(tmp_path))
+    stream = _FakeAudioStream(provider._sentence_url())
+    provider._audio_stream = stream
+    return provider, stream
+
+
+def test_split_sentences():
+    assert split_sentences("Location X remembered... Woof!  Good dog? ") == [
+        "Location X remembered...",
+        "Woof!",
+        "Good dog?",
+    ]
+    assert split_sentences("v1.5 is out") == ["v1.5 is out"]
+    assert split_sentences("  ") == []
+
+
+def test_sentences_synthesized_concurrently_and_played_in_order(tmp_path):
+    provider, stream = _pipelined_provider(tmp_path)
+    calls = []
+    provider.http.post_sync = _slow_tts(calls)
+    provider.start()
+
+    start = time.monotonic()
+    provider.add_pending_message("One. Two! Three?")
+    assert provider.get_pending_message_count() == 3
+    stream.requests.join()
+    elapsed = time.monotonic() - start
+    provider.stop()
+
+    assert stream.played == ["audio:One.", "audio:Two!", "audio:Three?"]
+    assert sorted(calls) == ["One.", "Three?", "Two!"]
+    # Three 100 ms syntheses overlap instead of running back to back
+    assert elapsed < 0.25
+
+
+def test_repeated_phrases_come_from_cache(tmp_path):
+    provider, stream = _pipelined_provider(tmp_path)
+    calls = []
+    provider.http.post_sync = _slow_tts(calls, delay=0)
+    provider.start()
+
+    provider.add_pending_message("Location 1 remembered. Woof!")
+    stream.requests.join()
+    provider.add_pending_message("Location 2 remembered. Woof!")
+    stream.requests.join()
+    provider.stop()
+
+    assert calls.count("Woof!") == 1
+    assert stream.played[-1] == "audio:Woof!"
+    stats = provider.stats
+    assert stats["sentences"] == 4
+    assert stats["synthesized"] == 3
+    assert stats["hits"] == 1
+    assert stats["hit_rate"] == 0.25
+
+
+def test_failed_sentence_is_skipped(tmp_path):
+    provider, stream = _pipelined_provider(tmp_path)
+
+    def post_sync(url, json, headers, timeout):
+        if json["text"] == "Bad.":
+            raise HTTPClientError("boom")
+        return _FakeResponse(f"audio:{json['text']}")
+
+    provider.http.post_sync = post_sync
+    provider.start()
+    provider.add_pending_message("Bad. Good.")
+    stream.requests.join()
+    provider.stop()
+
+    assert stream.played == ["audio:Good."]
+    assert provider.stats["entries"] == 1
+
+
+def test_sentence_server_shared_and_started_lazily():
+    with patch.object(tts_module, "_sentence_server", None):
+        first = ElevenLabsTTSProvider()
+        assert tts_module._sentence_server is None
+
+        first.start()
+        server = tts_module._sentence_server
+        assert server is not None
+        first.stop()
+
+        singleton.instances = {}
+        second = ElevenLabsTTSProvider()
+        second.start()
+        assert tts_module._sentence_server is server
+        assert second._sentence_url() != first._sentence_url()
+        second.stop()
+
+
+def test_cache_is_opt_in():
+    provider = ElevenLabsTTSProvider()
+    provider.start()
+    provider.stop()
+
+    assert provider._cache is None
+    assert "hits" not in provider.stats
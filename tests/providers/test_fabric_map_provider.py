@@ -0,0 +1,205 @@
+import gzip
+import json as _json
+import os
+
+import pytest
+
+from providers.fabric_map_provider import FabricData, FabricDataSubmitter
+from providers.sensor_log_provider import read_sensor_log
+from providers.singleton import singleton
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    singleton.instances = {}
+    yield
+
+
+class _FakeResp:
+    def __init__(self, status=201):
+        self.status_code = status
+        self.text = ""
+
+
+class _FakeHTTP:
+    def __init__(self):
+        self.online = True
+        self.bodies = []
+
+    def post_sync(self, url, headers, timeout, retries, json=None, data=None):
+        if not self.online:
+            raise ConnectionError("offline")
+        if data is not None:
+            assert headers["Content-Encoding"] == "gzip"
+            self.bodies.append(_json.loads(gzip.decompress(data)))
+        else:
+            assert "Content-Encoding" not in headers
+            self.bodies.append(json)
+        return _FakeResp()
+
+
+def _record(idx: int) -> FabricData:
+    return FabricData(
+        machine_id="robot",
+        payload_idx=idx,
+        gps_unix_ts=0.0,
+        gps_lat=0.0,
+        gps_lon=0.0,
+        gps_alt=0.0,
+        gps_qua=0,
+        rtk_unix_ts=0.0,
+        rtk_lat=0.0,
+        rtk_lon=0.0,
+        rtk_alt=0.0,
+        rtk_qua=0,
+        mag=0.0,
+        unix_ts=0.0,
+        odom_x=0.0,
+        odom_y=0.0,
+        odom_rockchip_ts=0.0,
+        odom_subscriber_ts=0.0,
+        odom_yaw_0_360=0.0,
+        odom_yaw_m180_p180=0.0,
+        rf_data=[],
+        rf_data_raw=[],
+    )
+
+
+@pytest.fixture
+def submitter(tmp_path):
+    fds = FabricDataSubmitter(
+        api_key="key",
+        batch_size=3,
+        batch_interval=0.05,
+        batch_upload=True,
+        spool_dir=str(tmp_path / "spool"),
+    )
+    http = _FakeHTTP()
+    fds.http = http
+    yield fds, http
+    fds.stop()
+
+
+def _sent_indices(session):
+    return [[r["payload_idx"] for r in body] for body in session.bodies]
+
+
+def test_records_are_batched(submitter):
+    fds, session = submitter
+
+    for i in range(7):
+        fds.share_data(_record(i))
+    fds.stop()
+
+    assert sum(_sent_indices(session), []) == list(range(7))
+    assert all(len(batch) <= 3 for batch in session.bodies)
+    metrics = fds.metrics
+    assert metrics["records_queued"] == 7
+    assert metrics["records_sent"] == 7
+    assert metrics["spool_batches"] == 0
+
+
+def test_offline_batches_are_spooled_and_replayed_in_order(submitter):
+    fds, session = submitter
+    session.online = False
+
+    batch = [_record(i) for i in range(3)]
+    fds._process_batch(batch)
+    fds._process_batch([_record(i) for i in range(3, 5)])
+
+    # The second batch is spooled without an upload attempt during backoff
+    assert session.bodies == []
+    assert len(os.listdir(fds.spool_dir)) == 2
+    assert fds.metrics["batches_spooled"] == 2
+    assert fds.metrics["upload_failures"] == 1
+
+    session.online = True
+    fds._retry_at = 0.0
+    fds._process_batch([_record(5)])
+
+    assert _sent_indices(session) == [[0, 1, 2], [3, 4], [5]]
+    assert os.listdir(fds.spool_dir) == []
+    assert fds.metrics["batches_replayed"] == 2
+
+
+def test_spool_is_bounded(submitter):
+    fds, session = submitter
+    session.online = False
+    fds.max_spool_bytes = 1
+
+    fds._process_batch([_record(0)])
+    fds._process_batch([_record(1)])
+
+    assert fds.metrics["batches_dropped"] == 2
+    assert fds.metrics["spool_batches"] == 0
+
+
+def test_local_records_go_to_shared_sensor_log(tmp_path):
+    fds = FabricDataSubmitter(write_to_local_file=True, batch_interval=0.01)
+    fds.sensor_log.directory = str(tmp_path)
+
+    fds.share_data(_record(0))
+    fds.share_data(_record(1))
+    # Stopping the submitter flushes the shared sensor log
+    fds.stop()
+
+    path = next(tmp_path.glob("fabric_*.slog"))
+    assert [r["payload_idx"] for r in read_sensor_log(str(path))] == [0, 1]
+
+
+def test_records_are_posted_one_by_one_by_default(tmp_path):
+    fds = FabricDataSubmitter(
+        api_key="key", batch_size=3, spool_dir=str(tmp_path / "spool")
+    )
+    session = _FakeHTTP()
+    fds.http = session
+
+    fds._process_batch([_record(0), _record(1)])
+
+    assert [body["payload_idx"] for body in session.bodies] == [0, 1]
+    assert fds.metrics["records_sent"] == 2
+    fds.stop()
+
+
+def test_failed_uploads_back_off(submitter):
+    fds, session = submitter
+    session.online = False
+    fds.max_backoff = 0.2
+
+    for _ in range(4):
+        fds._retry_at = 0.0
+        fds._process_batch([_record(0)])
+
+    assert fds.metrics["backoff"] == 0.2
+    assert not fds._may_upload()
+
+    session.online = True
+    fds._retry_at = 0.0
+    fds._process_batch([_record(1)])
+
+    assert fds.metrics["backoff"] == 0.0
+    assert fds.metrics["spool_batches"] == 0
+
+
+def test_full_queue_spills_to_spool(tmp_path):
+    fds = FabricDataSubmitter(
+        api_key="key",
+        batch_size=100,
+        batch_interval=60.0,
+        max_queue=2,
+        spool_dir=str(tmp_path / "spool"),
+    )
+    session = _FakeHTTP()
+    fds.http = session
+    # Without an uploader the queue fills up
+    fds.stop()
+
+    for i in range(3):
+        fds.share_data(_record(i))
+
+    assert fds.metrics["records_spilled"] == 3
+    assert fds.metrics["queue_depth"] == 0
+    (path,) = fds._spool_files()
+    with open(path, "rb") as f:
+        spooled = _json.loads(gzip.decompress(f.read()))
+    assert [r["payload_idx"] for r in spooled] == [0, 1, 2]
@@ -1,4 +1,19 @@
+import json
+import threading
+import time
+
+import pytest
+from websockets.exceptions import ConnectionClosed
+from websockets.sync.server import serve
+
 from providers.face_presence_provider import FacePresenceProvider, PresenceSnapshot
+from providers.singleton import singleton
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    singleton.instances = {}
+    yield
 
 
 class _FakeResp:
@@ -187,3 +202,154 @@ def test_emit_invokes_callbacks(monkeypatch):
 
     assert got, "callback should be invoked"
     assert "In Camera View: 2 known (alice and bob) and 1 unknown face." in got[0]
+
+
+def _who(now=(), unknown_now=0):
+    return {"now": list(now), "unknown_now": unknown_now, "frames_recent": 0}
+
+
+def test_callbacks_fire_only_on_change():
+    provider = FacePresenceProvider(base_url="http://fake")
+    got = []
+    provider.register_message_callback(got.append)
+
+    for data in [_who(["alice"]), _who(["alice"]), _who(), _who(), _who(["bob"])]:
+        provider._publish(provider._parse_snapshot(data))
+
+    assert got == [
+        "In Camera View: 1 known (alice).",
+        "No one in view.",
+        "In Camera View: 1 known (bob).",
+    ]
+
+
+def test_late_subscriber_gets_current_line():
+    provider = FacePresenceProvider(base_url="http://fake")
+    provider._publish(provider._parse_snapshot(_who(["alice"])))
+
+    got = []
+    provider.register_message_callback(got.append)
+    assert got == ["In Camera View: 1 known (alice)."]
+
+
+def test_wait_for_wakes_on_snapshot():
+    provider = FacePresenceProvider(base_url="http://fake")
+
+    def later():
+        time.sleep(0.05)
+        provider._publish(provider._parse_snapshot(_who(unknown_now=2)))
+        time.sleep(0.05)
+        provider._publish(provider._parse_snapshot(_who(["alice"])))
+
+    threading.Thread(target=later, daemon=True).start()
+    snap = provider.wait_for(lambda s: s.names == ["alice"], timeout=1.0)
+    assert snap is not None and snap.names == ["alice"]
+
+    assert provider.wait_for(lambda s: s.unknown_faces == 5, timeout=0.05) is None
+
+
+def test_wait_for_ignores_earlier_snapshot():
+    provider = FacePresenceProvider(base_url="http://fake")
+    provider._publish(provider._parse_snapshot(_who(["alice"])))
+
+    assert provider.wait_for(lambda s: s.names == ["alice"], timeout=0.05) is None
+
+    threading.Timer(
+        0.05, provider._publish, [provider._parse_snapshot(_who(["alice"]))]
+    ).start()
+    assert provider.wait_for(lambda s: s.names == ["alice"], timeout=1.0)
+
+
+def test_running(monkeypatch):
+    provider = FacePresenceProvider(base_url="http://fake", fps=50.0)
+    _patch_post(monkeypatch, provider, _who(["alice"]))
+    assert not provider.running
+
+    provider.start()
+    assert provider.running
+    assert provider.wait_for(lambda s: s.names == ["alice"], timeout=1.0)
+
+    provider.stop(wait=True)
+    assert not provider.running
+
+
+class _FaceService:
+    """Local stand-in for the face service `/who/stream` websocket."""
+
+    def __init__(self):
+        self.subscriptions = []
+        self.clients = []
+        self.server = serve(self._handler, "127.0.0.1", 0)
+        self.url = f"http://127.0.0.1:{self.server.socket.getsockname()[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _handler(self, ws):
+        assert ws.request.path == "/who/stream"
+        self.clients.append(ws)
+        for raw in ws:
+            self.subscriptions.append(json.loads(raw))
+
+    def push(self, data):
+        for ws in list(self.clients):
+            try:
+                ws.send(json.dumps(data))
+            except ConnectionClosed:
+                pass
+
+    def close(self):
+        self.server.shutdown()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_subscription_mode_receives_pushed_snapshots():
+    service = _FaceService()
+    provider = FacePresenceProvider(
+        base_url=service.url, recent_sec=2.0, subscribe=True, reconnect_interval=0.05
+    )
+    got = []
+    provider.register_message_callback(got.append)
+    provider.start()
+    try:
+        assert _wait_for(lambda: service.subscriptions == [{"recent_sec": 2.0}])
+
+        service.push(_who(["alice"]))
+        service.push(_who(["alice"]))
+        service.push(_who(unknown_now=1))
+        assert _wait_for(lambda: len(got) == 2)
+        assert got == [
+            "In Camera View: 1 known (alice).",
+            "In Camera View: 1 unknown face.",
+        ]
+        assert provider.unknown_faces == 1
+
+        provider.set_recent_sec(5.0)
+        assert _wait_for(lambda: service.subscriptions[-1] == {"recent_sec": 5.0})
+    finally:
+        provider.stop(wait=True)
+        service.close()
+
+
+def test_subscription_mode_reconnects():
+    service = _FaceService()
+    provider = FacePresenceProvider(
+        base_url=service.url, subscribe=True, reconnect_interval=0.05
+    )
+    provider.start()
+    try:
+        assert _wait_for(lambda: len(service.clients) == 1)
+        service.clients[0].close()
+        assert _wait_for(lambda: len(service.clients) == 2)
+        service.push(_who(["bob"]))
+        assert _wait_for(lambda: provider.snapshot is not None)
+        assert provider.snapshot.names == ["bob"]
+    finally:
+        provider.stop(wait=True)
+        service.close()
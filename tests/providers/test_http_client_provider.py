@@ -0,0 +1,202 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from providers.http_client_provider import (
+    HTTPClientError,
+    HTTPClientProvider,
+    HTTPTimeoutError,
+)
+from providers.singleton import singleton
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    singleton.instances = {}
+    yield
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answers with the next scripted status, echoing the request as JSON."""
+
+    def _respond(self):
+        server: _Server = self.server  # type: ignore
+        server.calls.append((self.command, self.path))
+        status = server.statuses.pop(0) if server.statuses else 200
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.dumps(
+            {
+                "method": self.command,
+                "path": self.path,
+                "body": self.rfile.read(length).decode(),
+            }
+        ).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    def __init__(self, handler=_Handler):
+        super().__init__(("127.0.0.1", 0), handler)
+        self.calls = []
+        self.statuses = []
+
+    def handle_error(self, request, client_address):
+        # Clients that time out close the connection mid-response
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = _Server()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server, path="/x"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+@pytest.fixture
+def http():
+    client = HTTPClientProvider(backoff_factor=0.001, max_backoff=0.01)
+    yield client
+    client.close_sync()
+
+
+def test_singleton():
+    assert HTTPClientProvider() is HTTPClientProvider()
+
+
+@pytest.mark.asyncio
+async def test_async_request_reuses_session(server, http):
+    resp = await http.post(_url(server, "/a"), json={"k": 1})
+    assert resp.ok
+    assert resp.json() == {"method": "POST", "path": "/a", "body": '{"k": 1}'}
+
+    resp = await http.get(_url(server, "/b"), params={"q": "1"})
+    assert resp.json()["path"] == "/b?q=1"
+    assert http.stats["sessions"] == 1
+    await http.close()
+    assert http.stats["sessions"] == 0
+
+
+def test_sessions_of_closed_loops_are_closed(server, http):
+    async def first():
+        await http.get(_url(server))
+        return http._sessions[asyncio.get_running_loop()]
+
+    async def second():
+        await http.get(_url(server))
+        stats = http.stats
+        await http.close()
+        return stats
+
+    session = asyncio.run(first())
+    assert not session.closed
+
+    stats = asyncio.run(second())
+    assert session.closed
+    assert stats["sessions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_retries_idempotent_methods(server, http):
+    server.statuses = [503, 429]
+    resp = await http.get(_url(server))
+    assert resp.status_code == 200
+    assert len(server.calls) == 3
+    assert http.stats["retries"] == 2
+    await http.close()
+
+
+@pytest.mark.asyncio
+async def test_async_post_not_retried_by_default(server, http):
+    server.statuses = [503]
+    resp = await http.post(_url(server))
+    assert resp.status_code == 503
+    assert len(server.calls) == 1
+
+    server.statuses = [503]
+    resp = await http.post(_url(server), retries=1)
+    assert resp.status_code == 200
+    await http.close()
+
+
+@pytest.mark.asyncio
+async def test_async_last_retryable_response_is_returned(server, http):
+    server.statuses = [500, 500, 500]
+    resp = await http.get(_url(server))
+    assert resp.status_code == 500
+    assert not resp.ok
+    assert len(server.calls) == 3
+    await http.close()
+
+
+@pytest.mark.asyncio
+async def test_async_connection_error(http):
+    with pytest.raises(HTTPClientError):
+        await http.get("http://127.0.0.1:1/", retries=1)
+    assert http.stats["failures"] == 1
+    await http.close()
+
+
+@pytest.mark.asyncio
+async def test_async_timeout(http):
+    class _Slow(_Handler):
+        def _respond(self):
+            threading.Event().wait(0.5)
+            super()._respond()
+
+        do_GET = _respond
+
+    httpd = _Server(_Slow)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        with pytest.raises(HTTPTimeoutError):
+            await http.get(_url(httpd), timeout=0.05, retries=0)
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        await http.close()
+
+
+def test_sync_facade(server, http):
+    server.statuses = [502]
+    resp = http.put_sync(_url(server, "/p"), data=b"payload")
+    assert resp.status_code == 200
+    assert resp.json()["body"] == "payload"
+    assert [c[0] for c in server.calls] == ["PUT", "PUT"]
+
+    resp = http.post_sync(_url(server), json={"a": 1})
+    assert resp.json()["body"] == '{"a": 1}'
+
+
+def test_sync_connection_error(http):
+    with pytest.raises(HTTPClientError):
+        http.get_sync("http://127.0.0.1:1/", retries=0)
+
+
+def test_backoff_is_bounded():
+    http = HTTPClientProvider(backoff_factor=1.0, max_backoff=2.0)
+    for attempt in range(6):
+        assert 0 <= http._backoff(attempt) <= 2.0
+    assert http._backoff(0, retry_after="1.5") >= 1.5
+    assert http._backoff(0, retry_after="60") == 2.0
+    assert http._backoff(0, retry_after="bogus") <= 1.0
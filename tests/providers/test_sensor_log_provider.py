@@ -0,0 +1,157 @@
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from providers.sensor_log_provider import (
+    SensorLogProvider,
+    decode_frame,
+    encode_frame,
+    read_sensor_log,
+    sensor_log_to_jsonl,
+)
+from providers.singleton import singleton
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    singleton.instances = {}
+    yield
+
+
+def test_frame_roundtrip_keeps_arrays_raw():
+    frame = np.arange(12, dtype=np.float64).reshape(6, 2)
+    record = {"odom_x": 1.5, "detections": [{"class": "cat"}], "frame": frame}
+
+    encoded = encode_frame(record)
+    decoded = decode_frame(encoded)
+
+    # array bytes are stored as-is rather than as JSON text
+    assert frame.tobytes() in encoded
+    assert decoded["odom_x"] == 1.5
+    assert decoded["detections"] == [{"class": "cat"}]
+    np.testing.assert_array_equal(decoded["frame"], frame)
+    assert decoded["frame"].dtype == np.float64
+
+
+def test_writer_writes_and_reads_back(tmp_path):
+    writer = SensorLogProvider(directory=str(tmp_path), flush_interval=0.01)
+
+    for i in range(5):
+        assert writer.log("lidar", {"i": i, "frame": np.full((3, 2), i)})
+    writer.stop()
+
+    stats = writer.stats
+    assert stats.queued == 5
+    assert stats.written == 5
+    assert stats.dropped == 0
+
+    files = list(tmp_path.glob("lidar_*.slog"))
+    assert len(files) == 1
+    records = list(read_sensor_log(str(files[0])))
+    assert [r["i"] for r in records] == list(range(5))
+    np.testing.assert_array_equal(records[3]["frame"], np.full((3, 2), 3))
+
+
+def test_size_rotation(tmp_path):
+    writer = SensorLogProvider(directory=str(tmp_path), max_file_size_bytes=100)
+
+    for i in range(4):
+        writer.log("yolo", {"i": i, "pad": "x" * 80})
+    writer.stop()
+
+    files = sorted(tmp_path.glob("yolo_*.slog"))
+    assert len(files) == 4
+    assert writer.stats.rotations == 3
+    assert [r["i"] for f in files for r in read_sensor_log(str(f))] == [0, 1, 2, 3]
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    writer = SensorLogProvider(directory=str(tmp_path), queue_size=2)
+    # Not started, so nothing drains the queue
+    writer.running = True
+
+    assert writer.log("lidar", {"i": 0})
+    assert writer.log("lidar", {"i": 1})
+    assert not writer.log("lidar", {"i": 2})
+    assert writer.stats.dropped == 1
+
+
+def test_stats_are_safe_while_streams_open(tmp_path):
+    writer = SensorLogProvider(directory=str(tmp_path))
+    done = threading.Event()
+    errors = []
+
+    def read_stats():
+        while not done.is_set():
+            try:
+                writer.stats
+            except Exception as e:
+                errors.append(e)
+
+    reader = threading.Thread(target=read_stats)
+    reader.start()
+    for i in range(200):
+        writer.log(f"stream{i}", {"i": i})
+    writer.stop()
+    done.set()
+    reader.join()
+
+    assert errors == []
+    assert writer.stats.written == 200
+    assert writer.stats.files == {}
+
+
+class _Owner:
+    pass
+
+
+def test_writer_stops_with_last_owner(tmp_path):
+    writer = SensorLogProvider(directory=str(tmp_path))
+    lidar, yolo = _Owner(), _Owner()
+    writer.acquire(lidar)
+    writer.acquire(yolo)
+
+    writer.release(lidar)
+    writer.release(lidar)
+    assert writer.running
+    assert writer.log("yolo", {"i": 0})
+
+    writer.release(yolo)
+    assert not writer.running
+    assert writer.stats.written == 1
+
+
+def test_log_after_stop_is_dropped(tmp_path):
+    writer = SensorLogProvider(directory=str(tmp_path))
+    writer.log("lidar", {"i": 0})
+    writer.stop()
+
+    assert not writer.log("lidar", {"i": 1})
+    assert not writer.running
+    assert writer.stats.queued == 1
+
+    owner = _Owner()
+    writer.acquire(owner)
+    assert writer.log("lidar", {"i": 2})
+    writer.stop()
+    assert writer.stats.written == 2
+
+
+def test_convert_to_jsonl_ignores_truncated_tail(tmp_path):
+    writer = SensorLogProvider(directory=str(tmp_path))
+    writer.log("lidar", {"frame": np.array([[1.0, 2.0]])})
+    writer.log("lidar", {"frame": np.array([[3.0, 4.0]])})
+    writer.stop()
+
+    path = next(tmp_path.glob("lidar_*.slog"))
+    with open(path, "ab") as f:
+        f.write(b"\x40\x00\x00\x00garbage")
+
+    out = sensor_log_to_jsonl(str(path))
+    with open(out) as f:
+        assert [json.loads(line) for line in f] == [
+            {"frame": [[1.0, 2.0]]},
+            {"frame": [[3.0, 4.0]]},
+        ]
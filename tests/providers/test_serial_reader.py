@@ -0,0 +1,168 @@
+import threading
+import time
+from functools import reduce
+from unittest.mock import patch
+
+import pytest
+
+from providers.gps_provider import GpsProvider
+from providers.rtk_provider import RtkProvider
+from providers.serial_reader import LineFramer, SerialLineReader, split_nmea
+from providers.singleton import singleton
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    singleton.instances = {}
+    yield
+
+
+def _nmea(body):
+    checksum = reduce(lambda acc, c: acc ^ ord(c), body, 0)
+    return f"${body}*{checksum:02X}"
+
+
+GGA = _nmea("GNGGA,231225.30,3723.2475,N,12158.3416,W,4,12,0.8,9.0,M,,M,,")
+
+
+class FakeSerial:
+    """Serial port fed by the test; reads block up to the timeout."""
+
+    def __init__(self, timeout=0.05):
+        self.timeout = timeout
+        self._data = bytearray()
+        self._cond = threading.Condition()
+        self.reads = 0
+
+    def feed(self, data: bytes):
+        with self._cond:
+            self._data += data
+            self._cond.notify_all()
+
+    @property
+    def in_waiting(self):
+        with self._cond:
+            return len(self._data)
+
+    def read(self, size=1):
+        with self._cond:
+            self._cond.wait_for(lambda: self._data, timeout=self.timeout)
+            self.reads += 1
+            chunk = bytes(self._data[:size])
+            del self._data[:size]
+            return chunk
+
+    def reset_input_buffer(self):
+        pass
+
+
+def _wait_for(predicate, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_framer_handles_partial_and_crlf_lines():
+    framer = LineFramer()
+    assert framer.feed(b"HDG:1") == []
+    assert framer.feed(b"2.5\r\nHDG:13") == [b"HDG:12.5"]
+    assert framer.feed(b".0\n\n\r\nSAT:7\n") == [b"HDG:13.0", b"SAT:7"]
+
+
+def test_framer_drops_overlong_lines_and_resyncs():
+    framer = LineFramer(max_line=8)
+    assert framer.feed(b"0123456789ABCDEF") == []
+    assert framer.feed(b"GHIJ\nok\n") == [b"ok"]
+    assert framer.feed(b"0123456789\nfine\n") == [b"fine"]
+    assert framer.dropped == 2
+
+
+def test_split_nmea():
+    sentence = split_nmea(GGA)
+    assert sentence is not None
+    assert (sentence.talker, sentence.msg_id) == ("GN", "GGA")
+    assert sentence.fields[0] == "231225.30"
+
+    assert split_nmea(GGA[:-1] + "0") is None
+    assert split_nmea(GGA.replace("3723", "3724")) is None
+    assert split_nmea("GPS:not nmea") is None
+
+
+def test_reader_keeps_up_with_bursts():
+    port = FakeSerial()
+    lines = []
+    reader = SerialLineReader(port, lines.append)
+    reader.start()
+    try:
+        burst = b"".join(f"HDG:{i}.0\n".encode() for i in range(200))
+        port.feed(burst)
+        assert _wait_for(lambda: len(lines) == 200, timeout=0.5)
+        # The burst is read in a handful of reads, not one line per 100 ms
+        assert port.reads < 20
+    finally:
+        reader.stop()
+    assert reader.stats["lines"] == 200
+
+
+def test_reader_counts_garbled_lines():
+    port = FakeSerial()
+
+    def on_line(line):
+        if line == "boom":
+            raise ValueError(line)
+
+    reader = SerialLineReader(port, on_line)
+    reader.start()
+    try:
+        port.feed(b"\xff\xfe\n" + b"boom\n" + b"ok\n")
+        assert _wait_for(lambda: reader.stats["lines"] == 2)
+        assert reader.stats["garbled"] == 2
+    finally:
+        reader.stop()
+
+
+def test_rtk_provider_exposes_latest_fix():
+    port = FakeSerial()
+    with patch("providers.rtk_provider.serial.Serial", return_value=port):
+        rtk = RtkProvider(serial_port="/dev/fake")
+    try:
+        bad = GGA[:-2] + "00"
+        port.feed(
+            f"{_nmea('GNGSA,A,3,,,,,,,,,,,,,1.0,0.8,0.6')}\r\n{bad}\r\n{GGA}\r\n".encode()
+        )
+        assert _wait_for(lambda: rtk.fix is not None)
+        fix = rtk.fix
+        assert fix.qua == 4
+        assert fix.sat == 12
+        assert fix.lat == pytest.approx(37.387458, abs=1e-6)
+        assert fix.age < 1.0
+        assert rtk.data["rtk_qua"] == 4
+
+        stats = rtk.stats
+        assert stats["sentences"] == 2
+        assert stats["garbled"] == 1
+    finally:
+        rtk.stop()
+
+
+def test_gps_provider_processes_lines_as_they_arrive():
+    port = FakeSerial()
+    with patch("providers.gps_provider.serial.Serial", return_value=port):
+        gps = GpsProvider(serial_port="/dev/fake")
+    try:
+        lines = [f"HDG:{i}.0" for i in range(30)]
+        lines.append(
+            "GPS:3723.2475N,12158.3416W,x,H:90.0,ALT:9.0,SAT:7,TIME:25:06:01:12:00:00:000,QUA:1"
+        )
+        lines.append("GPS:garbage")
+        port.feed(("\n".join(lines) + "\n").encode())
+        assert _wait_for(lambda: gps.stats["lines"] == 32, timeout=0.5)
+        assert gps.data["yaw_mag_0_360"] == 29.0
+        assert gps.fix is not None
+        assert gps.fix.sat == 7
+        assert gps.stats["garbled"] == 1
+    finally:
+        gps.stop()
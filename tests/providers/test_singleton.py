@@ -0,0 +1,65 @@
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from providers.singleton import provider_scope, singleton
+
+
+@singleton
+class Counter:
+    def __init__(self):
+        self.value = 0
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    singleton.instances = {}
+    yield
+    singleton.instances = {}
+
+
+def test_one_instance_per_process():
+    assert Counter() is Counter()
+
+
+def test_scope_has_its_own_instance():
+    shared = Counter()
+    with provider_scope() as instances:
+        scoped = Counter()
+        assert scoped is Counter()
+        assert scoped is not shared
+        assert list(instances.values()) == [scoped]
+    assert Counter() is shared
+
+
+def test_scope_can_be_reentered():
+    with provider_scope() as instances:
+        scoped = Counter()
+    with provider_scope(instances):
+        assert Counter() is scoped
+
+
+async def test_scopes_are_isolated_between_tasks():
+    async def run(value):
+        with provider_scope():
+            Counter().value = value
+            await asyncio.sleep(0.01)
+            return Counter().value
+
+    assert await asyncio.gather(run(1), run(2), run(3)) == [1, 2, 3]
+    assert Counter().value == 0
+
+
+def test_copied_context_carries_scope_into_threads():
+    seen = []
+    with provider_scope():
+        scoped = Counter()
+        context = contextvars.copy_context()
+    thread = threading.Thread(
+        target=context.run, args=(lambda: seen.append(Counter()),)
+    )
+    thread.start()
+    thread.join()
+    assert seen == [scoped]
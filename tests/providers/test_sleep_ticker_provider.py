@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import time
 
 import pytest
@@ -11,6 +12,7 @@ def sleep_ticker():
     provider = SleepTickerProvider()
     provider._skip_sleep = False
     provider._current_sleep_task = None
+    provider._wake_priority = None
     return provider
 
 
@@ -58,3 +60,57 @@ async def test_skip_sleep_property(sleep_ticker):
     assert sleep_ticker.skip_sleep is False
     sleep_ticker.skip_sleep = True
     assert sleep_ticker.skip_sleep is True
+
+
+@pytest.mark.asyncio
+async def test_wake_from_thread(sleep_ticker):
+    start_time = time.time()
+    timer = threading.Timer(0.05, sleep_ticker.wake, args=(1,))
+    timer.start()
+    await sleep_ticker.sleep(2)
+    timer.join()
+
+    assert time.time() - start_time < 1
+    assert sleep_ticker.take_wake() == 1
+    assert sleep_ticker.skip_sleep is False
+    assert sleep_ticker.take_wake() == 0
+
+
+@pytest.mark.asyncio
+async def test_until_woken_supersedes_lower_priority(sleep_ticker):
+    cancelled = asyncio.Event()
+
+    async def slow_request():
+        try:
+            await asyncio.sleep(2)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    asyncio.get_running_loop().call_later(0.05, sleep_ticker.wake, 0)
+    asyncio.get_running_loop().call_later(0.1, sleep_ticker.wake, 2)
+    result, superseded = await sleep_ticker.until_woken(slow_request(), 1)
+
+    assert (result, superseded) == (None, True)
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+@pytest.mark.asyncio
+async def test_until_woken_returns_result(sleep_ticker):
+    async def request():
+        return "output"
+
+    sleep_ticker.wake(1)
+    result, superseded = await sleep_ticker.until_woken(request(), 1)
+    assert (result, superseded) == ("output", False)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_caller_is_not_swallowed(sleep_ticker):
+    task = asyncio.create_task(sleep_ticker.sleep(2))
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(task, 1)
+    assert sleep_ticker._current_sleep_task is None
@@ -0,0 +1,65 @@
+import os
+import time
+
+from providers.tts_audio_cache import TTSAudioCache
+
+
+def test_key_depends_on_all_fields():
+    key = TTSAudioCache.key("voice", "model", "mp3", "Woof!")
+    assert key == TTSAudioCache.key("voice", "model", "mp3", "Woof!")
+    assert key != TTSAudioCache.key("other", "model", "mp3", "Woof!")
+    assert key != TTSAudioCache.key("voice", "other", "mp3", "Woof!")
+    assert key != TTSAudioCache.key("voice", "model", "pcm", "Woof!")
+    assert key != TTSAudioCache.key("voice", "model", "mp3", "Woof")
+
+
+def test_get_and_put(tmp_path):
+    cache = TTSAudioCache(str(tmp_path))
+    assert cache.get("a") is None
+    cache.put("a", "QUFB")
+    assert cache.get("a") == "QUFB"
+
+    stats = cache.stats
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["entries"] == 1
+    assert stats["bytes"] == 4
+
+
+def test_least_recently_used_is_evicted(tmp_path):
+    cache = TTSAudioCache(str(tmp_path), max_bytes=10)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    cache.get("a")
+    cache.put("c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "cccc"
+    assert cache.stats["evictions"] == 1
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        [f"a{TTSAudioCache.SUFFIX}", f"c{TTSAudioCache.SUFFIX}"]
+    )
+
+
+def test_survives_restart_in_lru_order(tmp_path):
+    cache = TTSAudioCache(str(tmp_path))
+    cache.put("old", "1111")
+    cache.put("new", "2222")
+    past = time.time() - 60
+    os.utime(tmp_path / f"old{TTSAudioCache.SUFFIX}", (past, past))
+
+    reloaded = TTSAudioCache(str(tmp_path), max_bytes=6)
+    assert reloaded.stats["entries"] == 1
+    assert reloaded.get("new") == "2222"
+    assert reloaded.get("old") is None
+
+
+def test_missing_file_is_a_miss(tmp_path):
+    cache = TTSAudioCache(str(tmp_path))
+    cache.put("a", "aaaa")
+    os.remove(tmp_path / f"a{TTSAudioCache.SUFFIX}")
+    assert cache.get("a") is None
+    assert cache.stats["entries"] == 0
+    assert cache.stats["bytes"] == 0
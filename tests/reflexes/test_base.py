@@ -0,0 +1,54 @@
+import pytest
+
+from llm.output_model import Action
+from reflexes import load_reflex
+from reflexes.base import Reflex, evaluate_condition, read_path
+
+
+class Lidar:
+    lidar_string = "You are surrounded by objects. DO NOT MOVE."
+    movement_options = {"advance": [], "retreat": False}
+
+
+def test_evaluate_condition():
+    assert evaluate_condition(5, {"min": 1, "max": 10})
+    assert not evaluate_condition("5", {"min": 1})
+    assert evaluate_condition("DO NOT MOVE.", {"contains": "do not move"})
+    assert evaluate_condition("a", {"one_of": ["a", "b"]})
+    assert evaluate_condition("a", {"not": "b"})
+    assert evaluate_condition([], {"empty": True})
+    assert evaluate_condition([3], {"empty": False})
+    assert not evaluate_condition(None, {"empty": True})
+
+
+def test_read_path_misses_satisfy_no_condition():
+    assert read_path(Lidar(), "movement_options.advance") == []
+    missing = read_path(Lidar(), "movement_options.turn_left")
+    assert not evaluate_condition(missing, {"empty": True})
+    assert not evaluate_condition(read_path(Lidar(), "missing"), None)
+
+
+def test_reflex_matches_and_vetoes():
+    reflex = load_reflex(
+        {
+            "name": "stop",
+            "provider": "Lidar",
+            "conditions": {
+                "lidar_string": {"contains": "DO NOT MOVE"},
+                "movement_options.advance": {"empty": True},
+            },
+            "actions": [{"type": "move", "value": "stand still"}],
+            "veto": [{"type": "move", "value": {"not": "stand still"}}],
+        }
+    )
+
+    assert isinstance(reflex, Reflex)
+    assert reflex.matches(Lidar())
+    assert reflex.vetoes(Action(type="move", value="move forwards"))
+    assert not reflex.vetoes(Action(type="move", value="stand still"))
+    assert not reflex.vetoes(Action(type="speak", value="hello"))
+
+
+def test_load_reflex_requires_conditions():
+    with pytest.raises(ValueError):
+        load_reflex({"name": "stop", "provider": "Lidar"})
@@ -0,0 +1,86 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from actions.orchestrator import ActionOrchestrator
+from llm.output_model import Action
+from providers.reflex_provider import ReflexProvider
+from providers.singleton import provider_scope, singleton
+from reflexes import load_reflex
+from reflexes.orchestrator import ReflexOrchestrator
+
+
+@singleton
+class ObstacleProvider:
+    def __init__(self):
+        self.lidar_string = "The path ahead is clear."
+
+
+@pytest.fixture
+def scope():
+    with provider_scope():
+        yield
+
+
+@pytest.fixture
+def config():
+    config = Mock()
+    config.agent_actions = []
+    config.reflexes = [
+        load_reflex(
+            {
+                "name": "stop_on_obstacle",
+                "provider": "ObstacleProvider",
+                "conditions": {"lidar_string": {"contains": "DO NOT MOVE"}},
+                "actions": [{"type": "move", "value": "stand still"}],
+                "veto": [{"type": "move", "value": {"not": "stand still"}}],
+                "message": "You stopped for an obstacle.",
+                "cooldown": 0.0,
+            }
+        )
+    ]
+    return config
+
+
+@pytest.mark.asyncio
+async def test_reflex_fires_vetoes_and_releases(scope, config):
+    action_orchestrator = Mock()
+    action_orchestrator.promise = AsyncMock()
+    orchestrator = ReflexOrchestrator(config, action_orchestrator)
+    reflex_provider = ReflexProvider()
+    provider = ObstacleProvider()
+
+    await orchestrator.evaluate()
+    action_orchestrator.promise.assert_not_called()
+
+    provider.lidar_string = "You are surrounded by objects. DO NOT MOVE."
+    await orchestrator.evaluate()
+    await orchestrator.evaluate()
+
+    action_orchestrator.promise.assert_called_once()
+    (actions,), kwargs = action_orchestrator.promise.call_args
+    assert actions == [Action(type="move", value="stand still")]
+    assert kwargs == {"ignore_vetoes": True}
+    assert reflex_provider.vetoed_by(Action(type="move", value="move forwards"))
+    assert reflex_provider.take_messages() == ["You stopped for an obstacle."]
+    assert orchestrator.stats[0]["firings"] == 1
+    assert orchestrator.stats[0]["vetoed"] == 1
+
+    provider.lidar_string = "The path ahead is clear."
+    await orchestrator.evaluate()
+    assert reflex_provider.vetoed_by(Action(type="move", value="move forwards")) is None
+    assert orchestrator.stats[0]["active"] is False
+
+
+@pytest.mark.asyncio
+async def test_action_orchestrator_drops_vetoed_actions(scope, config):
+    move = Mock()
+    move.llm_label = "move"
+    config.agent_actions = [move]
+    action_orchestrator = ActionOrchestrator(config)
+    ReflexProvider().activate("stop", lambda action: action.value != "stand still")
+
+    await action_orchestrator.promise([Action(type="move", value="move forwards")])
+    assert action_orchestrator.promise_queue == []
+
+    action_orchestrator.stop()
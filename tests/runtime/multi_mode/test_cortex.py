@@ -333,6 +333,18 @@ class TestModeCortexRuntime:
             mock_task2.cancel.assert_called_once()
             mock_gather.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_cleanup_closes_http_client(self, cortex_runtime):
+        """Test cleanup closes the shared HTTP client sessions."""
+        runtime, mocks = cortex_runtime
+        http_client = Mock(close=AsyncMock())
+
+        with patch("runtime.multi_mode.cortex.find_instance", return_value=http_client):
+            await runtime._cleanup_tasks()
+
+        http_client.close.assert_awaited_once()
+        http_client.close_sync.assert_called_once()
+
 
 class TestModeCortexRuntimeHotReload:
     """Test cases for hot reload functionality in ModeCortexRuntime."""
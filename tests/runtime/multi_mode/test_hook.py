@@ -12,11 +12,20 @@ from runtime.multi_mode.hook import (
     LifecycleHookType,
     MessageHookHandler,
     create_hook_handler,
+    describe_hook,
     execute_lifecycle_hooks,
     parse_lifecycle_hooks,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_function_cache():
+    """Forget the functions resolved by other tests."""
+    FunctionHookHandler._functions.clear()
+    yield
+    FunctionHookHandler._functions.clear()
+
+
 @pytest.fixture
 def sample_message_hook():
     """Sample message hook configuration."""
@@ -468,6 +477,21 @@ async def test_function_handler_no_module():
                 assert result is False
                 mock_logging.error.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_function_handler_caches_function(self, sample_context):
+        """Test that the function is only searched for once."""
+        config = {"function": "test_func", "module_name": "test_module"}
+
+        def mock_function(context):
+            return True
+
+        with patch.object(
+            FunctionHookHandler, "_find_function_in_module", return_value=mock_function
+        ) as mock_find:
+            assert await FunctionHookHandler(config).execute(sample_context) is True
+            assert await FunctionHookHandler(config).execute(sample_context) is True
+            mock_find.assert_called_once_with("test_module", "test_func")
+
     def test_find_function_in_module_hooks_dir_not_found(self):
         """Test function search when hooks directory doesn't exist."""
         handler = FunctionHookHandler({})
@@ -1167,3 +1191,88 @@ class TestExecuteLifecycleHooks:
         ):
             result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
             assert result is False  # Overall result is False due to one failure
+
+    @pytest.mark.asyncio
+    async def test_execute_hooks_same_priority_concurrently(self):
+        """Test that asynchronous hooks of the same priority run concurrently."""
+        hooks = [
+            LifecycleHook(
+                hook_type=LifecycleHookType.ON_ENTRY,
+                handler_type="command",
+                handler_config={"command": f"hook {i}"},
+            )
+            for i in range(3)
+        ]
+
+        async def slow_execution(context):
+            await asyncio.sleep(0.1)
+            return True
+
+        mock_handler = AsyncMock()
+        mock_handler.execute.side_effect = slow_execution
+
+        timings = {}
+        with patch(
+            "runtime.multi_mode.hook.create_hook_handler", return_value=mock_handler
+        ):
+            start = asyncio.get_running_loop().time()
+            result = await execute_lifecycle_hooks(
+                hooks, LifecycleHookType.ON_ENTRY, timings=timings
+            )
+            elapsed = asyncio.get_running_loop().time() - start
+
+        assert result is True
+        assert elapsed < 0.25
+        assert set(timings) == {"command:hook 0", "command:hook 1", "command:hook 2"}
+        assert all(duration >= 0.09 for duration in timings.values())
+
+    @pytest.mark.asyncio
+    async def test_execute_hooks_sync_hook_runs_alone(self):
+        """Test that a synchronous hook does not overlap other hooks."""
+        hooks = [
+            LifecycleHook(
+                hook_type=LifecycleHookType.ON_ENTRY,
+                handler_type="message",
+                handler_config={"message": name},
+                async_execution=name != "sync",
+            )
+            for name in ["first", "sync", "last"]
+        ]
+
+        events = []
+
+        def track_execution(hook):
+            handler = AsyncMock()
+
+            async def execute_with_tracking(context):
+                name = hook.handler_config["message"]
+                events.append(f"start {name}")
+                await asyncio.sleep(0.01)
+                events.append(f"end {name}")
+                return True
+
+            handler.execute = execute_with_tracking
+            return handler
+
+        with patch(
+            "runtime.multi_mode.hook.create_hook_handler", side_effect=track_execution
+        ):
+            result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+
+        assert result is True
+        assert events == [
+            "start first",
+            "end first",
+            "start sync",
+            "end sync",
+            "start last",
+            "end last",
+        ]
+
+
+def test_describe_hook(sample_function_hook, sample_command_hook):
+    """Test the names of hooks in timing reports."""
+    assert describe_hook(sample_function_hook) == "function:test_module.startup_handler"
+    assert describe_hook(sample_command_hook) == (
+        "command:echo 'Exiting mode: {mode_name}'"
+    )
@@ -395,6 +395,18 @@ class TestModeManager:
             callback.assert_called_once_with("default", "advanced")
             mock_save.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_transition_report(self, mode_manager):
+        """Test that the transition report includes the hook durations."""
+        with patch.object(mode_manager, "_save_mode_state"):
+            await mode_manager._execute_transition("advanced", "test_reason")
+
+        report = mode_manager.get_mode_info()["last_transition"]
+        assert report["transition"] == "default->advanced"
+        assert report["reason"] == "test_reason"
+        assert report["duration"] >= 0
+        assert set(report["hooks"]) == {"exit", "global_exit", "entry", "global_entry"}
+
     @pytest.mark.asyncio
     async def test_execute_transition_history_limit(self, mode_manager):
         """Test that transition history is limited to prevent excessive growth."""
@@ -1,3 +1,4 @@
+import time
 from unittest.mock import mock_open, patch
 
 import json5
@@ -8,6 +9,7 @@ from inputs.base import Sensor, SensorConfig
 from llm import LLM
 from llm.output_model import CortexOutputModel
 from runtime.single_mode.config import RuntimeConfig, load_config
+from runtime.topology import RemoteInput
 from simulators.base import Simulator, SimulatorConfig
 
 
@@ -227,6 +229,108 @@ def test_load_multiple_components(mock_multiple_components_config, mock_dependen
         assert len(config.agent_actions) == 2
 
 
+def test_load_components_in_stages(mock_multiple_components_config, mock_dependencies):
+    events = []
+
+    def recording(kind, result):
+        def build(*args, **kwargs):
+            events.append(("start", kind))
+            time.sleep(0.05)
+            events.append(("end", kind))
+            return result
+
+        return build
+
+    with (
+        patch(
+            "builtins.open",
+            mock_open(read_data=json5.dumps(mock_multiple_components_config)),
+        ),
+        patch(
+            "runtime.single_mode.config.load_input",
+            return_value=recording("input", mock_dependencies["input"]()),
+        ),
+        patch(
+            "runtime.single_mode.config.load_action",
+            side_effect=recording("action", mock_dependencies["action"]()),
+        ),
+        patch(
+            "runtime.single_mode.config.load_simulator",
+            return_value=recording(
+                "simulator",
+                mock_dependencies["simulator"](SimulatorConfig(name="simulator")),
+            ),
+        ),
+        patch(
+            "runtime.single_mode.config.load_llm", return_value=mock_dependencies["llm"]
+        ),
+    ):
+        load_config("multiple_components")
+
+    stages = ["input", "simulator", "action"]
+    for earlier, later in zip(stages, stages[1:]):
+        last_end = max(i for i, event in enumerate(events) if event == ("end", earlier))
+        first_start = min(
+            i for i, event in enumerate(events) if event == ("start", later)
+        )
+        assert last_end < first_start
+    assert events.count(("start", "input")) == 2
+
+
+def test_load_topology(mock_multiple_components_config, mock_dependencies):
+    mock_multiple_components_config["api_key"] = "global_test_api_key"
+    mock_multiple_components_config["backgrounds"] = [{"type": "test_background"}]
+    mock_multiple_components_config["topology"] = {
+        "processes": {
+            "perception": {
+                "inputs": ["test_input_2"],
+                "backgrounds": ["test_background"],
+            }
+        },
+        "max_restarts": 3,
+    }
+
+    with (
+        patch(
+            "builtins.open",
+            mock_open(read_data=json5.dumps(mock_multiple_components_config)),
+        ),
+        patch(
+            "runtime.single_mode.config.load_input",
+            return_value=mock_dependencies["input"],
+        ) as load_input,
+        patch("runtime.single_mode.config.load_background") as load_background,
+        patch(
+            "runtime.single_mode.config.load_action",
+            return_value=mock_dependencies["action"](),
+        ),
+        patch(
+            "runtime.single_mode.config.load_simulator",
+            return_value=mock_dependencies["simulator"],
+        ),
+        patch(
+            "runtime.single_mode.config.load_llm", return_value=mock_dependencies["llm"]
+        ),
+    ):
+        config = load_config("multiple_components")
+
+    load_input.assert_called_once_with("test_input_1")
+    load_background.assert_not_called()
+    assert config.backgrounds == []
+    assert isinstance(config.agent_inputs[0], mock_dependencies["input"])
+    assert isinstance(config.agent_inputs[1], RemoteInput)
+
+    assert config.topology is not None
+    assert config.topology.max_restarts == 3
+    (worker,) = config.topology.active_workers
+    assert worker.inputs == [
+        {"type": "test_input_2", "config": {"api_key": "global_test_api_key"}}
+    ]
+    assert worker.backgrounds == [
+        {"type": "test_background", "config": {"api_key": "global_test_api_key"}}
+    ]
+
+
 def test_load_config_missing_required_fields():
     invalid_config = {
         "version": "v1.0.0",
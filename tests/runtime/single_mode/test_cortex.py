@@ -105,6 +105,28 @@ async def test_tick_no_prompt(runtime):
     mocks["background_orchestrator"].promise.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_tick_skips_unchanged_inputs(runtime):
+    cortex_runtime, mocks = runtime
+
+    mocks["action_orchestrator"].flush_promises = AsyncMock(return_value=([], None))
+    mocks["fuser"].fuse.return_value = "test prompt"
+    mocks["fuser"].inputs_changed = False
+    cortex_runtime.config.cortex_llm.ask = AsyncMock(return_value=None)
+
+    cortex_runtime.config.skip_unchanged_ticks = False
+    await cortex_runtime._tick()
+    cortex_runtime.config.cortex_llm.ask.assert_called_once()
+
+    cortex_runtime.config.skip_unchanged_ticks = True
+    await cortex_runtime._tick()
+    cortex_runtime.config.cortex_llm.ask.assert_called_once()
+
+    mocks["fuser"].inputs_changed = True
+    await cortex_runtime._tick()
+    assert cortex_runtime.config.cortex_llm.ask.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_tick_no_llm_output(runtime):
     cortex_runtime, mocks = runtime
@@ -122,6 +144,24 @@ async def test_tick_no_llm_output(runtime):
     mocks["background_orchestrator"].promise.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_tick_superseded_by_higher_priority_input(runtime):
+    cortex_runtime, mocks = runtime
+
+    mocks["action_orchestrator"].flush_promises = AsyncMock(return_value=([], None))
+    mocks["fuser"].fuse.return_value = "test prompt"
+    cortex_runtime.config.agent_inputs = [Mock(priority=1)]
+    cortex_runtime._tick_priority = 0
+    mocks["sleep_ticker_provider"].until_woken = AsyncMock(return_value=(None, True))
+    mocks["action_orchestrator"].promise = AsyncMock()
+
+    await cortex_runtime._tick()
+
+    assert mocks["sleep_ticker_provider"].until_woken.call_args.args[1] == 0
+    mocks["action_orchestrator"].promise.assert_not_called()
+    mocks["fuser"].keep_inputs.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_run_cortex_loop(runtime):
     cortex_runtime, mocks = runtime
@@ -160,6 +200,50 @@ async def test_start_input_listeners(runtime):
         mocks["input_orchestrator"].listen.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_topology_supervisor_lifecycle(runtime):
+    cortex_runtime, mocks = runtime
+    cortex_runtime.reflex_orchestrator = None
+    supervisor = Mock()
+    supervisor.start.return_value = asyncio.get_running_loop().create_future()
+
+    with (
+        patch(
+            "runtime.single_mode.cortex.InputOrchestrator",
+            return_value=mocks["input_orchestrator"],
+        ),
+        patch(
+            "runtime.single_mode.cortex.TopologySupervisor", return_value=supervisor
+        ) as supervisor_class,
+    ):
+        mocks["input_orchestrator"].listen = AsyncMock()
+        await cortex_runtime._start_orchestrators()
+
+    supervisor_class.assert_called_once_with(cortex_runtime.config.topology)
+    assert cortex_runtime.topology_task is supervisor.start.return_value
+
+    await cortex_runtime._stop_current_orchestrators()
+
+    supervisor.stop.assert_called_once()
+    assert cortex_runtime.topology_supervisor is None
+    assert cortex_runtime.topology_task is None
+
+
+@pytest.mark.asyncio
+async def test_cleanup_closes_http_client(runtime):
+    cortex_runtime, _ = runtime
+    http_client = Mock(close=AsyncMock())
+
+    with patch(
+        "runtime.single_mode.cortex.find_instance", return_value=http_client
+    ) as find:
+        await cortex_runtime._cleanup_tasks()
+
+    find.assert_called_once_with("HTTPClientProvider")
+    http_client.close.assert_awaited_once()
+    http_client.close_sync.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_run_full_runtime(runtime):
     cortex_runtime, _ = runtime
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from providers.singleton import provider_scope, singleton
+from runtime.builder import ComponentBuilder
+
+
+def slow(value, delay=0.1):
+    def build():
+        time.sleep(delay)
+        return value
+
+    return build
+
+
+def test_builds_independent_components_concurrently():
+    builder = ComponentBuilder()
+    for i in range(4):
+        builder.add(f"c{i}", slow(i))
+
+    start = time.perf_counter()
+    results = builder.build()
+    elapsed = time.perf_counter() - start
+
+    assert list(results.values()) == [0, 1, 2, 3]
+    assert elapsed < 0.3
+    assert set(builder.timings) == {"c0", "c1", "c2", "c3"}
+
+
+def test_dependencies_are_built_first():
+    order = []
+    lock = threading.Lock()
+
+    def record(name, delay=0.0):
+        def build():
+            time.sleep(delay)
+            with lock:
+                order.append(name)
+            return name
+
+        return build
+
+    builder = ComponentBuilder()
+    bg = builder.add("background", record("background", delay=0.05))
+    a = builder.add("a", record("a"), depends_on=[bg])
+    b = builder.add("b", record("b"), depends_on=[bg])
+    builder.add(
+        "llm",
+        lambda: builder.results([a, b]),
+        depends_on=[a, b],
+    )
+
+    results = builder.build()
+
+    assert order[0] == "background"
+    assert results["llm"] == ["a", "b"]
+
+
+def test_sequential_build():
+    threads = []
+
+    def build():
+        threads.append(threading.current_thread())
+        return 1
+
+    builder = ComponentBuilder(max_workers=1)
+    builder.add("a", build)
+    builder.add("b", build)
+
+    assert builder.build() == {"a": 1, "b": 1}
+    assert threads == [threading.main_thread()] * 2
+
+
+def test_error_is_raised():
+    def fail():
+        raise ValueError("boom")
+
+    builder = ComponentBuilder()
+    builder.add("ok", slow(1))
+    builder.add("bad", fail)
+
+    with pytest.raises(ValueError, match="boom"):
+        builder.build()
+
+
+def test_unknown_dependency():
+    builder = ComponentBuilder()
+
+    with pytest.raises(ValueError):
+        builder.add("a", slow(1), depends_on=["b"])
+
+
+def test_builds_in_provider_scope():
+    @singleton
+    class Provider:
+        pass
+
+    builder = ComponentBuilder()
+    builder.add("a", lambda: Provider())
+    builder.add("b", lambda: Provider())
+
+    with provider_scope() as instances:
+        results = builder.build()
+
+    assert results["a"] is results["b"]
+    assert list(instances.values()) == [results["a"]]
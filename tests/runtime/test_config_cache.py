@@ -0,0 +1,143 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from runtime import config_cache
+from runtime.config_cache import (
+    is_mode_config,
+    load_raw_config,
+    parse_json5,
+    validate_config,
+)
+
+CONFIG_TEXT = """
+// Comments and trailing commas are JSON5
+{
+  version: "v1.0.0",
+  hertz: 1,
+  name: "test",
+  api_key: "key",
+  system_prompt_base: "base",
+  system_governance: "governance",
+  system_prompt_examples: "examples",
+  agent_inputs: [],
+  cortex_llm: { type: "OpenAILLM", config: { agent_name: "Spot" } },
+  agent_actions: [],
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path):
+    config_cache._memory.clear()
+    with patch.object(config_cache, "CACHE_DIR", str(tmp_path / "cache")):
+        yield tmp_path / "cache"
+    config_cache._memory.clear()
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "test.json5"
+    path.write_text(CONFIG_TEXT)
+    return str(path)
+
+
+def test_parse_json5():
+    assert parse_json5('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert parse_json5("{a: [1, 2,],}") == {"a": [1, 2]}
+    with pytest.raises(ValueError):
+        parse_json5("invalid json5")
+
+
+def test_load_writes_and_reads_cache(config_file, cache_dir):
+    raw_config = load_raw_config(config_file)
+
+    assert raw_config["cortex_llm"]["config"]["agent_name"] == "Spot"
+    assert len(os.listdir(cache_dir)) == 1
+
+    config_cache._memory.clear()
+    with patch("runtime.config_cache.json5.loads") as json5_loads:
+        assert load_raw_config(config_file) == raw_config
+    json5_loads.assert_not_called()
+
+
+def test_load_returns_new_objects(config_file):
+    first = load_raw_config(config_file)
+    first["cortex_llm"]["config"]["api_key"] = "changed"
+
+    assert "api_key" not in load_raw_config(config_file)["cortex_llm"]["config"]
+
+
+def test_changed_file_is_compiled_again(config_file, cache_dir):
+    load_raw_config(config_file)
+    with open(config_file, "w") as f:
+        f.write(CONFIG_TEXT.replace("hertz: 1", "hertz: 5"))
+
+    assert load_raw_config(config_file)["hertz"] == 5
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_corrupt_cache_entry_is_ignored(config_file, cache_dir):
+    load_raw_config(config_file)
+    config_cache._memory.clear()
+    for name in os.listdir(cache_dir):
+        (cache_dir / name).write_text("{corrupt")
+
+    assert load_raw_config(config_file)["name"] == "test"
+
+
+def test_without_cache(config_file, cache_dir):
+    assert load_raw_config(config_file, use_cache=False)["name"] == "test"
+    assert not os.path.exists(cache_dir)
+
+
+def test_missing_file():
+    with pytest.raises(FileNotFoundError):
+        load_raw_config("/nonexistent/config.json5")
+
+
+def test_invalid_config_is_logged(tmp_path):
+    path = tmp_path / "invalid.json5"
+    path.write_text('{name: "test"}')
+
+    with patch("runtime.config_cache.logging") as mock_logging:
+        assert load_raw_config(str(path)) == {"name": "test"}
+    assert mock_logging.warning.called
+
+
+def test_invalid_config_is_logged_on_cache_hit(tmp_path):
+    path = tmp_path / "invalid.json5"
+    path.write_text('{name: "test"}')
+    load_raw_config(str(path))
+
+    config_cache._memory.clear()
+    with (
+        patch("runtime.config_cache.logging") as mock_logging,
+        patch("runtime.config_cache.json5.loads") as json5_loads,
+    ):
+        assert load_raw_config(str(path)) == {"name": "test"}
+    json5_loads.assert_not_called()
+    assert mock_logging.warning.called
+
+
+def test_cache_keeps_newest_entries(tmp_path, cache_dir):
+    entries = []
+    with patch.object(config_cache, "CACHE_MAX_ENTRIES", 2):
+        for hertz in range(3):
+            path = tmp_path / f"config_{hertz}.json5"
+            path.write_text(CONFIG_TEXT.replace("hertz: 1", f"hertz: {hertz}"))
+            existing = set(os.listdir(cache_dir)) if cache_dir.exists() else set()
+            load_raw_config(str(path))
+            (entry,) = set(os.listdir(cache_dir)) - existing
+            os.utime(cache_dir / entry, (hertz, hertz))
+            entries.append(entry)
+
+    assert set(os.listdir(cache_dir)) == set(entries[1:])
+
+
+def test_validate_config():
+    assert validate_config(parse_json5(CONFIG_TEXT)) == []
+    assert validate_config({"name": "test"})
+    assert is_mode_config({"modes": {}, "default_mode": "a"})
+    assert not is_mode_config(parse_json5(CONFIG_TEXT))
@@ -0,0 +1,303 @@
+import asyncio
+import os
+import time
+from queue import Queue
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from inputs.base import SensorConfig
+from inputs.base.buffer import BufferPolicy, MessageBuffer
+from inputs.base.loop import FuserInput
+from providers.io_provider import IOProvider
+from providers.singleton import find_instance, provider_scope
+from providers.sleep_ticker_provider import SleepTickerProvider
+from runtime.logging import LoggingConfig
+from runtime.topology import (
+    ProviderMirror,
+    RemoteInput,
+    Topology,
+    TopologySupervisor,
+    WorkerSpec,
+    _Worker,
+    provider_mirror,
+)
+
+TOPOLOGY_CONFIG = {
+    "processes": {
+        "perception": {
+            "inputs": ["EchoInput"],
+            "backgrounds": ["Gps"],
+            "state": {"GpsProvider": ["lat", "lon"]},
+            "state_hz": 5,
+        }
+    },
+    "restart_delay": 0.5,
+    "max_restarts": 2,
+}
+
+
+class EchoInput(FuserInput[str]):
+    """
+    Input that sends its ``text`` every 50 ms and wakes the cortex loop.
+    """
+
+    def __init__(self, config: SensorConfig = SensorConfig()):
+        super().__init__(config)
+        self.text = getattr(config, "text", "hello")
+        self.latest = None
+        self.io_provider = IOProvider()
+
+    async def _poll(self) -> str:
+        await asyncio.sleep(0.05)
+        return self.text
+
+    async def raw_to_text(self, raw_input):
+        self.latest = raw_input
+        SleepTickerProvider().wake(self.priority)
+
+    def formatted_latest_buffer(self):
+        latest, self.latest = self.latest, None
+        if latest is not None:
+            self.io_provider.add_input("EchoInput", latest, None)
+        return latest
+
+
+class SpeechInput(FuserInput[str]):
+    """
+    Input that joins the utterances it hears, as the ASR inputs do.
+    """
+
+    def __init__(self, config: SensorConfig = SensorConfig()):
+        super().__init__(config)
+        self.messages: MessageBuffer[str] = MessageBuffer(BufferPolicy.JOIN)
+        self.utterances = ["hello there", "how are you"]
+
+    async def _poll(self):
+        if self.utterances:
+            return self.utterances.pop(0)
+        await asyncio.sleep(0.05)
+        return None
+
+    async def raw_to_text(self, raw_input):
+        if raw_input is not None:
+            self.messages.append(raw_input)
+
+    def formatted_latest_buffer(self):
+        if not self.messages:
+            return None
+        text = self.messages[-1]
+        self.messages.clear()
+        return text
+
+
+class CrashingInput(FuserInput[str]):
+    """
+    Input that exits its process.
+    """
+
+    async def _poll(self) -> str:
+        await asyncio.sleep(0.1)
+        os._exit(3)
+
+
+@pytest.fixture(autouse=True)
+def providers():
+    with provider_scope() as instances:
+        yield instances
+
+
+@pytest.fixture(autouse=True)
+def console_logging():
+    # The log file handler of pytest would make the workers log to files
+    with patch("runtime.topology.get_logging_config", return_value=LoggingConfig()):
+        yield
+
+
+def remote_topology(input_type, config, **topology_config):
+    topology = Topology.from_config(
+        {"processes": {"worker": {"inputs": [input_type]}}, **topology_config}
+    )
+    remote_input = topology.place_input(input_type, config)
+    topology.workers[0].inputs[0]["module"] = __name__
+    return topology, remote_input
+
+
+async def wait_for(condition, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.05)
+
+
+def test_from_config_places_inputs_and_backgrounds():
+    topology = Topology.from_config(TOPOLOGY_CONFIG)
+
+    remote_input = topology.place_input("EchoInput", {"priority": 2})
+    assert topology.place_input("OtherInput", {}) is None
+    assert topology.place_background("Gps", {"port": "/dev/gps"})
+    assert not topology.place_background("Odom", {})
+
+    (worker,) = topology.active_workers
+    assert worker.name == "perception"
+    assert worker.inputs == [{"type": "EchoInput", "config": {"priority": 2}}]
+    assert worker.backgrounds == [{"type": "Gps", "config": {"port": "/dev/gps"}}]
+    assert worker.state == {"GpsProvider": ["lat", "lon"]}
+    assert worker.state_hz == 5
+    assert (topology.restart_delay, topology.max_restarts) == (0.5, 2)
+
+    assert isinstance(remote_input, RemoteInput)
+    assert (remote_input.worker, remote_input.index) == ("perception", 0)
+    assert remote_input.priority == 2
+    assert topology.remote_inputs == [remote_input]
+
+
+def test_input_in_two_processes():
+    with pytest.raises(ValueError):
+        Topology.from_config(
+            {
+                "processes": {
+                    "a": {"inputs": ["EchoInput"]},
+                    "b": {"inputs": ["EchoInput"]},
+                }
+            }
+        )
+
+
+def test_unused_workers_are_inactive():
+    topology = Topology.from_config(TOPOLOGY_CONFIG)
+
+    assert topology.active_workers == []
+
+
+def test_remote_input_returns_text_once():
+    remote_input = RemoteInput(SensorConfig(), "perception", 0)
+    assert not remote_input.buffer_changed()
+    assert remote_input.formatted_latest_buffer() is None
+
+    remote_input.receive("first", [])
+    remote_input.receive("second", [("EchoInput", "second", 12.0)])
+
+    assert remote_input.buffer_changed()
+    assert remote_input.notifier is not None
+    assert remote_input.notifier.stats["notifications"] == 2
+    assert remote_input.formatted_latest_buffer() == "second"
+    assert IOProvider().inputs["EchoInput"].timestamp == 12.0
+    assert not remote_input.buffer_changed()
+    assert remote_input.formatted_latest_buffer() is None
+
+
+def test_remote_input_joins_unread_text():
+    remote_input = RemoteInput(SensorConfig(), "perception", 0)
+
+    remote_input.receive("hello there", [], join=True)
+    remote_input.receive("how are you", [], join=True)
+
+    assert remote_input.formatted_latest_buffer() == "hello there\nhow are you"
+    remote_input.receive("again", [], join=True)
+    assert remote_input.formatted_latest_buffer() == "again"
+
+
+async def test_worker_sends_joined_input_with_wake():
+    data_queue: Queue = Queue()
+    worker = _Worker(WorkerSpec(name="worker"), data_queue, Queue())
+    speech = SpeechInput(SensorConfig(priority=2))
+
+    task = asyncio.create_task(worker._listen(0, speech))
+    try:
+        await wait_for(lambda: data_queue.qsize() >= 4)
+    finally:
+        task.cancel()
+
+    messages = [data_queue.get() for _ in range(4)]
+    assert messages == [
+        ("input", 0, "hello there", [], True),
+        ("wake", 2),
+        ("input", 0, "how are you", [], True),
+        ("wake", 2),
+    ]
+
+
+def test_provider_mirror_is_found_by_name():
+    mirror = provider_mirror("GpsProvider")
+    mirror.update({"lat": 1.5})
+
+    assert find_instance("GpsProvider") is mirror
+    assert provider_mirror("GpsProvider") is mirror
+    assert isinstance(mirror, ProviderMirror)
+    assert mirror.lat == 1.5
+
+
+def test_supervisor_handles_messages():
+    topology = Topology.from_config(TOPOLOGY_CONFIG)
+    remote_input = topology.place_input("EchoInput", {})
+    supervisor = TopologySupervisor(topology)
+
+    supervisor._handle("perception", ("input", 0, "hello", [], False))
+    supervisor._handle("perception", ("wake", 3))
+    supervisor._handle("perception", ("state", {"GpsProvider": {"lat": 2.0}}))
+
+    assert remote_input.formatted_latest_buffer() == "hello"
+    assert SleepTickerProvider().take_wake() == 3
+    assert find_instance("GpsProvider").lat == 2.0
+
+
+def test_supervisor_does_not_mirror_a_local_provider(providers):
+    local = type("GpsProvider", (), {})()
+    providers[type(local)] = local
+    topology = Topology.from_config(TOPOLOGY_CONFIG)
+    topology.place_input("EchoInput", {})
+
+    supervisor = TopologySupervisor(topology)
+    supervisor._handle("perception", ("state", {"GpsProvider": {"lat": 2.0}}))
+
+    assert not hasattr(local, "lat")
+
+
+def test_supervisor_restarts_with_backoff_then_gives_up():
+    topology, _ = remote_topology("EchoInput", {}, restart_delay=0, max_restarts=2)
+    supervisor = TopologySupervisor(topology)
+    (worker,) = supervisor._processes
+    worker.process = MagicMock(exitcode=1)
+    worker.process.is_alive.return_value = False
+
+    with patch.object(supervisor, "_spawn") as spawn:
+        for _ in range(6):
+            supervisor._check()
+
+    assert spawn.call_count == 2
+    assert worker.restarts == 2
+    assert worker.failed
+    assert supervisor.stats["worker"]["failed"]
+
+
+async def test_worker_process_sends_text_and_wakes():
+    topology, remote_input = remote_topology(
+        "EchoInput", {"text": "from worker", "priority": 4}
+    )
+    supervisor = TopologySupervisor(topology)
+    task = supervisor.start()
+    try:
+        await wait_for(remote_input.buffer_changed)
+        assert remote_input.formatted_latest_buffer() == "from worker"
+        assert IOProvider().inputs["EchoInput"].input == "from worker"
+        await wait_for(lambda: SleepTickerProvider().skip_sleep)
+        assert SleepTickerProvider().take_wake() == 4
+        assert supervisor.stats["worker"]["alive"]
+    finally:
+        task.cancel()
+        await asyncio.to_thread(supervisor.stop)
+
+    assert not supervisor.stats["worker"]["alive"]
+
+
+async def test_crashed_worker_is_restarted():
+    topology, _ = remote_topology("CrashingInput", {}, restart_delay=0, max_restarts=1)
+    supervisor = TopologySupervisor(topology)
+    task = supervisor.start()
+    try:
+        await wait_for(lambda: supervisor.stats["worker"]["failed"])
+        assert supervisor.stats["worker"]["restarts"] == 1
+    finally:
+        task.cancel()
+        await asyncio.to_thread(supervisor.stop)
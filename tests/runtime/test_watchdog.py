@@ -0,0 +1,79 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+import runtime.watchdog as watchdog_module
+from runtime.watchdog import UNKNOWN_CULPRIT, LoopWatchdog, attribute_stack
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def attribute_tests(monkeypatch):
+    # Treat this test module as part of the code base, like a plugin
+    monkeypatch.setattr(watchdog_module, "_SRC_DIR", os.path.abspath(REPO_ROOT))
+
+
+class BlockingPlugin:
+    async def _poll(self):
+        time.sleep(0.25)
+
+
+def blocking_function():
+    return attribute_stack(sys._getframe())
+
+
+def test_attribute_stack_uses_self_class():
+    class Plugin:
+        def run(self):
+            return attribute_stack(sys._getframe())
+
+    culprit, stack = Plugin().run()
+    assert culprit == "Plugin"
+    assert "run" in stack[-1]
+
+
+def test_attribute_stack_plain_function():
+    culprit, _ = blocking_function()
+    assert culprit.endswith(".blocking_function")
+
+
+def test_attribute_stack_without_frame():
+    assert attribute_stack(None) == (UNKNOWN_CULPRIT, [])
+
+
+@pytest.mark.asyncio
+async def test_stall_attributed_to_plugin(tmp_path):
+    report_path = str(tmp_path / "stalls.txt")
+    plugin = BlockingPlugin()
+
+    async with LoopWatchdog(
+        threshold=0.1, interval=0.01, report_path=report_path
+    ) as watchdog:
+        await asyncio.sleep(0.05)
+        await plugin._poll()
+        await asyncio.sleep(0.05)
+
+    ranked = watchdog.ranked()
+    assert ranked[0].culprit == "BlockingPlugin"
+    assert ranked[0].count == 1
+    assert ranked[0].worst >= 0.2
+    assert any("time.sleep" in line for line in ranked[0].stack)
+
+    with open(report_path) as f:
+        report = f.read()
+    assert "BlockingPlugin" in report
+    assert "Worst stall of BlockingPlugin" in report
+
+
+@pytest.mark.asyncio
+async def test_no_stalls():
+    async with LoopWatchdog(threshold=0.2, interval=0.01) as watchdog:
+        await asyncio.sleep(0.1)
+
+    assert watchdog.ranked() == []
+    assert watchdog.lag_summary()["samples"] > 0
+    assert "No stalls above 200 ms" in watchdog.report()
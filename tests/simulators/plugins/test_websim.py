@@ -0,0 +1,169 @@
+import asyncio
+import threading
+
+import pytest
+
+from simulators.plugins.WebSim import _WebSimClient, json_patch
+
+
+def apply_patch(doc, ops):
+    """Minimal RFC 6902 applier mirroring the dashboard's applyPatch."""
+    import copy
+
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        if op["path"] == "":
+            doc = op["value"]
+            continue
+        keys = [
+            k.replace("~1", "/").replace("~0", "~") for k in op["path"].split("/")[1:]
+        ]
+        parent = doc
+        for k in keys[:-1]:
+            parent = parent[int(k)] if isinstance(parent, list) else parent[k]
+        last = keys[-1]
+        if isinstance(parent, list):
+            index = int(last)
+            if op["op"] == "remove":
+                parent.pop(index)
+            elif op["op"] == "add":
+                parent.insert(index, op["value"])
+            else:
+                parent[index] = op["value"]
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = op["value"]
+    return doc
+
+
+def test_json_patch_no_changes():
+    state = {"current_action": "idle", "inputs": [{"input": "a"}]}
+    assert json_patch(state, dict(state)) == []
+
+
+def test_json_patch_only_changed_fields():
+    old = {
+        "current_action": "idle",
+        "last_speech": "hello",
+        "inputs": [
+            {"input_type": "Vision", "timestamp": 0.0, "input": "a long caption"},
+            {"input_type": "Lidar", "timestamp": 0.1, "input": "clear"},
+        ],
+    }
+    new = {
+        "current_action": "walk",
+        "last_speech": "hello",
+        "inputs": [
+            {"input_type": "Vision", "timestamp": 0.0, "input": "a long caption"},
+            {"input_type": "Lidar", "timestamp": 0.3, "input": "clear"},
+        ],
+    }
+
+    ops = json_patch(old, new)
+
+    assert {"op": "replace", "path": "/current_action", "value": "walk"} in ops
+    assert {"op": "replace", "path": "/inputs/1/timestamp", "value": 0.3} in ops
+    assert len(ops) == 2
+    assert apply_patch(old, ops) == new
+
+
+@pytest.mark.parametrize(
+    "old,new",
+    [
+        ({"inputs": [1, 2, 3]}, {"inputs": [1]}),
+        ({"inputs": [1]}, {"inputs": [1, 2, 3]}),
+        ({"a": 1, "b/c": 2}, {"a~x": 1}),
+        ({"a": {"b": 1}}, {"a": [1]}),
+        ({"a": 1}, [1, 2]),
+    ],
+)
+def test_json_patch_roundtrip(old, new):
+    assert apply_patch(old, json_patch(old, new)) == new
+
+
+class _SlowWebSocket:
+    def __init__(self):
+        self.sent = []
+        self.release = asyncio.Event()
+
+    async def send_json(self, data):
+        self.sent.append(data)
+        await self.release.wait()
+        self.release.clear()
+
+
+@pytest.mark.asyncio
+async def test_slow_client_is_coalesced_to_latest_state():
+    from simulators.plugins.WebSim import WebSim
+
+    websocket = _SlowWebSocket()
+    client = _WebSimClient(websocket, {"n": 0})  # type: ignore
+
+    # Drive the per-client sender without starting a server
+    sim = WebSim.__new__(WebSim)
+    sim._clients = [client]
+    task = asyncio.create_task(sim._send_to_client(client))
+
+    client.offer({"n": 1})
+    await asyncio.sleep(0)
+    assert len(websocket.sent) == 1
+
+    # While the first send is in flight, newer states replace each other
+    for n in range(2, 10):
+        client.offer({"n": n})
+    websocket.release.set()
+    await asyncio.sleep(0.01)
+    websocket.release.set()
+    await asyncio.sleep(0.01)
+
+    assert websocket.sent == [
+        {"type": "patch", "ops": [{"op": "replace", "path": "/n", "value": 1}]},
+        {"type": "patch", "ops": [{"op": "replace", "path": "/n", "value": 9}]},
+    ]
+    assert client.last_sent == {"n": 9}
+
+    task.cancel()
+
+
+class _ClosingWebSocket:
+    def __init__(self):
+        self.closed_on = None
+
+    async def close(self):
+        self.closed_on = threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_closes_clients_on_the_server_loop():
+    from simulators.plugins.WebSim import WebSim
+
+    loop = asyncio.new_event_loop()
+    server_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    server_thread.start()
+
+    async def connect():
+        websocket = _ClosingWebSocket()
+        client = _WebSimClient(websocket, {})  # type: ignore
+        client.task = asyncio.create_task(asyncio.Event().wait())
+        return client
+
+    client = asyncio.run_coroutine_threadsafe(connect(), loop).result()
+    sim = WebSim.__new__(WebSim)
+    sim._clients = [client]
+    sim._loop = loop
+
+    await sim.cleanup()
+
+    assert client.websocket.closed_on is server_thread
+    assert sim._clients == []
+
+    async def cancelled():
+        await asyncio.sleep(0)
+        return client.task.cancelled()
+
+    assert asyncio.run_coroutine_threadsafe(cancelled(), loop).result()
+
+    loop.call_soon_threadsafe(loop.stop)
+    server_thread.join()
+    loop.close()